@@ -27,6 +27,7 @@ __all__ = [
     "jobs",
     "kill",
     "nodes",
+    "prestage",
     "properties",
     "queues",
     "run",
@@ -5,11 +5,17 @@
 Utilities for archiving and retrieving job-related files.
 
 This module provides the `Archiver` class, which coordinates the movement
-of files between working directory and the job archive.
+of files between working directory and the job archive, and the `ArchiveIndex`
+class, which maps loop cycles to the files archived for them. Files of individual
+cycles can be packed into tar bundles using the `Packer` class.
 """
 
 from .archiver import Archiver
+from .index import ArchiveIndex
+from .packer import Packer
 
 __all__ = [
+    "ArchiveIndex",
     "Archiver",
+    "Packer",
 ]
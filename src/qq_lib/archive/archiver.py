@@ -1,17 +1,22 @@
 # Released under MIT License.
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
+import os
 import re
 import socket
 from collections.abc import Iterable
 from pathlib import Path
 
 from qq_lib.batch.interface import BatchInterface
-from qq_lib.core.common import is_printf_pattern, printf_to_regex
+from qq_lib.core.common import append_to_file, is_printf_pattern, printf_to_regex
 from qq_lib.core.config import CFG
+from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
 from qq_lib.core.retryer import Retryer
 
+from .index import ArchiveIndex
+from .packer import Packer
+
 logger = get_logger(__name__, show_time=True)
 
 
@@ -27,6 +32,7 @@ class Archiver:
         input_machine: str,
         input_dir: Path,
         batch_system: type[BatchInterface],
+        pack: str | None = None,
     ):
         """
         Initialize the Archiver.
@@ -37,12 +43,20 @@ class Archiver:
             input_machine (str): The hostname from which the job was submitted.
             input_dir (Path): The directory from which the job was submitted.
             batch_system (type[BatchInterface]): The batch system which manages the job.
+            pack (str | None): Format of the bundles into which the files of each cycle
+                are packed (see `Packer.FORMATS`). If `None`, files are archived individually.
+
+        Raises:
+            QQError: If the pack format is not supported.
         """
         self._batch_system = batch_system
         self._archive = archive
         self._archive_format = archive_format
         self._input_machine = input_machine
         self._input_dir = input_dir
+        self._packer = Packer(pack) if pack else None
+        # parsed archive index, loaded on first use
+        self._index: ArchiveIndex | None = None
 
     def makeArchiveDir(self) -> None:
         """
@@ -63,6 +77,10 @@ class Archiver:
         fetched. If no cycle is provided, all files matching the pattern
         in the archive are fetched.
 
+        In the packed mode, only the matching members of the bundles are extracted
+        into the directory. Bundles located on the current machine are extracted
+        directly from the archive, other bundles are first copied to the directory.
+
         Args:
             dir (Path): The directory where files will be copied to.
             cycle (int | None): The cycle number to filter files for.
@@ -72,34 +90,39 @@ class Archiver:
         Raises:
             QQError: If file transfer fails.
         """
-        if not (
-            files := self._getFiles(
-                self._archive, self._input_machine, self._archive_format, cycle, False
-            )
-        ):
+        if not (files := self._getArchivedFiles(cycle)):
             logger.debug("Nothing to fetch from archive.")
             return
 
         logger.debug(f"Files to fetch from archive: {files}.")
 
-        Retryer(
-            self._batch_system.syncSelected,
-            self._archive,
-            dir,
-            self._input_machine,
-            socket.gethostname(),
-            files,
-            max_tries=CFG.archiver.retry_tries,
-            wait_seconds=CFG.archiver.retry_wait,
-        ).run()
+        bundles = [f for f in files if self._packer and self._packer.isBundle(f)]
+        if files := [f for f in files if f not in bundles]:
+            Retryer(
+                self._batch_system.syncSelected,
+                self._archive,
+                dir,
+                self._input_machine,
+                socket.gethostname(),
+                files,
+                max_tries=CFG.archiver.retry_tries,
+                wait_seconds=CFG.archiver.retry_wait,
+            ).run()
+
+        for bundle in bundles:
+            self._unpack(bundle, dir, cycle)
 
     def toArchive(self, dir: Path) -> None:
         """
         Archive all files matching the archive format in the specified directory.
 
         Copies all files matching the archive pattern from directory
-        `dir` to the archive directory. After successfully transferring
-        the files, they are removed from the working directory.
+        `dir` to the archive directory and records them in the archive index.
+        After successfully transferring the files, they are removed
+        from the working directory.
+
+        In the packed mode, the files are first packed into one bundle per cycle
+        and only the bundles are transferred to the archive.
 
         Args:
             work_dir (Path): The directory containing files to archive.
@@ -113,21 +136,25 @@ class Archiver:
 
         logger.debug(f"Files to archive: {files}.")
 
+        transferred = self._pack(dir, files) if self._packer else files
+
         Retryer(
             self._batch_system.syncSelected,
             dir,
             self._archive,
             socket.gethostname(),
             self._input_machine,
-            files,
+            transferred,
             max_tries=CFG.archiver.retry_tries,
             wait_seconds=CFG.archiver.retry_wait,
         ).run()
 
-        # remove the archived files
+        self._updateIndex(transferred)
+
+        # remove the archived files and the transferred bundles
         Retryer(
             self._removeFiles,
-            files,
+            files + [f for f in transferred if f not in files],
             max_tries=CFG.archiver.retry_tries,
             wait_seconds=CFG.archiver.retry_wait,
         ).run()
@@ -136,7 +163,8 @@ class Archiver:
         """
         Archive qq runtime files from a specific job located in the input directory.
 
-        The archived files are moved from the input directory to the archive directory.
+        The archived files are moved from the input directory to the archive directory
+        and recorded in the archive index.
 
         Ensure that `job_name` does not contain special regex characters, or that any such
         characters are properly escaped.
@@ -182,6 +210,348 @@ class Archiver:
             wait_seconds=CFG.archiver.retry_wait,
         ).run()
 
+        self._updateIndex(moved_files)
+
+    def rebuildIndex(self) -> ArchiveIndex:
+        """
+        Rebuild the archive index from the current content of the archive.
+
+        Should be used if files were added to or removed from the archive manually.
+
+        Returns:
+            ArchiveIndex: The rebuilt index.
+
+        Raises:
+            QQError: If the archive format does not support indexing
+                or the index cannot be written.
+        """
+        if not is_printf_pattern(self._archive_format):
+            raise QQError(
+                f"Archive format '{self._archive_format}' does not contain a cycle number and cannot be indexed."
+            )
+
+        index = self._scanIndex()
+        self._writeIndex(index.toString())
+        self._index = index
+        return index
+
+    def _pack(self, dir: Path, files: list[Path]) -> list[Path]:
+        """
+        Pack files into bundles, one bundle per cycle.
+
+        Bundles are named according to the archive format. If a bundle for the same
+        cycle is already present in the archive, a numeric suffix is added to the name
+        of the new bundle. Files whose cycle cannot be determined are not packed.
+
+        Args:
+            dir (Path): The directory containing the files. Bundles are created in it.
+            files (list[Path]): Files to pack.
+
+        Returns:
+            list[Path]: Paths to the created bundles and to the files that were not packed.
+
+        Raises:
+            QQError: If a bundle cannot be created.
+        """
+        assert self._packer is not None
+
+        groups: dict[int, list[Path]] = {}
+        unpacked = []
+        for file in files:
+            if (
+                cycle := ArchiveIndex.getCycle(file.name, self._archive_format)
+            ) is not None:
+                groups.setdefault(cycle, []).append(file)
+            else:
+                unpacked.append(file)
+
+        if (index := self._loadIndex()) is None:
+            index = self._scanIndex()
+
+        bundles = []
+        for cycle, group in groups.items():
+            archived = index.getFiles(cycle)
+            stem = self._archive_format % cycle
+            bundle = dir / f"{stem}{self._packer.suffix}"
+            n = 1
+            while bundle.name in archived or bundle.exists():
+                n += 1
+                bundle = dir / f"{stem}_{n}{self._packer.suffix}"
+
+            self._packer.pack(group, bundle)
+            bundles.append(bundle)
+
+        logger.debug(f"Created bundles: {bundles}.")
+        return bundles + unpacked
+
+    def _unpack(self, bundle: Path, dir: Path, cycle: int | None) -> None:
+        """
+        Extract files matching the archive format from a bundle in the archive.
+
+        Args:
+            bundle (Path): Path to the bundle in the archive.
+            dir (Path): The directory into which the files are extracted.
+            cycle (int | None): The cycle number to filter files for.
+
+        Raises:
+            QQError: If the bundle cannot be transferred or extracted.
+        """
+        assert self._packer is not None
+
+        regex = Archiver._getStemRegex(self._archive_format, cycle)
+
+        def select(name: str) -> bool:
+            path = Path(name)
+            return bool(regex.search(path.stem)) and (
+                path.suffix not in CFG.suffixes.all_suffixes
+            )
+
+        if self._isLocal():
+            source = bundle
+        else:
+            Retryer(
+                self._batch_system.syncSelected,
+                self._archive,
+                dir,
+                self._input_machine,
+                socket.gethostname(),
+                [bundle],
+                max_tries=CFG.archiver.retry_tries,
+                wait_seconds=CFG.archiver.retry_wait,
+            ).run()
+            source = dir / bundle.name
+
+        try:
+            extracted = Retryer(
+                self._packer.extract,
+                source,
+                dir,
+                select,
+                max_tries=CFG.archiver.retry_tries,
+                wait_seconds=CFG.archiver.retry_wait,
+            ).run()
+        finally:
+            if source != bundle:
+                source.unlink(missing_ok=True)
+
+        logger.debug(f"Files extracted from '{bundle}': {extracted}.")
+
+    def _getArchivedFiles(self, cycle: int | None) -> list[Path]:
+        """
+        Determine which files should be fetched from the archive.
+
+        Files of a specific cycle are looked up in the archive index, if available.
+        Otherwise, the archive directory is scanned.
+
+        Args:
+            cycle (int | None): The cycle number to filter files for.
+
+        Returns:
+            list[Path]: A list of absolute paths to the files in the archive.
+        """
+        if cycle and is_printf_pattern(self._archive_format):
+            if (index := self._loadIndex()) is not None and (
+                names := index.getFiles(cycle)
+            ):
+                logger.debug(f"Files of cycle {cycle} found in the archive index.")
+                return [
+                    self._archive / name
+                    for name in names
+                    if Path(name).suffix not in CFG.suffixes.all_suffixes
+                ]
+
+            # the index is missing or files were added into the archive manually
+            logger.debug(
+                f"Cycle {cycle} is not present in the archive index. Scanning the archive."
+            )
+
+        return self._getFiles(
+            self._archive, self._input_machine, self._archive_format, cycle, False
+        )
+
+    def _updateIndex(self, files: list[Path]) -> None:
+        """
+        Record newly archived files in the archive index.
+
+        Only the new entries are appended to the existing index using a single
+        append-mode write, so the index is never rewritten. If the index does not
+        exist yet, it is built from the content of the archive, which already
+        contains the new files.
+
+        Args:
+            files (list[Path]): Paths to the archived files.
+
+        Raises:
+            QQError: If the index cannot be written.
+        """
+        if not is_printf_pattern(self._archive_format):
+            return
+
+        entries: dict[int, list[str]] = {}
+        for file in files:
+            if (
+                cycle := ArchiveIndex.getCycle(file.name, self._archive_format)
+            ) is not None:
+                entries.setdefault(cycle, []).append(file.name)
+
+        if not entries:
+            return
+
+        if not Retryer(
+            self._indexExists,
+            max_tries=CFG.archiver.retry_tries,
+            wait_seconds=CFG.archiver.retry_wait,
+        ).run():
+            logger.debug("Archive index does not exist. Building it.")
+            index = self._scanIndex()
+            Retryer(
+                self._writeIndex,
+                index.toString(),
+                max_tries=CFG.archiver.retry_tries,
+                wait_seconds=CFG.archiver.retry_wait,
+            ).run()
+            self._index = index
+            return
+
+        Retryer(
+            self._appendIndex,
+            ArchiveIndex.formatEntries(entries),
+            max_tries=CFG.archiver.retry_tries,
+            wait_seconds=CFG.archiver.retry_wait,
+        ).run()
+
+        # keep the cached index in sync with the file
+        if self._index is not None:
+            for cycle, names in entries.items():
+                self._index.add(cycle, names)
+
+    def _scanIndex(self) -> ArchiveIndex:
+        """
+        Build the archive index by scanning the archive directory.
+
+        Returns:
+            ArchiveIndex: The index describing the current content of the archive.
+        """
+        files = self._getFiles(
+            self._archive,
+            self._input_machine,
+            self._archive_format,
+            cycle=None,
+            include_qq_files=True,
+        )
+        return ArchiveIndex.fromFiles((f.name for f in files), self._archive_format)
+
+    def _readIndex(self) -> str | None:
+        """
+        Read the content of the archive index.
+
+        Returns:
+            str | None: The content of the index file or None if it cannot be read.
+        """
+        index_file = self._archive / CFG.archiver.index_file
+        try:
+            if self._isLocal():
+                return index_file.read_text()
+            return self._batch_system.readRemoteFile(self._input_machine, index_file)
+        except (OSError, QQError) as e:
+            logger.debug(f"Could not read the archive index '{index_file}': {e}")
+            return None
+
+    def _loadIndex(self) -> ArchiveIndex | None:
+        """
+        Get the parsed archive index.
+
+        The index is only read and parsed once per `Archiver` instance.
+
+        Returns:
+            ArchiveIndex | None: The archive index or None if it cannot be read.
+        """
+        if self._index is None and (content := self._readIndex()) is not None:
+            self._index = ArchiveIndex.fromString(content)
+
+        return self._index
+
+    def _indexExists(self) -> bool:
+        """
+        Check whether the archive index exists without reading it.
+
+        Returns:
+            bool: True if the index file exists, False otherwise.
+
+        Raises:
+            QQError: If the existence of a remote index cannot be determined.
+        """
+        if self._index is not None:
+            return True
+
+        index_file = self._archive / CFG.archiver.index_file
+        if self._isLocal():
+            return index_file.is_file()
+        return self._batch_system.isRemoteFile(self._input_machine, index_file)
+
+    def _appendIndex(self, content: str) -> None:
+        """
+        Append lines to the archive index.
+
+        The content is appended using a single write into the index opened in append mode,
+        so a concurrent reader may only observe a partially written last line,
+        which is ignored when the index is parsed.
+
+        Args:
+            content (str): Lines to append, each terminated by a newline.
+
+        Raises:
+            QQError: If the index cannot be appended to.
+        """
+        index_file = self._archive / CFG.archiver.index_file
+
+        if self._isLocal():
+            try:
+                append_to_file(index_file, content)
+            except OSError as e:
+                raise QQError(
+                    f"Could not append to the archive index '{index_file}': {e}."
+                ) from e
+        else:
+            self._batch_system.appendRemoteFile(
+                self._input_machine, index_file, content
+            )
+
+    def _writeIndex(self, content: str) -> None:
+        """
+        Atomically replace the archive index.
+
+        The content is written into a temporary file which is then renamed,
+        so that readers never observe a partially written index.
+
+        Args:
+            content (str): The new content of the index file.
+
+        Raises:
+            QQError: If the index cannot be written.
+        """
+        index_file = self._archive / CFG.archiver.index_file
+        tmp_file = self._archive / f"{CFG.archiver.index_file}.{os.getpid()}.tmp"
+
+        if self._isLocal():
+            try:
+                tmp_file.write_text(content)
+                tmp_file.replace(index_file)
+            except OSError as e:
+                tmp_file.unlink(missing_ok=True)
+                raise QQError(
+                    f"Could not write the archive index '{index_file}': {e}."
+                ) from e
+        else:
+            self._batch_system.writeRemoteFile(self._input_machine, tmp_file, content)
+            self._batch_system.moveRemoteFiles(
+                self._input_machine, [tmp_file], [index_file]
+            )
+
+    def _isLocal(self) -> bool:
+        """Check whether the archive is accessible from the current machine."""
+        return self._input_machine == socket.gethostname()
+
     def _getFiles(
         self,
         directory: Path,
@@ -206,22 +576,7 @@ class Archiver:
         Returns:
             list[Path]: A list of absolute paths to matching files.
         """
-        if cycle and is_printf_pattern(pattern):
-            try:
-                # try inserting the loop number into the printf pattern
-                regex = re.compile(f"{pattern % cycle}")
-            except Exception:
-                logger.debug(
-                    f"Ignoring loop number since the provided pattern ('{pattern}') does not support it."
-                )
-                regex = Archiver._prepare_regex_pattern(pattern)
-        else:
-            logger.debug(
-                f"Loop number not specified or the provided pattern ('{pattern}') does not support it."
-            )
-            regex = Archiver._prepare_regex_pattern(pattern)
-
-        logger.debug(f"Regex for matching: {regex}.")
+        regex = Archiver._getStemRegex(pattern, cycle)
 
         # the directory must exist
         if host and host != socket.gethostname():
@@ -247,6 +602,37 @@ class Archiver:
             if regex.search(f.stem) and f.suffix not in CFG.suffixes.all_suffixes
         ]
 
+    @staticmethod
+    def _getStemRegex(pattern: str, cycle: int | None) -> re.Pattern[str]:
+        """
+        Get a regex matching stems of files described by a pattern.
+
+        Args:
+            pattern (str): A printf-style or regex pattern to match file stems.
+            cycle (int | None): Optional cycle number for printf-style patterns.
+                If provided, only stems corresponding to that loop are matched.
+
+        Returns:
+            re.Pattern[str]: Compiled regex pattern that can be used for matching.
+        """
+        if cycle and is_printf_pattern(pattern):
+            try:
+                # try inserting the loop number into the printf pattern
+                regex = re.compile(f"{pattern % cycle}")
+            except Exception:
+                logger.debug(
+                    f"Ignoring loop number since the provided pattern ('{pattern}') does not support it."
+                )
+                regex = Archiver._prepare_regex_pattern(pattern)
+        else:
+            logger.debug(
+                f"Loop number not specified or the provided pattern ('{pattern}') does not support it."
+            )
+            regex = Archiver._prepare_regex_pattern(pattern)
+
+        logger.debug(f"Regex for matching: {regex}.")
+        return regex
+
     @staticmethod
     def _prepare_regex_pattern(pattern: str) -> re.Pattern[str]:
         """
@@ -0,0 +1,109 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+import socket
+import sys
+from pathlib import Path
+from typing import NoReturn
+
+import click
+
+from qq_lib.batch.interface import BatchMeta
+from qq_lib.core.click_format import GNUHelpColorsCommand
+from qq_lib.core.common import get_info_files
+from qq_lib.core.config import CFG
+from qq_lib.core.error import QQError
+from qq_lib.core.logger import get_logger
+from qq_lib.info.informer import Informer
+from qq_lib.properties.loop import LoopInfo
+
+from .archiver import Archiver
+
+logger = get_logger(__name__)
+
+
+@click.command(
+    short_help="Rebuild the index of a loop job archive.",
+    help=f"""Rebuild the content index of a loop job archive.
+
+{click.style("ARCHIVE", fg="green")}   Path to the archive directory. Optional.
+
+qq loop jobs record the files archived in each cycle in an index stored inside the archive.
+If you add files to or remove files from the archive manually, the index no longer describes
+the content of the archive and should be rebuilt using `{CFG.binary_name} reindex`.
+
+If ARCHIVE or the archive format is not specified, they are taken from the newest
+loop job in the current directory.""",
+    cls=GNUHelpColorsCommand,
+    help_options_color="bright_blue",
+)
+@click.argument(
+    "archive",
+    type=str,
+    metavar=click.style("ARCHIVE", fg="green"),
+    required=False,
+    default=None,
+)
+@click.option(
+    "--archive-format",
+    type=str,
+    default=None,
+    help="Filename format of the archived files.",
+)
+def reindex(archive: str | None, archive_format: str | None) -> NoReturn:
+    """
+    Rebuild the content index of a loop job archive.
+    """
+    try:
+        if archive and archive_format:
+            archive_dir, fmt = Path(archive).resolve(), archive_format
+        else:
+            loop_info = _get_loop_info(Path())
+            archive_dir = Path(archive).resolve() if archive else loop_info.archive
+            fmt = archive_format or loop_info.archive_format
+
+        if not archive_dir.is_dir():
+            raise QQError(f"Archive '{archive_dir}' does not exist.")
+
+        archiver = Archiver(
+            archive_dir,
+            fmt,
+            socket.gethostname(),
+            Path().resolve(),
+            BatchMeta.fromEnvVarOrGuess(),
+        )
+        index = archiver.rebuildIndex()
+        logger.info(f"Indexed {len(index)} files from {len(index.getCycles())} cycles.")
+        sys.exit(0)
+    except QQError as e:
+        logger.error(e)
+        sys.exit(CFG.exit_codes.default)
+    except Exception as e:
+        logger.critical(e, exc_info=True, stack_info=True)
+        sys.exit(CFG.exit_codes.unexpected_error)
+
+
+def _get_loop_info(directory: Path) -> LoopInfo:
+    """
+    Get the loop job information of the newest loop job in the directory.
+
+    Args:
+        directory (Path): The directory to search for qq info files.
+
+    Returns:
+        LoopInfo: Loop job information of the newest loop job.
+
+    Raises:
+        QQError: If no loop job is found in the directory.
+    """
+    # info files are sorted from the oldest
+    for info_file in reversed(get_info_files(directory)):
+        try:
+            if loop_info := Informer.fromFile(info_file).info.loop_info:
+                return loop_info
+        except QQError as e:
+            logger.debug(e)
+
+    raise QQError(
+        "No loop job found in the current directory. Specify the archive and its format explicitly."
+    )
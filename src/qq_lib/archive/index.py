@@ -0,0 +1,188 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Content index of loop job archives.
+
+The archive of a long-running loop job accumulates files from thousands of cycles.
+Instead of listing the whole archive and matching every filename against the archive
+format, `Archiver` keeps an index file inside the archive which maps cycle numbers
+to the names of the files archived for them.
+
+The index is a plain text file with one `<cycle>\\t<filename>` entry per line.
+Entries are only ever appended; when the same file is archived again, the entry
+is simply repeated. Lines that cannot be parsed (e.g., a partially written last line)
+are ignored. The index can always be rebuilt from the content of the archive.
+"""
+
+import re
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Self
+
+from qq_lib.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ArchiveIndex:
+    """
+    Mapping of loop cycle numbers to the names of files archived for them.
+    """
+
+    def __init__(self, entries: dict[int, list[str]] | None = None):
+        """
+        Initialize the index.
+
+        Args:
+            entries (dict[int, list[str]] | None): Cycle numbers mapped to filenames.
+        """
+        self._entries: dict[int, list[str]] = {}
+        for cycle, names in (entries or {}).items():
+            self.add(cycle, names)
+
+    @classmethod
+    def fromString(cls, content: str) -> Self:
+        """
+        Load the index from its text representation.
+
+        Args:
+            content (str): The content of the index file.
+
+        Returns:
+            ArchiveIndex: The loaded index.
+        """
+        index = cls()
+        for line in content.splitlines():
+            cycle, _, name = line.partition("\t")
+            if not name or not cycle.isdigit():
+                logger.debug(f"Ignoring malformed archive index entry '{line}'.")
+                continue
+
+            index.add(int(cycle), [name])
+
+        return index
+
+    @classmethod
+    def fromFiles(cls, names: Iterable[str], archive_format: str) -> Self:
+        """
+        Build the index from the names of files in the archive.
+
+        Files which do not match the archive format are not indexed.
+
+        Args:
+            names (Iterable[str]): Names of the files in the archive.
+            archive_format (str): Printf-style pattern describing archived filenames.
+
+        Returns:
+            ArchiveIndex: The index describing the files.
+        """
+        index = cls()
+        for name in names:
+            if (cycle := ArchiveIndex.getCycle(name, archive_format)) is not None:
+                index.add(cycle, [name])
+
+        return index
+
+    def toString(self) -> str:
+        """
+        Get the text representation of the index.
+
+        Returns:
+            str: The content of the index file.
+        """
+        return ArchiveIndex.formatEntries(self._entries)
+
+    def add(self, cycle: int, names: Iterable[str]) -> None:
+        """
+        Record files archived for the specified cycle.
+
+        Args:
+            cycle (int): The cycle number.
+            names (Iterable[str]): Names of the archived files.
+        """
+        indexed = self._entries.setdefault(cycle, [])
+        indexed.extend(name for name in names if name not in indexed)
+
+    def getFiles(self, cycle: int) -> list[str]:
+        """
+        Get the names of files archived for the specified cycle.
+
+        Args:
+            cycle (int): The cycle number.
+
+        Returns:
+            list[str]: Names of the archived files. Empty if the cycle is not indexed.
+        """
+        return list(self._entries.get(cycle, []))
+
+    def getCycles(self) -> list[int]:
+        """
+        Get all indexed cycle numbers.
+
+        Returns:
+            list[int]: Sorted cycle numbers.
+        """
+        return sorted(self._entries)
+
+    def __len__(self) -> int:
+        """Get the total number of indexed files."""
+        return sum(len(names) for names in self._entries.values())
+
+    @staticmethod
+    def formatEntries(entries: dict[int, list[str]]) -> str:
+        """
+        Convert entries into lines of the index file.
+
+        Args:
+            entries (dict[int, list[str]]): Cycle numbers mapped to filenames.
+
+        Returns:
+            str: Lines of the index file, each terminated by a newline.
+        """
+        return "".join(
+            f"{cycle}\t{name}\n" for cycle in sorted(entries) for name in entries[cycle]
+        )
+
+    @staticmethod
+    def getCycle(name: str, archive_format: str) -> int | None:
+        """
+        Determine the cycle number of an archived file from its name.
+
+        Args:
+            name (str): Name of the archived file.
+            archive_format (str): Printf-style pattern describing archived filenames.
+
+        Returns:
+            int | None: The cycle number or None if the name does not match the pattern.
+        """
+        if not (
+            match := ArchiveIndex._compileFormat(archive_format).search(Path(name).stem)
+        ):
+            return None
+
+        return int(match.group(1))
+
+    @staticmethod
+    def _compileFormat(archive_format: str) -> re.Pattern[str]:
+        """
+        Convert a printf-style pattern into a regex capturing the cycle number.
+
+        The cycle number corresponds to the first numeric placeholder of the pattern.
+
+        Args:
+            archive_format (str): Printf-style pattern describing archived filenames.
+
+        Returns:
+            re.Pattern[str]: Compiled regex with the cycle number in the first group.
+        """
+        # the first placeholder is captured, the remaining ones are matched
+        # the same way as in `printf_to_regex`
+        regex = re.sub(
+            r"%0(\d+)d|%d",
+            lambda m: rf"(\d{{{m.group(1)}}})" if m.group(1) else r"(\d+)",
+            re.escape(archive_format),
+            count=1,
+        )
+        regex = re.sub(r"%0(\d+)d", r"\\d{\1}", regex)
+        return re.compile(re.sub(r"%d", r"\\d+", regex))
@@ -0,0 +1,171 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Per-cycle bundles of archived files.
+
+Storing every file produced by a loop job in the archive quickly exhausts inode
+quotas of shared filesystems and slows down every listing of the archive.
+In the packed archive mode, `Archiver` stores the files of each cycle
+as a single (optionally compressed) tar bundle created by `Packer`.
+
+Bundles are written and read as streams, so that files can be extracted
+from a bundle without seeking and only the requested members are written to disk.
+"""
+
+import gzip
+import lzma
+import tarfile
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import IO
+
+from qq_lib.core.common import load_zstd
+from qq_lib.core.error import QQError
+from qq_lib.core.logger import get_logger
+
+logger = get_logger(__name__, show_time=True)
+
+
+class Packer:
+    """
+    Creates and extracts tar bundles of archived files.
+    """
+
+    # supported pack formats mapped to the suffixes of the bundles
+    FORMATS: dict[str, str] = {
+        "tar": ".tar",
+        "gz": ".tar.gz",
+        "xz": ".tar.xz",
+        "zst": ".tar.zst",
+    }
+
+    def __init__(self, pack: str):
+        """
+        Initialize the packer.
+
+        Args:
+            pack (str): The pack format. One of `Packer.FORMATS`.
+
+        Raises:
+            QQError: If the pack format is not supported.
+        """
+        if pack not in Packer.FORMATS:
+            raise QQError(
+                f"Unsupported pack format '{pack}'. Supported formats: {', '.join(Packer.FORMATS)}."
+            )
+
+        self._pack = pack
+
+    @property
+    def suffix(self) -> str:
+        """Suffix of the bundles created by this packer."""
+        return Packer.FORMATS[self._pack]
+
+    def isBundle(self, file: Path) -> bool:
+        """
+        Check whether a file is a bundle created by this packer.
+
+        Args:
+            file (Path): Path to the file.
+
+        Returns:
+            bool: True if the file has the suffix of the bundles, else False.
+        """
+        return file.name.endswith(self.suffix)
+
+    def pack(self, files: Iterable[Path], bundle: Path) -> None:
+        """
+        Pack files into a bundle.
+
+        Files are stored under their names, without the leading directories.
+        Directories are packed recursively.
+
+        Args:
+            files (Iterable[Path]): Files to pack.
+            bundle (Path): Path of the bundle to create.
+
+        Raises:
+            QQError: If the bundle cannot be created.
+        """
+        logger.debug(f"Packing files into '{bundle}'.")
+        try:
+            with (
+                self._open(bundle, "wb") as stream,
+                tarfile.open(fileobj=stream, mode="w|") as tar,
+            ):
+                for file in files:
+                    tar.add(file, arcname=file.name)
+        except Exception as e:
+            bundle.unlink(missing_ok=True)
+            raise QQError(f"Could not create bundle '{bundle}': {e}.") from e
+
+    def extract(
+        self, bundle: Path, directory: Path, select: Callable[[str], bool]
+    ) -> list[str]:
+        """
+        Extract selected members of a bundle into a directory.
+
+        The bundle is read sequentially and members that are not selected are skipped
+        without being written to disk. Members with unsafe paths are refused.
+
+        Args:
+            bundle (Path): Path to the bundle.
+            directory (Path): Directory into which the members are extracted.
+            select (Callable[[str], bool]): Callable receiving the name of a top-level
+                member and returning True if the member should be extracted.
+                Nested members are extracted together with their top-level directory.
+
+        Returns:
+            list[str]: Names of the extracted top-level members.
+
+        Raises:
+            QQError: If the bundle cannot be read or a member cannot be extracted.
+        """
+        logger.debug(f"Extracting files from '{bundle}' into '{directory}'.")
+        extracted = []
+        try:
+            with (
+                self._open(bundle, "rb") as stream,
+                tarfile.open(fileobj=stream, mode="r|") as tar,
+            ):
+                for member in tar:
+                    top = member.name.split("/", maxsplit=1)[0]
+                    if not select(top):
+                        continue
+
+                    tar.extract(member, directory, filter="data")
+                    if top not in extracted:
+                        extracted.append(top)
+        except Exception as e:
+            raise QQError(f"Could not extract bundle '{bundle}': {e}.") from e
+
+        return extracted
+
+    def _open(self, bundle: Path, mode: str) -> IO[bytes]:
+        """
+        Open a bundle as a (de)compressed binary stream.
+
+        Args:
+            bundle (Path): Path to the bundle.
+            mode (str): Either "rb" or "wb".
+
+        Returns:
+            IO[bytes]: The opened stream.
+
+        Raises:
+            QQError: If the compression required by the pack format is not available.
+        """
+        match self._pack:
+            case "gz":
+                return gzip.open(bundle, mode)
+            case "xz":
+                return lzma.open(bundle, mode)
+            case "zst":
+                if not (zstd := load_zstd()):
+                    raise QQError(
+                        "Zstandard compression is not available. Install the 'zstandard' package or use a different pack format."
+                    )
+                return zstd.open(bundle, mode)
+            case _:
+                return bundle.open(mode)
@@ -5,6 +5,8 @@
 import socket
 import subprocess
 from abc import ABC
+from collections.abc import Iterable
+from datetime import datetime
 from pathlib import Path
 
 from qq_lib.core.common import convert_absolute_to_relative
@@ -13,6 +15,7 @@ from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
 from qq_lib.properties.depend import Depend
 from qq_lib.properties.resources import Resources
+from qq_lib.properties.size import Size
 
 from .job import BatchJobInterface
 from .node import BatchNodeInterface
@@ -99,6 +102,51 @@ class BatchInterface[
             f"createWorkDirOnScratch method is not implemented for {cls.__name__}"
         )
 
+    @classmethod
+    def getInputCacheDir(cls, work_dir: Path) -> Path:
+        """
+        Get the directory in which explicitly included input files are cached on the node.
+
+        The cache directory must be located on the same filesystem as the working directory
+        and must not be removed together with it.
+
+        Default behavior:
+            - The cache directory is created next to the working directory.
+
+        Args:
+            work_dir (Path): The working directory of the job.
+
+        Returns:
+            Path: Path to the cache directory.
+        """
+        return work_dir.parent / CFG.input_cache.directory
+
+    @classmethod
+    def getPrestageDir(cls, job_id: str, user: str, work_dir_type: str) -> Path | None:
+        """
+        Get the node-local directory into which input data of a queued job can be pre-staged.
+
+        The directory must be located on the same filesystem as the future working directory
+        of the job so that the pre-staged data can be moved into it.
+
+        Default behavior:
+            - Pre-staging is not supported and None is returned.
+
+        Args:
+            job_id (str): Identifier of the job.
+            user (str): Name of the user who submitted the job.
+            work_dir_type (str): Type of the working directory requested by the job.
+
+        Returns:
+            Path | None: Path to the directory on the execution node
+            or None if pre-staging is not supported for this type of working directory.
+        """
+        # pre-staging is not supported by default
+        _ = job_id
+        _ = user
+        _ = work_dir_type
+        return None
+
     @classmethod
     def jobSubmit(
         cls,
@@ -109,20 +157,27 @@ class BatchInterface[
         depend: list[Depend],
         env_vars: dict[str, str],
         account: str | None = None,
+        start_time: datetime | None = None,
     ) -> str:
         """
         Submit a job to the batch system.
 
         Can also perform additional validation of the job's resources.
 
+        The submission command must be executed in the directory containing the script
+        without changing the working directory of the current process, so that
+        multiple jobs can be submitted concurrently.
+
         Args:
             res (Resources): Resources required for the job.
             queue (str): Target queue for the job submission.
-            script (Path): Path to the script to execute.
+            script (Path): Absolute path to the script to execute.
             job_name (str): Name of the job to use.
             depend (list[Depend]): List of job dependencies.
             env_vars (dict[str, str]): Dictionary of environment variables to propagate to the job.
             account (str | None): Optional account name to use for the job.
+            start_time (datetime | None): Optional time before which the job must not start.
+                The job is queued immediately.
 
         Returns:
             str: Unique ID of the submitted job.
@@ -134,6 +189,80 @@ class BatchInterface[
             f"jobSubmit method is not implemented for {cls.__name__}"
         )
 
+    @classmethod
+    def jobSubmitArray(
+        cls,
+        res: Resources,
+        queue: str,
+        script: Path,
+        job_name: str,
+        depend: list[Depend],
+        env_vars: dict[str, str],
+        array_dir: Path,
+        array_size: int,
+        account: str | None = None,
+    ) -> str:
+        """
+        Submit an array job to the batch system.
+
+        All members of the array run the same script with the same resources
+        and environment variables. The members are indexed from zero.
+
+        The submission command must be executed in the array directory
+        without changing the working directory of the current process.
+
+        Args:
+            res (Resources): Resources required for each member of the array.
+            queue (str): Target queue for the job submission.
+            script (Path): Absolute path to the script to execute.
+            job_name (str): Name of the array job.
+            depend (list[Depend]): List of job dependencies.
+            env_vars (dict[str, str]): Dictionary of environment variables to propagate to the members.
+            array_dir (Path): Directory from which the array is submitted.
+                Output of the batch system for the individual members is written into this directory.
+            array_size (int): Number of members of the array.
+            account (str | None): Optional account name to use for the job.
+
+        Returns:
+            str: Unique ID of the submitted array job.
+
+        Raises:
+            QQError: If the job submission fails.
+        """
+        raise NotImplementedError(
+            f"jobSubmitArray method is not implemented for {cls.__name__}"
+        )
+
+    @classmethod
+    def getArrayIndex(cls) -> int | None:
+        """
+        Get the array index of the current job from the corresponding batch system's environment variable.
+
+        For this method to work, it has to be called from the inside of an active job.
+
+        Returns:
+            int | None: Array index of the job or None if the job is not a member of an array.
+        """
+        raise NotImplementedError(
+            f"getArrayIndex method is not implemented for {cls.__name__}"
+        )
+
+    @classmethod
+    def getArrayMemberId(cls, array_id: str, index: int) -> str:
+        """
+        Get the ID of a member of an array job.
+
+        Args:
+            array_id (str): ID of the array job as returned by `jobSubmitArray`.
+            index (int): Array index of the member.
+
+        Returns:
+            str: ID of the member.
+        """
+        raise NotImplementedError(
+            f"getArrayMemberId method is not implemented for {cls.__name__}"
+        )
+
     @classmethod
     def jobKill(cls, job_id: str) -> None:
         """
@@ -183,7 +312,9 @@ class BatchInterface[
         )
 
     @classmethod
-    def getUnfinishedBatchJobs(cls, user: str) -> list[TBatchJob]:
+    def getUnfinishedBatchJobs(
+        cls, user: str, columns: Iterable[str] | None = None
+    ) -> list[TBatchJob]:
         """
         Retrieve information about all unfinished jobs submitted by `user`.
 
@@ -191,6 +322,9 @@ class BatchInterface[
 
         Args:
             user (str): Username for which to fetch unfinished jobs.
+            columns (Iterable[str] | None): Headers of the columns of the jobs presenter
+                that will be shown. The batch system may skip fetching information
+                not needed for these columns. Defaults to all information.
 
         Returns:
             list[TBatchJob]: A list of job info objects representing the user's unfinished jobs.
@@ -200,7 +334,9 @@ class BatchInterface[
         )
 
     @classmethod
-    def getBatchJobs(cls, user: str) -> list[TBatchJob]:
+    def getBatchJobs(
+        cls, user: str, columns: Iterable[str] | None = None
+    ) -> list[TBatchJob]:
         """
         Retrieve information about all jobs submitted by a specific user (including finished jobs).
 
@@ -208,6 +344,9 @@ class BatchInterface[
 
         Args:
             user (str): Username for which to fetch all jobs.
+            columns (Iterable[str] | None): Headers of the columns of the jobs presenter
+                that will be shown. The batch system may skip fetching information
+                not needed for these columns. Defaults to all information.
 
         Returns:
             list[TBatchJob]: A list of job info objects representing all jobs of the user.
@@ -217,12 +356,19 @@ class BatchInterface[
         )
 
     @classmethod
-    def getAllUnfinishedBatchJobs(cls) -> list[TBatchJob]:
+    def getAllUnfinishedBatchJobs(
+        cls, columns: Iterable[str] | None = None
+    ) -> list[TBatchJob]:
         """
         Retrieve information about unfinished jobs of all users.
 
         The jobs can be returned in arbitrary order.
 
+        Args:
+            columns (Iterable[str] | None): Headers of the columns of the jobs presenter
+                that will be shown. The batch system may skip fetching information
+                not needed for these columns. Defaults to all information.
+
         Returns:
             list[TBatchJob]: A list of job info objects representing unfinished jobs of all users.
         """
@@ -231,12 +377,17 @@ class BatchInterface[
         )
 
     @classmethod
-    def getAllBatchJobs(cls) -> list[TBatchJob]:
+    def getAllBatchJobs(cls, columns: Iterable[str] | None = None) -> list[TBatchJob]:
         """
         Retrieve information about all jobs of all users.
 
         The jobs can be returned in arbitrary order.
 
+        Args:
+            columns (Iterable[str] | None): Headers of the columns of the jobs presenter
+                that will be shown. The batch system may skip fetching information
+                not needed for these columns. Defaults to all information.
+
         Returns:
             list[TBatchJob]: A list of job info objects representing all jobs of all users.
         """
@@ -369,6 +520,54 @@ class BatchInterface[
             )
         return result.stdout
 
+    @classmethod
+    def readRemoteFiles(cls, host: str, files: list[Path]) -> list[str | None]:
+        """
+        Read the contents of multiple files on a remote host using a single connection.
+
+        The default implementation uses SSH to retrieve the contents of all files at once.
+        Note that the timeout for the SSH connection is set to `CFG.timeouts.ssh` seconds.
+
+        Subclasses should override this method to provide a more efficient implementation
+        if possible.
+
+        Args:
+            host (str): The hostname of the remote machine where the files reside.
+            files (list[Path]): Paths to the files on the remote host.
+
+        Returns:
+            list[str | None]: The contents of the files in the same order as `files`.
+                None for files that do not exist.
+
+        Raises:
+            QQError: If any existing file cannot be read or SSH fails.
+        """
+        # each file is prefixed with a flag marking whether it exists and terminated by NUL
+        command = "; ".join(
+            f"if [ -f {file} ]; then printf 1; cat {file} || exit 1; else printf 0; fi; printf '\\0'"
+            for file in files
+        )
+        result = subprocess.run(
+            [
+                "ssh",
+                "-o PasswordAuthentication=no",
+                "-o GSSAPIAuthentication=yes",
+                f"-o ConnectTimeout={CFG.timeouts.ssh}",
+                "-q",  # suppress some SSH messages
+                host,
+                command,
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        parts = result.stdout.split("\0")[: len(files)]
+        if result.returncode != 0 or len(parts) != len(files):
+            raise QQError(
+                f"Could not read remote files '{', '.join(str(f) for f in files)}' on '{host}': {result.stderr.strip()}."
+            )
+        return [part[1:] if part.startswith("1") else None for part in parts]
+
     @classmethod
     def writeRemoteFile(cls, host: str, file: Path, content: str) -> None:
         """
@@ -409,6 +608,86 @@ class BatchInterface[
                 f"Could not write to remote file '{file}' on '{host}': {result.stderr.strip()}."
             )
 
+    @classmethod
+    def appendRemoteFile(cls, host: str, file: Path, content: str) -> None:
+        """
+        Append the given content to a file on a remote host, creating it if it does not exist.
+
+        The default implementation uses SSH to append the content to the remote file.
+        Note that the timeout for the SSH connection is set to `CFG.timeouts.ssh` seconds.
+
+        Subclasses should override this method to provide a more efficient implementation
+        if possible.
+
+        Args:
+            host (str): The hostname of the remote machine where the file resides.
+            file (Path): The path to the file on the remote host.
+            content (str): The content to append to the remote file.
+
+        Raises:
+            QQError: If the file cannot be written or SSH fails.
+        """
+
+        result = subprocess.run(
+            [
+                "ssh",
+                "-o PasswordAuthentication=no",
+                "-o GSSAPIAuthentication=yes",
+                f"-o ConnectTimeout={CFG.timeouts.ssh}",
+                host,
+                f"cat >> {file}",
+            ],
+            input=content,
+            capture_output=True,
+            text=True,
+        )
+
+        if result.returncode != 0:
+            raise QQError(
+                f"Could not append to remote file '{file}' on '{host}': {result.stderr.strip()}."
+            )
+
+    @classmethod
+    def isRemoteFile(cls, host: str, file: Path) -> bool:
+        """
+        Check whether a regular file exists on a remote host.
+
+        The default implementation uses SSH to run `test -f` on the remote host.
+        Note that the timeout for the SSH connection is set to `CFG.timeouts.ssh` seconds.
+
+        Subclasses should override this method to provide a more efficient implementation
+        if possible.
+
+        Args:
+            host (str): The hostname of the remote machine where the file resides.
+            file (Path): The path to the file on the remote host.
+
+        Returns:
+            bool: True if the file exists, False otherwise.
+
+        Raises:
+            QQError: If the SSH connection fails.
+        """
+        result = subprocess.run(
+            [
+                "ssh",
+                "-o PasswordAuthentication=no",
+                "-o GSSAPIAuthentication=yes",
+                f"-o ConnectTimeout={CFG.timeouts.ssh}",
+                "-q",  # suppress some SSH messages
+                host,
+                f"test -f {file}",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        if result.returncode == cls._SSH_FAIL:
+            raise QQError(
+                f"Could not check remote file '{file}' on '{host}': Could not connect to host."
+            )
+        return result.returncode == 0
+
     @classmethod
     def makeRemoteDir(cls, host: str, directory: Path) -> None:
         """
@@ -584,13 +863,15 @@ class BatchInterface[
         src_host: str | None,
         dest_host: str | None,
         exclude_files: list[Path] | None = None,
+        delete: bool = False,
     ) -> None:
         """
         Synchronize the contents of two directories using rsync, optionally across remote hosts,
         while excluding specified files or subdirectories.
 
         All files and directories in `src_dir` are copied to `dest_dir` except
-        those listed in `exclude_files`. Files are never removed from the destination.
+        those listed in `exclude_files`. Files are removed from the destination
+        only if `delete` is set.
 
         Args:
             src_dir (Path): Source directory to sync from.
@@ -601,6 +882,8 @@ class BatchInterface[
                 None if the destination is local.
             exclude_files (list[Path] | None): Optional list of absolute file paths to exclude from syncing.
                 These will be converted to paths relative to `src_dir`.
+            delete (bool): Remove files that are not present in `src_dir` from `dest_dir`.
+                Excluded files are never removed.
 
         Raises:
             QQError: If the rsync command fails for any reason or timeouts.
@@ -613,7 +896,7 @@ class BatchInterface[
         )
 
         command = cls._translateRsyncExcludedCommand(
-            src_dir, dest_dir, src_host, dest_host, relative_excluded
+            src_dir, dest_dir, src_host, dest_host, relative_excluded, delete
         )
         logger.debug(f"Rsync command: {command}.")
 
@@ -627,6 +910,7 @@ class BatchInterface[
         src_host: str | None,
         dest_host: str | None,
         include_files: list[Path] | None = None,
+        timeout: float | None = None,
     ) -> None:
         """
         Synchronize only the explicitly selected files and directories from the source
@@ -645,6 +929,8 @@ class BatchInterface[
             include_files (list[Path] | None): Optional list of absolute file paths to include in syncing.
                 These paths are converted relative to `src_dir`.
                 This argument is optional only for consistency with syncWithExclusions.
+            timeout (float | None): Optional maximal duration of the transfer in seconds.
+                If None, `CFG.timeouts.rsync` is used.
 
         Raises:
             QQError: If the rsync command fails or times out.
@@ -661,7 +947,7 @@ class BatchInterface[
         )
         logger.debug(f"Rsync command: {command}.")
 
-        cls._runRsync(src_dir, dest_dir, src_host, dest_host, command)
+        cls._runRsync(src_dir, dest_dir, src_host, dest_host, command, timeout)
 
     @classmethod
     def transformResources(cls, queue: str, provided_resources: Resources) -> Resources:
@@ -687,6 +973,34 @@ class BatchInterface[
             f"transformResources method is not implemented for {cls.__name__}"
         )
 
+    @classmethod
+    def selectWorkDir(
+        cls, queue: str, provided_resources: Resources, input_size: Size
+    ) -> Resources:
+        """
+        Select the type and size of the working directory for a job submitted with work-dir='auto'.
+
+        The original `provided_resources` object is not modified.
+
+        Args:
+            queue (str): The name of the queue the job is submitted to.
+            provided_resources (Resources): The raw resources specified by the user.
+            input_size (Size): Total size of the data copied to the working directory.
+
+        Returns:
+            Resources: A new Resources instance with the selected working directory.
+
+        Raises:
+            QQError: If automatic selection of the working directory is not supported
+                or no working directory is large enough.
+        """
+        _ = queue
+        _ = provided_resources
+        _ = input_size
+        raise QQError(
+            f"Working directory type 'auto' is not supported for {cls.envName()}."
+        )
+
     @classmethod
     def isShared(cls, directory: Path) -> bool:
         """
@@ -882,6 +1196,7 @@ class BatchInterface[
         src_host: str | None,
         dest_host: str | None,
         relative_excluded: list[Path],
+        delete: bool = False,
     ) -> list[str]:
         """
         Build an rsync command to synchronize a directory while excluding specific files.
@@ -900,6 +1215,7 @@ class BatchInterface[
                 None if the destination is local.
             relative_excluded (list[Path]): List of paths relative to `src_dir`
                 to exclude from syncing.
+            delete (bool): Remove files that are not present in `src_dir` from `dest_dir`.
 
         Returns:
             list[str]: List of command arguments for rsync, suitable for `subprocess.run`.
@@ -917,6 +1233,9 @@ class BatchInterface[
             "ssh -o GSSAPIAuthentication=yes -o PasswordAuthentication=no",  # allow Kerberos tickets and never ask for password
             "-rltD",
         ]
+        # excluded files are protected from deletion
+        if delete:
+            command.append("--delete")
         for file in relative_excluded:
             command.extend(["--exclude", str(file)])
 
@@ -963,6 +1282,15 @@ class BatchInterface[
             "ssh -o GSSAPIAuthentication=yes -o PasswordAuthentication=no",  # allow Kerberos tickets and never ask for password
             "-rltD",
         ]
+        # parent directories of nested files must be included, otherwise rsync does not descend into them
+        parents = dict.fromkeys(
+            parent
+            for file in relative_included
+            for parent in reversed(file.parents[:-1])
+        )
+        for parent in parents:
+            command.extend(["--include", f"{str(parent)}/"])
+
         for file in relative_included:
             # if `file` is a file
             command.extend(["--include", str(file)])
@@ -986,6 +1314,7 @@ class BatchInterface[
         src_host: str | None,
         dest_host: str | None,
         command: list[str],
+        timeout: float | None = None,
     ) -> None:
         """
         Execute an rsync command to synchronize files between source and destination.
@@ -1001,21 +1330,24 @@ class BatchInterface[
                 None if the destination is local.
             command (list[str]): List of command-line arguments for rsync, typically
                 generated by `_translateRsyncExcludedCommand` or `_translateRsyncIncludedCommand`.
+            timeout (float | None): Optional maximal duration of the command in seconds.
+                If None, `CFG.timeouts.rsync` is used.
 
         Raises:
             QQError: If the rsync command fails (non-zero exit code) or
-                if the command times out after `CFG.timeouts.rsync` seconds.
+                if the command times out.
         """
         src = f"{src_host}:{str(src_dir)}" if src_host else str(src_dir)
         dest = f"{dest_host}:{str(dest_dir)}" if dest_host else str(dest_dir)
+        timeout = CFG.timeouts.rsync if timeout is None else timeout
 
         try:
             result = subprocess.run(
-                command, capture_output=True, text=True, timeout=CFG.timeouts.rsync
+                command, capture_output=True, text=True, timeout=timeout
             )
         except subprocess.TimeoutExpired as e:
             raise QQError(
-                f"Could not rsync files between '{src}' and '{dest}': Connection timed out after {CFG.timeouts.rsync} seconds."
+                f"Could not rsync files between '{src}' and '{dest}': Connection timed out after {timeout} seconds."
             ) from e
 
         if result.returncode != 0:
@@ -0,0 +1,335 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Columnar inventory of compute nodes.
+
+`NodeInventory` loads the resources of all nodes into columns (one array per
+resource, sizes in kilobytes) and the properties of the nodes into bitsets
+(one integer per property with one bit per node). Finding the nodes able to host
+a job is then a handful of whole-column comparisons combined using bitwise
+operations instead of calling the getters of every node for every resource.
+
+The columns are NumPy arrays if NumPy is installed. Otherwise, they are stored
+using the `array` module from the standard library.
+"""
+
+import math
+import re
+from array import array
+from collections.abc import Sequence
+
+from qq_lib.core.common import equals_normalized, load_numpy
+from qq_lib.core.error import QQError
+from qq_lib.core.logger import get_logger
+from qq_lib.properties.resources import Resources
+from qq_lib.properties.size import Size
+
+from .node import BatchNodeInterface
+
+logger = get_logger(__name__)
+
+
+class NodeInventory:
+    """
+    Resources and properties of compute nodes stored column by column.
+    """
+
+    # columns of the inventory and names of the getters of the corresponding resources
+    _COLUMNS = {
+        "ncpus": "getNCPUs",
+        "free_cpus": "getNFreeCPUs",
+        "ngpus": "getNGPUs",
+        "free_gpus": "getNFreeGPUs",
+        "cpu_mem": "getCPUMemory",
+        "free_cpu_mem": "getFreeCPUMemory",
+        "gpu_mem": "getGPUMemory",
+        "free_gpu_mem": "getFreeGPUMemory",
+        "local_scratch": "getLocalScratch",
+        "free_local_scratch": "getFreeLocalScratch",
+        "ssd_scratch": "getSSDScratch",
+        "free_ssd_scratch": "getFreeSSDScratch",
+        "shared_scratch": "getSharedScratch",
+        "free_shared_scratch": "getFreeSharedScratch",
+    }
+
+    # columns with the free space of the individual types of working directories
+    _WORK_DIR_COLUMNS = {
+        "scratch_local": "free_local_scratch",
+        "scratch_ssd": "free_ssd_scratch",
+        "scratch_shared": "free_shared_scratch",
+        # in-RAM scratch counts towards the memory of the job
+        "scratch_shm": "free_cpu_mem",
+    }
+
+    # resources that can be used in a specification of resources
+    _RESOURCE_KEYS = {
+        "nnodes",
+        "ncpus",
+        "ncpus_per_node",
+        "mem",
+        "mem_per_node",
+        "mem_per_cpu",
+        "ngpus",
+        "ngpus_per_node",
+        "work_dir",
+        "work_size",
+        "work_size_per_node",
+        "work_size_per_cpu",
+    }
+
+    def __init__(self, nodes: list[BatchNodeInterface]):
+        """
+        Load the resources and properties of the nodes into the inventory.
+
+        Resources that are not available for a node are stored as zero.
+
+        Args:
+            nodes (list[BatchNodeInterface]): The nodes to load.
+        """
+        self._nodes = nodes
+        self._numpy = load_numpy()
+
+        values: dict[str, list[int]] = {name: [] for name in NodeInventory._COLUMNS}
+        self._properties: dict[str, int] = {}
+        for i, node in enumerate(nodes):
+            for name, getter in NodeInventory._COLUMNS.items():
+                value = getattr(node, getter)()
+                values[name].append(
+                    value.value if isinstance(value, Size) else value or 0
+                )
+            for prop in node.getProperties():
+                self._properties[prop] = self._properties.get(prop, 0) | (1 << i)
+
+        self._columns = {name: self._toColumn(v) for name, v in values.items()}
+        # bitset with all nodes
+        self._all = (1 << len(nodes)) - 1
+
+        logger.debug(
+            f"Loaded {len(nodes)} nodes into the inventory using {'numpy' if self._numpy else 'array'}."
+        )
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def getColumn(self, name: str) -> Sequence[int]:
+        """
+        Get a column of the inventory.
+
+        Args:
+            name (str): Name of the column, e.g., 'free_cpus' or 'free_local_scratch'.
+
+        Returns:
+            Sequence[int]: Values of the resource for all nodes. Sizes are in kilobytes.
+
+        Raises:
+            QQError: If the column does not exist.
+        """
+        if name not in self._columns:
+            raise QQError(f"Unknown column of the node inventory: '{name}'.")
+        return self._columns[name]
+
+    def getNodes(self, mask: int | None = None) -> list[BatchNodeInterface]:
+        """
+        Get the nodes selected by a bitset.
+
+        Args:
+            mask (int | None): Bitset of the nodes to get. Defaults to all nodes.
+
+        Returns:
+            list[BatchNodeInterface]: The selected nodes in their original order.
+        """
+        if mask is None:
+            return list(self._nodes)
+
+        # bit i of the mask corresponds to the i-th character from the end
+        return [
+            self._nodes[i]
+            for i, bit in enumerate(reversed(bin(mask & self._all)[2:]))
+            if bit == "1"
+        ]
+
+    def atLeast(self, name: str, required: int) -> int:
+        """
+        Select the nodes with at least the required value in a column.
+
+        Args:
+            name (str): Name of the column.
+            required (int): The required value. Sizes are in kilobytes.
+
+        Returns:
+            int: Bitset of the selected nodes.
+        """
+        column = self.getColumn(name)
+        if self._numpy:
+            packed = self._numpy.packbits(column >= required, bitorder="little")
+            return int.from_bytes(packed.tobytes(), "little")
+
+        return int(
+            "".join("1" if v >= required else "0" for v in reversed(column)) or "0", 2
+        )
+
+    def withProperty(self, prop: str) -> int:
+        """
+        Select the nodes with a property.
+
+        Args:
+            prop (str): The property.
+
+        Returns:
+            int: Bitset of the nodes with the property.
+        """
+        return self._properties.get(prop, 0)
+
+    def anyFits(self, name: str, required: int) -> bool:
+        """
+        Check whether any node has at least the required value in a column.
+
+        Args:
+            name (str): Name of the column, e.g., 'free_ssd_scratch'.
+            required (int): The required value. Sizes are in kilobytes.
+
+        Returns:
+            bool: True if at least one node has enough of the resource, else False.
+        """
+        return self.atLeast(name, required) != 0
+
+    def getFitMask(self, resources: Resources) -> int:
+        """
+        Select the nodes on which a part of a job with the given resources can start now.
+
+        Per-node requirements are obtained by dividing the total resources of the job
+        by the number of requested nodes. Properties set to 'true' must be present
+        and properties set to 'false' must be absent. Other property values
+        cannot be checked and are ignored.
+
+        Args:
+            resources (Resources): Resources requested by the job.
+
+        Returns:
+            int: Bitset of the nodes with enough free resources.
+        """
+        mask = self._all
+        for name, required in NodeInventory._getNodeRequirements(resources).items():
+            if required > 0:
+                mask &= self.atLeast(name, required)
+
+        for prop, value in (resources.props or {}).items():
+            if equals_normalized(value, "true"):
+                mask &= self.withProperty(prop)
+            elif equals_normalized(value, "false"):
+                mask &= ~self.withProperty(prop)
+            else:
+                logger.warning(
+                    f"Property '{prop}={value}' cannot be checked and is ignored."
+                )
+
+        return mask & self._all
+
+    def fit(self, resources: Resources) -> list[BatchNodeInterface]:
+        """
+        Get the nodes on which a part of a job with the given resources can start now.
+
+        See `getFitMask` for details.
+
+        Args:
+            resources (Resources): Resources requested by the job.
+
+        Returns:
+            list[BatchNodeInterface]: The candidate nodes.
+        """
+        return self.getNodes(self.getFitMask(resources))
+
+    @staticmethod
+    def parseResources(spec: str) -> Resources:
+        """
+        Parse a specification of resources such as 'ncpus=64,ngpus=2,mem=256gb,cl_cluster'.
+
+        The parts of the specification are separated by commas or whitespace.
+        Parts in the form 'key=value' where key is a resource (e.g., 'ncpus',
+        'mem-per-cpu', or 'work-dir') set the resource. Other parts are properties
+        of the nodes in the same format as in `qq submit --props`.
+
+        Args:
+            spec (str): The specification of resources.
+
+        Returns:
+            Resources: The parsed resources.
+
+        Raises:
+            QQError: If the specification is not valid.
+        """
+        options: dict[str, str] = {}
+        props: list[str] = []
+        for part in filter(None, re.split(r"[,\s]+", spec)):
+            key, _, value = part.partition("=")
+            key = key.replace("-", "_")
+            if value and key in NodeInventory._RESOURCE_KEYS:
+                if key in options:
+                    raise QQError(f"Resource '{key}' is defined multiple times.")
+                options[key] = value
+            else:
+                props.append(part)
+
+        try:
+            return Resources(**options, props=",".join(props) or None)
+        except ValueError as e:
+            raise QQError(f"Invalid specification of resources '{spec}': {e}.") from e
+
+    @staticmethod
+    def _getNodeRequirements(resources: Resources) -> dict[str, int]:
+        """
+        Get the minimal free resources a node must have to host its part of a job.
+
+        Args:
+            resources (Resources): Resources requested by the job.
+
+        Returns:
+            dict[str, int]: Required values mapped to the names of the columns.
+        """
+        nnodes = resources.nnodes or 1
+        ncpus = resources.ncpus_per_node or math.ceil((resources.ncpus or 0) / nnodes)
+        ngpus = resources.ngpus_per_node or math.ceil((resources.ngpus or 0) / nnodes)
+
+        def per_node(
+            total: Size | None, per_node: Size | None, per_cpu: Size | None
+        ) -> int:
+            if per_node:
+                return per_node.value
+            if total:
+                return math.ceil(total.value / nnodes)
+            if per_cpu:
+                return per_cpu.value * ncpus
+            return 0
+
+        requirements = {
+            "free_cpus": ncpus,
+            "free_gpus": ngpus,
+            "free_cpu_mem": per_node(
+                resources.mem, resources.mem_per_node, resources.mem_per_cpu
+            ),
+        }
+
+        if resources.work_dir and (
+            column := next(
+                (
+                    c
+                    for work_dir, c in NodeInventory._WORK_DIR_COLUMNS.items()
+                    if equals_normalized(work_dir, resources.work_dir)
+                ),
+                None,
+            )
+        ):
+            requirements[column] = requirements.get(column, 0) + per_node(
+                resources.work_size,
+                resources.work_size_per_node,
+                resources.work_size_per_cpu,
+            )
+
+        return requirements
+
+    def _toColumn(self, values: list[int]) -> Sequence[int]:
+        """Convert values of a resource into a column."""
+        if self._numpy:
+            return self._numpy.array(values, dtype=self._numpy.int64)
+        return array("q", values)
@@ -2,15 +2,50 @@
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
 
+import functools
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Self
 
+from qq_lib.core.records import RecordValue, to_record_value
 from qq_lib.properties.size import Size
 from qq_lib.properties.states import BatchState
 
 
+def cached_getter[T](getter: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator caching the value returned by a getter of a batch job.
+
+    The value is decoded from the raw job information only on the first call
+    and stored in the `_cache` dictionary of the job. The cache must be reset
+    whenever the raw information of the job changes.
+
+    Args:
+        getter (Callable[..., T]): Method of a job taking no arguments.
+
+    Returns:
+        Callable[..., T]: The caching method.
+    """
+    name = getter.__name__
+
+    @functools.wraps(getter)
+    def wrapper(self) -> T:
+        try:
+            cache = self._cache
+        except AttributeError:
+            cache = self._cache = {}
+
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = getter(self)
+            return value
+
+    return wrapper
+
+
 class BatchJobInterface(ABC):
     """
     Abstract base class for retrieving and maintaining job information
@@ -22,6 +57,32 @@ class BatchJobInterface(ABC):
     be used inside the corresponding implementation of `BatchInterface.getBatchJob`.
     """
 
+    # Fields of the machine-readable record of a job (see `toRecord`).
+    RECORD_FIELDS = [
+        "id",
+        "array_id",
+        "name",
+        "user",
+        "account",
+        "queue",
+        "state",
+        "ncpus",
+        "ngpus",
+        "nnodes",
+        "mem_kb",
+        "walltime_seconds",
+        "submission_time",
+        "start_time",
+        "completion_time",
+        "util_cpu",
+        "util_mem",
+        "exit_code",
+        "nodes",
+        "input_machine",
+        "input_dir",
+        "comment",
+    ]
+
     @abstractmethod
     def isEmpty(self) -> bool:
         """
@@ -330,6 +391,43 @@ class BatchJobInterface(ABC):
         """
         pass
 
+    def toRecord(self) -> dict[str, RecordValue]:
+        """
+        Return information about the job as a flat record with typed fields.
+
+        The record contains the fields listed in `RECORD_FIELDS`. The state is one of
+        the lowercase names of `BatchState`, times are in ISO 8601 format, memory
+        is in kilobytes, walltime is in seconds, and nodes are a list of node names.
+        Missing values are None.
+
+        Returns:
+            dict[str, RecordValue]: The record of the job.
+        """
+        return {
+            "id": self.getId(),
+            "array_id": self.getArrayId(),
+            "name": self.getName(),
+            "user": self.getUser(),
+            "account": self.getAccount(),
+            "queue": self.getQueue(),
+            "state": str(self.getState()),
+            "ncpus": self.getNCPUs(),
+            "ngpus": self.getNGPUs(),
+            "nnodes": self.getNNodes(),
+            "mem_kb": to_record_value(self.getMem()),
+            "walltime_seconds": to_record_value(self.getWalltime()),
+            "submission_time": to_record_value(self.getSubmissionTime()),
+            "start_time": to_record_value(self.getStartTime()),
+            "completion_time": to_record_value(self.getCompletionTime()),
+            "util_cpu": self.getUtilCPU(),
+            "util_mem": self.getUtilMem(),
+            "exit_code": self.getExitCode(),
+            "nodes": to_record_value(self.getNodes()),
+            "input_machine": self.getInputMachine(),
+            "input_dir": to_record_value(self.getInputDir()),
+            "comment": self.getComment(),
+        }
+
     @abstractmethod
     def getSteps(self) -> list[Self]:
         """
@@ -352,3 +450,26 @@ class BatchJobInterface(ABC):
             str | None: Job step index or `None` if this is not a job step.
         """
         pass
+
+    @abstractmethod
+    def getArrayId(self) -> str | None:
+        """
+        Return the identifier of the array job this job belongs to.
+
+        For the array job itself as well as for its members, the identifier
+        of the whole array is returned.
+
+        Returns:
+            str | None: Identifier of the array job or `None` if this job is not part of an array.
+        """
+        pass
+
+    @abstractmethod
+    def getArrayIndex(self) -> int | None:
+        """
+        Return the index of this job inside its array job.
+
+        Returns:
+            int | None: Array index of the job or `None` if this job is not a member of an array.
+        """
+        pass
@@ -0,0 +1,140 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Reverse index of jobs by the nodes they occupy.
+
+`NodeJobIndex` is built from a single list of jobs obtained from the batch system
+(typically from `getAllUnfinishedBatchJobs`) in one pass over the jobs. It answers
+which jobs run on a node and which nodes are held by a user without querying
+the batch system for the individual nodes.
+
+Nodes are identified by their short hostnames (the part before the first dot)
+so that the names of nodes reported for jobs match the names of nodes reported
+by `BatchInterface.getNodes` regardless of whether either includes the domain.
+"""
+
+from collections.abc import Iterable
+
+from qq_lib.core.logger import get_logger
+
+from .job import BatchJobInterface
+
+logger = get_logger(__name__)
+
+
+class NodeJobIndex:
+    """
+    Jobs indexed by the nodes they occupy.
+    """
+
+    # columns of the jobs presenter with the information needed to build the index
+    # (to be passed to the batch system when obtaining the jobs)
+    COLUMNS = frozenset({"User", "Node"})
+
+    def __init__(self, jobs: Iterable[BatchJobInterface]):
+        """
+        Build the index from a list of jobs.
+
+        Jobs without assigned nodes (e.g., queued jobs) are not indexed.
+
+        Args:
+            jobs (Iterable[BatchJobInterface]): The jobs to index.
+        """
+        # node -> jobs running on the node
+        self._jobs: dict[str, list[BatchJobInterface]] = {}
+        # user -> nodes occupied by the jobs of the user
+        self._nodes: dict[str, dict[str, None]] = {}
+
+        n_jobs = 0
+        for job in jobs:
+            # short names of the nodes are used if full names are not available
+            if not (nodes := job.getNodes() or job.getShortNodes()):
+                continue
+
+            n_jobs += 1
+            user = job.getUser() or "?"
+            # a job may be listed multiple times for the same node
+            for node in dict.fromkeys(NodeJobIndex.normalize(n) for n in nodes):
+                self._jobs.setdefault(node, []).append(job)
+                self._nodes.setdefault(user, {})[node] = None
+
+        logger.debug(f"Indexed {n_jobs} jobs on {len(self._jobs)} nodes.")
+
+    def getNodes(self) -> list[str]:
+        """
+        Get the nodes occupied by at least one job.
+
+        Returns:
+            list[str]: Short names of the occupied nodes.
+        """
+        return list(self._jobs)
+
+    def getJobs(self, node: str) -> list[BatchJobInterface]:
+        """
+        Get the jobs running on a node.
+
+        Args:
+            node (str): Name of the node.
+
+        Returns:
+            list[BatchJobInterface]: Jobs running on the node.
+        """
+        return self._jobs.get(NodeJobIndex.normalize(node), [])
+
+    def getUsers(self, node: str) -> dict[str, int]:
+        """
+        Get the users with jobs running on a node.
+
+        Args:
+            node (str): Name of the node.
+
+        Returns:
+            dict[str, int]: Number of jobs running on the node mapped to the users.
+        """
+        users: dict[str, int] = {}
+        for job in self.getJobs(node):
+            user = job.getUser() or "?"
+            users[user] = users.get(user, 0) + 1
+
+        return users
+
+    def getNodesOfUser(self, user: str) -> list[str]:
+        """
+        Get the nodes occupied by the jobs of a user.
+
+        Args:
+            user (str): Name of the user.
+
+        Returns:
+            list[str]: Short names of the nodes occupied by the user.
+        """
+        return list(self._nodes.get(user, {}))
+
+    def formatUsers(self, node: str) -> str:
+        """
+        Get a compact description of the users with jobs running on a node.
+
+        Args:
+            node (str): Name of the node.
+
+        Returns:
+            str: Users with their number of jobs, e.g., 'alice (2), bob'.
+        """
+        return ", ".join(
+            f"{user} ({count})" if count > 1 else user
+            for user, count in self.getUsers(node).items()
+        )
+
+    @staticmethod
+    def normalize(node: str) -> str:
+        """
+        Get the short name of a node.
+
+        Args:
+            node (str): Name of the node, possibly including the domain.
+
+        Returns:
+            str: The name of the node without the domain.
+        """
+        return node.split(".", 1)[0]
@@ -3,6 +3,7 @@
 
 from abc import ABC, abstractmethod
 
+from qq_lib.core.records import RecordValue, to_record_value
 from qq_lib.properties.size import Size
 
 
@@ -14,6 +15,26 @@ class BatchNodeInterface(ABC):
     be used inside the corresponding implementation of `BatchInterface.getNodes`.
     """
 
+    # Fields of the machine-readable record of a node (see `toRecord`).
+    RECORD_FIELDS = [
+        "name",
+        "ncpus",
+        "free_cpus",
+        "ngpus",
+        "free_gpus",
+        "cpu_mem_kb",
+        "free_cpu_mem_kb",
+        "gpu_mem_kb",
+        "free_gpu_mem_kb",
+        "local_scratch_kb",
+        "free_local_scratch_kb",
+        "ssd_scratch_kb",
+        "free_ssd_scratch_kb",
+        "shared_scratch_kb",
+        "free_shared_scratch_kb",
+        "properties",
+    ]
+
     @abstractmethod
     def update(self) -> None:
         """
@@ -197,6 +218,35 @@ class BatchNodeInterface(ABC):
         """
         pass
 
+    def toRecord(self) -> dict[str, RecordValue]:
+        """
+        Return information about the node as a flat record with typed fields.
+
+        The record contains the fields listed in `RECORD_FIELDS`. Sizes are
+        in kilobytes and properties are a list of strings. Missing values are None.
+
+        Returns:
+            dict[str, RecordValue]: The record of the node.
+        """
+        return {
+            "name": self.getName(),
+            "ncpus": self.getNCPUs(),
+            "free_cpus": self.getNFreeCPUs(),
+            "ngpus": self.getNGPUs(),
+            "free_gpus": self.getNFreeGPUs(),
+            "cpu_mem_kb": to_record_value(self.getCPUMemory()),
+            "free_cpu_mem_kb": to_record_value(self.getFreeCPUMemory()),
+            "gpu_mem_kb": to_record_value(self.getGPUMemory()),
+            "free_gpu_mem_kb": to_record_value(self.getFreeGPUMemory()),
+            "local_scratch_kb": to_record_value(self.getLocalScratch()),
+            "free_local_scratch_kb": to_record_value(self.getFreeLocalScratch()),
+            "ssd_scratch_kb": to_record_value(self.getSSDScratch()),
+            "free_ssd_scratch_kb": to_record_value(self.getFreeSSDScratch()),
+            "shared_scratch_kb": to_record_value(self.getSharedScratch()),
+            "free_shared_scratch_kb": to_record_value(self.getFreeSharedScratch()),
+            "properties": to_record_value(self.getProperties()),
+        }
+
     @abstractmethod
     def toYaml(self) -> str:
         """
@@ -4,6 +4,7 @@
 from abc import ABC, abstractmethod
 from datetime import timedelta
 
+from qq_lib.core.records import RecordValue, to_record_value
 from qq_lib.properties.resources import Resources
 
 
@@ -16,6 +17,21 @@ class BatchQueueInterface(ABC):
     be used inside the corresponding implementation of `BatchInterface.getQueues`.
     """
 
+    # Fields of the machine-readable record of a queue (see `toRecord`).
+    RECORD_FIELDS = [
+        "name",
+        "priority",
+        "total_jobs",
+        "running_jobs",
+        "queued_jobs",
+        "other_jobs",
+        "max_walltime_seconds",
+        "max_nnodes",
+        "destinations",
+        "from_route_only",
+        "comment",
+    ]
+
     @abstractmethod
     def update(self) -> None:
         """
@@ -157,6 +173,30 @@ class BatchQueueInterface(ABC):
         """
         pass
 
+    def toRecord(self) -> dict[str, RecordValue]:
+        """
+        Return information about the queue as a flat record with typed fields.
+
+        The record contains the fields listed in `RECORD_FIELDS`. The maximal walltime
+        is in seconds and destinations are a list of queue names. Missing values are None.
+
+        Returns:
+            dict[str, RecordValue]: The record of the queue.
+        """
+        return {
+            "name": self.getName(),
+            "priority": self.getPriority(),
+            "total_jobs": self.getTotalJobs(),
+            "running_jobs": self.getRunningJobs(),
+            "queued_jobs": self.getQueuedJobs(),
+            "other_jobs": self.getOtherJobs(),
+            "max_walltime_seconds": to_record_value(self.getMaxWalltime()),
+            "max_nnodes": self.getMaxNNodes(),
+            "destinations": to_record_value(self.getDestinations()),
+            "from_route_only": self.fromRouteOnly(),
+            "comment": self.getComment(),
+        }
+
     @abstractmethod
     def toYaml(self) -> str:
         """
@@ -10,11 +10,13 @@ from typing import Self
 import yaml
 
 from qq_lib.batch.interface import BatchJobInterface
+from qq_lib.batch.interface.job import cached_getter
 from qq_lib.batch.pbs.common import parse_pbs_dump_to_dictionary
 from qq_lib.core.common import hhmmss_to_duration, load_yaml_dumper
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
+from qq_lib.properties.array import ArrayIndex
 from qq_lib.properties.size import Size
 from qq_lib.properties.states import BatchState
 
@@ -29,10 +31,43 @@ class PBSJob(BatchJobInterface):
     Stores metadata for a single PBS job.
     """
 
+    # array jobs are identified as '<number>[]<suffix>', their members as '<number>[<index>]<suffix>'
+    _ARRAY_ID_REGEX = re.compile(r"^(\d+)\[(\d*)\](.*)$")
+
+    # keys of the job information read by the getters
+    _USED_KEYS = frozenset(
+        {
+            "job_state",
+            "Exit_status",
+            "comment",
+            "estimated.start_time",
+            "estimated.exec_vnode",
+            "exec_host",
+            "exec_host2",
+            "Job_Name",
+            "Job_Owner",
+            "queue",
+            "Resource_List.ncpus",
+            "Resource_List.ngpus",
+            "Resource_List.nodect",
+            "Resource_List.mem",
+            "Resource_List.walltime",
+            "resources_used.cpupercent",
+            "resources_used.mem",
+            "stime",
+            "ctime",
+            "obittime",
+            "mtime",
+            "Submit_Host",
+            "Variable_List",
+        }
+    )
+
     def __init__(self, job_id: str):
         """Query the batch system for information about the job with the specified ID."""
         self._job_id = job_id
         self._info: dict[str, str] = {}
+        self._cache: dict[str, object] = {}
 
         self.update()
 
@@ -67,10 +102,17 @@ class PBSJob(BatchJobInterface):
         else:
             self._info = parse_pbs_dump_to_dictionary(result.stdout)
 
+        self._cache = {}
+
+    @cached_getter
     def getState(self) -> BatchState:
         if not (state := self._info.get("job_state")):
             return BatchState.UNKNOWN
 
+        # array job with at least one running member
+        if state == "B":
+            return BatchState.RUNNING
+
         # if the job is finished and the return code is not zero, return FAILED
         if state == "F":
             exit_code = self.getExitCode()
@@ -107,12 +149,14 @@ class PBSJob(BatchJobInterface):
 
         return (time, " + ".join(vnodes))
 
+    @cached_getter
     def getMainNode(self) -> str | None:
         if raw_node := self._info.get("exec_host2"):
             return PBSJob._cleanNodeName(raw_node.split("+")[0].strip())
 
         return None
 
+    @cached_getter
     def getNodes(self) -> list[str] | None:
         if not (raw_nodes := self._info.get("exec_host2")):
             return None
@@ -123,6 +167,7 @@ class PBSJob(BatchJobInterface):
 
         return nodes
 
+    @cached_getter
     def getShortNodes(self) -> list[str] | None:
         if not (raw_nodes := self._info.get("exec_host")):
             return None
@@ -136,15 +181,19 @@ class PBSJob(BatchJobInterface):
     def getName(self) -> str | None:
         return self._info.get("Job_Name")
 
+    @cached_getter
     def getNCPUs(self) -> int | None:
         return self._getIntProperty("Resource_List.ncpus", "the number of CPUs")
 
+    @cached_getter
     def getNGPUs(self) -> int | None:
         return self._getIntProperty("Resource_List.ngpus", "the number of GPUs")
 
+    @cached_getter
     def getNNodes(self) -> int | None:
         return self._getIntProperty("Resource_List.nodect", "the number of nodes")
 
+    @cached_getter
     def getMem(self) -> Size | None:
         if not (mem := self._info.get("Resource_List.mem")):
             logger.debug(
@@ -158,27 +207,33 @@ class PBSJob(BatchJobInterface):
             logger.warning(f"Could not parse memory for '{self._job_id}': {e}.")
             return None
 
+    @cached_getter
     def getStartTime(self) -> datetime | None:
         return self._getDatetimeProperty("stime", "the job start time")
 
+    @cached_getter
     def getSubmissionTime(self) -> datetime | None:
         return self._getDatetimeProperty("ctime", "the job submission time")
 
+    @cached_getter
     def getCompletionTime(self) -> datetime | None:
         return self._getDatetimeProperty("obittime", "the job completion time")
 
+    @cached_getter
     def getModificationTime(self) -> datetime | None:
         return (
             self._getDatetimeProperty("mtime", "the job modification time")
             or self.getSubmissionTime()
         )
 
+    @cached_getter
     def getUser(self) -> str | None:
         if not (user := self._info.get("Job_Owner")):
             return None
 
         return user.split("@")[0]
 
+    @cached_getter
     def getWalltime(self) -> timedelta | None:
         if not (walltime := self._info.get("Resource_List.walltime")):
             return None
@@ -192,6 +247,7 @@ class PBSJob(BatchJobInterface):
     def getQueue(self) -> str | None:
         return self._info.get("queue")
 
+    @cached_getter
     def getUtilCPU(self) -> int | None:
         if not (util_cpu := self._info.get("resources_used.cpupercent")):
             logger.debug(
@@ -215,6 +271,7 @@ class PBSJob(BatchJobInterface):
             )
             return None
 
+    @cached_getter
     def getUtilMem(self) -> int | None:
         if not (util_mem := self._info.get("resources_used.mem")):
             logger.debug(
@@ -237,6 +294,7 @@ class PBSJob(BatchJobInterface):
             )
             return None
 
+    @cached_getter
     def getExitCode(self) -> int | None:
         if not (exit := self._info.get("Exit_status")):
             return None
@@ -250,6 +308,7 @@ class PBSJob(BatchJobInterface):
     def getInputMachine(self) -> str | None:
         return self._info.get("Submit_Host")
 
+    @cached_getter
     def getInputDir(self) -> Path | None:
         if not (env_vars := self._getEnvVars()):
             logger.debug(
@@ -274,13 +333,17 @@ class PBSJob(BatchJobInterface):
             )
             return None
 
-        if not (info_file := env_vars.get(CFG.env_vars.info_file)):
-            logger.debug(
-                f"Job '{self._job_id}' does not have an assigned qq info file."
-            )
-            return None
+        if info_file := env_vars.get(CFG.env_vars.info_file):
+            return Path(info_file)
+
+        # members of array jobs find their info files in the index of the array
+        if (array_index := env_vars.get(CFG.env_vars.array_index)) and (
+            index := self.getArrayIndex()
+        ) is not None:
+            return ArrayIndex.findInfoFile(Path(array_index), index)
 
-        return Path(info_file)
+        logger.debug(f"Job '{self._job_id}' does not have an assigned qq info file.")
+        return None
 
     def toYaml(self) -> str:
         # we need to add job id to the start of the dictionary
@@ -297,8 +360,24 @@ class PBSJob(BatchJobInterface):
         # no job steps for PBS
         return None
 
+    @cached_getter
+    def getArrayId(self) -> str | None:
+        if not (match := PBSJob._ARRAY_ID_REGEX.match(self._job_id)):
+            return None
+
+        return f"{match.group(1)}[]{match.group(3)}"
+
+    @cached_getter
+    def getArrayIndex(self) -> int | None:
+        if not (match := PBSJob._ARRAY_ID_REGEX.match(self._job_id)) or not match.group(
+            2
+        ):
+            return None
+
+        return int(match.group(2))
+
     @classmethod
-    def fromDict(cls, job_id: str, info: dict[str, str]) -> Self:
+    def fromDict(cls, job_id: str, info: dict[str, str], compact: bool = False) -> Self:
         """
         Construct a new instance of PBSJob from a job ID and a dictionary of job information.
 
@@ -308,19 +387,24 @@ class PBSJob(BatchJobInterface):
         Args:
             job_id (str): The unique identifier of the job.
             info (dict[str, str]): A dictionary containing PBS job metadata as key-value pairs.
+            compact (bool): Keep only the keys read by the getters and only the environment
+                variables used by qq. Reduces the memory of large job listings.
 
         Returns:
             Self: A new instance of PBSJob.
 
         Note:
-            This method does not perform any validation or processing of the provided dictionary.
+            Apart from compacting, this method does not perform any validation
+            or processing of the provided dictionary.
         """
         job_info = cls.__new__(cls)
         job_info._job_id = job_id
-        job_info._info = info
+        job_info._info = PBSJob._compactInfo(info) if compact else info
+        job_info._cache = {}
 
         return job_info
 
+    @cached_getter
     def getIdInt(self) -> int | None:
         """
         Extract the leading numeric portion of the job ID and return it as an integer.
@@ -332,6 +416,7 @@ class PBSJob(BatchJobInterface):
         match = re.match(r"\d+", self.getId())
         return int(match.group()) if match else None
 
+    @cached_getter
     def _getEnvVars(self) -> dict[str, str] | None:
         """
         Retrieve environment variables associated with the job.
@@ -347,6 +432,38 @@ class PBSJob(BatchJobInterface):
             item.split("=", 1) for item in variable_list.split(",") if "=" in item
         )
 
+    @staticmethod
+    def _compactInfo(info: dict[str, str]) -> dict[str, str]:
+        """
+        Drop the job information that is never read by the getters.
+
+        The list of environment variables, which may be several kilobytes long,
+        is reduced to the variables qq reads.
+
+        Args:
+            info (dict[str, str]): Complete information about the job.
+
+        Returns:
+            dict[str, str]: The compacted information.
+        """
+        compacted = {k: v for k, v in info.items() if k in PBSJob._USED_KEYS}
+
+        if variable_list := compacted.get("Variable_List"):
+            used_vars = (
+                "PBS_O_WORKDIR",
+                CFG.env_vars.input_dir,
+                "INF_INPUT_DIR",
+                CFG.env_vars.info_file,
+                CFG.env_vars.array_index,
+            )
+            compacted["Variable_List"] = ",".join(
+                item
+                for item in variable_list.split(",")
+                if item.split("=", 1)[0] in used_vars
+            )
+
+        return compacted
+
     def _getIntProperty(self, property: str, property_name: str) -> int | None:
         """
         Retrieve an integer property value from the job information.
@@ -2,24 +2,30 @@
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
 
+import getpass
+import math
 import os
 import shutil
 import socket
 import subprocess
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 from qq_lib.batch.interface import BatchInterface, BatchMeta
+from qq_lib.batch.interface.inventory import NodeInventory
 from qq_lib.batch.interface.meta import batch_system
 from qq_lib.batch.pbs.common import parse_multi_pbs_dump_to_dictionaries
 from qq_lib.batch.pbs.node import PBSNode
 from qq_lib.batch.pbs.queue import PBSQueue
-from qq_lib.core.common import equals_normalized
+from qq_lib.core.common import append_to_file, equals_normalized
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
 from qq_lib.properties.depend import Depend
 from qq_lib.properties.resources import Resources
+from qq_lib.properties.size import Size
 
 from .job import PBSJob
 
@@ -64,6 +70,22 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
 
         return work_dir
 
+    @classmethod
+    def getInputCacheDir(cls, work_dir: Path) -> Path:
+        # the allocated scratch directory belongs to a single job
+        # (it is at most retained for the next cycle of a loop job),
+        # so the cache shared by all jobs is stored in its parent directory
+        return work_dir.parent.parent / CFG.input_cache.directory
+
+    @classmethod
+    def getPrestageDir(cls, job_id: str, user: str, work_dir_type: str) -> Path | None:
+        for scratch_type, root in CFG.pbs_options.scratch_roots.items():
+            if equals_normalized(scratch_type, work_dir_type):
+                return Path(root) / user / CFG.prestage.directory / job_id
+
+        # shared scratch is not local to the node
+        return None
+
     @classmethod
     def jobSubmit(
         cls,
@@ -74,11 +96,12 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
         depend: list[Depend],
         env_vars: dict[str, str],
         account: str | None = None,
+        start_time: datetime | None = None,
     ) -> str:
         # account unused
         _ = account
 
-        cls._sharedGuard(res, env_vars)
+        cls._sharedGuard(res, env_vars, script.parent)
 
         # set env vars required for Infinity modules
         env_vars.update(cls._collectAMSEnvVars())
@@ -92,25 +115,58 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
             job_name,
             depend,
             env_vars,
+            start_time=start_time,
         )
         logger.debug(command)
 
-        # submit the script
-        result = subprocess.run(
-            ["bash"],
-            input=command,
-            text=True,
-            check=False,
-            capture_output=True,
-            errors="replace",
+        # submit the script from the input directory
+        return cls._runSubmit(command, script, script.parent)
+
+    @classmethod
+    def jobSubmitArray(
+        cls,
+        res: Resources,
+        queue: str,
+        script: Path,
+        job_name: str,
+        depend: list[Depend],
+        env_vars: dict[str, str],
+        array_dir: Path,
+        array_size: int,
+        account: str | None = None,
+    ) -> str:
+        # account unused
+        _ = account
+
+        cls._sharedGuard(res, env_vars, script.parent)
+
+        # set env vars required for Infinity modules
+        env_vars.update(cls._collectAMSEnvVars())
+
+        command = cls._translateSubmit(
+            res,
+            queue,
+            array_dir,
+            str(script),
+            job_name,
+            depend,
+            env_vars,
+            array_size,
         )
+        logger.debug(command)
 
-        if result.returncode != 0:
-            raise QQError(
-                f"Failed to submit script '{str(script)}': {result.stderr.strip()}."
-            )
+        return cls._runSubmit(command, script, array_dir)
 
-        return result.stdout.strip()
+    @classmethod
+    def getArrayIndex(cls) -> int | None:
+        if (index := os.environ.get("PBS_ARRAY_INDEX")) is None:
+            return None
+
+        return int(index)
+
+    @classmethod
+    def getArrayMemberId(cls, array_id: str, index: int) -> str:
+        return array_id.replace("[]", f"[{index}]", 1)
 
     @classmethod
     def jobKill(cls, job_id: str) -> None:
@@ -153,28 +209,34 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
         return PBSJob(job_id)  # ty: ignore[invalid-return-type]
 
     @classmethod
-    def getUnfinishedBatchJobs(cls, user: str) -> list[PBSJob]:
+    def getUnfinishedBatchJobs(
+        cls, user: str, columns: Iterable[str] | None = None
+    ) -> list[PBSJob]:
         command = f"qstat -fwu {user}"
         logger.debug(command)
-        return cls._getBatchJobsUsingCommand(command)
+        return cls._getBatchJobsUsingCommand(command, compact=columns is not None)
 
     @classmethod
-    def getBatchJobs(cls, user: str) -> list[PBSJob]:
+    def getBatchJobs(
+        cls, user: str, columns: Iterable[str] | None = None
+    ) -> list[PBSJob]:
         command = f"qstat -fwxu {user}"
         logger.debug(command)
-        return cls._getBatchJobsUsingCommand(command)
+        return cls._getBatchJobsUsingCommand(command, compact=columns is not None)
 
     @classmethod
-    def getAllUnfinishedBatchJobs(cls) -> list[PBSJob]:
+    def getAllUnfinishedBatchJobs(
+        cls, columns: Iterable[str] | None = None
+    ) -> list[PBSJob]:
         command = "qstat -fw"
         logger.debug(command)
-        return cls._getBatchJobsUsingCommand(command)
+        return cls._getBatchJobsUsingCommand(command, compact=columns is not None)
 
     @classmethod
-    def getAllBatchJobs(cls) -> list[PBSJob]:
+    def getAllBatchJobs(cls, columns: Iterable[str] | None = None) -> list[PBSJob]:
         command = "qstat -fxw"
         logger.debug(command)
-        return cls._getBatchJobsUsingCommand(command)
+        return cls._getBatchJobsUsingCommand(command, compact=columns is not None)
 
     @classmethod
     def getQueues(cls) -> list[PBSQueue]:
@@ -236,6 +298,7 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
             "scratch_shm",
             "input_dir",
             "job_dir",  # same as input_dir
+            "auto",  # selected at submission based on the size of the input data
         ]
 
     @classmethod
@@ -253,6 +316,25 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
             logger.debug(f"Reading a remote file '{file}' on '{host}'.")
             return super().readRemoteFile(host, file)
 
+    @classmethod
+    def readRemoteFiles(cls, host: str, files: list[Path]) -> list[str | None]:
+        if os.environ.get(CFG.env_vars.shared_submit):
+            # files are on shared storage, we can read them directly
+            logger.debug(f"Reading files '{files}' from shared storage.")
+            contents: list[str | None] = []
+            for file in files:
+                try:
+                    contents.append(file.read_text())
+                except FileNotFoundError:
+                    contents.append(None)
+                except Exception as e:
+                    raise QQError(f"Could not read file '{file}': {e}.") from e
+            return contents
+
+        # otherwise, we fall back to the default implementation
+        logger.debug(f"Reading remote files '{files}' on '{host}'.")
+        return super().readRemoteFiles(host, files)
+
     @classmethod
     def writeRemoteFile(cls, host: str, file: Path, content: str) -> None:
         if os.environ.get(CFG.env_vars.shared_submit):
@@ -268,6 +350,31 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
             logger.debug(f"Writing a remote file '{file}' on '{host}'.")
             super().writeRemoteFile(host, file, content)
 
+    @classmethod
+    def appendRemoteFile(cls, host: str, file: Path, content: str) -> None:
+        if os.environ.get(CFG.env_vars.shared_submit):
+            # file is on shared storage, we can append to it directly
+            # this assumes that the method is only used to write files into input_dir
+            logger.debug(f"Appending to a file '{file}' on shared storage.")
+            try:
+                append_to_file(file, content)
+            except Exception as e:
+                raise QQError(f"Could not append to file '{file}': {e}.") from e
+        else:
+            # otherwise, we fall back to the default implementation
+            logger.debug(f"Appending to a remote file '{file}' on '{host}'.")
+            super().appendRemoteFile(host, file, content)
+
+    @classmethod
+    def isRemoteFile(cls, host: str, file: Path) -> bool:
+        if os.environ.get(CFG.env_vars.shared_submit):
+            # file is on shared storage, we can check it directly
+            return file.is_file()
+
+        # otherwise, we fall back to the default implementation
+        logger.debug(f"Checking a remote file '{file}' on '{host}'.")
+        return super().isRemoteFile(host, file)
+
     @classmethod
     def makeRemoteDir(cls, host: str, directory: Path) -> None:
         if os.environ.get(CFG.env_vars.shared_submit):
@@ -341,6 +448,7 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
         src_host: str | None,
         dest_host: str | None,
         exclude_files: list[Path] | None = None,
+        delete: bool = False,
     ) -> None:
         cls._syncDirectories(
             src_dir,
@@ -348,7 +456,7 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
             src_host,
             dest_host,
             exclude_files,
-            super().syncWithExclusions,
+            partial(super().syncWithExclusions, delete=delete),
         )
 
     @classmethod
@@ -359,6 +467,7 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
         src_host: str | None,
         dest_host: str | None,
         include_files: list[Path] | None = None,
+        timeout: float | None = None,
     ) -> None:
         cls._syncDirectories(
             src_dir,
@@ -366,7 +475,7 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
             src_host,
             dest_host,
             include_files,
-            super().syncSelected,
+            partial(super().syncSelected, timeout=timeout),
         )
 
     @classmethod
@@ -434,6 +543,82 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
             f"Unknown working directory type specified: work-dir='{resources.work_dir}'. Supported types for {cls.envName()} are: '{' '.join(cls.getSupportedWorkDirTypes())}'."
         )
 
+    @classmethod
+    def selectWorkDir(
+        cls, queue: str, provided_resources: Resources, input_size: Size
+    ) -> Resources:
+        # the fastest type of scratch is preferred; in-RAM scratch is considered first
+        # but only for small inputs and if a node has enough free memory
+        resources = Resources.mergeResources(
+            provided_resources,
+            PBSQueue(queue).getDefaultResources(),
+            cls._getDefaultServerResources(),
+        )
+        required = max(
+            math.ceil(input_size.value * CFG.pbs_options.auto_work_dir_headroom),
+            Size.fromString(CFG.pbs_options.auto_work_dir_min_size).value,
+            provided_resources.work_size.value if provided_resources.work_size else 0,
+        )
+        # round up to full megabytes
+        work_size = Size(math.ceil(required / 1024), "mb")
+        logger.debug(
+            f"Input data: {input_size}. Required size of the working directory: {work_size}."
+        )
+
+        try:
+            user = getpass.getuser()
+            inventory = NodeInventory(
+                [n for n in cls.getNodes() if n.isAvailableToUser(user)]
+            )
+        except QQError as e:
+            logger.warning(
+                f"Could not get information about nodes: {e} Using 'scratch_local' as the working directory."
+            )
+            return Resources.mergeResources(
+                Resources(work_dir="scratch_local", work_size=work_size),
+                provided_resources,
+            )
+
+        mem = cls._getTotalMemory(resources)
+        if (
+            mem
+            # work-size cannot be requested for in-RAM scratch
+            and not provided_resources.work_size
+            and not provided_resources.work_size_per_node
+            and not provided_resources.work_size_per_cpu
+            and work_size.value
+            <= Size.fromString(CFG.pbs_options.auto_work_dir_shm_max_size).value
+            and inventory.anyFits("free_cpu_mem", mem.value + work_size.value)
+        ):
+            logger.info(
+                f"Selected working directory 'scratch_shm' for {input_size} of input data."
+            )
+            # the in-RAM scratch counts towards the memory of the job
+            return Resources.mergeResources(
+                Resources(
+                    work_dir="scratch_shm", mem=Size(mem.value + work_size.value, "kb")
+                ),
+                provided_resources,
+            )
+
+        for work_dir, column in (
+            ("scratch_ssd", "free_ssd_scratch"),
+            ("scratch_local", "free_local_scratch"),
+            ("scratch_shared", "free_shared_scratch"),
+        ):
+            if inventory.anyFits(column, work_size.value):
+                logger.info(
+                    f"Selected working directory '{work_dir}' of size {work_size} for {input_size} of input data."
+                )
+                return Resources.mergeResources(
+                    Resources(work_dir=work_dir, work_size=work_size),
+                    provided_resources,
+                )
+
+        raise QQError(
+            f"No node has a scratch directory with {work_size} of free space required for {input_size} of input data."
+        )
+
     @classmethod
     def sortJobs(cls, jobs: list[PBSJob]) -> None:
         # jobs with invalid ID get assigned an ID of 0 for sorting => they are sorted to the start
@@ -452,11 +637,46 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
         return Path(scratch_dir)
 
     @classmethod
-    def _sharedGuard(cls, res: Resources, env_vars: dict[str, str]) -> None:
+    def _runSubmit(cls, command: str, script: Path, directory: Path) -> str:
+        """
+        Execute a submission command in the specified directory.
+
+        Args:
+            command (str): The qsub command to execute.
+            script (Path): Path to the submitted script. Used in error messages.
+            directory (Path): Directory from which the job is submitted.
+
+        Returns:
+            str: ID of the submitted job.
+
+        Raises:
+            QQError: If the job submission fails.
+        """
+        result = subprocess.run(
+            ["bash"],
+            input=command,
+            text=True,
+            check=False,
+            capture_output=True,
+            errors="replace",
+            cwd=directory,
+        )
+
+        if result.returncode != 0:
+            raise QQError(
+                f"Failed to submit script '{str(script)}': {result.stderr.strip()}."
+            )
+
+        return result.stdout.strip()
+
+    @classmethod
+    def _sharedGuard(
+        cls, res: Resources, env_vars: dict[str, str], input_dir: Path = Path()
+    ) -> None:
         """
         Ensure correct handling of shared vs. local submission directories.
 
-        If the current working directory is on shared storage, adds the
+        If the submission directory is on shared storage, adds the
         environment variable `SHARED_SUBMIT` to the list of env vars to propagate to the job.
         This environment variable is later used e.g. to select the appropriate data copying method.
 
@@ -466,12 +686,14 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
         Args:
             res (Resources): The job's resource configuration.
             env_vars (dict[str, str]): Dictionary of environment variables to propagate to the job.
+            input_dir (Path): The directory from which the job is submitted.
+                Defaults to the current working directory.
 
         Raises:
             QQError: If the job is set to run directly in the submission
                     directory while submission is from a non-shared filesystem.
         """
-        if cls.isShared(Path()):
+        if cls.isShared(input_dir):
             env_vars[CFG.env_vars.shared_submit] = "true"
         elif not res.usesScratch():
             # if job directory is used as working directory, it must always be shared
@@ -489,6 +711,8 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
         job_name: str,
         depend: list[Depend],
         env_vars: dict[str, str],
+        array_size: int | None = None,
+        start_time: datetime | None = None,
     ) -> str:
         """
         Generate the PBS submission command for a job.
@@ -500,13 +724,24 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
             script (str): Path to the job script.
             job_name (str): Name of the job.
             depend (list[Depend]): List of dependencies of the job.
+            array_size (int | None): Number of members if an array job should be submitted.
+            start_time (datetime | None): Time before which the job must not start.
 
         Returns:
             str: The fully constructed qsub command string.
         """
-        qq_output = str((input_dir / job_name).with_suffix(CFG.suffixes.qq_out))
+        if array_size:
+            # each member of the array writes its own qq output
+            qq_output = str(
+                input_dir / f"{Path(job_name).stem}.^array_index^{CFG.suffixes.qq_out}"
+            )
+        else:
+            qq_output = str((input_dir / job_name).with_suffix(CFG.suffixes.qq_out))
         command = f"qsub -N {job_name} -q {queue} -j eo -e {qq_output} "
 
+        if array_size:
+            command += f"-J 0-{array_size - 1} "
+
         # translate environment variables
         if env_vars:
             command += f"-v {cls._translateEnvVars(env_vars)} "
@@ -540,6 +775,10 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
         if converted_depend := cls._translateDependencies(depend):
             command += f"-W depend={converted_depend} "
 
+        # deferred start ([[CC]YY]MMDDhhmm[.SS] in the local time)
+        if start_time:
+            command += f"-a {start_time.strftime('%Y%m%d%H%M.%S')} "
+
         # add script
         command += script
 
@@ -749,6 +988,25 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
             walltime="1d",
         )
 
+    @staticmethod
+    def _getTotalMemory(resources: Resources) -> Size | None:
+        """
+        Get the total amount of memory requested for a job.
+
+        Args:
+            resources (Resources): Resources of the job including the default resources.
+
+        Returns:
+            Size | None: The total requested memory or None if it cannot be determined.
+        """
+        if resources.mem:
+            return resources.mem
+        if resources.mem_per_node and resources.nnodes:
+            return resources.mem_per_node * resources.nnodes
+        if resources.mem_per_cpu and resources.ncpus:
+            return resources.mem_per_cpu * resources.ncpus
+        return None
+
     @classmethod
     def _translateKillForce(cls, job_id: str) -> str:
         """
@@ -823,12 +1081,16 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
                 )
 
     @classmethod
-    def _getBatchJobsUsingCommand(cls, command: str) -> list[PBSJob]:
+    def _getBatchJobsUsingCommand(
+        cls, command: str, compact: bool = False
+    ) -> list[PBSJob]:
         """
         Execute a shell command to retrieve information about PBS jobs and parse it.
 
         Args:
             command (str): The shell command to execute, typically a PBS query command.
+            compact (bool): Drop the job information that is not read by qq
+                (see `PBSJob.fromDict`). qstat cannot be asked for selected attributes only.
 
         Returns:
             list[PBSJob]: A list of `PBSJob` instances corresponding to the jobs
@@ -857,6 +1119,6 @@ class PBS(BatchInterface[PBSJob, PBSQueue, PBSNode], metaclass=BatchMeta):
         for data, job_id in parse_multi_pbs_dump_to_dictionaries(
             result.stdout.strip(), "Job Id"
         ):
-            jobs.append(PBSJob.fromDict(job_id, data))
+            jobs.append(PBSJob.fromDict(job_id, data, compact))
 
         return jobs
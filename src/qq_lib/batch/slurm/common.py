@@ -1,7 +1,11 @@
 # Released under MIT License.
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
+import re
+from collections.abc import Iterable
 from dataclasses import fields
+from functools import lru_cache
+from itertools import product
 
 from qq_lib.core.common import dhhmmss_to_duration, format_duration_wdhhmmss
 from qq_lib.core.logger import get_logger
@@ -15,6 +19,30 @@ SACCT_FIELDS = "JobID,Account,State,User,JobName,Partition,WorkDir,AllocCPUs,Req
 # fields requested in sacct for job steps
 SACCT_STEP_FIELDS = "JobID,State,Start,End"
 
+# fields requested in sacct for every job, regardless of the columns shown by the jobs presenter
+# (identification and state of the job and resources collected for statistics)
+SACCT_REQUIRED_FIELDS = {
+    "JobID",
+    "State",
+    "Reason",
+    "AllocCPUs",
+    "ReqCPUs",
+    "AllocTRES",
+    "ReqTRES",
+    "AllocNodes",
+    "ReqNodes",
+}
+
+# additional fields requested in sacct for the individual columns of the jobs presenter
+SACCT_COLUMN_FIELDS = {
+    "User": {"User"},
+    "Job Name": {"JobName"},
+    "Queue": {"Partition"},
+    "Times": {"Submit", "Start", "End", "TimeLimit"},
+    "Node": {"NodeList"},
+    "Exit": {"ExitCode"},
+}
+
 
 def parse_slurm_dump_to_dictionary(
     text: str, separator: str | None = None
@@ -38,6 +66,96 @@ def parse_slurm_dump_to_dictionary(
     return result
 
 
+def sacct_fields_for_columns(columns: Iterable[str] | None) -> str:
+    """
+    Get the fields to request in sacct to show the specified columns of the jobs presenter.
+
+    Args:
+        columns (Iterable[str] | None): Headers of the shown columns.
+            If None, all fields are requested.
+
+    Returns:
+        str: Comma-separated sacct fields in the order of `SACCT_FIELDS`.
+    """
+    if columns is None:
+        return SACCT_FIELDS
+
+    required = SACCT_REQUIRED_FIELDS.union(
+        *(SACCT_COLUMN_FIELDS.get(column, set()) for column in columns)
+    )
+    return ",".join(f for f in SACCT_FIELDS.split(",") if f in required)
+
+
+@lru_cache(maxsize=4096)
+def expand_node_list(compact: str) -> tuple[str, ...] | None:
+    """
+    Expand a compact Slurm node list expression into individual hostnames.
+
+    Supports comma-separated lists of hostnames with any number of bracketed
+    ranges, e.g., 'node[01-03,07],gpu1' or 'rack[1-2]-node[1-2]'. Zero-padding
+    of the range bounds is preserved. Results are memoized since many jobs
+    share the same node lists.
+
+    Args:
+        compact (str): The compact node list expression.
+
+    Returns:
+        tuple[str, ...] | None: The expanded hostnames or None
+        if the expression could not be parsed.
+    """
+    # split on commas outside of brackets
+    expressions, depth, start = [], 0, 0
+    for i, char in enumerate(compact):
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            expressions.append(compact[start:i])
+            start = i + 1
+        if depth not in (0, 1):
+            return None
+    if depth != 0:
+        return None
+    expressions.append(compact[start:])
+
+    hostnames: list[str] = []
+    for expression in expressions:
+        # literal parts are at even positions, contents of brackets at odd positions
+        parts = re.split(r"\[([^\[\]]*)\]", expression)
+        if not expression or any("[" in p or "]" in p for p in parts[::2]):
+            return None
+
+        choices: list[list[str]] = []
+        for i, part in enumerate(parts):
+            if i % 2 == 0:
+                choices.append([part])
+            elif (expanded := _expand_range(part)) is None:
+                return None
+            else:
+                choices.append(expanded)
+
+        hostnames.extend("".join(p) for p in product(*choices))
+
+    return tuple(hostnames)
+
+
+def _expand_range(spec: str) -> list[str] | None:
+    """Expand the contents of brackets in a Slurm node list, e.g., '01-03,07'."""
+    values = []
+    for item in spec.split(","):
+        first, _, last = item.partition("-")
+        if not first.isdigit() or (last and not last.isdigit()):
+            return None
+        if last and int(last) < int(first):
+            return None
+        values.extend(
+            str(n).zfill(len(first)) for n in range(int(first), int(last or first) + 1)
+        )
+
+    return values
+
+
 def default_resources_from_dict(res: dict[str, str]) -> Resources:
     """
     Extract and convert default resource settings from a parsed Slurm info dump.
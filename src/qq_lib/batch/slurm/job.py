@@ -9,15 +9,21 @@ from typing import Self
 
 import yaml
 
-from qq_lib.batch.interface.job import BatchJobInterface
+from qq_lib.batch.interface.job import BatchJobInterface, cached_getter
 from qq_lib.core.common import dhhmmss_to_duration, load_yaml_dumper
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
+from qq_lib.properties.array import ArrayIndex
 from qq_lib.properties.size import Size
 from qq_lib.properties.states import BatchState
 
-from .common import SACCT_FIELDS, SACCT_STEP_FIELDS, parse_slurm_dump_to_dictionary
+from .common import (
+    SACCT_FIELDS,
+    SACCT_STEP_FIELDS,
+    expand_node_list,
+    parse_slurm_dump_to_dictionary,
+)
 
 logger = get_logger(__name__)
 
@@ -30,6 +36,10 @@ class SlurmJob(BatchJobInterface):
     Stores metadata for a single Slurm job.
     """
 
+    # members of array jobs are identified as '<array id>_<index>',
+    # pending members may be listed together as '<array id>_[<indices>]'
+    _ARRAY_ID_REGEX = re.compile(r"^(\d+)_(\d+|\[.*\])$")
+
     # converts from Slurm state names to qq BatchStates
     _STATE_CONVERTER: dict[str, BatchState] = {
         "BOOT_FAIL": BatchState.FAILED,
@@ -46,12 +56,58 @@ class SlurmJob(BatchJobInterface):
         "TIMEOUT": BatchState.FAILED,
     }
 
-    def __init__(self, job_id: str):
-        """Query the batch system for information about the job with the specified ID."""
+    # converts from names of sacct fields to keys used by scontrol (if they differ)
+    _SACCT_TO_INFO: dict[str, str] = {
+        "JobID": "JobId",
+        "State": "JobState",
+        "User": "UserId",
+        "Submit": "SubmitTime",
+        "Start": "StartTime",
+        "End": "EndTime",
+    }
+
+    # keys of the job information read by the getters
+    _USED_KEYS = frozenset(
+        {
+            "JobId",
+            "Account",
+            "JobState",
+            "Reason",
+            "JobName",
+            "UserId",
+            "Partition",
+            "WorkDir",
+            "NumCPUs",
+            "MinCPUsNode",
+            "NumNodes",
+            "AllocTRES",
+            "ReqTRES",
+            "SubmitTime",
+            "StartTime",
+            "EndTime",
+            "TimeLimit",
+            "NodeList",
+            "SchedNodeList",
+            "BatchHost",
+            "ExitCode",
+        }
+    )
+
+    def __init__(self, job_id: str, compact: bool = False):
+        """
+        Query the batch system for information about the job with the specified ID.
+
+        If `compact` is True, only the information read by the getters is kept.
+        """
         self._job_id = job_id
         self._info: dict[str, str] = {}
+        self._cache: dict[str, object] = {}
 
         self.update()
+        if compact:
+            self._info = {
+                k: v for k, v in self._info.items() if k in SlurmJob._USED_KEYS
+            }
 
     def isEmpty(self) -> bool:
         return not self._info
@@ -63,6 +119,8 @@ class SlurmJob(BatchJobInterface):
         return self._info.get("Account")
 
     def update(self) -> None:
+        self._cache = {}
+
         # first try `scontrol`
         command = f"scontrol show job {self._job_id} -o"
         logger.debug(command)
@@ -108,6 +166,7 @@ class SlurmJob(BatchJobInterface):
             job: SlurmJob = SlurmJob.fromSacctString(result.stdout.strip())
             self._info: dict[str, str] = job._info
 
+    @cached_getter
     def getState(self) -> BatchState:
         if not (raw_state := self._info.get("JobState")):
             return BatchState.UNKNOWN
@@ -140,6 +199,7 @@ class SlurmJob(BatchJobInterface):
 
         return (time, node_list)
 
+    @cached_getter
     def getMainNode(self) -> str | None:
         if (main_node := self._info.get("BatchHost")) and "None" not in main_node:
             return main_node
@@ -150,12 +210,14 @@ class SlurmJob(BatchJobInterface):
 
         return None
 
+    @cached_getter
     def getNodes(self) -> list[str] | None:
         if (node_list := self._info.get("NodeList")) and "None" not in node_list:
             return SlurmJob._expandNodeList(node_list)
 
         return None
 
+    @cached_getter
     def getShortNodes(self) -> list[str] | None:
         # treat all nodes a single node, without expanding
         # this assumes that getShortNodes is only used in qq jobs and qq stat
@@ -171,6 +233,7 @@ class SlurmJob(BatchJobInterface):
 
         return name
 
+    @cached_getter
     def getNCPUs(self) -> int | None:
         min_cpus = (
             self._getIntProperty("MinCPUsNode", "the minimum number of CPUs per node")
@@ -182,6 +245,7 @@ class SlurmJob(BatchJobInterface):
 
         return max(min_cpus, cpus)
 
+    @cached_getter
     def getNGPUs(self) -> int | None:
         tres = self._getTres()
         for item in tres.split(","):
@@ -196,9 +260,11 @@ class SlurmJob(BatchJobInterface):
 
         return None
 
+    @cached_getter
     def getNNodes(self) -> int | None:
         return self._getIntProperty("NumNodes", "the number of nodes")
 
+    @cached_getter
     def getMem(self) -> Size | None:
         tres = self._getTres()
         for item in tres.split(","):
@@ -212,21 +278,26 @@ class SlurmJob(BatchJobInterface):
         logger.debug(f"Memory not available for '{self._job_id}'.")
         return None
 
+    @cached_getter
     def getStartTime(self) -> datetime | None:
         return self._getDatetimeProperty("StartTime", "the job start time")
 
+    @cached_getter
     def getSubmissionTime(self) -> datetime | None:
         return self._getDatetimeProperty("SubmitTime", "the job submission time")
 
+    @cached_getter
     def getCompletionTime(self) -> datetime | None:
         # the property EndTime is available for running jobs as well (estimated completion time)
         # but that should not matter for our purposes
         return self._getDatetimeProperty("EndTime", "the job completion time")
 
+    @cached_getter
     def getModificationTime(self) -> datetime | None:
         # assuming this is only used for completed jobs
         return self.getCompletionTime() or self.getSubmissionTime()
 
+    @cached_getter
     def getUser(self) -> str | None:
         if not (user := self._info.get("UserId")):
             logger.debug(f"Could not get user for '{self._job_id}'.")
@@ -234,6 +305,7 @@ class SlurmJob(BatchJobInterface):
 
         return user.split("(")[0]
 
+    @cached_getter
     def getWalltime(self) -> timedelta | None:
         if not (walltime := self._info.get("TimeLimit")):
             logger.debug(f"Could not get walltime for '{self._job_id}'.")
@@ -260,6 +332,7 @@ class SlurmJob(BatchJobInterface):
         # not available in Slurm
         return None
 
+    @cached_getter
     def getExitCode(self) -> int | None:
         if not (raw_exit := self._info.get("ExitCode")):
             return None
@@ -278,6 +351,7 @@ class SlurmJob(BatchJobInterface):
         # not available for Slurm
         return None
 
+    @cached_getter
     def getInputDir(self) -> Path | None:
         # note that Slurm's WorkDir corresponds to the directory from which sbatch was run
         if not (raw_dir := self._info.get("WorkDir")):
@@ -295,12 +369,16 @@ class SlurmJob(BatchJobInterface):
         # we need to check whether the info file actually exists
         # (or rather if it is available to the user)
         try:
-            if not info_file.is_file():
-                return None
+            if info_file.is_file():
+                return info_file
         except PermissionError:
             return None
 
-        return info_file
+        # members of array jobs are submitted from the directory containing the index of the array
+        if (index := self.getArrayIndex()) is not None:
+            return ArrayIndex.findInfoFile(ArrayIndex.getPath(input_dir, name), index)
+
+        return None
 
     def toYaml(self) -> str:
         return yaml.dump(
@@ -336,6 +414,7 @@ class SlurmJob(BatchJobInterface):
 
         return jobs
 
+    @cached_getter
     def getStepId(self) -> str | None:
         try:
             (_, step) = self._job_id.split(".", maxsplit=1)
@@ -343,6 +422,23 @@ class SlurmJob(BatchJobInterface):
         except ValueError:
             return None
 
+    @cached_getter
+    def getArrayId(self) -> str | None:
+        if not (match := SlurmJob._ARRAY_ID_REGEX.match(self._job_id)):
+            return None
+
+        return match.group(1)
+
+    @cached_getter
+    def getArrayIndex(self) -> int | None:
+        if (
+            not (match := SlurmJob._ARRAY_ID_REGEX.match(self._job_id))
+            or not match.group(2).isdigit()
+        ):
+            return None
+
+        return int(match.group(2))
+
     @classmethod
     def fromDict(cls, job_id: str, info: dict[str, str]) -> Self:
         """
@@ -364,41 +460,25 @@ class SlurmJob(BatchJobInterface):
         job_info = cls.__new__(cls)
         job_info._job_id = job_id
         job_info._info = info
+        job_info._cache = {}
 
         return job_info
 
     @classmethod
-    def fromSacctString(cls, string: str) -> Self:
+    def fromSacctString(cls, string: str, format: str = SACCT_FIELDS) -> Self:
         """
         Construct a new instance of SlurmJob using a string from sacct.
 
         Args:
             string (str): String describing the job properties obtained using sacct.
+            format (str): Comma-separated sacct fields the string was obtained with.
+                Defaults to `SACCT_FIELDS`.
 
         Returns:
             Self: A new instance of SlurmJob.
         """
         fields: list[str] = [
-            "JobId",
-            "Account",
-            "JobState",
-            "UserId",
-            "JobName",
-            "Partition",
-            "WorkDir",
-            "AllocCPUs",
-            "ReqCPUs",
-            "AllocTRES",
-            "ReqTRES",
-            "AllocNodes",
-            "ReqNodes",
-            "SubmitTime",
-            "StartTime",
-            "EndTime",
-            "TimeLimit",
-            "NodeList",
-            "Reason",
-            "ExitCode",
+            SlurmJob._SACCT_TO_INFO.get(field, field) for field in format.split(",")
         ]
 
         split = string.split("|")
@@ -450,6 +530,7 @@ class SlurmJob(BatchJobInterface):
 
         return SlurmJob.fromDict(info["JobId"], info)
 
+    @cached_getter
     def getIdsForSorting(self) -> list[int]:
         """
         Extract numeric components of the job ID for sorting.
@@ -476,8 +557,9 @@ class SlurmJob(BatchJobInterface):
         """
         Expand a compact Slurm node list expression into individual hostnames.
 
-        This method uses the Slurm `scontrol show hostnames` command to translate
-        a compact node list (e.g., "node[01-03]") into an explicit list of node names.
+        The node list (e.g., "node[01-03]") is expanded without querying Slurm
+        (see `expand_node_list`). Only expressions that cannot be parsed
+        are translated using the Slurm `scontrol show hostnames` command.
         If the expansion fails, the original compact string is returned as a single-element list.
 
         Args:
@@ -487,6 +569,9 @@ class SlurmJob(BatchJobInterface):
             list[str]: A list of fully expanded node hostnames. If expansion fails,
                 returns a list containing the original input string.
         """
+        if (expanded := expand_node_list(compact)) is not None:
+            return list(expanded)
+
         command = f"scontrol show hostnames {compact}"
         logger.debug(command)
 
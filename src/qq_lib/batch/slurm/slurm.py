@@ -4,7 +4,9 @@
 import os
 import shutil
 import subprocess
+from collections.abc import Iterable
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
 
 from qq_lib.batch.interface import BatchInterface
@@ -20,6 +22,7 @@ from .common import (
     SACCT_FIELDS,
     default_resources_from_dict,
     parse_slurm_dump_to_dictionary,
+    sacct_fields_for_columns,
 )
 from .job import SlurmJob
 from .node import SlurmNode
@@ -48,6 +51,12 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
 
     @classmethod
     def getJobId(cls) -> str | None:
+        # members of array jobs are identified by the id of the array and the array index
+        if (array_id := os.environ.get("SLURM_ARRAY_JOB_ID")) and (
+            index := os.environ.get("SLURM_ARRAY_TASK_ID")
+        ):
+            return cls.getArrayMemberId(array_id, int(index))
+
         return os.environ.get("SLURM_JOB_ID")
 
     @classmethod
@@ -60,31 +69,69 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
         depend: list[Depend],
         env_vars: dict[str, str],
         account: str | None = None,
+        start_time: datetime | None = None,
     ) -> str:
         # intentionally using PBS
-        PBS._sharedGuard(res, env_vars)
+        PBS._sharedGuard(res, env_vars, script.parent)
 
         command = cls._translateSubmit(
-            res, queue, script.parent, str(script), job_name, depend, env_vars, account
+            res,
+            queue,
+            script.parent,
+            str(script),
+            job_name,
+            depend,
+            env_vars,
+            account,
+            start_time=start_time,
         )
         logger.debug(command)
 
-        # submit the script
-        result = subprocess.run(
-            ["bash"],
-            input=command,
-            text=True,
-            check=False,
-            capture_output=True,
-            errors="replace",
+        # submit the script from the input directory
+        # (Slurm uses the current working directory of sbatch as the working directory of the job)
+        return cls._runSubmit(command, script, script.parent)
+
+    @classmethod
+    def jobSubmitArray(
+        cls,
+        res: Resources,
+        queue: str,
+        script: Path,
+        job_name: str,
+        depend: list[Depend],
+        env_vars: dict[str, str],
+        array_dir: Path,
+        array_size: int,
+        account: str | None = None,
+    ) -> str:
+        # intentionally using PBS
+        PBS._sharedGuard(res, env_vars, script.parent)
+
+        command = cls._translateSubmit(
+            res,
+            queue,
+            array_dir,
+            str(script),
+            job_name,
+            depend,
+            env_vars,
+            account,
+            array_size,
         )
+        logger.debug(command)
 
-        if result.returncode != 0:
-            raise QQError(
-                f"Failed to submit script '{str(script)}': {result.stderr.strip()}."
-            )
+        return cls._runSubmit(command, script, array_dir)
 
-        return result.stdout.split()[-1]
+    @classmethod
+    def getArrayIndex(cls) -> int | None:
+        if (index := os.environ.get("SLURM_ARRAY_TASK_ID")) is None:
+            return None
+
+        return int(index)
+
+    @classmethod
+    def getArrayMemberId(cls, array_id: str, index: int) -> str:
+        return f"{array_id}_{index}"
 
     @classmethod
     def jobKill(cls, job_id: str) -> None:
@@ -127,72 +174,90 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
         return SlurmJob(job_id)  # ty: ignore[invalid-return-type]
 
     @classmethod
-    def getUnfinishedBatchJobs(cls, user: str) -> list[SlurmJob]:
+    def getUnfinishedBatchJobs(
+        cls, user: str, columns: Iterable[str] | None = None
+    ) -> list[SlurmJob]:
+        format = sacct_fields_for_columns(columns)
+
         # get running jobs from sacct (faster than using squeue and scontrol)
-        command = f"sacct -u {user} --state RUNNING --allocations --noheader --parsable2 --format={SACCT_FIELDS}"
+        command = f"sacct -u {user} --state RUNNING --allocations --noheader --parsable2 --format={format}"
         logger.debug(command)
 
-        sacct_jobs = cls._getBatchJobsUsingSacctCommand(command)
+        sacct_jobs = cls._getBatchJobsUsingSacctCommand(command, format)
 
         # get pending jobs using squeue
         command = f'squeue -u {user} -t PENDING -h -o "%i"'
         logger.debug(command)
 
-        squeue_jobs = cls._getBatchJobsUsingSqueueCommand(command)
+        squeue_jobs = cls._getBatchJobsUsingSqueueCommand(command, columns is not None)
 
         # filter out duplicate jobs
         merged = {job.getId(): job for job in sacct_jobs + squeue_jobs}
         return list(merged.values())
 
     @classmethod
-    def getBatchJobs(cls, user: str) -> list[SlurmJob]:
+    def getBatchJobs(
+        cls, user: str, columns: Iterable[str] | None = None
+    ) -> list[SlurmJob]:
+        format = sacct_fields_for_columns(columns)
+
         # get all jobs, except pending which are not available from sacct
-        command = f"sacct -u {user} --allocations --noheader --parsable2 --format={SACCT_FIELDS}"
+        command = (
+            f"sacct -u {user} --allocations --noheader --parsable2 --format={format}"
+        )
         logger.debug(command)
 
-        sacct_jobs = cls._getBatchJobsUsingSacctCommand(command)
+        sacct_jobs = cls._getBatchJobsUsingSacctCommand(command, format)
 
         # get pending jobs using squeue
         command = f'squeue -u {user} -t PENDING -h -o "%i"'
         logger.debug(command)
 
-        squeue_jobs = cls._getBatchJobsUsingSqueueCommand(command)
+        squeue_jobs = cls._getBatchJobsUsingSqueueCommand(command, columns is not None)
 
         # filter out duplicate jobs
         merged = {job.getId(): job for job in sacct_jobs + squeue_jobs}
         return list(merged.values())
 
     @classmethod
-    def getAllUnfinishedBatchJobs(cls) -> list[SlurmJob]:
+    def getAllUnfinishedBatchJobs(
+        cls, columns: Iterable[str] | None = None
+    ) -> list[SlurmJob]:
+        format = sacct_fields_for_columns(columns)
+
         # get running jobs using sacct (faster than using squeue and scontrol)
-        command = f"sacct --state RUNNING --allusers --allocations --noheader --parsable2 --format={SACCT_FIELDS}"
+        command = f"sacct --state RUNNING --allusers --allocations --noheader --parsable2 --format={format}"
         logger.debug(command)
 
-        sacct_jobs = cls._getBatchJobsUsingSacctCommand(command)
+        sacct_jobs = cls._getBatchJobsUsingSacctCommand(command, format)
 
         # get pending jobs using squeue
         command = 'squeue -t PENDING -h -o "%i"'
         logger.debug(command)
 
-        squeue_jobs = cls._getBatchJobsUsingSqueueCommand(command)
+        squeue_jobs = cls._getBatchJobsUsingSqueueCommand(command, columns is not None)
 
         # filter out duplicate jobs
         merged = {job.getId(): job for job in sacct_jobs + squeue_jobs}
         return list(merged.values())
 
     @classmethod
-    def getAllBatchJobs(cls) -> list[SlurmJob]:
+    def getAllBatchJobs(cls, columns: Iterable[str] | None = None) -> list[SlurmJob]:
+        format = sacct_fields_for_columns(columns)
+
         # get all jobs, except pending which are not available from sacct
-        command = f"sacct --allusers --allocations --noheader --parsable2 --format={SACCT_FIELDS}"
+        command = (
+            f"sacct --allusers --allocations --noheader --parsable2 --format={format}"
+        )
         logger.debug(command)
 
-        sacct_jobs = cls._getBatchJobsUsingSacctCommand(command)
+        sacct_jobs = cls._getBatchJobsUsingSacctCommand(command, format)
 
         # get pending jobs using squeue
         command = 'squeue -t PENDING -h -o "%i"'
         logger.debug(command)
 
-        squeue_jobs = cls._getBatchJobsUsingSqueueCommand(command)
+        squeue_jobs = cls._getBatchJobsUsingSqueueCommand(command, columns is not None)
 
         # filter out duplicate jobs
         merged = {job.getId(): job for job in sacct_jobs + squeue_jobs}
@@ -254,10 +319,22 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
     def readRemoteFile(cls, host: str, file: Path) -> str:
         return PBS.readRemoteFile(host, file)
 
+    @classmethod
+    def readRemoteFiles(cls, host: str, files: list[Path]) -> list[str | None]:
+        return PBS.readRemoteFiles(host, files)
+
     @classmethod
     def writeRemoteFile(cls, host: str, file: Path, content: str) -> None:
         PBS.writeRemoteFile(host, file, content)
 
+    @classmethod
+    def appendRemoteFile(cls, host: str, file: Path, content: str) -> None:
+        PBS.appendRemoteFile(host, file, content)
+
+    @classmethod
+    def isRemoteFile(cls, host: str, file: Path) -> bool:
+        return PBS.isRemoteFile(host, file)
+
     @classmethod
     def makeRemoteDir(cls, host: str, directory: Path) -> None:
         PBS.makeRemoteDir(host, directory)
@@ -284,8 +361,11 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
         src_host: str | None,
         dest_host: str | None,
         exclude_files: list[Path] | None = None,
+        delete: bool = False,
     ) -> None:
-        PBS.syncWithExclusions(src_dir, dest_dir, src_host, dest_host, exclude_files)
+        PBS.syncWithExclusions(
+            src_dir, dest_dir, src_host, dest_host, exclude_files, delete
+        )
 
     @classmethod
     def syncSelected(
@@ -295,8 +375,9 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
         src_host: str | None,
         dest_host: str | None,
         include_files: list[Path] | None = None,
+        timeout: float | None = None,
     ) -> None:
-        PBS.syncSelected(src_dir, dest_dir, src_host, dest_host, include_files)
+        PBS.syncSelected(src_dir, dest_dir, src_host, dest_host, include_files, timeout)
 
     @classmethod
     def sortJobs(cls, jobs: list[SlurmJob]) -> None:
@@ -344,6 +425,39 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
         """
         return f"scancel --signal=KILL {job_id}"
 
+    @classmethod
+    def _runSubmit(cls, command: str, script: Path, directory: Path) -> str:
+        """
+        Execute a submission command in the specified directory.
+
+        Args:
+            command (str): The sbatch command to execute.
+            script (Path): Path to the submitted script. Used in error messages.
+            directory (Path): Directory from which the job is submitted.
+
+        Returns:
+            str: ID of the submitted job.
+
+        Raises:
+            QQError: If the job submission fails.
+        """
+        result = subprocess.run(
+            ["bash"],
+            input=command,
+            text=True,
+            check=False,
+            capture_output=True,
+            errors="replace",
+            cwd=directory,
+        )
+
+        if result.returncode != 0:
+            raise QQError(
+                f"Failed to submit script '{str(script)}': {result.stderr.strip()}."
+            )
+
+        return result.stdout.split()[-1]
+
     @classmethod
     def _translateSubmit(
         cls,
@@ -355,6 +469,8 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
         depend: list[Depend],
         env_vars: dict[str, str],
         account: str | None,
+        array_size: int | None = None,
+        start_time: datetime | None = None,
     ) -> str:
         """
         Generate the Slurm submission command for a job.
@@ -368,13 +484,24 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
             depend (list[Depend]): List of dependencies of the job.
             env_vars (dict[str, str]): Dictionary of environment variables and their values to propagate to the job's environment.
             account (str | None): Optional name of the account to use for the job.
+            array_size (int | None): Number of members if an array job should be submitted.
+            start_time (datetime | None): Time before which the job must not start.
 
         Returns:
             str: The fully constructed sbatch command string.
         """
-        qq_output = str((input_dir / job_name).with_suffix(CFG.suffixes.qq_out))
+        if array_size:
+            # each member of the array writes its own qq output
+            qq_output = str(
+                input_dir / f"{Path(job_name).stem}.%a{CFG.suffixes.qq_out}"
+            )
+        else:
+            qq_output = str((input_dir / job_name).with_suffix(CFG.suffixes.qq_out))
         command = f"sbatch -J {job_name} -p {queue} -e {qq_output} -o {qq_output} "
 
+        if array_size:
+            command += f"--array 0-{array_size - 1} "
+
         if account:
             command += f"--account {account} "
 
@@ -409,6 +536,10 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
         if converted_depend := cls._translateDependencies(depend):
             command += f"--dependency={converted_depend} "
 
+        # deferred start
+        if start_time:
+            command += f"--begin={start_time.strftime('%Y-%m-%dT%H:%M:%S')} "
+
         # add script
         command += script
 
@@ -561,12 +692,16 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
         )
 
     @classmethod
-    def _getBatchJobsUsingSacctCommand(cls, command: str) -> list[SlurmJob]:
+    def _getBatchJobsUsingSacctCommand(
+        cls, command: str, format: str = SACCT_FIELDS
+    ) -> list[SlurmJob]:
         """
         Execute `sacct` to retrieve information about Slurm jobs and parse it.
 
         Args:
             command (str): A Slurm command to get the relevant jobs.
+            format (str): Comma-separated sacct fields requested by the command.
+                Defaults to `SACCT_FIELDS`.
 
         Returns:
             list[SlurmJob]: A list of `SlurmJob` instances corresponding to the jobs
@@ -596,12 +731,14 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
             if sacct_string.strip() == "":
                 continue
 
-            jobs.append(SlurmJob.fromSacctString(sacct_string))
+            jobs.append(SlurmJob.fromSacctString(sacct_string, format))
 
         return jobs
 
     @classmethod
-    def _getBatchJobsUsingSqueueCommand(cls, command: str) -> list[SlurmJob]:
+    def _getBatchJobsUsingSqueueCommand(
+        cls, command: str, compact: bool = False
+    ) -> list[SlurmJob]:
         """
         Execute `squeue` and `scontrol show job` to retrieve information about Slurm jobs.
 
@@ -612,6 +749,7 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
 
         Args:
             command (str): A Slurm command to get the relevant job IDs.
+            compact (bool): Keep only the job information read by qq.
 
         Returns:
             list[SlurmJob]: A list of `SlurmJob` instances corresponding to the jobs
@@ -639,7 +777,7 @@ class Slurm(BatchInterface[SlurmJob, SlurmQueue, SlurmNode], metaclass=BatchMeta
         ids = [line.strip() for line in result.stdout.split("\n") if line.strip()]
 
         def get_job(job_id: str) -> SlurmJob:
-            return SlurmJob(job_id)
+            return SlurmJob(job_id, compact)
 
         jobs: list[SlurmJob] = []
 
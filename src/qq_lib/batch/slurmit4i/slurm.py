@@ -11,7 +11,7 @@ from qq_lib.batch.interface import BatchInterface
 from qq_lib.batch.interface.meta import BatchMeta, batch_system
 from qq_lib.batch.slurm import Slurm
 from qq_lib.batch.slurm.queue import SlurmQueue
-from qq_lib.core.common import equals_normalized
+from qq_lib.core.common import append_to_file, equals_normalized
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
@@ -91,6 +91,20 @@ class SlurmIT4I(Slurm, metaclass=BatchMeta):
         except Exception as e:
             raise QQError(f"Could not read file '{file}': {e}.") from e
 
+    @classmethod
+    def readRemoteFiles(cls, host: str, files: list[Path]) -> list[str | None]:
+        # files are always on shared storage
+        _ = host
+        contents: list[str | None] = []
+        for file in files:
+            try:
+                contents.append(file.read_text())
+            except FileNotFoundError:
+                contents.append(None)
+            except Exception as e:
+                raise QQError(f"Could not read file '{file}': {e}.") from e
+        return contents
+
     @classmethod
     def writeRemoteFile(cls, host: str, file: Path, content: str) -> None:
         # file is always on shared storage
@@ -100,6 +114,21 @@ class SlurmIT4I(Slurm, metaclass=BatchMeta):
         except Exception as e:
             raise QQError(f"Could not write file '{file}': {e}.") from e
 
+    @classmethod
+    def appendRemoteFile(cls, host: str, file: Path, content: str) -> None:
+        # file is always on shared storage
+        _ = host
+        try:
+            append_to_file(file, content)
+        except Exception as e:
+            raise QQError(f"Could not append to file '{file}': {e}.") from e
+
+    @classmethod
+    def isRemoteFile(cls, host: str, file: Path) -> bool:
+        # file is always on shared storage
+        _ = host
+        return file.is_file()
+
     @classmethod
     def makeRemoteDir(cls, host: str, directory: Path) -> None:
         # directory is always on shared storage
@@ -149,11 +178,14 @@ class SlurmIT4I(Slurm, metaclass=BatchMeta):
         src_host: str | None,
         dest_host: str | None,
         exclude_files: list[Path] | None = None,
+        delete: bool = False,
     ) -> None:
         # always on shared storage
         _ = src_host
         _ = dest_host
-        BatchInterface.syncWithExclusions(src_dir, dest_dir, None, None, exclude_files)
+        BatchInterface.syncWithExclusions(
+            src_dir, dest_dir, None, None, exclude_files, delete
+        )
 
     @classmethod
     def syncSelected(
@@ -163,11 +195,14 @@ class SlurmIT4I(Slurm, metaclass=BatchMeta):
         src_host: str | None,
         dest_host: str | None,
         include_files: list[Path] | None = None,
+        timeout: float | None = None,
     ) -> None:
         # always on shared storage
         _ = src_host
         _ = dest_host
-        BatchInterface.syncSelected(src_dir, dest_dir, None, None, include_files)
+        BatchInterface.syncSelected(
+            src_dir, dest_dir, None, None, include_files, timeout
+        )
 
     @classmethod
     def transformResources(cls, queue: str, provided_resources: Resources) -> Resources:
@@ -4,6 +4,7 @@
 import getpass
 import os
 import shutil
+from datetime import datetime
 from pathlib import Path
 
 from qq_lib.batch.interface.meta import BatchMeta, batch_system
@@ -44,6 +45,7 @@ class SlurmLumi(SlurmIT4I, metaclass=BatchMeta):
         depend: list[Depend],
         env_vars: dict[str, str],
         account: str | None = None,
+        start_time: datetime | None = None,
     ) -> str:
         # set the 'lumi_scratch_type' env var to be able to decide in getScratchDir
         # whether to create a scratch directory on /scratch or on /flash
@@ -52,7 +54,37 @@ class SlurmLumi(SlurmIT4I, metaclass=BatchMeta):
             env_vars[CFG.env_vars.lumi_scratch_type] = res.work_dir
 
         return super().jobSubmit(
-            res, queue, script, job_name, depend, env_vars, account
+            res, queue, script, job_name, depend, env_vars, account, start_time
+        )
+
+    @classmethod
+    def jobSubmitArray(
+        cls,
+        res: Resources,
+        queue: str,
+        script: Path,
+        job_name: str,
+        depend: list[Depend],
+        env_vars: dict[str, str],
+        array_dir: Path,
+        array_size: int,
+        account: str | None = None,
+    ) -> str:
+        # see `jobSubmit`
+        if res.usesScratch():
+            assert res.work_dir is not None
+            env_vars[CFG.env_vars.lumi_scratch_type] = res.work_dir
+
+        return super().jobSubmitArray(
+            res,
+            queue,
+            script,
+            job_name,
+            depend,
+            env_vars,
+            array_dir,
+            array_size,
+            account,
         )
 
     @classmethod
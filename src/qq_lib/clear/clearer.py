@@ -5,7 +5,11 @@
 from collections.abc import Iterable
 from pathlib import Path
 
-from qq_lib.core.common import get_info_files, get_runtime_files
+from qq_lib.core.common import (
+    construct_journal_path,
+    get_info_files,
+    get_runtime_files,
+)
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
@@ -105,6 +109,9 @@ class Clearer:
                 RealState.IN_AN_INCONSISTENT_STATE,
             ]:
                 excluded.append(file)  # qq info file
+                excluded.append(
+                    construct_journal_path(file)
+                )  # journal of the info file
                 excluded.append(
                     self._directory / informer.info.stdout_file
                 )  # script stdout
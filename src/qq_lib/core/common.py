@@ -8,10 +8,12 @@ This module provides helpers for working with qq job files, time durations,
 YAML I/O, string normalization, user prompts, path manipulation, and job-name construction.
 """
 
+import os
 import re
 from datetime import timedelta
 from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 
 import readchar
 import yaml
@@ -57,6 +59,44 @@ def load_yaml_loader() -> type[yaml.SafeLoader]:
     return SafeLoader
 
 
+@lru_cache(maxsize=1)
+def load_zstd() -> ModuleType | None:
+    """
+    Return a module providing Zstandard compression or None if it is not available.
+
+    The `compression.zstd` module from the standard library (Python 3.14+) is preferred,
+    falling back to the third-party `zstandard` package. Both provide a compatible `open` function.
+    """
+    try:
+        from compression import zstd  # ty: ignore[unresolved-import]
+
+        logger.debug("Loaded zstd from the standard library.")
+    except ImportError:
+        try:
+            import zstandard as zstd  # ty: ignore[unresolved-import]
+
+            logger.debug("Loaded zstd from the 'zstandard' package.")
+        except ImportError:
+            logger.debug("Zstandard compression is not available.")
+            return None
+
+    return zstd
+
+
+@lru_cache(maxsize=1)
+def load_numpy() -> ModuleType | None:
+    """Return the `numpy` module or None if it is not installed."""
+    try:
+        import numpy as np  # ty: ignore[unresolved-import]
+
+        logger.debug("Loaded numpy.")
+    except ImportError:
+        logger.debug("NumPy is not available.")
+        return None
+
+    return np
+
+
 def get_files_with_suffix(directory: Path, suffix: str) -> list[Path]:
     """
     Retrieve all files in a directory that have the specified file suffix.
@@ -93,6 +133,62 @@ def get_runtime_files(directory: Path) -> list[Path]:
     return files
 
 
+def append_to_file(file: Path, content: str) -> None:
+    """
+    Append content to a file using a single write, creating the file if it does not exist.
+
+    The file is opened with `O_APPEND`, so content appended concurrently
+    by multiple processes is never interleaved or overwritten
+    (as long as each piece of content is written by a single call).
+
+    Args:
+        file (Path): The file to append to.
+        content (str): The content to append.
+
+    Raises:
+        OSError: If the file cannot be opened or written to.
+    """
+    fd = os.open(file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, content.encode())
+    finally:
+        os.close(fd)
+
+
+def get_directory_size(directory: Path) -> int:
+    """
+    Get the total size of all files in a directory and its subdirectories.
+
+    Symbolic links are not followed. A path to a regular file is also accepted.
+
+    Args:
+        directory (Path): The directory (or file) to measure.
+
+    Returns:
+        int: The total size in bytes.
+
+    Raises:
+        QQError: If the directory cannot be scanned.
+    """
+    try:
+        if not directory.is_dir():
+            return directory.stat().st_size
+
+        total = 0
+        stack = [directory]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+    except OSError as e:
+        raise QQError(f"Could not measure the size of '{directory}': {e}.") from e
+
+    return total
+
+
 def get_info_file(directory: Path) -> Path:
     """
     Locate the qq job info file in a directory.
@@ -705,6 +801,35 @@ def construct_info_file_path(input_dir: Path, job_name: str) -> Path:
     return (input_dir / job_name).with_suffix(CFG.suffixes.qq_info).resolve()
 
 
+def construct_journal_path(info_file: Path) -> Path:
+    """
+    Construct the path to the journal of updates of a qq info file.
+
+    Args:
+        info_file (Path): The path to the qq info file.
+
+    Returns:
+        Path: The path to the journal stored next to the info file.
+    """
+    return info_file.with_suffix(CFG.suffixes.qq_journal)
+
+
+def construct_tombstone_path(work_dir: Path) -> Path:
+    """
+    Construct the path to which a working directory is renamed before its deferred deletion.
+
+    The tombstone is placed next to the working directory so that the rename
+    never crosses a filesystem boundary.
+
+    Args:
+        work_dir (Path): The working directory of the job.
+
+    Returns:
+        Path: The path of the tombstone directory.
+    """
+    return work_dir.with_name(f"{work_dir.name}{CFG.suffixes.tombstone}")
+
+
 def available_work_dirs() -> str:
     """
     Return the supported work-directory types for the detected batch system.
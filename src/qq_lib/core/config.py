@@ -25,17 +25,25 @@ class FileSuffixes:
 
     # Suffix for qq info files.
     qq_info: str = ".qqinfo"
+    # Suffix for journals of updates of qq info files.
+    qq_journal: str = ".qqjournal"
     # Suffix for qq output files.
     qq_out: str = ".qqout"
     # Suffix for captured stdout.
     stdout: str = ".out"
     # Suffix for captured stderr.
     stderr: str = ".err"
+    # Suffix for working directories scheduled for deferred deletion.
+    tombstone: str = ".qqtomb"
+    # Suffix for index files of array jobs.
+    qq_array: str = ".qqarray"
+    # Suffix for state files of submitted workflows.
+    qq_workflow: str = ".qqworkflow"
 
     @property
     def all_suffixes(self) -> list[str]:
         """List of all file suffixes."""
-        return [self.qq_info, self.qq_out, self.stdout, self.stderr]
+        return [self.qq_info, self.qq_out, self.stdout, self.stderr, self.qq_journal]
 
 
 @dataclass
@@ -48,6 +56,8 @@ class EnvironmentVariables:
     debug_mode: str = "QQ_DEBUG"
     # Path to the qq info file for the job.
     info_file: str = "QQ_INFO"
+    # Path to the index file of an array job.
+    array_index: str = "QQ_ARRAY_INDEX"
     # Machine from which the job was submitted.
     input_machine: str = "QQ_INPUT_MACHINE"
     # Submission directory path.
@@ -66,12 +76,18 @@ class EnvironmentVariables:
     no_resubmit: str = "QQ_NO_RESUBMIT"
     # Archive filename pattern.
     archive_format: str = "QQ_ARCHIVE_FORMAT"
+    # Index of the task of a pack job.
+    pack_task: str = "QQ_PACK_TASK"
     # Scratch directory on Metacentrum clusters.
     pbs_scratch_dir: str = "SCRATCHDIR"
     # Slurm account used for the job.
     slurm_job_account: str = "SLURM_JOB_ACCOUNT"
     # Storage type for LUMI scratch.
     lumi_scratch_type: str = "LUMI_SCRATCH_TYPE"
+    # Number of OpenMP threads.
+    omp_num_threads: str = "OMP_NUM_THREADS"
+    # GPUs visible to CUDA applications.
+    cuda_visible_devices: str = "CUDA_VISIBLE_DEVICES"
     # Total CPUs used.
     ncpus: str = "QQ_NCPUS"
     # Total GPUs used.
@@ -104,6 +120,26 @@ class RunnerSettings:
     sigterm_to_sigkill: int = 5
     # Interval (in seconds) between successive checks of the running script's state.
     subprocess_checks_wait_time: int = 2
+    # Delete the working directory in a detached low-priority process instead of waiting for it.
+    deferred_deletion: bool = True
+    # Niceness of the process deleting the working directory.
+    deletion_niceness: int = 19
+    # Copy files produced by a killed job from the working directory to the input directory.
+    kill_stage_out: bool = True
+    # Time (in seconds) after receiving SIGTERM at which the copying of files of a killed job is stopped.
+    # Must be shorter than the time between SIGTERM and SIGKILL granted by the batch system
+    # (10 seconds by default in PBS, 30 seconds by default in Slurm).
+    kill_stage_out_time: int = 8
+    # Glob patterns of files that are copied first when a job is killed.
+    kill_stage_out_patterns: list[str] = field(default_factory=list)
+    # Maximal number of files copied in one transfer when a job is killed.
+    kill_stage_out_batch: int = 20
+    # Minimal interval (in seconds) between writes of the task states of a pack job into the qq info file.
+    pack_update_interval: int = 60
+    # Copy files of a pack job to the input directory even if some of its tasks failed,
+    # so that the results of the successful tasks are not lost.
+    # The working directory is then still kept on scratch.
+    pack_stage_out_on_failure: bool = True
 
 
 @dataclass
@@ -114,6 +150,8 @@ class ArchiverSettings:
     retry_tries: int = 3
     # Wait time (in seconds) between retry attempts.
     retry_wait: int = 300
+    # Name of the file inside the archive mapping cycle numbers to archived files.
+    index_file: str = ".qqindex"
 
 
 @dataclass
@@ -131,6 +169,73 @@ class LoopJobSettings:
 
     # Pattern used for naming loop jobs.
     pattern: str = "+%04d"
+    # Name of the manifest file marking a working directory retained for the next cycle.
+    manifest_file: str = ".qqmanifest"
+    # Maximal total size of a working directory that can be retained for the next cycle.
+    reuse_max_size: str = "100gb"
+    # Maximal time (in seconds) for which a retained working directory can be reused.
+    reuse_max_age: int = 86400
+    # Wait time (in seconds) before the first requeue of a cycle failing due to an error of the qq infrastructure.
+    # The wait time doubles with each following requeue of the same cycle.
+    requeue_backoff: int = 60
+    # Maximal wait time (in seconds) before requeueing a cycle.
+    requeue_backoff_max: int = 600
+    # Number of recent cycles whose resource usage is considered when autosizing the next cycle.
+    autosize_history: int = 5
+    # Minimal number of cycles with known resource usage required to autosize the next cycle.
+    autosize_min_samples: int = 2
+    # Percentile of the resource usage of the recent cycles used as the estimate for the next cycle.
+    autosize_percentile: int = 90
+    # Multiplier applied to the estimated resource usage.
+    autosize_headroom: float = 1.25
+    # Autosized resources never drop below this multiple of the originally requested resources.
+    autosize_min_factor: float = 0.25
+    # Autosized resources never grow above this multiple of the originally requested resources.
+    autosize_max_factor: float = 2.0
+
+
+@dataclass
+class InputCacheSettings:
+    """Settings for the node-local cache of explicitly included files."""
+
+    # Use the cache when staging explicitly included files into a working directory on scratch.
+    enabled: bool = True
+    # Name of the cache directory created next to the working directories.
+    directory: str = ".qqcache"
+    # Maximal total size of the cached files.
+    max_size: str = "50gb"
+
+
+@dataclass
+class PrestageSettings:
+    """Settings for pre-staging input data to the estimated execution node."""
+
+    # Name of the directory in the user's scratch directory on the node into which input data are pre-staged.
+    directory: str = ".qqprestage"
+    # Time (in seconds) before the estimated start of the job at which input data are pre-staged
+    # when waiting for the job.
+    lead_time: int = 900
+    # Interval (in seconds) between successive checks of the job's estimated start.
+    wait_time: int = 60
+    # Maximal time (in seconds) for which pre-staged data can be used by the job.
+    max_age: int = 86400
+
+
+@dataclass
+class InfoFileSettings:
+    """Settings for qq info files."""
+
+    # Format of newly written qq info files: 'yaml' (human-readable) or 'json' (faster to load).
+    # Info files in both formats can always be read.
+    format: str = "yaml"
+
+
+@dataclass
+class SubmitterSettings:
+    """Settings for Submitter operations."""
+
+    # Maximal number of jobs submitted concurrently when submitting from multiple directories.
+    max_workers: int = 8
 
 
 @dataclass
@@ -220,6 +325,16 @@ class JobsPresenterSettings:
     # Code used to signify "total jobs".
     sum_jobs_code: str = "Σ"
 
+    # Number of rows written at once in the plain output.
+    plain_chunk_size: int = 500
+
+    # Minimal interval between refreshes of jobs in watch mode (in seconds).
+    watch_min_interval: float = 2.0
+    # Maximal interval between refreshes of jobs in watch mode (in seconds).
+    watch_max_interval: float = 30.0
+    # Factor by which the interval between refreshes grows while no job changes.
+    watch_backoff: float = 1.5
+
 
 @dataclass
 class QueuesPresenterSettings:
@@ -377,6 +492,21 @@ class PBSOptions:
 
     # Name of the subdirectory inside SCRATCHDIR used as the job's working directory.
     scratch_dir_inner: str = "main"
+    # Multiple of the size of the input data requested as work-size when using work-dir='auto'.
+    auto_work_dir_headroom: float = 2.0
+    # Minimal work-size requested when using work-dir='auto'.
+    auto_work_dir_min_size: str = "1gb"
+    # Maximal work-size for which in-RAM scratch can be selected when using work-dir='auto'.
+    # Set to '0kb' to never select in-RAM scratch.
+    auto_work_dir_shm_max_size: str = "8gb"
+    # Node-local directories containing scratch directories of individual users for each type of scratch.
+    scratch_roots: dict[str, str] = field(
+        default_factory=lambda: {
+            "scratch_local": "/scratch",
+            "scratch_ssd": "/scratch.ssd",
+            "scratch_shm": "/dev/shm/scratch.shm",
+        }
+    )
 
 
 @dataclass
@@ -415,6 +545,10 @@ class Config:
     goer: GoerSettings = field(default_factory=GoerSettings)
     presenter: PresenterSettings = field(default_factory=PresenterSettings)
     loop_jobs: LoopJobSettings = field(default_factory=LoopJobSettings)
+    input_cache: InputCacheSettings = field(default_factory=InputCacheSettings)
+    prestage: PrestageSettings = field(default_factory=PrestageSettings)
+    info_file: InfoFileSettings = field(default_factory=InfoFileSettings)
+    submitter: SubmitterSettings = field(default_factory=SubmitterSettings)
     jobs_presenter: JobsPresenterSettings = field(default_factory=JobsPresenterSettings)
     queues_presenter: QueuesPresenterSettings = field(
         default_factory=QueuesPresenterSettings
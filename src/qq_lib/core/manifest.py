@@ -0,0 +1,288 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Content manifests of working directories.
+
+This module defines `WorkDirManifest`, a lightweight description of the content
+of a working directory (relative paths, sizes, and modification times of all files).
+A manifest is written into a working directory that is kept on a computing node
+after the job finishes, so that a following job can verify that the directory
+is intact before adopting it.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Self
+
+from .config import CFG
+from .error import QQError
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class WorkDirManifest:
+    """
+    Description of the content of a working directory retained on a computing node.
+    """
+
+    # Identifier of the job that created the manifest
+    job_id: str
+
+    # Host on which the working directory resides
+    host: str
+
+    # Input directory of the job that created the manifest
+    input_dir: Path
+
+    # The described working directory
+    work_dir: Path
+
+    # Time at which the manifest was created
+    created: datetime
+
+    # Relative paths of all files in the directory mapped to [size, mtime in ns]
+    files: dict[str, list[int]] = field(default_factory=dict)
+
+    @classmethod
+    def fromWorkDir(
+        cls, job_id: str, host: str, input_dir: Path, work_dir: Path
+    ) -> Self:
+        """
+        Create a manifest by scanning the content of a working directory.
+
+        Args:
+            job_id (str): Identifier of the job owning the working directory.
+            host (str): Host on which the working directory resides.
+            input_dir (Path): Input directory of the job.
+            work_dir (Path): The working directory to describe.
+
+        Returns:
+            WorkDirManifest: The manifest describing the current content of the directory.
+
+        Raises:
+            QQError: If the directory cannot be scanned.
+        """
+        return cls(
+            job_id=job_id,
+            host=host,
+            input_dir=input_dir,
+            work_dir=work_dir,
+            created=datetime.now(),
+            files=WorkDirManifest._scan(work_dir),
+        )
+
+    @classmethod
+    def fromInputDir(
+        cls,
+        job_id: str,
+        host: str,
+        input_dir: Path,
+        work_dir: Path,
+        excluded: list[Path] | None = None,
+    ) -> Self:
+        """
+        Create a manifest describing a copy of the input directory.
+
+        The manifest is created by scanning the input directory but describes
+        the directory `work_dir` into which the input directory is copied.
+        Files and directories matching the excluded paths are not included,
+        following the semantics of rsync's `--exclude`: a path without a slash
+        matches a file or directory of that name at any depth.
+
+        Args:
+            job_id (str): Identifier of the job owning the copy.
+            host (str): Host on which the copy resides.
+            input_dir (Path): The input directory to describe.
+            work_dir (Path): The directory into which the input directory is copied.
+            excluded (list[Path] | None): Paths relative to the input directory
+                that are not copied.
+
+        Returns:
+            WorkDirManifest: The manifest describing the copy of the input directory.
+
+        Raises:
+            QQError: If the input directory cannot be scanned.
+        """
+        patterns = [str(path).strip("/") for path in excluded or []]
+
+        def is_excluded(relative: str) -> bool:
+            parts = Path(relative).parts
+            for pattern in patterns:
+                if "/" in pattern:
+                    if relative == pattern or relative.startswith(pattern + "/"):
+                        return True
+                elif pattern in parts:
+                    return True
+            return False
+
+        return cls(
+            job_id=job_id,
+            host=host,
+            input_dir=input_dir,
+            work_dir=work_dir,
+            created=datetime.now(),
+            files={
+                relative: value
+                for relative, value in WorkDirManifest._scan(input_dir).items()
+                if not is_excluded(relative)
+            },
+        )
+
+    @classmethod
+    def fromFile(cls, file: Path) -> Self:
+        """
+        Load a manifest from a file.
+
+        Args:
+            file (Path): Path to the manifest file.
+
+        Returns:
+            WorkDirManifest: The loaded manifest.
+
+        Raises:
+            QQError: If the file cannot be read or is not a valid manifest.
+        """
+        try:
+            with file.open("r") as f:
+                return cls.fromString(f.read())
+        except Exception as e:
+            raise QQError(f"Could not load manifest '{file}': {e}.") from e
+
+    @classmethod
+    def fromString(cls, content: str) -> Self:
+        """
+        Load a manifest from its JSON representation.
+
+        Args:
+            content (str): The JSON representation of the manifest.
+
+        Returns:
+            WorkDirManifest: The loaded manifest.
+
+        Raises:
+            KeyError, ValueError: If the content is not a valid manifest.
+        """
+        data = json.loads(content)
+
+        return cls(
+            job_id=data["job_id"],
+            host=data["host"],
+            input_dir=Path(data["input_dir"]),
+            work_dir=Path(data["work_dir"]),
+            created=datetime.strptime(data["created"], CFG.date_formats.standard),
+            files=data["files"],
+        )
+
+    def toFile(self, file: Path) -> None:
+        """
+        Write the manifest into a file.
+
+        Args:
+            file (Path): Path to the manifest file.
+
+        Raises:
+            QQError: If the file cannot be written.
+        """
+        try:
+            with file.open("w") as f:
+                f.write(self.toString())
+        except Exception as e:
+            raise QQError(f"Could not write manifest '{file}': {e}.") from e
+
+    def toString(self) -> str:
+        """
+        Get the JSON representation of the manifest.
+
+        Returns:
+            str: The manifest serialized as compact JSON.
+        """
+        data = {
+            "job_id": self.job_id,
+            "host": self.host,
+            "input_dir": str(self.input_dir),
+            "work_dir": str(self.work_dir),
+            "created": self.created.strftime(CFG.date_formats.standard),
+            "files": self.files,
+        }
+
+        return json.dumps(data, separators=(",", ":"))
+
+    def getSize(self) -> int:
+        """
+        Get the total size of all files in the manifest.
+
+        Returns:
+            int: The total size in bytes.
+        """
+        return sum(size for size, _ in self.files.values())
+
+    def isExpired(self, max_age: timedelta) -> bool:
+        """
+        Check whether the manifest is older than the specified age.
+
+        Args:
+            max_age (timedelta): The maximal allowed age of the manifest.
+
+        Returns:
+            bool: True if the manifest is too old, else False.
+        """
+        return datetime.now() - self.created > max_age
+
+    def matchesWorkDir(self) -> bool:
+        """
+        Check whether the working directory still has the content described by the manifest.
+
+        Returns:
+            bool: True if all files have the same sizes and modification times
+            and no files were added or removed, else False.
+        """
+        try:
+            return WorkDirManifest._scan(self.work_dir) == self.files
+        except QQError as e:
+            logger.debug(e)
+            return False
+
+    @staticmethod
+    def _scan(directory: Path) -> dict[str, list[int]]:
+        """
+        Recursively collect sizes and modification times of all files in a directory.
+
+        Symbolic links are not followed. The manifest file itself is skipped.
+
+        Args:
+            directory (Path): The directory to scan.
+
+        Returns:
+            dict[str, list[int]]: Relative paths mapped to [size, mtime in ns].
+
+        Raises:
+            QQError: If the directory cannot be scanned.
+        """
+        files: dict[str, list[int]] = {}
+        stack = [directory]
+
+        try:
+            while stack:
+                current = stack.pop()
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(Path(entry.path))
+                            continue
+
+                        relative = os.path.relpath(entry.path, directory)
+                        if relative == CFG.loop_jobs.manifest_file:
+                            continue
+
+                        stat = entry.stat(follow_symlinks=False)
+                        files[relative] = [stat.st_size, stat.st_mtime_ns]
+        except OSError as e:
+            raise QQError(f"Could not scan directory '{directory}': {e}.") from e
+
+        return files
@@ -0,0 +1,188 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Machine-readable output of jobs, nodes, queues, and qq job information.
+
+Each object is converted into a flat record with a fixed set of typed fields
+(see `toRecord` methods of the batch interfaces and of `Informer`) and written
+by `RecordWriter` immediately, one record at a time.
+
+Values of the records are JSON-compatible: strings, integers, booleans,
+lists of strings, or null. Times are in ISO 8601 format, durations in seconds,
+and sizes in kilobytes. Fields that are not available are null in JSON
+and empty in CSV. Lists are joined by spaces in CSV.
+
+Supported formats:
+- `json`: a single JSON array of records,
+- `ndjson`: one JSON record per line,
+- `csv`: a header line followed by one line per record.
+"""
+
+import csv
+import json
+import sys
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import IO, Self
+
+from qq_lib.core.error import QQError
+from qq_lib.properties.size import Size
+
+# JSON-compatible type of a record value
+type RecordValue = str | int | bool | list[str] | None
+
+
+class OutputFormat(Enum):
+    """
+    Format of machine-readable output.
+    """
+
+    JSON = 1
+    NDJSON = 2
+    CSV = 3
+
+    def __str__(self):
+        return self.name.lower()
+
+    @classmethod
+    def fromStr(cls, s: str) -> Self:
+        """
+        Convert a string to the corresponding OutputFormat enum variant.
+
+        Args:
+            s (str): String representation of the format (case-insensitive).
+
+        Returns:
+            OutputFormat variant.
+
+        Raises:
+            QQError if the string corresponds to no OutputFormat.
+        """
+        try:
+            return cls[s.upper()]
+        except KeyError:
+            raise QQError(f"Could not recognize an output format '{s}'.")
+
+
+class RecordWriter:
+    """
+    Writes records into a stream one at a time.
+    """
+
+    def __init__(
+        self, format: OutputFormat, fields: list[str], stream: IO[str] | None = None
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            format (OutputFormat): Format of the output.
+            fields (list[str]): Names of the fields of the records in output order.
+            stream (IO[str] | None): Stream to write into. Defaults to stdout.
+        """
+        self._format = format
+        self._fields = fields
+        self._stream = stream or sys.stdout
+        self._count = 0
+
+        self._csv = (
+            csv.writer(self._stream, lineterminator="\n")
+            if format == OutputFormat.CSV
+            else None
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def write(self, record: dict[str, RecordValue]) -> None:
+        """
+        Write a single record.
+
+        Fields missing in the record are written as null (or empty in CSV).
+
+        Args:
+            record (dict[str, RecordValue]): The record to write.
+        """
+        if self._csv:
+            if self._count == 0:
+                self._csv.writerow(self._fields)
+            self._csv.writerow(
+                [RecordWriter._toCSV(record.get(f)) for f in self._fields]
+            )
+        else:
+            line = json.dumps({f: record.get(f) for f in self._fields})
+            if self._format == OutputFormat.JSON:
+                line = ("[\n" if self._count == 0 else ",\n") + line
+            else:
+                line += "\n"
+            self._stream.write(line)
+
+        self._count += 1
+
+    def writeAll(self, records: Iterable[dict[str, RecordValue]]) -> None:
+        """
+        Write records one at a time as they are produced and close the writer.
+
+        Args:
+            records (Iterable[dict[str, RecordValue]]): The records to write.
+        """
+        with self:
+            for record in records:
+                self.write(record)
+
+    def close(self) -> None:
+        """
+        Finish the output. Writes the closing bracket of the JSON array
+        or the CSV header if no record has been written.
+        """
+        if self._format == OutputFormat.JSON:
+            self._stream.write("[]\n" if self._count == 0 else "\n]\n")
+        elif self._csv and self._count == 0:
+            self._csv.writerow(self._fields)
+
+        self._stream.flush()
+
+    @staticmethod
+    def _toCSV(value: RecordValue) -> str | int:
+        """Convert a record value into a CSV cell."""
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return str(value).lower()
+        if isinstance(value, list):
+            return " ".join(value)
+        return value
+
+
+def to_record_value(
+    value: str | int | bool | datetime | timedelta | Size | Path | Enum | list | None,
+) -> RecordValue:
+    """
+    Convert a value obtained from a batch system or an info file into a record value.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        RecordValue: Datetimes in ISO 8601 format, timedeltas in seconds,
+        sizes in kilobytes, paths and enums as strings, and lists as lists of strings.
+    """
+    match value:
+        case datetime():
+            return value.isoformat()
+        case timedelta():
+            return int(value.total_seconds())
+        case Size():
+            return value.value
+        case Path() | Enum():
+            return str(value)
+        case list():
+            return [str(v) for v in value]
+        case _:
+            return value
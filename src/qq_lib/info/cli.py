@@ -15,6 +15,7 @@ from qq_lib.core.common import (
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
+from qq_lib.core.records import OutputFormat, RecordWriter
 from qq_lib.core.repeater import Repeater
 from qq_lib.info.informer import Informer
 from qq_lib.info.presenter import Presenter
@@ -43,7 +44,13 @@ If JOB_ID is not specified, `{CFG.binary_name} info` searches for qq jobs in the
 @click.option(
     "-s", "--short", is_flag=True, help="Display only the job ID and current state."
 )
-def info(job: str | None, short: bool) -> NoReturn:
+@click.option(
+    "--format",
+    type=click.Choice([str(f) for f in OutputFormat], case_sensitive=False),
+    default=None,
+    help="Output information about the job(s) in a machine-readable format.",
+)
+def info(job: str | None, short: bool, format: str | None) -> NoReturn:
     """
     Get information about the specified qq job or qq job(s) submitted from this directory.
     """
@@ -58,6 +65,12 @@ def info(job: str | None, short: bool) -> NoReturn:
             ):
                 raise QQError("No qq job info file found.")
 
+        if format:
+            RecordWriter(OutputFormat.fromStr(format), Informer.RECORD_FIELDS).writeAll(
+                informer.toRecord() for informer in informers
+            )
+            sys.exit(0)
+
         Repeater(informers, _info_for_job, short).run()
         sys.exit(0)
     except QQError as e:
@@ -1,15 +1,17 @@
 # Released under MIT License.
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Self
 
 from qq_lib.batch.interface import BatchInterface, BatchJobInterface
 from qq_lib.batch.interface.meta import BatchMeta
-from qq_lib.core.common import construct_info_file_path
+from qq_lib.core.common import construct_info_file_path, hhmmss_to_duration
 from qq_lib.core.error import QQError, QQJobMismatchError
 from qq_lib.core.logger import get_logger
+from qq_lib.core.records import RecordValue, to_record_value
 from qq_lib.properties.info import Info
 from qq_lib.properties.states import BatchState, NaiveState, RealState
 
@@ -21,6 +23,33 @@ class Informer:
     Provides an interface to access and manipulate qq job information.
     """
 
+    # Fields of the machine-readable record of a qq job (see `toRecord`).
+    RECORD_FIELDS = [
+        "job_id",
+        "job_name",
+        "job_type",
+        "state",
+        "user",
+        "queue",
+        "script_name",
+        "input_machine",
+        "input_dir",
+        "work_dir",
+        "main_node",
+        "nodes",
+        "ncpus",
+        "ngpus",
+        "nnodes",
+        "mem_kb",
+        "walltime_seconds",
+        "loop_cycle",
+        "submission_time",
+        "start_time",
+        "completion_time",
+        "exit_code",
+        "comment",
+    ]
+
     def __init__(self, info: Info):
         """
         Initialize the informer with job information.
@@ -49,7 +78,7 @@ class Informer:
         If 'host' is provided, the file is read from the remote host; otherwise, it is read locally.
 
         Args:
-            file (Path): Path to a YAML file containing job information.
+            file (Path): Path to a qq info file containing job information.
             host (str | None): Optional remote host from which to read the file.
 
         Returns:
@@ -127,7 +156,7 @@ class Informer:
         If `host` is provided, the file is written to the remote host; otherwise, it is written locally.
 
         Args:
-            file (Path): Path to the output YAML file.
+            file (Path): Path to the output qq info file.
             host (str | None): Optional remote host where the file should be written.
 
         Raises:
@@ -135,6 +164,37 @@ class Informer:
         """
         self.info.toFile(file, host)
 
+    def toJournal(
+        self, file: Path, names: Iterable[str], host: str | None = None
+    ) -> None:
+        """
+        Record the selected fields of the job information in the journal of a file.
+
+        If `host` is provided, the journal is written on the remote host; otherwise, it is written locally.
+
+        Args:
+            file (Path): Path to the qq info file.
+            names (Iterable[str]): Names of the fields of `Info` to record.
+            host (str | None): Optional remote host where the journal should be written.
+
+        Raises:
+            QQError: If the record cannot be appended to the journal.
+        """
+        self.info.toJournal(file, names, host)
+
+    def compactJournal(self, file: Path, host: str | None = None) -> None:
+        """
+        Incorporate the journal of a qq info file into the file and truncate the journal.
+
+        Args:
+            file (Path): Path to the qq info file.
+            host (str | None): Optional remote host where the file resides.
+
+        Raises:
+            QQError: If the info file cannot be written or the journal cannot be truncated.
+        """
+        self.info.compactJournal(file, host)
+
     def matchesJob(self, job_id: str) -> bool:
         """
         Determine whether this informer corresponds to the specified job ID.
@@ -349,3 +409,62 @@ class Informer:
             Path: Absolute path to the info file.
         """
         return construct_info_file_path(self.info.input_dir, self.info.job_name)
+
+    def toRecord(self) -> dict[str, RecordValue]:
+        """
+        Return information about the job as a flat record with typed fields.
+
+        The record contains the fields listed in `RECORD_FIELDS`. The state is the
+        real state of the job (as shown by `qq info`), times are in ISO 8601 format,
+        memory is in kilobytes, walltime is in seconds, and nodes are a list of node names.
+        Resources are the resources requested for the job. Missing values are None.
+
+        Note that this queries the batch system for the state of the job.
+
+        Returns:
+            dict[str, RecordValue]: The record of the job.
+        """
+        info = self.info
+        state = self.getRealState()
+        # the comment of the batch system is only relevant for jobs that wait
+        comment = (
+            self.getComment()
+            if state
+            in {
+                RealState.QUEUED,
+                RealState.HELD,
+                RealState.WAITING,
+                RealState.SUSPENDED,
+            }
+            else None
+        )
+
+        return {
+            "job_id": info.job_id,
+            "job_name": info.job_name,
+            "job_type": str(info.job_type),
+            "state": str(state),
+            "user": info.username,
+            "queue": info.queue,
+            "script_name": info.script_name,
+            "input_machine": info.input_machine,
+            "input_dir": to_record_value(info.input_dir),
+            "work_dir": to_record_value(info.work_dir),
+            "main_node": info.main_node,
+            "nodes": to_record_value(info.all_nodes),
+            "ncpus": info.resources.ncpus,
+            "ngpus": info.resources.ngpus,
+            "nnodes": info.resources.nnodes,
+            "mem_kb": to_record_value(info.resources.mem),
+            "walltime_seconds": to_record_value(
+                hhmmss_to_duration(info.resources.walltime)
+                if info.resources.walltime
+                else None
+            ),
+            "loop_cycle": info.loop_info.current if info.loop_info else None,
+            "submission_time": to_record_value(info.submission_time),
+            "start_time": to_record_value(info.start_time),
+            "completion_time": to_record_value(info.completion_time),
+            "exit_code": info.job_exit_code,
+            "comment": comment,
+        }
@@ -14,7 +14,7 @@ from rich.text import Text
 from qq_lib.batch.interface.job import BatchJobInterface
 from qq_lib.core.common import format_duration_wdhhmmss, get_panel_width
 from qq_lib.core.config import CFG
-from qq_lib.properties.states import RealState
+from qq_lib.properties.states import NaiveState, RealState
 
 from .informer import Informer
 
@@ -173,6 +173,12 @@ class Presenter:
 
         if loop_info:
             content = f"{job_type_str} [{loop_info.current}/{loop_info.end}]"
+        elif pack_info := self._informer.info.pack_info:
+            failed = pack_info.countTasks(NaiveState.FAILED)
+            done = pack_info.countTasks(NaiveState.FINISHED) + failed
+            content = f"{job_type_str} [{done}/{len(pack_info.tasks)}]"
+            if failed:
+                content += f" ({failed} failed)"
         else:
             content = job_type_str
 
@@ -5,7 +5,8 @@
 Presentation utilities for batch-system job listings and statistics.
 
 This module provides `JobsPresenter`, which formats batch-system job data
-into compact CLI tables and Rich panels.
+into compact CLI tables and Rich panels, and `JobsWatcher`,
+which keeps such a summary refreshed in the terminal.
 
 Unlike many other qq modules, this module operates purely
 on information obtained directly from the batch system
@@ -13,5 +14,6 @@ and does not use qq info files.
 """
 
 from .presenter import JobsPresenter
+from .watcher import JobsWatcher
 
-__all__ = ["JobsPresenter"]
+__all__ = ["JobsPresenter", "JobsWatcher"]
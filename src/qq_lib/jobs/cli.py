@@ -4,17 +4,21 @@
 
 import getpass
 import sys
+from pathlib import Path
 from typing import NoReturn
 
 import click
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 
-from qq_lib.batch.interface import BatchMeta
+from qq_lib.batch.interface import BatchJobInterface, BatchMeta
 from qq_lib.core.click_format import GNUHelpColorsCommand
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
+from qq_lib.core.records import OutputFormat
 from qq_lib.jobs.presenter import JobsPresenter
+from qq_lib.jobs.watcher import JobsWatcher
+from qq_lib.workflow import WorkflowPresenter, WorkflowState
 
 logger = get_logger(__name__)
 
@@ -45,30 +49,126 @@ logger = get_logger(__name__)
     help="Include both unfinished and finished jobs in the summary.",
 )
 @click.option("--yaml", is_flag=True, help="Output job metadata in YAML format.")
-def jobs(user: str, extra: bool, all: bool, yaml: bool) -> NoReturn:
+@click.option(
+    "-w",
+    "--workflow",
+    type=str,
+    default=None,
+    help="Only show jobs of the specified submitted workflow and summarize the progress of its steps.",
+)
+@click.option(
+    "--format",
+    type=click.Choice([str(f) for f in OutputFormat], case_sensitive=False),
+    default=None,
+    help="Output job metadata in a machine-readable format.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep the summary open and refresh it periodically until interrupted by Ctrl+C.",
+)
+@click.option(
+    "--plain",
+    is_flag=True,
+    help="Write the jobs as plain rows as soon as they are formatted. Faster for large numbers of jobs.",
+)
+@click.option(
+    "--sort",
+    type=click.Choice(list(JobsPresenter.SORT_KEYS), case_sensitive=False),
+    default=None,
+    help="Sort the jobs by the specified key. Implies '--plain'.",
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Show at most the specified number of rows. Implies '--plain'.",
+)
+@click.option(
+    "--page",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Page of '--limit' rows to show. Implies '--plain'.",
+)
+def jobs(
+    user: str,
+    extra: bool,
+    all: bool,
+    yaml: bool,
+    workflow: str | None,
+    format: str | None,
+    watch: bool,
+    plain: bool,
+    sort: str | None,
+    limit: int | None,
+    page: int,
+) -> NoReturn:
     try:
+        plain = plain or bool(sort) or bool(limit) or page != 1
+        if sum([yaml, bool(format), watch, plain]) > 1:
+            raise QQError(
+                "Options '--yaml', '--format', '--watch', and '--plain' cannot be used together."
+            )
+
         batch_system = BatchMeta.fromEnvVarOrGuess()
         if not user:
             # use the current user, if `--user` is not specified
             user = getpass.getuser()
 
-        if all:
-            jobs = batch_system.getBatchJobs(user)
-        else:
-            jobs = batch_system.getUnfinishedBatchJobs(user)
+        state = None
+        if workflow:
+            state = WorkflowState.fromFile(WorkflowState.getPath(Path(workflow)))
+            job_ids = state.getJobIds()
+
+        presenter = JobsPresenter(batch_system, [], extra, all or bool(workflow))
+        console = Console(record=False, markup=False)
+
+        # machine-readable outputs contain all information about the jobs
+        columns = None if yaml or format else presenter.getRequiredColumns(sort)
+
+        def get_jobs() -> list[BatchJobInterface]:
+            if all or workflow:
+                jobs = batch_system.getBatchJobs(user, columns)
+            else:
+                jobs = batch_system.getUnfinishedBatchJobs(user, columns)
+
+            if state:
+                jobs = [job for job in jobs if job.getId() in job_ids]
+
+            if jobs:
+                batch_system.sortJobs(jobs)
+            return jobs
+
+        def render(jobs: list[BatchJobInterface]) -> RenderableType:
+            presenter.update(jobs)
+            panel = presenter.createJobsInfoPanel(console)
+            if state:
+                return Group(WorkflowPresenter(state, jobs).createSummaryTable(), panel)
+            return panel
+
+        if watch:
+            JobsWatcher(get_jobs, render, console).watch()
+            sys.exit(0)
+
+        jobs = get_jobs()
+        if format:
+            presenter.update(jobs)
+            presenter.dumpRecords(OutputFormat.fromStr(format))
+            sys.exit(0)
 
         if not jobs:
             logger.info("No jobs found.")
             sys.exit(0)
 
-        batch_system.sortJobs(jobs)
-        presenter = JobsPresenter(batch_system, jobs, extra, all)
         if yaml:
+            presenter.update(jobs)
             presenter.dumpYaml()
+        elif plain:
+            presenter.update(jobs)
+            presenter.dumpPlain(sort, limit, page)
         else:
-            console = Console(record=False, markup=False)
-            panel = presenter.createJobsInfoPanel(console)
-            console.print(panel)
+            console.print(render(jobs))
 
         sys.exit(0)
     except QQError as e:
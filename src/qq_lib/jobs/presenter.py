@@ -1,8 +1,14 @@
 # Released under MIT License.
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
+import heapq
+import re
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from itertools import islice
+from typing import IO
 
 from rich.console import Console, Group
 from rich.panel import Panel
@@ -12,11 +18,13 @@ from tabulate import Line, TableFormat, tabulate
 
 from qq_lib.batch.interface import BatchJobInterface
 from qq_lib.batch.interface.interface import BatchInterface
+from qq_lib.batch.interface.job_index import NodeJobIndex
 from qq_lib.core.common import (
     format_duration_wdhhmmss,
     get_panel_width,
 )
 from qq_lib.core.config import CFG
+from qq_lib.core.records import OutputFormat, RecordWriter
 from qq_lib.properties.states import BatchState
 
 
@@ -59,6 +67,48 @@ class JobsPresenter:
         "reset": "\033[0m",
     }
 
+    # States of array members ordered by their significance for the summary row of the array.
+    _ARRAY_STATE_PRIORITY = [
+        BatchState.RUNNING,
+        BatchState.EXITING,
+        BatchState.QUEUED,
+        BatchState.HELD,
+        BatchState.WAITING,
+        BatchState.MOVING,
+        BatchState.SUSPENDED,
+        BatchState.FAILED,
+        BatchState.FINISHED,
+        BatchState.UNKNOWN,
+    ]
+
+    # Keys by which the jobs can be sorted in the plain output:
+    # name -> (key of a group of jobs, sort in descending order)
+    SORT_KEYS: dict[str, tuple[Callable[[list[BatchJobInterface]], object], bool]] = {
+        "cpus": (lambda group: sum(job.getNCPUs() or 0 for job in group), True),
+        "gpus": (lambda group: sum(job.getNGPUs() or 0 for job in group), True),
+        "nodes": (lambda group: sum(job.getNNodes() or 0 for job in group), True),
+        "submitted": (
+            lambda group: group[0].getSubmissionTime() or datetime.min,
+            True,
+        ),
+        "started": (lambda group: group[0].getStartTime() or datetime.min, True),
+        "name": (lambda group: group[0].getName() or "", False),
+        "user": (lambda group: group[0].getUser() or "", False),
+        "queue": (lambda group: group[0].getQueue() or "", False),
+    }
+
+    # Columns whose information is needed to sort the jobs by the individual keys of `SORT_KEYS`.
+    _SORT_COLUMNS = {
+        "submitted": "Times",
+        "started": "Times",
+        "name": "Job Name",
+        "user": "User",
+        "queue": "Queue",
+    }
+
+    # Regex matching ANSI escape sequences.
+    _ANSI_REGEX = re.compile(r"\033\[[0-9;]*m")
+
     # Table formatting configuration for `tabulate`.
     _COMPACT_TABLE = TableFormat(
         lineabove=Line("", "", "", ""),
@@ -93,6 +143,45 @@ class JobsPresenter:
         self._extra = extra
         self._all = all
 
+        # rows of the last created table: signature of a group of jobs -> (group, row)
+        self._rows: dict[tuple, tuple[list[BatchJobInterface], list[str]]] = {}
+
+    def update(self, jobs: list[BatchJobInterface]) -> None:
+        """
+        Replace the presented jobs with their refreshed versions.
+
+        Only rows of the jobs that have changed since the last call of
+        `createJobsInfoPanel` are rebuilt when the panel is created again.
+
+        Args:
+            jobs (list[BatchJobInterface]): Refreshed list of jobs.
+        """
+        self._jobs = jobs
+
+    def getRequiredColumns(self, sort: str | None = None) -> set[str] | None:
+        """
+        Get the columns whose information is needed to present the jobs.
+
+        The result can be passed to the batch system so that it does not fetch
+        information that would not be shown.
+
+        Args:
+            sort (str | None): Key from `SORT_KEYS` the jobs will be sorted by.
+
+        Returns:
+            set[str] | None: Headers of the required columns or None
+            if all information about the jobs is needed.
+        """
+        # additional information about the jobs may require any field
+        if self._extra:
+            return None
+
+        columns = set(self._getVisibleHeaders())
+        if sort and (column := JobsPresenter._SORT_COLUMNS.get(sort)):
+            columns.add(column)
+
+        return columns
+
     def createJobsInfoPanel(self, console: Console | None = None) -> Group:
         """
         Create a Rich panel displaying job information and statistics.
@@ -142,6 +231,242 @@ class JobsPresenter:
         for job in self._jobs:
             print(job.toYaml())
 
+    def dumpRecords(self, format: OutputFormat) -> None:
+        """
+        Print machine-readable records of all jobs to stdout.
+
+        Args:
+            format (OutputFormat): Format of the output.
+        """
+        RecordWriter(format, BatchJobInterface.RECORD_FIELDS).writeAll(
+            job.toRecord() for job in self._jobs
+        )
+
+    def dumpPlain(
+        self,
+        sort: str | None = None,
+        limit: int | None = None,
+        page: int = 1,
+        stream: IO[str] | None = None,
+    ) -> None:
+        """
+        Write the jobs table followed by job statistics directly into a stream.
+
+        Unlike `createJobsInfoPanel`, rows are written in chunks of
+        `CFG.jobs_presenter.plain_chunk_size` as soon as they are formatted.
+        The widths of the columns are determined from the first chunk; values
+        wider than their column in later chunks widen the column. Colors are
+        only used if the stream is a terminal.
+
+        Statistics include all jobs, not only those on the shown page.
+
+        Args:
+            sort (str | None): Key from `SORT_KEYS` to sort the jobs by.
+                If None, the jobs are shown in their original order.
+            limit (int | None): Maximal number of rows shown. If None, all rows are shown.
+            page (int): Page of `limit` rows to show (starting from 1).
+            stream (IO[str] | None): Stream to write into. Defaults to stdout.
+        """
+        stream = stream or sys.stdout
+        color = stream.isatty()
+        headers = self._getVisibleHeaders()
+
+        groups = self._groupArrays()
+        selected = JobsPresenter._selectGroups(groups, sort, limit, page)
+
+        widths: list[int] | None = None
+        chunk: list[tuple[list[str], BatchJobInterface]] = []
+        for group in selected:
+            row = (
+                self._createJobRow(group[0], headers)
+                if len(group) == 1
+                else self._createArrayRow(group, headers)
+            )
+            chunk.append((row, group[0]))
+            if len(chunk) >= CFG.jobs_presenter.plain_chunk_size:
+                widths = self._writePlainChunk(stream, headers, chunk, widths, color)
+                chunk = []
+
+        if chunk or widths is None:
+            self._writePlainChunk(stream, headers, chunk, widths, color)
+
+        # statistics of the jobs that are not shown
+        shown = {id(group) for group in selected}
+        for group in groups:
+            if id(group) not in shown:
+                for job in group:
+                    self._stats.addJob(
+                        job.getState(),
+                        job.getNCPUs() or 0,
+                        job.getNGPUs() or 0,
+                        job.getNNodes() or 0,
+                    )
+
+        footer = ["", self._stats.createPlainSummary()]
+        if limit:
+            first = (page - 1) * limit
+            pages = max(-(-len(groups) // limit), 1)
+            footer.append(
+                f"Showing rows {first + 1}-{first + len(selected)} of {len(groups)} (page {page} of {pages})."
+                if selected
+                else f"No rows on page {page} of {pages}."
+            )
+        stream.write("\n".join(footer) + "\n")
+        stream.flush()
+
+    def dumpByNode(self, index: NodeJobIndex, stream: IO[str] | None = None) -> None:
+        """
+        Write a table of the occupied nodes with the jobs running on them.
+
+        Nodes are sorted by name. Colors are only used if the stream is a terminal.
+
+        Args:
+            index (NodeJobIndex): Jobs indexed by nodes.
+            stream (IO[str] | None): Stream to write into. Defaults to stdout.
+        """
+        stream = stream or sys.stdout
+        color = stream.isatty()
+
+        def natural(name: str) -> list[str | int]:
+            return [
+                int(t) if t.isdigit() else t.lower() for t in re.split(r"(\d+)", name)
+            ]
+
+        rows = []
+        jobs: set[str] = set()
+        users: set[str] = set()
+        for node in sorted(index.getNodes(), key=natural):
+            node_jobs = index.getJobs(node)
+            jobs.update(job.getId() for job in node_jobs)
+            users.update(index.getUsers(node))
+            rows.append(
+                [
+                    JobsPresenter._mainColor(node),
+                    JobsPresenter._mainColor(str(len(node_jobs))),
+                    JobsPresenter._mainColor(index.formatUsers(node)),
+                    JobsPresenter._secondaryColor(
+                        " ".join(
+                            JobsPresenter._shortenJobId(job.getId())
+                            for job in node_jobs
+                        )
+                    ),
+                ]
+            )
+
+        table = tabulate(
+            rows,
+            headers=self._formatHeaders(["Node", "Jobs", "Users", "Job IDs"]),
+            tablefmt=JobsPresenter._COMPACT_TABLE,
+            stralign="center",
+            numalign="center",
+            disable_numparse=True,
+        )
+        text = (
+            f"{table}\n\n{len(rows)} nodes are occupied by {len(jobs)} jobs of {len(users)} users.\n"
+            if rows
+            else "No jobs are running.\n"
+        )
+        stream.write(text if color else JobsPresenter._ANSI_REGEX.sub("", text))
+        stream.flush()
+
+    @staticmethod
+    def _selectGroups(
+        groups: list[list[BatchJobInterface]],
+        sort: str | None,
+        limit: int | None,
+        page: int,
+    ) -> list[list[BatchJobInterface]]:
+        """
+        Select the groups of jobs shown on a page.
+
+        If both `sort` and `limit` are specified, only the groups up to the requested
+        page are ordered (using a heap) instead of sorting all groups.
+
+        Args:
+            groups (list[list[BatchJobInterface]]): All groups of jobs.
+            sort (str | None): Key from `SORT_KEYS` to sort the groups by.
+            limit (int | None): Number of groups on a page. If None, all groups are selected.
+            page (int): Page to select (starting from 1).
+
+        Returns:
+            list[list[BatchJobInterface]]: Groups shown on the page, in display order.
+        """
+        end = limit * page if limit else None
+
+        if sort:
+            key, descending = JobsPresenter.SORT_KEYS[sort]
+            if end is None:
+                ordered = sorted(groups, key=key, reverse=descending)
+            elif descending:
+                ordered = heapq.nlargest(end, groups, key=key)
+            else:
+                ordered = heapq.nsmallest(end, groups, key=key)
+        else:
+            ordered = groups
+
+        if limit is None:
+            return list(ordered)
+        return list(islice(ordered, end - limit, end))
+
+    def _writePlainChunk(
+        self,
+        stream: IO[str],
+        headers: list[str],
+        chunk: list[tuple[list[str], BatchJobInterface]],
+        widths: list[int] | None,
+        color: bool,
+    ) -> list[int]:
+        """
+        Write a chunk of rows of the plain jobs table.
+
+        The header is written before the first chunk.
+
+        Args:
+            stream (IO[str]): Stream to write into.
+            headers (list[str]): List of headers included in the rows.
+            chunk (list[tuple[list[str], BatchJobInterface]]): Rows to write,
+                each with the job used for the extra information.
+            widths (list[int] | None): Widths of the columns. None for the first chunk.
+            color (bool): Whether to keep ANSI colors.
+
+        Returns:
+            list[int]: Widths of the columns after writing the chunk.
+        """
+        formatted_headers = self._formatHeaders(headers)
+        first = widths is None
+        widths = [
+            max(
+                [0 if first else widths[i], JobsPresenter._visibleLength(h)]
+                + [JobsPresenter._visibleLength(row[i]) for row, _ in chunk]
+            )
+            for i, h in enumerate(formatted_headers)
+        ]
+
+        lines = [JobsPresenter._padRow(formatted_headers, widths)] if first else []
+        for row, job in chunk:
+            lines.append(JobsPresenter._padRow(row, widths))
+            if self._extra:
+                lines.append(JobsPresenter._formatExtraInfo(job))
+
+        text = "\n".join(lines) + "\n" if lines else ""
+        stream.write(text if color else JobsPresenter._ANSI_REGEX.sub("", text))
+        stream.flush()
+        return widths
+
+    @staticmethod
+    def _padRow(row: list[str], widths: list[int]) -> str:
+        """Center the cells of a row in their columns and join them."""
+        cells = []
+        for cell, width in zip(row, widths):
+            padding = width - JobsPresenter._visibleLength(cell)
+            cells.append(" " * (padding // 2) + cell + " " * (padding - padding // 2))
+        return " ".join(cells)
+
+    @staticmethod
+    def _visibleLength(string: str) -> int:
+        """Get the length of a string without ANSI escape sequences."""
+        return len(JobsPresenter._ANSI_REGEX.sub("", string))
+
     def _createBasicJobsTable(self) -> str:
         """
         Build a compact tabulated string representation of the job list.
@@ -153,9 +478,36 @@ class JobsPresenter:
             - Uses `tabulate` with `_COMPACT_TABLE` format because
               Rich's Table is prohibitively slow for large number of items.
             - Updates internal job statistics via `self._stats`.
+            - Members of the same array job are collapsed into a single summary row.
+            - Rows of jobs that have not changed since the previous call are reused,
+              only their time-dependent columns are refreshed.
         """
         headers = self._getVisibleHeaders()
-        rows = [self._createJobRow(job, headers) for job in self._jobs]
+        rows = []
+        new_rows: dict[tuple, tuple[list[BatchJobInterface], list[str]]] = {}
+        for group in self._groupArrays():
+            signature = JobsPresenter._getSignature(group, headers)
+            if cached := self._rows.pop(signature, None):
+                group, row = cached
+                self._refreshRow(group, row, headers)
+            elif len(group) == 1:
+                row = self._createJobRow(group[0], headers)
+            else:
+                row = self._createArrayRow(group, headers)
+
+            new_rows[signature] = (group, row)
+            rows.append(row)
+
+        # remove jobs that have changed or disappeared from the statistics
+        for group, _ in self._rows.values():
+            for job in group:
+                self._stats.removeJob(
+                    job.getState(),
+                    job.getNCPUs() or 0,
+                    job.getNGPUs() or 0,
+                    job.getNNodes() or 0,
+                )
+        self._rows = new_rows
 
         return tabulate(
             rows,
@@ -205,7 +557,6 @@ class JobsPresenter:
             list[str]: List of formatted cell values.
         """
         state = job.getState()
-        start_time, end_time = self._getJobTimes(job, state)
 
         # update statistics
         cpus = job.getNCPUs() or 0
@@ -213,30 +564,175 @@ class JobsPresenter:
         nodes = job.getNNodes() or 0
         self._stats.addJob(state, cpus, gpus, nodes)
 
-        # build the row
-        row_data = {
-            "S": JobsPresenter._color(state.toCode(), state.color),
-            "Job ID": JobsPresenter._mainColor(
+        # build the row; only the cells of the shown columns are computed
+        cells: dict[str, Callable[[], str | None]] = {
+            "S": lambda: JobsPresenter._color(state.toCode(), state.color),
+            "Job ID": lambda: JobsPresenter._mainColor(
                 JobsPresenter._shortenJobId(job.getId())
             ),
-            "User": JobsPresenter._mainColor(job.getUser() or ""),
-            "Job Name": JobsPresenter._mainColor(
+            "User": lambda: JobsPresenter._mainColor(job.getUser() or ""),
+            "Job Name": lambda: JobsPresenter._mainColor(
                 JobsPresenter._shortenJobName(job.getName() or "")
             ),
-            "Queue": JobsPresenter._mainColor(job.getQueue() or ""),
-            "NCPUs": JobsPresenter._mainColor(str(cpus)),
-            "NGPUs": JobsPresenter._mainColor(str(gpus)),
-            "NNodes": JobsPresenter._mainColor(str(nodes)),
-            "Times": JobsPresenter._formatTime(
-                state, start_time, end_time, job.getWalltime()
+            "Queue": lambda: JobsPresenter._mainColor(job.getQueue() or ""),
+            "NCPUs": lambda: JobsPresenter._mainColor(str(cpus)),
+            "NGPUs": lambda: JobsPresenter._mainColor(str(gpus)),
+            "NNodes": lambda: JobsPresenter._mainColor(str(nodes)),
+            "Times": lambda: JobsPresenter._formatTime(
+                state, *self._getJobTimes(job, state), job.getWalltime()
+            ),
+            "Node": lambda: JobsPresenter._formatNodesOrComment(state, job),
+            "%CPU": lambda: JobsPresenter._formatUtilCPU(job.getUtilCPU()),
+            "%Mem": lambda: JobsPresenter._formatUtilMem(job.getUtilMem()),
+            "Exit": lambda: (
+                JobsPresenter._formatExitCode(job, state) if self._all else None
+            ),
+        }
+
+        return [cells[header]() for header in headers if header in cells]
+
+    def _createArrayRow(
+        self, jobs: list[BatchJobInterface], headers: list[str]
+    ) -> list[str]:
+        """
+        Create a single summary row for members of an array job.
+
+        The state of the row is the most significant state of the members
+        and the node column lists the number of members in each state.
+        Resources are summed over all members.
+
+        Args:
+            jobs (list[BatchJobInterface]): Members of the array job.
+            headers (list[str]): List of headers to include in the row
+
+        Returns:
+            list[str]: List of formatted cell values.
+        """
+        counts: dict[BatchState, int] = {}
+        cpus = gpus = nodes = 0
+        for job in jobs:
+            job_state = job.getState()
+            counts[job_state] = counts.get(job_state, 0) + 1
+
+            job_cpus = job.getNCPUs() or 0
+            job_gpus = job.getNGPUs() or 0
+            job_nodes = job.getNNodes() or 0
+            self._stats.addJob(job_state, job_cpus, job_gpus, job_nodes)
+            cpus += job_cpus
+            gpus += job_gpus
+            nodes += job_nodes
+
+        states = sorted(counts, key=JobsPresenter._ARRAY_STATE_PRIORITY.index)
+        state = states[0]
+        representative = next(job for job in jobs if job.getState() == state)
+
+        def array_id() -> str:
+            shortened = JobsPresenter._shortenJobId(jobs[0].getArrayId() or "")
+            return shortened if "[]" in shortened else shortened + "[]"
+
+        # only the cells of the shown columns are computed
+        cells: dict[str, Callable[[], str | None]] = {
+            "S": lambda: JobsPresenter._color(state.toCode(), state.color),
+            "Job ID": lambda: JobsPresenter._mainColor(array_id()),
+            "User": lambda: JobsPresenter._mainColor(representative.getUser() or ""),
+            "Job Name": lambda: JobsPresenter._mainColor(
+                JobsPresenter._shortenJobName(representative.getName() or "")
+            ),
+            "Queue": lambda: JobsPresenter._mainColor(representative.getQueue() or ""),
+            "NCPUs": lambda: JobsPresenter._mainColor(str(cpus)),
+            "NGPUs": lambda: JobsPresenter._mainColor(str(gpus)),
+            "NNodes": lambda: JobsPresenter._mainColor(str(nodes)),
+            "Times": lambda: JobsPresenter._formatTime(
+                state,
+                *self._getJobTimes(representative, state),
+                representative.getWalltime(),
+            ),
+            "Node": lambda: " ".join(
+                JobsPresenter._color(f"{counts[s]}{s.toCode()}", s.color)
+                for s in states
+            ),
+            "%CPU": lambda: "",
+            "%Mem": lambda: "",
+            "Exit": lambda: (
+                JobsPresenter._formatExitCode(representative, state)
+                if self._all
+                else None
             ),
-            "Node": JobsPresenter._formatNodesOrComment(state, job),
-            "%CPU": JobsPresenter._formatUtilCPU(job.getUtilCPU()),
-            "%Mem": JobsPresenter._formatUtilMem(job.getUtilMem()),
-            "Exit": JobsPresenter._formatExitCode(job, state) if self._all else None,
         }
 
-        return [row_data[header] for header in headers if header in row_data]
+        return [cells[header]() for header in headers if header in cells]
+
+    def _refreshRow(
+        self, group: list[BatchJobInterface], row: list[str], headers: list[str]
+    ) -> None:
+        """
+        Refresh the columns of a reused row that depend on the current time.
+
+        Args:
+            group (list[BatchJobInterface]): Job or members of an array job shown in the row.
+            row (list[str]): The row to refresh in place.
+            headers (list[str]): List of headers included in the row.
+        """
+        if len(group) == 1:
+            state = group[0].getState()
+            representative = group[0]
+            if "Node" in headers:
+                row[headers.index("Node")] = JobsPresenter._formatNodesOrComment(
+                    state, representative
+                )
+        else:
+            states = sorted(
+                {job.getState() for job in group},
+                key=JobsPresenter._ARRAY_STATE_PRIORITY.index,
+            )
+            state = states[0]
+            representative = next(job for job in group if job.getState() == state)
+
+        if "Times" in headers:
+            start_time, end_time = self._getJobTimes(representative, state)
+            row[headers.index("Times")] = JobsPresenter._formatTime(
+                state, start_time, end_time, representative.getWalltime()
+            )
+
+    @staticmethod
+    def _getSignature(group: list[BatchJobInterface], headers: list[str]) -> tuple:
+        """
+        Get a signature of a group of jobs used to detect changes between refreshes.
+
+        Args:
+            group (list[BatchJobInterface]): Job or members of an array job.
+            headers (list[str]): List of headers included in the row.
+
+        Returns:
+            tuple: IDs, states, and (if shown) utilizations of the jobs.
+        """
+        show_cpu, show_mem = "%CPU" in headers, "%Mem" in headers
+        return tuple(
+            (
+                job.getId(),
+                job.getState(),
+                job.getUtilCPU() if show_cpu else None,
+                job.getUtilMem() if show_mem else None,
+            )
+            for job in group
+        )
+
+    def _groupArrays(self) -> list[list[BatchJobInterface]]:
+        """
+        Group members of the same array job together.
+
+        Jobs that are not members of an array job form groups of their own.
+        Groups are ordered by the position of their first job.
+
+        Returns:
+            list[list[BatchJobInterface]]: Groups of jobs.
+        """
+        groups: dict[tuple[bool, object], list[BatchJobInterface]] = {}
+        for job in self._jobs:
+            key = (True, array_id) if (array_id := job.getArrayId()) else (False, job)
+            groups.setdefault(key, []).append(job)
+
+        return list(groups.values())
 
     @staticmethod
     def _getJobTimes(
@@ -296,29 +792,47 @@ class JobsPresenter:
         split_table = table.splitlines()
         table_with_extra_info = split_table[0] + "\n"
 
-        for line, job in zip(split_table[1:], self._jobs):
+        for line, job in zip(
+            split_table[1:], (group[0] for group in self._groupArrays())
+        ):
             table_with_extra_info += line + "\n"
+            table_with_extra_info += JobsPresenter._formatExtraInfo(job) + "\n"
 
-            if input_machine := job.getInputMachine():
-                table_with_extra_info += JobsPresenter._color(
-                    f" >   Input machine:   {input_machine}\n",
-                    CFG.jobs_presenter.extra_info_style,
-                )
+        return table_with_extra_info
 
-            if input_dir := job.getInputDir():
-                table_with_extra_info += JobsPresenter._color(
-                    f" >   Input directory: {str(input_dir)}\n",
-                    CFG.jobs_presenter.extra_info_style,
-                )
+    @staticmethod
+    def _formatExtraInfo(job: BatchJobInterface) -> str:
+        """
+        Format additional information about a job shown below its row.
 
-            if comment := job.getComment():
-                table_with_extra_info += JobsPresenter._color(
-                    f" >   Comment:         {comment}\n",
-                    CFG.jobs_presenter.extra_info_style,
-                )
-            table_with_extra_info += "\n"
+        Lines where job attributes are missing are skipped.
 
-        return table_with_extra_info
+        Args:
+            job (BatchJobInterface): Job to format the information for.
+
+        Returns:
+            str: ANSI-colored lines with the additional information, each terminated by a newline.
+        """
+        extra_info = ""
+        if input_machine := job.getInputMachine():
+            extra_info += JobsPresenter._color(
+                f" >   Input machine:   {input_machine}\n",
+                CFG.jobs_presenter.extra_info_style,
+            )
+
+        if input_dir := job.getInputDir():
+            extra_info += JobsPresenter._color(
+                f" >   Input directory: {str(input_dir)}\n",
+                CFG.jobs_presenter.extra_info_style,
+            )
+
+        if comment := job.getComment():
+            extra_info += JobsPresenter._color(
+                f" >   Comment:         {comment}\n",
+                CFG.jobs_presenter.extra_info_style,
+            )
+
+        return extra_info
 
     @staticmethod
     def _formatTime(
@@ -643,6 +1157,57 @@ class JobsStatistics:
             self.n_unknown_gpus += gpus
             self.n_unknown_nodes += nodes
 
+    def removeJob(self, state: BatchState, cpus: int, gpus: int, nodes: int) -> None:
+        """
+        Remove a job previously added using `addJob` from the collected statistics.
+
+        Args:
+            state (BatchState): State of the job according to the batch system.
+            cpus (int): Number of CPUs requested by the job.
+            gpus (int): Number of GPUs requested by the job.
+            nodes (int): Number of nodes requested by the job.
+        """
+        if (count := self.n_jobs.get(state, 0) - 1) > 0:
+            self.n_jobs[state] = count
+        else:
+            self.n_jobs.pop(state, None)
+
+        if state in {BatchState.QUEUED, BatchState.HELD}:
+            self.n_requested_cpus -= cpus
+            self.n_requested_gpus -= gpus
+            self.n_requested_nodes -= nodes
+        elif state in {BatchState.RUNNING, BatchState.EXITING}:
+            self.n_allocated_cpus -= cpus
+            self.n_allocated_gpus -= gpus
+            self.n_allocated_nodes -= nodes
+        elif state == BatchState.UNKNOWN:
+            self.n_unknown_cpus -= cpus
+            self.n_unknown_gpus -= gpus
+            self.n_unknown_nodes -= nodes
+
+    def createPlainSummary(self) -> str:
+        """
+        Create a plain-text summary of the job statistics.
+
+        Returns:
+            str: Number of jobs in each state and the requested and allocated resources.
+        """
+        jobs = "  ".join(
+            f"{state.toCode()} {self.n_jobs[state]}"
+            for state in BatchState
+            if state in self.n_jobs
+        )
+        summary = (
+            f"Jobs: {jobs}{'  ' if jobs else ''}"
+            f"{CFG.jobs_presenter.sum_jobs_code} {sum(self.n_jobs.values())}\n"
+            f"Requested: {self.n_requested_cpus} CPUs  {self.n_requested_gpus} GPUs  {self.n_requested_nodes} nodes\n"
+            f"Allocated: {self.n_allocated_cpus} CPUs  {self.n_allocated_gpus} GPUs  {self.n_allocated_nodes} nodes"
+        )
+        if self.n_unknown_cpus or self.n_unknown_gpus or self.n_unknown_nodes:
+            summary += f"\nUnknown:   {self.n_unknown_cpus} CPUs  {self.n_unknown_gpus} GPUs  {self.n_unknown_nodes} nodes"
+
+        return summary
+
     def createStatsPanel(self) -> Group:
         """
         Build a Rich Group containing job statistics sections.
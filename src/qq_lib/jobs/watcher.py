@@ -0,0 +1,101 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Live monitoring of batch-system jobs.
+
+`JobsWatcher` keeps a summary of jobs refreshed in the terminal. The batch system
+is queried once per refresh. The interval between refreshes is adaptive:
+it is reset to `CFG.jobs_presenter.watch_min_interval` whenever a job appears,
+disappears, or changes its state and grows up to `CFG.jobs_presenter.watch_max_interval`
+while nothing changes.
+"""
+
+from collections.abc import Callable
+from datetime import datetime
+from time import sleep
+from typing import TYPE_CHECKING
+
+from rich.console import Console, Group, RenderableType
+from rich.live import Live
+from rich.text import Text
+
+from qq_lib.batch.interface import BatchJobInterface
+from qq_lib.core.config import CFG
+from qq_lib.core.logger import get_logger
+
+if TYPE_CHECKING:
+    from qq_lib.properties.states import BatchState
+
+logger = get_logger(__name__)
+
+
+class JobsWatcher:
+    """
+    Periodically refreshes a summary of jobs until interrupted.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], list[BatchJobInterface]],
+        render: Callable[[list[BatchJobInterface]], RenderableType],
+        console: Console | None = None,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            fetch (Callable[[], list[BatchJobInterface]]): Queries the batch system for the jobs.
+            render (Callable[[list[BatchJobInterface]], RenderableType]): Creates
+                the summary of the jobs.
+            console (Console | None): Optional Rich Console instance.
+                If None, a new Console will be created.
+        """
+        self._fetch = fetch
+        self._render = render
+        self._console = console or Console()
+
+        # IDs and states of the jobs at the previous refresh
+        self._states: dict[str, BatchState] | None = None
+        self._interval = CFG.jobs_presenter.watch_min_interval
+
+    def watch(self) -> None:
+        """
+        Refresh the summary of the jobs until interrupted by the user (Ctrl+C).
+        """
+        try:
+            with Live(console=self._console, auto_refresh=False) as live:
+                while True:
+                    live.update(self.refresh(), refresh=True)
+                    sleep(self._interval)
+        except KeyboardInterrupt:
+            logger.debug("Watching of jobs interrupted by the user.")
+
+    def refresh(self) -> RenderableType:
+        """
+        Query the jobs, adapt the refresh interval, and render the summary of the jobs.
+
+        Returns:
+            RenderableType: Summary of the jobs followed by the time of the refresh.
+        """
+        jobs = self._fetch()
+        states = {job.getId(): job.getState() for job in jobs}
+
+        if states != self._states:
+            self._interval = CFG.jobs_presenter.watch_min_interval
+        else:
+            self._interval = min(
+                self._interval * CFG.jobs_presenter.watch_backoff,
+                CFG.jobs_presenter.watch_max_interval,
+            )
+        logger.debug(f"Next refresh of jobs in {self._interval:.1f} seconds.")
+        self._states = states
+
+        return Group(
+            self._render(jobs),
+            Text(
+                f"Updated at {datetime.now().strftime(CFG.date_formats.standard)}. "
+                f"Next update in {self._interval:.0f} s. Press Ctrl+C to exit.",
+                style=CFG.jobs_presenter.extra_info_style,
+            ),
+        )
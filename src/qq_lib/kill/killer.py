@@ -1,9 +1,7 @@
 # Released under MIT License.
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
-import stat
 from datetime import datetime
-from pathlib import Path
 
 from qq_lib.core.error import QQNotSuitableError
 from qq_lib.core.logger import get_logger
@@ -87,14 +85,13 @@ class Killer(Operator):
 
     def _updateInfoFile(self) -> None:
         """
-        Mark the job as killed in the info file and lock it to prevent overwriting.
+        Mark the job as killed in the journal of the info file.
+
+        Once the job is recorded as killed, later updates of its state
+        (e.g., by a booting job) are ignored when the info file is loaded.
         """
         self._informer.setKilled(datetime.now())
-        self._informer.toFile(self._info_file)
-        # strictly speaking, we only need to lock the info file
-        # when dealing with a booting job but doing it for the other jobs
-        # which state is managed by `qq kill` does not hurt anything
-        self._lockFile(self._info_file)
+        self._informer.toJournal(self._info_file, ["job_state", "completion_time"])
 
     def _isSuspended(self) -> bool:
         """Check if the job is currently suspended."""
@@ -127,13 +124,3 @@ class Killer(Operator):
     def _isUnknownInconsistent(self) -> bool:
         """Check if the job is in an unknown or inconsistent state."""
         return self._state in {RealState.UNKNOWN, RealState.IN_AN_INCONSISTENT_STATE}
-
-    def _lockFile(self, file_path: Path) -> None:
-        """
-        Remove write permissions for an info file to prevent overwriting
-        information about the killed job.
-        """
-        current_mode = Path.stat(file_path).st_mode
-        new_mode = current_mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
-
-        Path.chmod(file_path, new_mode)
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING, NoReturn
 import click
 from rich.console import Console
 
+from qq_lib.batch.interface.inventory import NodeInventory
+from qq_lib.batch.interface.job_index import NodeJobIndex
 from qq_lib.batch.interface.meta import BatchMeta
 
 if TYPE_CHECKING:
@@ -17,6 +19,7 @@ from qq_lib.core.click_format import GNUHelpColorsCommand
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
+from qq_lib.core.records import OutputFormat
 from qq_lib.nodes.presenter import NodesPresenter
 
 logger = get_logger(__name__)
@@ -29,7 +32,13 @@ logger = get_logger(__name__)
 By default, only nodes that are available to you are shown.
 If the `--all` flag is specified, display all nodes, including those not available.
 
-Nodes are grouped heuristically into node groups based on their names.""",
+Nodes are grouped heuristically into node groups based on their names.
+
+If `--fit` is specified, display only the available nodes on which a job
+with the given resources could start right now, e.g.,
+`qq nodes --fit ncpus=64,ngpus=2,mem=256gb,work-dir=scratch_local,work-size=500gb`.
+
+If `--jobs` is specified, also display the users with jobs running on each node.""",
     cls=GNUHelpColorsCommand,
     help_options_color="bright_blue",
 )
@@ -40,18 +49,70 @@ Nodes are grouped heuristically into node groups based on their names.""",
     help="Display all nodes, including those that are down or inaccessible.",
 )
 @click.option("--yaml", is_flag=True, help="Output node metadata in YAML format.")
-def nodes(all: bool, yaml: bool) -> NoReturn:
+@click.option(
+    "--format",
+    type=click.Choice([str(f) for f in OutputFormat], case_sensitive=False),
+    default=None,
+    help="Output node metadata in a machine-readable format.",
+)
+@click.option(
+    "--plain",
+    is_flag=True,
+    help="Write the nodes as plain tables without the panel. Faster for large clusters.",
+)
+@click.option(
+    "--fit",
+    type=str,
+    default=None,
+    metavar="RESOURCES",
+    help="Display only nodes with enough free resources to start a job requesting RESOURCES now.",
+)
+@click.option(
+    "--jobs",
+    is_flag=True,
+    help="Display the users with jobs running on each node.",
+)
+def nodes(
+    all: bool,
+    yaml: bool,
+    format: str | None,
+    plain: bool,
+    fit: str | None,
+    jobs: bool,
+) -> NoReturn:
     try:
+        if sum([yaml, bool(format), plain]) > 1:
+            raise QQError(
+                "Options '--yaml', '--format', and '--plain' cannot be used together."
+            )
+        if jobs and yaml:
+            raise QQError("Options '--jobs' and '--yaml' cannot be used together.")
+
         BatchSystem = BatchMeta.fromEnvVarOrGuess()
         nodes: list[BatchNodeInterface] = BatchSystem.getNodes()
         user = getpass.getuser()
 
-        if not all:
+        # jobs can only start on available nodes
+        if not all or fit:
             nodes = [n for n in nodes if n.isAvailableToUser(user)]
 
-        presenter = NodesPresenter(nodes, user, all)
-        if yaml:
+        if fit:
+            nodes = _fit_nodes(nodes, fit)
+
+        # all jobs are obtained at once; no node is queried individually
+        index = (
+            NodeJobIndex(BatchSystem.getAllUnfinishedBatchJobs(NodeJobIndex.COLUMNS))
+            if jobs
+            else None
+        )
+
+        presenter = NodesPresenter(nodes, user, all, index)
+        if format:
+            presenter.dumpRecords(OutputFormat.fromStr(format))
+        elif yaml:
             presenter.dumpYaml()
+        elif plain:
+            presenter.dumpPlain()
         else:
             console = Console(record=False, markup=False)
             panel = presenter.createNodesInfoPanel(console)
@@ -65,3 +126,37 @@ def nodes(all: bool, yaml: bool) -> NoReturn:
         logger.critical(e, exc_info=True, stack_info=True)
         print()
         sys.exit(CFG.exit_codes.unexpected_error)
+
+
+def _fit_nodes(
+    nodes: list["BatchNodeInterface"], spec: str
+) -> list["BatchNodeInterface"]:
+    """
+    Get the nodes on which a job with the specified resources could start now.
+
+    Args:
+        nodes (list[BatchNodeInterface]): The available nodes.
+        spec (str): Specification of the resources of the job.
+
+    Returns:
+        list[BatchNodeInterface]: The candidate nodes.
+
+    Raises:
+        QQError: If the specification is invalid or no node can host the job.
+    """
+    resources = NodeInventory.parseResources(spec)
+    candidates = NodeInventory(nodes).fit(resources)
+    if not candidates:
+        raise QQError(
+            f"No available node can currently host a job requesting '{spec}'."
+        )
+
+    logger.info(
+        f"{len(candidates)} of {len(nodes)} available nodes can currently host a job requesting '{spec}'."
+    )
+    if len(candidates) < (nnodes := resources.nnodes or 1):
+        logger.warning(
+            f"The job requests {nnodes} nodes but only {len(candidates)} can currently host it."
+        )
+
+    return candidates
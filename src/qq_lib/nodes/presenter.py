@@ -2,19 +2,26 @@
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
 import re
+import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
 from itertools import zip_longest
+from typing import IO
 
+from rich.color import ColorSystem
 from rich.console import Console, Group
 from rich.panel import Panel
 from rich.rule import Rule
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
+from tabulate import Line, TableFormat, tabulate
 
+from qq_lib.batch.interface.job_index import NodeJobIndex
 from qq_lib.batch.interface.node import BatchNodeInterface
 from qq_lib.core.common import get_panel_width
 from qq_lib.core.config import CFG
+from qq_lib.core.records import OutputFormat, RecordWriter
 from qq_lib.properties.size import Size
 
 
@@ -23,7 +30,13 @@ class NodeGroup:
     Represents a logical group of compute nodes within a batch system.
     """
 
-    def __init__(self, name: str, nodes: list[BatchNodeInterface], user: str):
+    def __init__(
+        self,
+        name: str,
+        nodes: list[BatchNodeInterface],
+        user: str,
+        index: NodeJobIndex | None = None,
+    ):
         """
         Initialize a NodeGroup with a name and a list of nodes for the specified user.
 
@@ -31,22 +44,21 @@ class NodeGroup:
             name (str): Name identifying this group.
             nodes (list[BatchNodeInterface]): List of nodes in this group.
             user (str): User to check node availability for.
+            index (NodeJobIndex | None): Jobs indexed by nodes. If provided,
+                users with jobs running on each node are displayed.
         """
         self.name = name
         self.nodes = nodes
         self.stats = NodeGroupStats()
 
         self._user = user
+        self._index = index
+
+        self._shared_properties: list[str] = []
 
         self._sortNodes()
         self._setSharedProperties()
-
-        self._show_gpus = self._shouldShowGPUs()
-        self._show_gpu_mem = self._shouldShowGPUMem()
-        self._show_local = self._shouldShowLocalScratch()
-        self._show_ssd = self._shouldShowSSDScratch()
-        self._show_shared = self._shouldShowSharedScratch()
-        self._show_props = self._shouldShowProperties()
+        self._scanNodes()
 
     def createFullInfoPanel(self) -> Group:
         """
@@ -81,32 +93,57 @@ class NodeGroup:
             padding=(0, 1),
         )
 
-        headers = {
-            "": True,
-            "Name": True,
-            "NCPUs": True,
-            "CPU Mem": True,
-            "NGPUs": self._show_gpus,
-            "GPU Mem": self._show_gpu_mem,
-            "Scratch Local": self._show_local,
-            "Scratch SSD": self._show_ssd,
-            "Scratch Shared": self._show_shared,
-            "Extra Properties": self._show_props,
-        }
-
-        for header, show in headers.items():
-            if show:
-                table.add_column(
-                    header=Text(header, justify="center"),
-                    justify="center",
-                    header_style=CFG.nodes_presenter.headers_style,
-                )
+        for header in self._getVisibleHeaders():
+            table.add_column(
+                header=Text(header, justify="center"),
+                justify="center",
+                header_style=CFG.nodes_presenter.headers_style,
+            )
 
         for node in self.nodes:
             self._addNodeRow(node, table)
 
         return table
 
+    def createPlainNodesTable(self, color: bool) -> str:
+        """
+        Build a compact tabulated string representation of the nodes in this group.
+
+        Contains the same columns as `createNodesTable` but uses `tabulate`
+        instead of Rich's Table, which is prohibitively slow for large number of nodes.
+
+        Args:
+            color (bool): Whether to apply the styles using ANSI escape codes.
+
+        Returns:
+            str: Tabulated node information.
+        """
+        return tabulate(
+            [self._createPlainNodeRow(node, color) for node in self.nodes],
+            headers=[
+                NodesPresenter._style(h, CFG.nodes_presenter.headers_style, color)
+                for h in self._getVisibleHeaders()
+            ],
+            tablefmt=NodesPresenter._COMPACT_TABLE,
+            stralign="center",
+            numalign="center",
+            disable_numparse=True,
+        )
+
+    def createPlainMetadata(self, color: bool) -> str:
+        """
+        Create a plain-text summary of the shared properties and statistics of the group.
+
+        Args:
+            color (bool): Whether to apply the styles using ANSI escape codes.
+
+        Returns:
+            str: Shared properties followed by a table of resource totals.
+        """
+        return NodesPresenter._formatPlainMetadata(
+            self._shared_properties, "Shared properties", self.stats, color
+        )
+
     def createMetadataTable(self) -> Table:
         """
         Create a metadata summary table for the group.
@@ -161,7 +198,7 @@ class NodeGroup:
 
     def _addNodeRow(self, node: BatchNodeInterface, table: Table) -> None:
         """
-        Insert a row into the group table representing a single node and update statistics.
+        Insert a row into the group table representing a single node.
 
         Args:
             node (BatchNodeInterface): Node whose data will be added.
@@ -179,11 +216,6 @@ class NodeGroup:
         free_gpus = node.getNFreeGPUs() or 0
         total_gpus = node.getNGPUs() or 0
 
-        # add the properties of this node to statistics
-        self.stats.addNode(
-            total_cpus, free_cpus, total_gpus, free_gpus, node.getProperties()
-        )
-
         content = [
             NodesPresenter._formatStateMark(
                 free_cpus, total_cpus, free_gpus, total_gpus, available
@@ -215,72 +247,155 @@ class NodeGroup:
             )
             if self._show_props
             else None,
+            Text(self._index.formatUsers(node.getName()), style=style)
+            if self._index
+            else None,
         ]
 
         table.add_row(*(x for x in content if x is not None))
 
-    def _shouldShowGPUs(self) -> bool:
+    def _createPlainNodeRow(self, node: BatchNodeInterface, color: bool) -> list[str]:
         """
-        Determine whether the GPUs column should be displayed.
+        Create a single row of the plain nodes table.
+
+        Args:
+            node (BatchNodeInterface): Node to show information for.
+            color (bool): Whether to apply the styles using ANSI escape codes.
 
         Returns:
-            bool: True if any node has GPUs, False otherwise.
+            list[str]: List of formatted cell values.
         """
-        return any((ngpus := n.getNGPUs()) and ngpus != 0 for n in self.nodes)
+        available = node.isAvailableToUser(self._user)
+        style = (
+            CFG.nodes_presenter.main_text_style
+            if available
+            else CFG.nodes_presenter.unavailable_node_style
+        )
 
-    def _shouldShowGPUMem(self) -> bool:
-        """
-        Determine whether GPU memory column should be displayed.
+        free_cpus = node.getNFreeCPUs() or 0
+        total_cpus = node.getNCPUs() or 0
+        free_gpus = node.getNFreeGPUs() or 0
+        total_gpus = node.getNGPUs() or 0
 
-        Returns:
-            bool: True if any node has GPU memory, False otherwise.
-        """
-        return any((mem := n.getGPUMemory()) and mem.value != 0 for n in self.nodes)
+        def styled(string: str) -> str:
+            return NodesPresenter._style(string, style, color)
 
-    def _shouldShowLocalScratch(self) -> bool:
-        """
-        Determine whether local scratch storage columns should be displayed.
+        content = [
+            NodesPresenter._style(
+                CFG.nodes_presenter.state_mark,
+                NodesPresenter._getStateMarkStyle(
+                    free_cpus, total_cpus, free_gpus, total_gpus, available
+                ),
+                color,
+            ),
+            styled(node.getName()),
+            NodesPresenter._style(
+                f"{free_cpus} / {total_cpus}",
+                NodesPresenter._getProcessingUnitsStyle(
+                    free_cpus, total_cpus, available
+                ),
+                color,
+            ),
+            styled(
+                f"{node.getFreeCPUMemory() or Size(0, 'kb')} / {node.getCPUMemory() or Size(0, 'kb')}"
+            ),
+            NodesPresenter._style(
+                f"{free_gpus} / {total_gpus}",
+                NodesPresenter._getProcessingUnitsStyle(
+                    free_gpus, total_gpus, available
+                ),
+                color,
+            )
+            if self._show_gpus
+            else None,
+            styled(str(node.getFreeGPUMemory() or Size(0, "kb")))
+            if self._show_gpu_mem
+            else None,
+            styled(str(node.getFreeLocalScratch() or Size(0, "kb")))
+            if self._show_local
+            else None,
+            styled(str(node.getFreeSSDScratch() or Size(0, "kb")))
+            if self._show_ssd
+            else None,
+            styled(str(node.getFreeSharedScratch() or Size(0, "kb")))
+            if self._show_shared
+            else None,
+            styled(
+                ", ".join(
+                    x for x in node.getProperties() if x not in self._shared_properties
+                )
+            )
+            if self._show_props
+            else None,
+            styled(self._index.formatUsers(node.getName())) if self._index else None,
+        ]
 
-        Returns:
-            bool: True if any node has local scratch space, False otherwise.
-        """
-        return any(
-            (scratch := n.getLocalScratch()) and scratch.value != 0 for n in self.nodes
-        )
+        return [x for x in content if x is not None]
 
-    def _shouldShowSSDScratch(self) -> bool:
+    def _getVisibleHeaders(self) -> list[str]:
         """
-        Determine whether SSD scratch storage columns should be displayed.
+        Get the headers of the columns to display.
 
         Returns:
-            bool: True if any node has SSD scratch space, False otherwise.
+            list[str]: Headers of the mandatory columns and of the optional columns
+            that are relevant for this group.
         """
-        return any(
-            (scratch := n.getSSDScratch()) and scratch.value != 0 for n in self.nodes
-        )
+        headers = {
+            "": True,
+            "Name": True,
+            "NCPUs": True,
+            "CPU Mem": True,
+            "NGPUs": self._show_gpus,
+            "GPU Mem": self._show_gpu_mem,
+            "Scratch Local": self._show_local,
+            "Scratch SSD": self._show_ssd,
+            "Scratch Shared": self._show_shared,
+            "Extra Properties": self._show_props,
+            "Jobs": self._index is not None,
+        }
 
-    def _shouldShowSharedScratch(self) -> bool:
-        """
-        Determine whether shared scratch storage columns should be displayed.
+        return [header for header, show in headers.items() if show]
 
-        Returns:
-            bool: True if any node has shared scratch space, False otherwise.
+    def _scanNodes(self) -> None:
         """
-        return any(
-            (scratch := n.getSharedScratch()) and scratch.value != 0 for n in self.nodes
-        )
+        Collect statistics of the group and determine which optional columns
+        should be displayed using a single pass over the nodes.
 
-    def _shouldShowProperties(self) -> bool:
+        A column of GPUs, GPU memory, or scratch storage is displayed if any node
+        has a non-zero amount of the resource. The column of extra properties is displayed
+        if any node has a property not shared by all nodes in the group.
         """
-        Determine whether extra property column should be displayed.
+        self._show_gpus = False
+        self._show_gpu_mem = False
+        self._show_local = False
+        self._show_ssd = False
+        self._show_shared = False
+        self._show_props = False
+
+        shared = set(self._shared_properties)
+        for node in self.nodes:
+            total_gpus = node.getNGPUs() or 0
+            props = node.getProperties()
+
+            self.stats.addNode(
+                node.getNCPUs() or 0,
+                node.getNFreeCPUs() or 0,
+                total_gpus,
+                node.getNFreeGPUs() or 0,
+                props,
+            )
 
-        Returns:
-            bool: True if any node has properties not shared by all nodes in the group.
-        """
-        return any(
-            any(p not in self._shared_properties for p in n.getProperties())
-            for n in self.nodes
-        )
+            self._show_gpus |= total_gpus != 0
+            self._show_gpu_mem |= NodeGroup._isNonZero(node.getGPUMemory())
+            self._show_local |= NodeGroup._isNonZero(node.getLocalScratch())
+            self._show_ssd |= NodeGroup._isNonZero(node.getSSDScratch())
+            self._show_shared |= NodeGroup._isNonZero(node.getSharedScratch())
+            self._show_props |= any(p not in shared for p in props)
+
+    @staticmethod
+    def _isNonZero(size: Size | None) -> bool:
+        """Check whether a size is specified and non-zero."""
+        return size is not None and size.value != 0
 
 
 @dataclass
@@ -327,6 +442,42 @@ class NodeGroupStats:
         self.n_free_gpus += free_gpus
         self.properties.update(props)
 
+    def createPlainStatsTable(self, color: bool) -> str:
+        """
+        Create a tabulated plain-text summary of aggregated node statistics.
+
+        Args:
+            color (bool): Whether to apply the styles using ANSI escape codes.
+
+        Returns:
+            str: Table with total and free CPUs, GPUs, and nodes.
+        """
+        style = CFG.nodes_presenter.secondary_text_style
+
+        def styled(string: str, bold: bool = False) -> str:
+            return NodesPresenter._style(
+                string, f"{style} bold" if bold else style, color
+            )
+
+        headers = ["", styled("CPUs")]
+        total = [styled("Total", True), styled(str(self.n_cpus))]
+        free = [styled("Free", True), styled(str(self.n_free_cpus))]
+        if self.n_gpus > 0:
+            headers.append(styled("GPUs"))
+            total.append(styled(str(self.n_gpus)))
+            free.append(styled(str(self.n_free_gpus)))
+        headers.append(styled("Nodes"))
+        total.append(styled(str(self.n_nodes)))
+        free.append("")
+
+        return tabulate(
+            [total, free],
+            headers=headers,
+            tablefmt=NodesPresenter._COMPACT_TABLE,
+            colalign=["left"] + ["center"] * (len(headers) - 1),
+            disable_numparse=True,
+        )
+
     def createStatsTable(self) -> Table:
         """
         Create a Rich table summarizing aggregated node statistics.
@@ -395,7 +546,25 @@ class NodesPresenter:
     Presenter class for displaying information about batch system nodes.
     """
 
-    def __init__(self, nodes: list[BatchNodeInterface], user: str, all: bool):
+    # Table formatting configuration for `tabulate`.
+    _COMPACT_TABLE = TableFormat(
+        lineabove=Line("", "", "", ""),
+        linebelowheader="",
+        linebetweenrows="",
+        linebelow=Line("", "", "", ""),
+        headerrow=("", "  ", ""),
+        datarow=("", "  ", ""),
+        padding=0,
+        with_header_hide=["lineabove", "linebelow"],
+    )
+
+    def __init__(
+        self,
+        nodes: list[BatchNodeInterface],
+        user: str,
+        all: bool,
+        index: NodeJobIndex | None = None,
+    ):
         """
         Initialize the presenter with a list of nodes.
 
@@ -404,10 +573,13 @@ class NodesPresenter:
                 to be presented.
             user (str): Name of the user for which the nodes are displayed.
             all (boolean): Display all nodes or only those that are available.
+            index (NodeJobIndex | None): Jobs indexed by nodes. If provided,
+                jobs running on the nodes are displayed.
         """
         self._nodes = nodes
         self._user = user
         self._display_all = all
+        self._index = index
 
         self._node_groups = self._createNodeGroups()
 
@@ -418,6 +590,72 @@ class NodesPresenter:
         for node in self._nodes:
             print(node.toYaml())
 
+    def dumpRecords(self, format: OutputFormat) -> None:
+        """
+        Print machine-readable records of all nodes to stdout.
+
+        If jobs indexed by nodes are available, each record also contains
+        the IDs of the jobs running on the node.
+
+        Args:
+            format (OutputFormat): Format of the output.
+        """
+        if not (index := self._index):
+            RecordWriter(format, BatchNodeInterface.RECORD_FIELDS).writeAll(
+                node.toRecord() for node in self._nodes
+            )
+            return
+
+        RecordWriter(format, BatchNodeInterface.RECORD_FIELDS + ["jobs"]).writeAll(
+            node.toRecord()
+            | {"jobs": [job.getId() for job in index.getJobs(node.getName())]}
+            for node in self._nodes
+        )
+
+    def dumpPlain(self, stream: IO[str] | None = None) -> None:
+        """
+        Write plain tables of all node groups and their statistics.
+
+        The tables are built using `tabulate` and written directly to the stream,
+        skipping Rich's layout, which is slow for clusters with thousands of nodes.
+        Colors are only used if the stream is a terminal.
+
+        Args:
+            stream (IO[str] | None): Stream to write into. Defaults to stdout.
+        """
+        stream = stream or sys.stdout
+        color = stream.isatty()
+
+        for i, group in enumerate(self._node_groups):
+            if i > 0:
+                stream.write("\n")
+            stream.write(
+                NodesPresenter._style(
+                    f"NODE GROUP: {group.name}", CFG.nodes_presenter.title_style, color
+                )
+                + "\n\n"
+            )
+            stream.write(group.createPlainNodesTable(color) + "\n\n")
+            stream.write(group.createPlainMetadata(color) + "\n")
+
+        if len(self._node_groups) > 1:
+            total_stats = NodeGroupStats.sumStats(*(g.stats for g in self._node_groups))
+            stream.write(
+                "\n"
+                + NodesPresenter._style(
+                    "OVERALL STATISTICS", CFG.nodes_presenter.title_style, color
+                )
+                + "\n\n"
+            )
+            stream.write(
+                NodesPresenter._formatPlainMetadata(
+                    list(total_stats.properties), "All properties", total_stats, color
+                )
+                + "\n"
+            )
+
+        stream.flush()
+
     def createNodesInfoPanel(self, console: Console | None = None) -> Group:
         """
         Build a complete Rich panel summarizing all node groups.
@@ -507,7 +745,7 @@ class NodesPresenter:
         groups: list[NodeGroup] = []
         for prefix, nodes in raw_groups.items():
             if len(nodes) >= 3:
-                groups.append(NodeGroup(prefix, nodes, self._user))
+                groups.append(NodeGroup(prefix, nodes, self._user, self._index))
             else:
                 unassigned.extend(nodes)
 
@@ -520,6 +758,7 @@ class NodesPresenter:
                     else CFG.nodes_presenter.all_nodes_group_name,
                     unassigned,
                     self._user,
+                    self._index,
                 )
             )
 
@@ -578,18 +817,33 @@ class NodesPresenter:
         Returns:
             Text: A styled Rich text element showing free and total counts.
         """
-        if not available:
-            style = CFG.nodes_presenter.unavailable_node_style
-        elif total == 0:
-            style = CFG.nodes_presenter.main_text_style
-        elif total == free:
-            style = CFG.nodes_presenter.free_node_style
-        elif free > 0:
-            style = CFG.nodes_presenter.part_free_node_style
-        else:
-            style = CFG.nodes_presenter.busy_node_style
+        return Text(
+            f"{free} / {total}",
+            style=NodesPresenter._getProcessingUnitsStyle(free, total, available),
+        )
 
-        return Text(f"{free} / {total}", style=style)
+    @staticmethod
+    def _getProcessingUnitsStyle(free: int, total: int, available: bool) -> str:
+        """
+        Get the style of the numbers of free and total CPUs or GPUs.
+
+        Args:
+            free (int): Number of free units (e.g., CPUs or GPUs).
+            total (int): Total number of units.
+            available (bool): Whether the node is available to the user.
+
+        Returns:
+            str: Rich style string.
+        """
+        if not available:
+            return CFG.nodes_presenter.unavailable_node_style
+        if total == 0:
+            return CFG.nodes_presenter.main_text_style
+        if total == free:
+            return CFG.nodes_presenter.free_node_style
+        if free > 0:
+            return CFG.nodes_presenter.part_free_node_style
+        return CFG.nodes_presenter.busy_node_style
 
     @staticmethod
     def _formatSizeProperty(free: Size, total: Size, style: str) -> Text:
@@ -644,16 +898,41 @@ class NodesPresenter:
         Returns:
             Text: A styled Rich text symbol representing node state.
         """
-        if not available:
-            style = CFG.nodes_presenter.unavailable_node_style
-        elif free_cpus == total_cpus and free_gpus == total_gpus:
-            style = CFG.nodes_presenter.free_node_style
-        elif free_cpus != 0 or free_gpus != 0:
-            style = CFG.nodes_presenter.part_free_node_style
-        else:
-            style = CFG.nodes_presenter.busy_node_style
+        return Text(
+            CFG.nodes_presenter.state_mark,
+            style=NodesPresenter._getStateMarkStyle(
+                free_cpus, total_cpus, free_gpus, total_gpus, available
+            ),
+        )
 
-        return Text(CFG.nodes_presenter.state_mark, style=style)
+    @staticmethod
+    def _getStateMarkStyle(
+        free_cpus: int,
+        total_cpus: int,
+        free_gpus: int,
+        total_gpus: int,
+        available: bool,
+    ) -> str:
+        """
+        Get the style of the state mark indicating node utilization and availability.
+
+        Args:
+            free_cpus (int): Number of free CPU cores.
+            total_cpus (int): Total number of CPU cores.
+            free_gpus (int): Number of free GPUs.
+            total_gpus (int): Total number of GPUs.
+            available (bool): Whether the node is accessible to the user.
+
+        Returns:
+            str: Rich style string.
+        """
+        if not available:
+            return CFG.nodes_presenter.unavailable_node_style
+        if free_cpus == total_cpus and free_gpus == total_gpus:
+            return CFG.nodes_presenter.free_node_style
+        if free_cpus != 0 or free_gpus != 0:
+            return CFG.nodes_presenter.part_free_node_style
+        return CFG.nodes_presenter.busy_node_style
 
     @staticmethod
     def _formatPropertiesSection(props: list[str], title: str) -> Text:
@@ -701,3 +980,45 @@ class NodesPresenter:
         )
 
         return grid
+
+    @staticmethod
+    def _formatPlainMetadata(
+        props: list[str], title: str, stats: NodeGroupStats, color: bool
+    ) -> str:
+        """
+        Create a plain-text summary of (shared/all) properties and aggregated statistics.
+
+        Args:
+            props (list[str]): List of properties to display.
+            title (str): Title label for the property section.
+            stats (NodeGroupStats): Aggregated statistics for the corresponding node group.
+            color (bool): Whether to apply the styles using ANSI escape codes.
+
+        Returns:
+            str: Line with the properties followed by the statistics table.
+        """
+        style = CFG.nodes_presenter.main_text_style
+        return (
+            NodesPresenter._style(f"{title}: ", f"{style} bold", color)
+            + NodesPresenter._style(", ".join(sorted(props)), style, color)
+            + "\n\n"
+            + stats.createPlainStatsTable(color)
+        )
+
+    @staticmethod
+    def _style(string: str, style: str, color: bool) -> str:
+        """
+        Apply a Rich style string to a string using ANSI escape codes.
+
+        Args:
+            string (str): The string to style.
+            style (str): Rich style string, e.g., 'bright_green bold'.
+            color (bool): Whether to apply the style at all.
+
+        Returns:
+            str: The styled string or the original string if `color` is False.
+        """
+        if not color:
+            return string
+
+        return Style.parse(style).render(string, color_system=ColorSystem.EIGHT_BIT)
@@ -0,0 +1,18 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Utilities for pre-staging input data of queued qq jobs.
+
+This module defines the `Prestager` class, an extension of `Operator` which
+copies the input directory of a queued job to a staging area on the node
+on which the batch system estimates the job will start. Once the job starts
+on that node, the runner moves the pre-staged data into the working directory
+and only transfers files that changed in the meantime.
+"""
+
+from .prestager import Prestager
+
+__all__ = [
+    "Prestager",
+]
@@ -0,0 +1,120 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+import sys
+from pathlib import Path
+from typing import NoReturn
+
+import click
+from rich.console import Console
+
+from qq_lib.core.click_format import GNUHelpColorsCommand
+from qq_lib.core.common import get_info_files
+from qq_lib.core.config import CFG
+from qq_lib.core.error import (
+    QQError,
+    QQNotSuitableError,
+)
+from qq_lib.core.error_handlers import (
+    handle_general_qq_error,
+    handle_not_suitable_error,
+)
+from qq_lib.core.logger import get_logger
+from qq_lib.core.repeater import Repeater
+from qq_lib.info.informer import Informer
+from qq_lib.prestage.prestager import Prestager
+
+logger = get_logger(__name__)
+console = Console()
+
+
+@click.command(
+    short_help="Copy input data of a queued job to its estimated execution node.",
+    help=f"""Copy the input directory of the specified queued qq job, or of all queued qq jobs in the current directory,
+to the node on which the batch system estimates the job will start.
+
+{click.style("JOB_ID", fg="green")}   The identifier of the job which input data should be pre-staged. Optional.
+
+If JOB_ID is not specified, `{CFG.binary_name} prestage` searches for qq jobs in the current directory.
+
+Once the job starts on the estimated node, the pre-staged data are moved into its working directory
+and only files that changed in the meantime are copied from the input directory.
+If the job starts on a different node, the pre-staged data are deleted and the input data are copied as usual.
+
+Pre-staging is only possible for jobs using a node-local scratch and only if the batch system
+provides an estimate of the job's execution node.
+
+When the `--wait` flag is used, `{CFG.binary_name} prestage` waits until the job is estimated to start
+within {CFG.prestage.lead_time} seconds before copying the data.""",
+    cls=GNUHelpColorsCommand,
+    help_options_color="bright_blue",
+)
+@click.argument(
+    "job",
+    type=str,
+    metavar=click.style("JOB_ID", fg="green"),
+    required=False,
+    default=None,
+)
+@click.option(
+    "--wait",
+    is_flag=True,
+    help="Wait until the job is about to start before pre-staging its input data.",
+)
+def prestage(job: str | None, wait: bool = False) -> NoReturn:
+    """
+    Pre-stage input data of the specified qq job or qq job(s) submitted from the current directory.
+    """
+    try:
+        if job:
+            informers = [Informer.fromJobId(job)]
+        else:
+            if not (
+                informers := [
+                    Informer.fromFile(info) for info in get_info_files(Path.cwd())
+                ]
+            ):
+                raise QQError("No qq job info file found.")
+
+        repeater = Repeater(informers, _prestage_job, wait)
+        repeater.onException(QQNotSuitableError, handle_not_suitable_error)
+        repeater.onException(QQError, handle_general_qq_error)
+        repeater.run()
+        print()
+        sys.exit(0)
+    # QQErrors should be caught by Repeater
+    except QQError as e:
+        logger.error(e)
+        sys.exit(CFG.exit_codes.default)
+    except Exception as e:
+        logger.critical(e, exc_info=True, stack_info=True)
+        sys.exit(CFG.exit_codes.unexpected_error)
+
+
+def _prestage_job(informer: Informer, wait: bool) -> None:
+    """
+    Attempt to pre-stage the input data of the job associated with the specified Informer.
+
+    Args:
+        informer (Informer): Informer associated with the job.
+        wait (bool): Whether to wait until the job is about to start.
+
+    Raises:
+        QQNotSuitableError: If input data of the job cannot be pre-staged.
+        QQError: If the input data cannot be copied.
+    """
+    prestager = Prestager.fromInformer(informer)
+    prestager.printInfo(console)
+
+    prestager.ensureSuitable()
+
+    if wait and not prestager.isDue():
+        logger.info(
+            f"Waiting for the job to be estimated to start within {CFG.prestage.lead_time} seconds."
+        )
+        prestager.waitUntilDue()
+
+    node = prestager.prestage()
+    logger.info(
+        f"Pre-staged input data of the job '{informer.info.job_id}' to '{node}'."
+    )
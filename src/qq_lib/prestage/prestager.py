@@ -0,0 +1,197 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import sleep
+
+from qq_lib.core.common import convert_absolute_to_relative
+from qq_lib.core.config import CFG
+from qq_lib.core.error import QQError, QQNotSuitableError
+from qq_lib.core.logger import get_logger
+from qq_lib.core.manifest import WorkDirManifest
+from qq_lib.core.operator import Operator
+from qq_lib.properties.states import RealState
+
+logger = get_logger(__name__)
+
+
+class Prestager(Operator):
+    """
+    Class managing pre-staging of input data to the estimated execution node of a queued job.
+    """
+
+    def ensureSuitable(self) -> None:
+        """
+        Verify that input data of the job can be pre-staged.
+
+        Raises:
+            QQNotSuitableError: If the job is no longer queued, does not use
+                a node-local scratch, or its input directory is not accessible.
+        """
+        if not self._isQueued():
+            raise QQNotSuitableError(
+                f"Job is {str(self._state)}: input data can only be pre-staged for queued jobs."
+            )
+
+        if not self._informer.usesScratch():
+            raise QQNotSuitableError(
+                "Job does not use scratch: there is nothing to pre-stage."
+            )
+
+        if not self._getPrestageDir():
+            raise QQNotSuitableError(
+                f"Input data cannot be pre-staged for working directory of type '{self._informer.info.resources.work_dir}'."
+            )
+
+        if not self._informer.info.input_dir.is_dir():
+            raise QQNotSuitableError(
+                "Input directory of the job is not accessible from this machine."
+            )
+
+    def getEstimated(self) -> tuple[datetime, str] | None:
+        """
+        Get the estimated start time and main execution node of the job.
+
+        Returns:
+            tuple[datetime, str] | None: The estimated start time and the estimated
+            main node or None if the batch system provides no estimate.
+        """
+        if not (estimated := self._informer.getEstimated()):
+            return None
+
+        time, nodes = estimated
+        return time, nodes.split("+")[0].strip()
+
+    def isDue(self) -> bool:
+        """
+        Check whether the job is estimated to start within `CFG.prestage.lead_time` seconds.
+
+        Returns:
+            bool: True if the job is estimated to start soon, False if it is not
+            or if no estimate is available.
+        """
+        if not (estimated := self.getEstimated()):
+            return False
+
+        return estimated[0] - datetime.now() <= timedelta(
+            seconds=CFG.prestage.lead_time
+        )
+
+    def waitUntilDue(self) -> None:
+        """
+        Wait until the job is estimated to start within `CFG.prestage.lead_time` seconds.
+
+        Raises:
+            QQNotSuitableError: If at any point the job is found to be no longer queued.
+
+        Note:
+            This is a blocking method.
+        """
+        while not self.isDue():
+            sleep(CFG.prestage.wait_time)
+            self.update()
+            self.ensureSuitable()
+
+    def prestage(self) -> str:
+        """
+        Copy the input directory of the job to the estimated main execution node.
+
+        Data pre-staged to a previously estimated node are removed.
+        The estimated node is recorded in the qq info file so that the job
+        can locate the pre-staged data once it starts.
+
+        Returns:
+            str: The node to which the input data were pre-staged.
+
+        Raises:
+            QQError: If the execution node is not known or the data cannot be copied.
+        """
+        if not (estimated := self.getEstimated()):
+            raise QQError("Estimated execution node of the job is not known.")
+
+        _, node = estimated
+        info = self._informer.info
+        prestage_dir = self._getPrestageDir()
+        assert prestage_dir is not None
+
+        if (previous := info.prestaged_node) and previous != node:
+            logger.info(
+                f"Estimated execution node changed from '{previous}' to '{node}'. Removing input data pre-staged to '{previous}'."
+            )
+            try:
+                self._batch_system.deleteRemoteDir(previous, prestage_dir)
+            except QQError as e:
+                logger.warning(f"Could not delete pre-staged input data: {e}")
+
+        # the same files are excluded as when copying data to the working directory
+        excluded = info.excluded_files + [
+            self._info_file,
+            (info.input_dir / info.job_name).with_suffix(CFG.suffixes.qq_out),
+            *info.getQueuedCyclesInfoFiles(),
+        ]
+        if info.loop_info:
+            excluded.append(info.loop_info.archive)
+
+        # the input directory is scanned before copying, so that files modified
+        # in the meantime do not match the manifest and are not used
+        manifest = WorkDirManifest.fromInputDir(
+            info.job_id,
+            node,
+            info.input_dir,
+            prestage_dir,
+            convert_absolute_to_relative(excluded, info.input_dir),
+        )
+
+        logger.info(f"Pre-staging input data to '{prestage_dir}' on '{node}'.")
+        self._batch_system.makeRemoteDir(node, prestage_dir.parent)
+        self._batch_system.makeRemoteDir(node, prestage_dir)
+        self._batch_system.syncWithExclusions(
+            info.input_dir, prestage_dir, None, node, excluded
+        )
+        self._batch_system.writeRemoteFile(
+            node, prestage_dir / CFG.loop_jobs.manifest_file, manifest.toString()
+        )
+
+        self._recordPrestagedNode(node)
+        return node
+
+    def _recordPrestagedNode(self, node: str) -> None:
+        """
+        Record the node with the pre-staged data in the qq info file.
+
+        Args:
+            node (str): The node to which the input data were pre-staged.
+
+        Raises:
+            QQError: If the job has started in the meantime.
+        """
+        self.update()
+        if not self._isQueued():
+            raise QQError(
+                f"Job is {str(self._state)}: pre-staged input data will not be used."
+            )
+
+        self._informer.info.prestaged_node = node
+        self._informer.toFile(self._info_file)
+
+    def _getPrestageDir(self) -> Path | None:
+        """
+        Get the directory into which the input data of the job are pre-staged.
+
+        Returns:
+            Path | None: Path to the directory on the execution node or None
+            if pre-staging is not supported for the job.
+        """
+        info = self._informer.info
+        return self._batch_system.getPrestageDir(
+            info.job_id, info.username, str(info.resources.work_dir)
+        )
+
+    def _isQueued(self) -> bool:
+        """Check if the job is queued, held, or waiting."""
+        return self._state in {
+            RealState.QUEUED,
+            RealState.HELD,
+            RealState.WAITING,
+        }
@@ -0,0 +1,161 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Index of qq array jobs.
+
+When the same script is submitted from many directories as a single array job,
+all members of the array share one submission command and one set of environment
+variables. The members therefore find their own input directories in an index file
+written at submission time, which maps array indices to the paths of the qq info files
+of the members.
+
+The index is a plain text file with one absolute path to a qq info file per line.
+The line number (starting from zero) corresponds to the array index of the member.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Self
+
+from qq_lib.batch.interface import BatchMeta
+from qq_lib.core.config import CFG
+from qq_lib.core.error import QQError
+from qq_lib.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ArrayIndex:
+    """
+    Mapping of array indices to the qq info files of the array members.
+    """
+
+    def __init__(self, info_files: list[Path]):
+        """
+        Initialize the index.
+
+        Args:
+            info_files (list[Path]): Absolute paths to the qq info files of the members
+                ordered by their array indices.
+        """
+        self._info_files = info_files
+
+    @classmethod
+    def fromFile(cls, file: Path, host: str | None = None) -> Self:
+        """
+        Load the index from a file, either locally or on a remote host.
+
+        Args:
+            file (Path): Path to the index file.
+            host (str | None): Optional hostname of the machine where the file resides.
+                If None, the file is assumed to be local.
+
+        Returns:
+            ArrayIndex: The loaded index.
+
+        Raises:
+            QQError: If the file does not exist or cannot be read.
+        """
+        try:
+            if host:
+                logger.debug(f"Loading array index from '{file}' on '{host}'.")
+                content = BatchMeta.fromEnvVarOrGuess().readRemoteFile(host, file)
+            else:
+                logger.debug(f"Loading array index from '{file}'.")
+                content = file.read_text()
+        except QQError:
+            raise
+        except Exception as e:
+            raise QQError(f"Could not read array index '{file}': {e}.") from e
+
+        return cls([Path(line) for line in content.splitlines() if line.strip()])
+
+    def toFile(self, file: Path) -> None:
+        """
+        Write the index into a file.
+
+        Args:
+            file (Path): Path to the index file.
+
+        Raises:
+            QQError: If the file already exists or cannot be written.
+        """
+        logger.debug(f"Exporting array index into '{file}'.")
+        try:
+            with file.open("x") as output:
+                output.write(
+                    "".join(f"{info_file}\n" for info_file in self._info_files)
+                )
+        except FileExistsError as e:
+            raise QQError(
+                f"Array index '{file}' already exists. Is the array already submitted?"
+            ) from e
+        except Exception as e:
+            raise QQError(f"Could not write array index '{file}': {e}.") from e
+
+    def getInfoFile(self, index: int) -> Path:
+        """
+        Get the qq info file of the array member with the specified index.
+
+        Args:
+            index (int): Array index of the member.
+
+        Returns:
+            Path: Absolute path to the qq info file of the member.
+
+        Raises:
+            QQError: If the index does not belong to the array.
+        """
+        if not 0 <= index < len(self._info_files):
+            raise QQError(
+                f"Array index {index} is out of range for an array of {len(self._info_files)} jobs."
+            )
+
+        return self._info_files[index]
+
+    @staticmethod
+    def findInfoFile(file: Path, index: int) -> Path | None:
+        """
+        Find the qq info file of an array member using a local index file.
+
+        Index files are never modified after submission, so each index file
+        is only read once per process even if it is queried for many members.
+
+        Args:
+            file (Path): Path to the index file.
+            index (int): Array index of the member.
+
+        Returns:
+            Path | None: Absolute path to the qq info file of the member
+            or None if the index file cannot be read or does not contain the member.
+        """
+        try:
+            return _load_array_index(file).getInfoFile(index)
+        except QQError as e:
+            logger.debug(e)
+            return None
+
+    def __len__(self) -> int:
+        """Get the number of members of the array."""
+        return len(self._info_files)
+
+    @staticmethod
+    def getPath(directory: Path, job_name: str) -> Path:
+        """
+        Get the path to the index file of an array job.
+
+        Args:
+            directory (Path): Directory from which the array job is submitted.
+            job_name (str): Name of the array job.
+
+        Returns:
+            Path: Path to the index file.
+        """
+        return (directory / job_name).with_suffix(CFG.suffixes.qq_array)
+
+
+@lru_cache(maxsize=64)
+def _load_array_index(file: Path) -> ArrayIndex:
+    """Load a local array index file. Results are cached."""
+    return ArrayIndex.fromFile(file)
@@ -0,0 +1,303 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Resource usage of loop job cycles and right-sizing of the following cycles.
+
+When a loop job is submitted with `--autosize`, each cycle records the resources
+it actually used (walltime, peak memory, and size of the working directory)
+into its qq info file as `ResourceUsage`. Before the next cycle is submitted,
+its walltime, memory, and work-size are set to a high percentile of the usage
+of the recent cycles with some headroom.
+
+`AutosizeInfo` holds the resources requested for the first autosized cycle.
+The adjusted resources never drop below or grow above fixed multiples
+of these resources (see `CFG.loop_jobs`).
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Self
+
+from qq_lib.core.common import hhmmss_to_duration
+from qq_lib.core.config import CFG
+from qq_lib.core.error import QQError
+from qq_lib.core.logger import get_logger
+
+from .resources import Resources
+from .size import Size
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ResourceUsage:
+    """
+    Resources actually used by a single cycle of a loop job.
+    """
+
+    # Walltime consumed by the cycle.
+    walltime: timedelta | None = None
+
+    # Peak memory used by the cycle.
+    mem: Size | None = None
+
+    # Size of the working directory at the end of the cycle.
+    work_size: Size | None = None
+
+    def toDict(self) -> dict[str, object]:
+        """Return all fields as a dict. Fields that are None are ignored."""
+        result: dict[str, object] = {}
+        if self.walltime is not None:
+            result["walltime"] = _to_hhmmss(self.walltime.total_seconds())
+        if self.mem is not None:
+            result["mem"] = self.mem.toStrExact()
+        if self.work_size is not None:
+            result["work_size"] = self.work_size.toStrExact()
+
+        return result
+
+    @classmethod
+    def fromDict(cls, data: dict[str, object]) -> Self:
+        """
+        Construct a ResourceUsage from a dictionary.
+
+        Args:
+            data (dict[str, object]): Dictionary created by `ResourceUsage.toDict`.
+
+        Returns:
+            ResourceUsage: The constructed resource usage.
+        """
+        walltime, mem, work_size = (
+            data.get("walltime"),
+            data.get("mem"),
+            data.get("work_size"),
+        )
+        return cls(
+            walltime=hhmmss_to_duration(walltime)
+            if isinstance(walltime, str)
+            else None,
+            mem=Size.fromString(mem) if isinstance(mem, str) else None,
+            work_size=Size.fromString(work_size)
+            if isinstance(work_size, str)
+            else None,
+        )
+
+
+@dataclass
+class AutosizeInfo:
+    """
+    Resources requested for the first autosized cycle of a loop job.
+    """
+
+    # Requested walltime in HH:MM:SS format.
+    walltime: str | None = None
+
+    # Requested total memory.
+    mem: Size | None = None
+
+    # Requested total size of the working directory.
+    work_size: Size | None = None
+
+    @classmethod
+    def fromResources(cls, resources: Resources) -> Self:
+        """
+        Construct autosizing information from the resources requested for a job.
+
+        Memory and work-size requested per CPU core or per node are converted to totals.
+
+        Args:
+            resources (Resources): Resources requested for the job.
+
+        Returns:
+            AutosizeInfo: The constructed autosizing information.
+        """
+        return cls(
+            walltime=resources.walltime,
+            mem=_total(
+                resources.mem,
+                resources.mem_per_node,
+                resources.mem_per_cpu,
+                resources,
+            ),
+            work_size=_total(
+                resources.work_size,
+                resources.work_size_per_node,
+                resources.work_size_per_cpu,
+                resources,
+            )
+            if resources.usesScratch()
+            else None,
+        )
+
+    @classmethod
+    def fromStr(cls, string: str) -> Self:
+        """
+        Construct autosizing information from its string representation.
+
+        Args:
+            string (str): String created by `AutosizeInfo.toStr`,
+                e.g., 'walltime=24:00:00,mem=16gb,work-size=10gb'.
+
+        Returns:
+            AutosizeInfo: The constructed autosizing information.
+
+        Raises:
+            QQError: If the string is not valid.
+        """
+        values: dict[str, str] = {}
+        for part in filter(None, string.split(",")):
+            key, _, value = part.partition("=")
+            if key not in {"walltime", "mem", "work-size"} or not value:
+                raise QQError(f"Invalid autosize specification '{string}'.")
+            values[key] = value
+
+        return cls(
+            walltime=values.get("walltime"),
+            mem=Size.fromString(values["mem"]) if "mem" in values else None,
+            work_size=Size.fromString(values["work-size"])
+            if "work-size" in values
+            else None,
+        )
+
+    def toStr(self) -> str:
+        """
+        Get the string representation of the autosizing information.
+
+        Returns:
+            str: Comma-separated requested resources, e.g., 'walltime=24:00:00,mem=16gb'.
+        """
+        parts = []
+        if self.walltime:
+            parts.append(f"walltime={self.walltime}")
+        if self.mem:
+            parts.append(f"mem={self.mem.toStrExact()}")
+        if self.work_size:
+            parts.append(f"work-size={self.work_size.toStrExact()}")
+
+        return ",".join(parts)
+
+    def adjust(self, resources: Resources, history: list[ResourceUsage]) -> Resources:
+        """
+        Get resources for the next cycle based on the usage of the previous cycles.
+
+        Each resource is set to the `CFG.loop_jobs.autosize_percentile` percentile
+        of its usage multiplied by `CFG.loop_jobs.autosize_headroom` and bounded
+        by `CFG.loop_jobs.autosize_min_factor` and `CFG.loop_jobs.autosize_max_factor`
+        multiples of the originally requested resource. A resource is only adjusted
+        if it was originally requested and its usage is known for at least
+        `CFG.loop_jobs.autosize_min_samples` cycles.
+
+        Args:
+            resources (Resources): Resources requested for the current cycle.
+            history (list[ResourceUsage]): Usage of the recent cycles.
+
+        Returns:
+            Resources: Resources for the next cycle.
+        """
+        adjusted = Resources(**resources.toDict())  # ty: ignore[invalid-argument-type]
+
+        if (
+            self.walltime
+            and (
+                seconds := _estimate(
+                    [
+                        u.walltime.total_seconds()
+                        for u in history
+                        if u.walltime is not None
+                    ],
+                    hhmmss_to_duration(self.walltime).total_seconds(),
+                )
+            )
+            is not None
+        ):
+            # round up to full minutes
+            adjusted.walltime = _to_hhmmss(math.ceil(seconds / 60) * 60)
+
+        if (
+            self.mem
+            and (
+                kb := _estimate(
+                    [u.mem.value for u in history if u.mem is not None], self.mem.value
+                )
+            )
+            is not None
+        ):
+            adjusted.mem = _round_size(kb)
+            adjusted.mem_per_node = None
+            adjusted.mem_per_cpu = None
+
+        if (
+            self.work_size
+            and resources.usesScratch()
+            and (
+                kb := _estimate(
+                    [u.work_size.value for u in history if u.work_size is not None],
+                    self.work_size.value,
+                )
+            )
+            is not None
+        ):
+            adjusted.work_size = _round_size(kb)
+            adjusted.work_size_per_node = None
+            adjusted.work_size_per_cpu = None
+
+        logger.debug(f"Autosized resources: {adjusted}.")
+        return adjusted
+
+
+def _estimate(samples: list[float], requested: float) -> float | None:
+    """
+    Estimate the amount of a resource required by the next cycle.
+
+    Args:
+        samples (list[float]): Usage of the resource by the recent cycles.
+        requested (float): Originally requested amount of the resource.
+
+    Returns:
+        float | None: The estimated amount or None if there are not enough samples.
+    """
+    if len(samples) < max(CFG.loop_jobs.autosize_min_samples, 1):
+        return None
+
+    # nearest-rank percentile
+    ordered = sorted(samples)
+    rank = math.ceil(CFG.loop_jobs.autosize_percentile / 100 * len(ordered))
+    estimate = ordered[min(max(rank, 1), len(ordered)) - 1]
+
+    return min(
+        max(
+            estimate * CFG.loop_jobs.autosize_headroom,
+            requested * CFG.loop_jobs.autosize_min_factor,
+        ),
+        requested * CFG.loop_jobs.autosize_max_factor,
+    )
+
+
+def _total(
+    total: Size | None,
+    per_node: Size | None,
+    per_cpu: Size | None,
+    resources: Resources,
+) -> Size | None:
+    """Get the total amount of memory or storage requested for a job."""
+    if total:
+        return total
+    if per_node and resources.nnodes:
+        return per_node * resources.nnodes
+    if per_cpu and resources.ncpus:
+        return per_cpu * resources.ncpus
+    return None
+
+
+def _round_size(kb: float) -> Size:
+    """Round a size in kilobytes up to full megabytes."""
+    return Size(math.ceil(kb / 1024), "mb")
+
+
+def _to_hhmmss(seconds: float) -> str:
+    """Format a number of seconds as HH:MM:SS."""
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02}:{minutes:02}:{seconds:02}"
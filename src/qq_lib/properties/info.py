@@ -7,14 +7,25 @@ Structured storage and serialization of qq job metadata.
 This module defines the `Info` dataclass, which provides a representation
 of qq job information: submission parameters, resource requests, job state,
 timing data, dependencies, and execution context. It handles
-loading and exporting YAML info files both locally and from remote hosts, and
+loading and exporting info files both locally and from remote hosts, and
 offers minimal helpers such as command-line reconstruction for resubmission.
 
+Info files are written either in YAML (default, human-readable) or in JSON
+(selected by `info_file.format`). The format of an existing info file is detected
+from its content, so files in both formats can always be read. JSON info files
+start with a single-line header containing the version of the format and the fields
+of `InfoHeader`, which can be loaded without decoding the rest of the file.
+
+Updates of the state of a job are appended to a journal stored next to the info file
+(see `InfoJournal`) and replayed on top of the info file when it is loaded.
+
 `Info` focuses strictly on data representation and safe serialization; higher-level
 logic (state interpretation, batch-system interaction, consistency checks) is
 implemented in `Informer` and related components.
 """
 
+import json
+from collections.abc import Iterable
 from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
@@ -23,14 +34,23 @@ from typing import Self
 import yaml
 
 from qq_lib.batch.interface import BatchInterface, BatchMeta
-from qq_lib.core.common import load_yaml_dumper, load_yaml_loader
+from qq_lib.core.common import (
+    construct_info_file_path,
+    construct_journal_path,
+    construct_loop_job_name,
+    load_yaml_dumper,
+    load_yaml_loader,
+)
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
 from qq_lib.properties.depend import Depend
 
+from .autosize import ResourceUsage
 from .job_type import JobType
+from .journal import InfoJournal
 from .loop import LoopInfo
+from .pack import PackInfo
 from .resources import Resources
 from .states import NaiveState
 
@@ -39,6 +59,30 @@ logger = get_logger(__name__)
 SafeLoader: type[yaml.SafeLoader] = load_yaml_loader()
 Dumper: type[yaml.Dumper] = load_yaml_dumper()
 
+# beginning of qq info files in the JSON format
+_JSON_MAGIC = '{"qq_info_format":'
+# version of the JSON format of qq info files
+_JSON_VERSION = 1
+# fields stored in the header of qq info files in the JSON format
+_HEADER_FIELDS = ("job_id", "job_state", "input_dir", "journal_offset")
+
+
+@dataclass(frozen=True)
+class InfoHeader:
+    """
+    Identifying fields of a qq job that can be loaded
+    without loading the entire qq info file.
+    """
+
+    # Job identifier inside the batch system
+    job_id: str
+
+    # Job state according to qq
+    job_state: NaiveState
+
+    # Directory from which the job was submitted
+    input_dir: Path
+
 
 @dataclass
 class Info:
@@ -107,6 +151,12 @@ class Info:
     # Loop job-associated information.
     loop_info: LoopInfo | None = None
 
+    # Pack job-associated information.
+    pack_info: PackInfo | None = None
+
+    # Resources actually used by the job (only recorded for autosized loop jobs).
+    usage: ResourceUsage | None = None
+
     # Account associated with the job
     account: str | None = None
 
@@ -128,16 +178,25 @@ class Info:
     # Exit code of qq run
     job_exit_code: int | None = None
 
+    # Node to which input data of the job were pre-staged
+    prestaged_node: str | None = None
+
+    # Files copied from the working directory to the input directory when the job was killed
+    saved_files: list[Path] = field(default_factory=list)
+
+    # Length of the journal of the info file (in bytes) already incorporated into the file
+    journal_offset: int | None = None
+
     @classmethod
     def fromFile(cls, file: Path, host: str | None = None) -> Self:
         """
-        Load an Info instance from a YAML file, either locally or on a remote host.
+        Load an Info instance from a YAML or JSON file, either locally or on a remote host.
 
         If `host` is provided, the file will be read from the remote host using
         the batch system's `readRemoteFile` method. Otherwise, the file is read locally.
 
         Args:
-            file (Path): Path to the YAML qq info file.
+            file (Path): Path to the qq info file.
             host (str | None): Optional hostname of the remote machine where the file resides.
                 If None, the file is assumed to be local.
 
@@ -148,50 +207,80 @@ class Info:
             QQError: If the file does not exist, cannot be reached, cannot be parsed,
                     or does not contain all mandatory information.
         """
+        content, journal = Info._read(file, host)
+        data = Info._replayJournal(Info._parse(content, file), file, host, journal)
+
         try:
-            if host:
-                # remote file
-                logger.debug(f"Loading qq info from '{file}' on '{host}'.")
+            return cls._fromDict(data)
+        except TypeError as e:
+            raise QQError(f"Invalid qq info file '{file}': {e}.") from e
 
-                BatchSystem = BatchMeta.fromEnvVarOrGuess()
-                data: dict[str, object] = yaml.load(
-                    BatchSystem.readRemoteFile(host, file),
-                    Loader=SafeLoader,
-                )
-            else:
-                # local file
-                logger.debug(f"Loading qq info from '{file}'.")
+    @staticmethod
+    def loadHeader(file: Path, host: str | None = None) -> InfoHeader:
+        """
+        Load only the job ID, job state, and input directory from a qq info file.
 
-                if not file.exists():
-                    raise QQError(f"qq info file '{file}' does not exist.")
+        For info files in the JSON format, only the header line is decoded
+        (and, for local files, read). Info files in the YAML format are parsed
+        completely, but no Info instance is constructed. The journal of the info file
+        is replayed in both cases.
 
-                with file.open("r") as input:
-                    data: dict[str, object] = yaml.load(input, Loader=SafeLoader)
+        Args:
+            file (Path): Path to the qq info file.
+            host (str | None): Optional hostname of the remote machine where the file resides.
+                If None, the file is assumed to be local.
 
-            return cls._fromDict(data)
-        except yaml.YAMLError as e:
-            raise QQError(f"Could not parse the qq info file '{file}': {e}.") from e
-        except TypeError as e:
-            raise QQError(f"Invalid qq info file '{file}': {e}.") from e
+        Returns:
+            InfoHeader: The identifying fields of the job.
+
+        Raises:
+            QQError: If the file does not exist, cannot be reached, cannot be parsed,
+                    or does not contain the header fields.
+        """
+        content, journal = Info._read(file, host, header_only=True)
+        data = Info._replayJournal(
+            Info._parse(content, file, True), file, host, journal
+        )
+
+        try:
+            state = data["job_state"]
+            return InfoHeader(
+                job_id=str(data["job_id"]),
+                job_state=NaiveState.fromStr(str(state))
+                if state
+                else NaiveState.UNKNOWN,
+                input_dir=Path(str(data["input_dir"])),
+            )
+        except (KeyError, TypeError) as e:
+            raise QQError(f"Invalid qq info file '{file}': missing {e}.") from e
 
     def toFile(self, file: Path, host: str | None = None) -> None:
         """
-        Export this Info instance to a YAML file, either locally or on a remote host.
+        Export this Info instance to a file, either locally or on a remote host.
+
+        The format of the file is given by `info_file.format`.
 
         If `host` is provided, the file will be written to the remote host using
         the batch system's `writeRemoteFile` method. Otherwise, the file is written locally.
 
         Args:
-            file (Path): Path to write the YAML file.
+            file (Path): Path to write the file.
             host (str | None): Optional hostname of the remote machine where the file should be written.
                 If None, the file is written locally.
 
         Raises:
-            QQError: If the file cannot be created, reached, or written to.
+            QQError: If the format of info files is unknown or the file cannot be
+                created, reached, or written to.
         """
-        try:
-            content = "# qq job info file\n" + self._toYaml() + "\n"
+        match CFG.info_file.format.lower():
+            case "yaml":
+                content = "# qq job info file\n" + self._toYaml() + "\n"
+            case "json":
+                content = self._toJson()
+            case format:
+                raise QQError(f"Unknown format of qq info files: '{format}'.")
 
+        try:
             if host:
                 # remote file
                 logger.debug(f"Exporting qq info into '{file}' on '{host}'.")
@@ -204,10 +293,87 @@ class Info:
         except Exception as e:
             raise QQError(f"Cannot create or write to file '{file}': {e}") from e
 
-    def getCommandLineForResubmit(self) -> list[str]:
+    def toJournal(
+        self, file: Path, names: Iterable[str], host: str | None = None
+    ) -> None:
+        """
+        Record the current values of the selected fields in the journal of an info file
+        instead of rewriting the whole file.
+
+        Fields that are None or empty are not recorded.
+
+        Args:
+            file (Path): Path to the qq info file.
+            names (Iterable[str]): Names of the fields to record.
+            host (str | None): Optional hostname of the remote machine where the file resides.
+                If None, the file is assumed to be local.
+
+        Raises:
+            QQError: If the record cannot be appended to the journal.
+        """
+        data = self._toDict()
+        InfoJournal.append(
+            file,
+            self.job_id,
+            {name: data[name] for name in names if name in data},
+            self.batch_system,
+            host,
+        )
+
+    def compactJournal(self, file: Path, host: str | None = None) -> None:
+        """
+        Incorporate the journal of an info file into the file and truncate the journal.
+
+        The whole info file is rewritten first, so the journal is only truncated
+        once its records are safely stored in the file. Should the truncation fail,
+        the remaining records are replayed on top of the file again, which is harmless.
+
+        Args:
+            file (Path): Path to the qq info file.
+            host (str | None): Optional hostname of the remote machine where the file resides.
+                If None, the file is assumed to be local.
+
+        Raises:
+            QQError: If the info file cannot be written or the journal cannot be truncated.
+        """
+        self.journal_offset = None
+        self.toFile(file, host)
+        InfoJournal.clear(file, self.batch_system, host)
+
+    def getQueuedCyclesInfoFiles(self) -> list[Path]:
+        """
+        Get paths to the info files of the following loop cycles submitted in advance.
+
+        Returns:
+            list[Path]: Absolute paths to the info files of the cycles within
+            the submission window. Empty if this is not a loop job
+            or no cycles are submitted in advance.
+        """
+        if not self.loop_info:
+            return []
+
+        return [
+            construct_info_file_path(
+                self.input_dir, construct_loop_job_name(self.script_name, cycle)
+            )
+            for cycle in range(
+                self.loop_info.current + 1, self.loop_info.getLastQueuedCycle() + 1
+            )
+        ]
+
+    def getCommandLineForResubmit(
+        self, requeue: bool = False, resources: Resources | None = None
+    ) -> list[str]:
         """
         Construct the command-line arguments required to resubmit the job.
 
+        Args:
+            requeue (bool): Submit the current cycle of a loop job again instead
+                of submitting the next cycle. The submitted job does not depend
+                on this job and its number of requeues is increased.
+            resources (Resources | None): Resources to request for the resubmitted job.
+                Defaults to the resources of this job.
+
         Returns:
             list[str]: A list of command-line tokens representing all options
             needed to resubmit the job.
@@ -221,11 +387,12 @@ class Info:
             str(self.job_type),
             "--batch-system",
             str(self.batch_system),
-            "--depend",
-            f"afterok={self.job_id}",
         ]
 
-        command_line.extend(self.resources.toCommandLine())
+        if not requeue:
+            command_line.extend(["--depend", f"afterok={self.job_id}"])
+
+        command_line.extend((resources or self.resources).toCommandLine())
 
         if self.account:
             command_line.extend(["--account", self.account])
@@ -242,6 +409,8 @@ class Info:
 
         if self.loop_info:
             command_line.extend(self.loop_info.toCommandLine())
+            if requeue:
+                command_line.extend(["--requeues", str(self.loop_info.requeues + 1)])
 
         return command_line
 
@@ -256,6 +425,144 @@ class Info:
             self._toDict(), default_flow_style=False, sort_keys=False, Dumper=Dumper
         )
 
+    def _toJson(self) -> str:
+        """
+        Serialize the Info instance to the JSON format of qq info files.
+
+        The first line contains the header with the version of the format
+        and the fields of `InfoHeader`. The second line contains all fields.
+
+        Returns:
+            str: JSON representation of the Info object.
+        """
+        data = self._toDict()
+        header = {"qq_info_format": _JSON_VERSION} | {
+            name: data[name] for name in _HEADER_FIELDS if name in data
+        }
+        return json.dumps(header) + "\n" + json.dumps(data) + "\n"
+
+    @staticmethod
+    def _read(
+        file: Path, host: str | None, header_only: bool = False
+    ) -> tuple[str, str | None]:
+        """
+        Read the content of a qq info file, either locally or on a remote host.
+
+        The journal of a remote info file is read together with the file using
+        a single connection. The journal of a local info file is not read here,
+        since only its part following the offset stored in the info file has to be read.
+
+        Args:
+            file (Path): Path to the qq info file.
+            host (str | None): Hostname of the remote machine where the file resides.
+            header_only (bool): Read only the first line of local JSON info files.
+
+        Returns:
+            tuple[str, str | None]: The content of the file and the content of its
+            journal (empty if the journal does not exist) or None if the journal was not read.
+
+        Raises:
+            QQError: If the file does not exist or cannot be reached.
+        """
+        if host:
+            # remote file
+            logger.debug(f"Loading qq info from '{file}' on '{host}'.")
+
+            BatchSystem = BatchMeta.fromEnvVarOrGuess()
+            content, journal = BatchSystem.readRemoteFiles(
+                host, [file, construct_journal_path(file)]
+            )
+            if content is None:
+                raise QQError(f"qq info file '{file}' does not exist on '{host}'.")
+            return content, journal or ""
+
+        # local file
+        logger.debug(f"Loading qq info from '{file}'.")
+
+        if not file.exists():
+            raise QQError(f"qq info file '{file}' does not exist.")
+
+        with file.open("r") as input:
+            if header_only and (line := input.readline()).startswith(_JSON_MAGIC):
+                return line, None
+            input.seek(0)
+            return input.read(), None
+
+    @staticmethod
+    def _replayJournal(
+        data: dict[str, object],
+        file: Path,
+        host: str | None,
+        journal_content: str | None = None,
+    ) -> dict[str, object]:
+        """
+        Replay the records of the journal of an info file that are not yet
+        incorporated into the file.
+
+        Args:
+            data (dict[str, object]): The data loaded from the info file.
+            file (Path): Path to the qq info file.
+            host (str | None): Hostname of the remote machine where the file resides.
+            journal_content (str | None): The already loaded content of the whole journal.
+                If None, the journal is read from the file.
+
+        Returns:
+            dict[str, object]: The updated data with `journal_offset` pointing
+            behind the replayed records.
+        """
+        # invalid data are reported when constructing the Info instance
+        if not isinstance(data, dict):
+            return data
+
+        offset = data.get("journal_offset")
+        offset = offset if isinstance(offset, int) else 0
+        journal = (
+            InfoJournal(journal_content[offset:])
+            if journal_content is not None
+            else InfoJournal.fromFile(file, host, offset)
+        )
+        if not journal.size:
+            return data
+
+        logger.debug(f"Replaying {len(journal)} journal records for '{file}'.")
+        data = journal.apply(data)
+        data["journal_offset"] = offset + journal.size
+        return data
+
+    @staticmethod
+    def _parse(
+        content: str, file: Path, header_only: bool = False
+    ) -> dict[str, object]:
+        """
+        Parse the content of a qq info file in the YAML or JSON format.
+
+        Args:
+            content (str): The content of the file.
+            file (Path): Path to the file (used in error messages).
+            header_only (bool): Decode only the header of JSON info files.
+
+        Returns:
+            dict[str, object]: The parsed data.
+
+        Raises:
+            QQError: If the content cannot be parsed or uses an unsupported version
+                of the JSON format.
+        """
+        try:
+            if not content.startswith(_JSON_MAGIC):
+                return yaml.load(content, Loader=SafeLoader)
+
+            header, _, body = content.partition("\n")
+            data = json.loads(header)
+            if (version := data.get("qq_info_format")) != _JSON_VERSION:
+                raise QQError(
+                    f"Unsupported version of the qq info file format in '{file}': {version}."
+                )
+
+            return data if header_only else json.loads(body)
+        except (yaml.YAMLError, json.JSONDecodeError) as e:
+            raise QQError(f"Could not parse the qq info file '{file}': {e}.") from e
+
     def _toDict(self) -> dict[str, object]:
         """
         Convert the Info instance into a dictionary of string-object pairs.
@@ -281,7 +588,12 @@ class Info:
             if f.type == JobType:
                 result[f.name] = str(value)
             # convert resources
-            elif f.type == Resources or f.type == LoopInfo | None:
+            elif (
+                f.type == Resources
+                or f.type == LoopInfo | None
+                or f.type == PackInfo | None
+                or f.type == ResourceUsage | None
+            ):
                 result[f.name] = value.toDict()
             # convert the state and the batch system
             elif (
@@ -336,6 +648,12 @@ class Info:
                 init_kwargs[name] = LoopInfo(  # ty: ignore[missing-argument]
                     **{k: Path(v) if k == "archive" else v for k, v in value.items()}
                 )
+            # convert optional pack job info
+            elif f.type == PackInfo | None and isinstance(value, dict):
+                init_kwargs[name] = PackInfo.fromDict(value)
+            # convert optional resource usage
+            elif f.type == ResourceUsage | None and isinstance(value, dict):
+                init_kwargs[name] = ResourceUsage.fromDict(value)
             # convert resources
             elif f.type == Resources:
                 init_kwargs[name] = Resources(**value)  # ty: ignore[invalid-argument-type]
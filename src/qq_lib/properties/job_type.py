@@ -5,7 +5,7 @@
 Enumeration of supported qq job types.
 
 This module defines `JobType`, an enum distinguishing between standard
-(single-run) qq jobs and loop jobs.
+(single-run) qq jobs, loop jobs, and pack jobs.
 """
 
 from enum import Enum
@@ -21,6 +21,7 @@ class JobType(Enum):
 
     STANDARD = 1
     LOOP = 2
+    PACK = 3
 
     def __str__(self):
         return self.name.lower()
@@ -0,0 +1,213 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Append-only journal of updates of a qq info file.
+
+Instead of rewriting the entire info file on each state transition of a job,
+`qq run` and `qq kill` append small records to a journal stored next to the info file
+(with the `.qqjournal` suffix). The records are replayed on top of the info file
+whenever it is loaded.
+
+Each record is a single line containing a JSON object with the ID of the job
+and the updated fields of the info file in the same representation as in the info file:
+
+    {"job_id": "12345.server", "fields": {"job_state": "killed", ...}}
+
+Records are appended using a single write into a file opened with `O_APPEND`,
+so concurrent updates by multiple processes never overwrite each other.
+Records of other jobs (e.g., from a stale journal of a job with the same name)
+are ignored. Once a job is killed, records changing the state of the job are ignored,
+so that `qq run` cannot overwrite the information that the job has been killed.
+A partially written last line is ignored until it is completed.
+
+Whenever the whole info file is rewritten, it records the length of the journal
+that has already been incorporated into it (`journal_offset`) and only the records
+following this offset are replayed. Once a job finishes, `qq run` compacts the journal:
+the info file is rewritten with all the records incorporated and the journal is truncated.
+"""
+
+import json
+from pathlib import Path
+from typing import Self
+
+from qq_lib.batch.interface import BatchInterface, BatchMeta
+from qq_lib.core.common import append_to_file, construct_journal_path
+from qq_lib.core.error import QQError
+from qq_lib.core.logger import get_logger
+
+from .states import NaiveState
+
+logger = get_logger(__name__)
+
+
+class InfoJournal:
+    """
+    Records of updates of a qq info file.
+    """
+
+    def __init__(self, content: str):
+        """
+        Parse the content of a journal.
+
+        Args:
+            content (str): The content of the journal (or its part following an offset).
+        """
+        self._records: list[dict[str, object]] = []
+
+        # only complete lines are parsed
+        complete, _, partial = content.rpartition("\n")
+        if partial:
+            logger.debug(f"Ignoring incomplete journal record '{partial}'.")
+
+        # length of the parsed content (records contain only ASCII characters)
+        self.size = len(content) - len(partial)
+
+        for line in complete.splitlines():
+            try:
+                record = json.loads(line)
+                if isinstance(record, dict) and isinstance(record.get("fields"), dict):
+                    self._records.append(record)
+                    continue
+            except json.JSONDecodeError:
+                pass
+
+            logger.debug(f"Ignoring malformed journal record '{line}'.")
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @classmethod
+    def fromFile(
+        cls, info_file: Path, host: str | None = None, offset: int = 0
+    ) -> Self:
+        """
+        Load the records of the journal of an info file following the specified offset.
+
+        A missing journal is treated as empty.
+
+        Args:
+            info_file (Path): Path to the qq info file.
+            host (str | None): Optional hostname of the remote machine where the file resides.
+                If None, the file is assumed to be local.
+            offset (int): Number of bytes at the start of the journal to skip.
+
+        Returns:
+            InfoJournal: The loaded journal.
+        """
+        journal = construct_journal_path(info_file)
+
+        if host:
+            try:
+                BatchSystem = BatchMeta.fromEnvVarOrGuess()
+                content = BatchSystem.readRemoteFile(host, journal)[offset:]
+            except QQError as e:
+                logger.debug(f"Could not read journal '{journal}' on '{host}': {e}")
+                content = ""
+        else:
+            try:
+                with journal.open("rb") as input:
+                    input.seek(offset)
+                    content = input.read().decode()
+            except FileNotFoundError:
+                content = ""
+            except OSError as e:
+                raise QQError(f"Could not read journal '{journal}': {e}.") from e
+
+        return cls(content)
+
+    def apply(self, data: dict[str, object]) -> dict[str, object]:
+        """
+        Replay the records of the journal on top of the data loaded from an info file.
+
+        Args:
+            data (dict[str, object]): Fields of the info file. Modified in place.
+
+        Returns:
+            dict[str, object]: The updated fields.
+        """
+        for record in self._records:
+            if record.get("job_id") != data.get("job_id"):
+                logger.debug(f"Ignoring journal record of another job: {record}.")
+                continue
+
+            fields: dict[str, object] = record["fields"]  # ty: ignore[invalid-assignment]
+            if "job_state" in fields and data.get("job_state") == str(
+                NaiveState.KILLED
+            ):
+                logger.debug(f"Ignoring journal record of a killed job: {record}.")
+                continue
+
+            data.update(fields)
+
+        return data
+
+    @staticmethod
+    def append(
+        info_file: Path,
+        job_id: str,
+        fields: dict[str, object],
+        batch_system: type[BatchInterface],
+        host: str | None = None,
+    ) -> None:
+        """
+        Append a record to the journal of an info file.
+
+        Args:
+            info_file (Path): Path to the qq info file.
+            job_id (str): ID of the job the record belongs to.
+            fields (dict[str, object]): The updated fields of the info file.
+            batch_system (type[BatchInterface]): Batch system used to append
+                to a journal on a remote host.
+            host (str | None): Optional hostname of the remote machine where the file resides.
+                If None, the file is assumed to be local.
+
+        Raises:
+            QQError: If the record cannot be appended.
+        """
+        journal = construct_journal_path(info_file)
+        record = json.dumps({"job_id": job_id, "fields": fields}) + "\n"
+
+        if host:
+            logger.debug(f"Appending '{record.strip()}' to '{journal}' on '{host}'.")
+            batch_system.appendRemoteFile(host, journal, record)
+            return
+
+        logger.debug(f"Appending '{record.strip()}' to '{journal}'.")
+        try:
+            append_to_file(journal, record)
+        except OSError as e:
+            raise QQError(f"Could not append to journal '{journal}': {e}.") from e
+
+    @staticmethod
+    def clear(
+        info_file: Path,
+        batch_system: type[BatchInterface],
+        host: str | None = None,
+    ) -> None:
+        """
+        Remove all records from the journal of an info file.
+
+        Args:
+            info_file (Path): Path to the qq info file.
+            batch_system (type[BatchInterface]): Batch system used to truncate
+                a journal on a remote host.
+            host (str | None): Optional hostname of the remote machine where the file resides.
+                If None, the file is assumed to be local.
+
+        Raises:
+            QQError: If the journal cannot be truncated.
+        """
+        journal = construct_journal_path(info_file)
+
+        if host:
+            logger.debug(f"Clearing journal '{journal}' on '{host}'.")
+            batch_system.writeRemoteFile(host, journal, "")
+            return
+
+        logger.debug(f"Clearing journal '{journal}'.")
+        try:
+            with journal.open("w"):
+                pass
+        except OSError as e:
+            raise QQError(f"Could not clear journal '{journal}': {e}.") from e
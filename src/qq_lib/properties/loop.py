@@ -15,9 +15,14 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 
 from qq_lib.archive.archiver import Archiver
+from qq_lib.archive.packer import Packer
+from qq_lib.core.common import is_printf_pattern
+from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
 
+from .autosize import AutosizeInfo
+
 logger = get_logger(__name__)
 
 
@@ -32,6 +37,13 @@ class LoopInfo:
     archive: Path
     archive_format: str
     current: int
+    reuse_work_dir: bool
+    reused_work_dir: Path | None
+    window: int
+    archive_pack: str | None
+    max_requeues: int
+    requeues: int
+    autosize: AutosizeInfo | None
 
     def __init__(
         self,
@@ -41,6 +53,13 @@ class LoopInfo:
         archive_format: str,
         current: int | None = None,
         input_dir: Path | None = None,
+        reuse_work_dir: bool = False,
+        reused_work_dir: Path | str | None = None,
+        window: int = 1,
+        archive_pack: str | None = None,
+        max_requeues: int = 0,
+        requeues: int = 0,
+        autosize: AutosizeInfo | str | None = None,
     ):
         """
         Initialize loop job information with validation checks.
@@ -54,10 +73,27 @@ class LoopInfo:
             archive_format (str): File naming pattern used for archived files.
             current (int | None): The current cycle number. Defaults to `start`
                 if not provided.
+            reuse_work_dir (bool): Keep the working directory on the computing node
+                after a successful cycle so that the next cycle can reuse it.
+            reused_work_dir (Path | str | None): Working directory of the previous cycle
+                that was reused by the current cycle.
+            window (int): Number of cycles kept submitted in advance, each depending
+                on the successful completion of the previous one. Defaults to 1,
+                i.e., each cycle submits the next one once it finishes.
+            archive_pack (str | None): Format of the bundles into which the files
+                of each cycle are packed in the archive. If `None`, files are archived
+                individually.
+            max_requeues (int): Maximal number of times a cycle failing due to an error
+                of the qq infrastructure is submitted again. Defaults to 0 (never).
+            requeues (int): Number of times the current cycle has already been submitted again.
+            autosize (AutosizeInfo | str | None): Resources requested for the first autosized cycle
+                (or their string representation). If `None`, the resources of the following
+                cycles are not adjusted.
 
         Raises:
             QQError: If `end` is not provided, if `start > end`, if `current > end`,
-                or if the archive path is invalid.
+                if `window` is lower than 1, if the archive path is invalid,
+                if the pack format is not supported, or if the number of requeues is negative.
         """
         if not end:
             raise QQError("Attribute 'loop-end' is undefined.")
@@ -72,6 +108,16 @@ class LoopInfo:
         self.end = end
         self.current = current or self._getCycle()
 
+        self.reuse_work_dir = reuse_work_dir
+        self.reused_work_dir = Path(reused_work_dir) if reused_work_dir else None
+        self.window = window
+        self.archive_pack = archive_pack
+        self.max_requeues = max_requeues
+        self.requeues = requeues
+        self.autosize = (
+            AutosizeInfo.fromStr(autosize) if isinstance(autosize, str) else autosize
+        )
+
         if self.start < 0:
             raise QQError(f"Attribute 'loop-start' ({self.start}) cannot be negative.")
 
@@ -85,11 +131,41 @@ class LoopInfo:
                 f"Current cycle number ({self.current}) cannot be higher than 'loop-end' ({self.end})."
             )
 
+        if self.window < 1:
+            raise QQError(
+                f"Attribute 'loop-window' ({self.window}) must be at least 1."
+            )
+
+        if self.max_requeues < 0:
+            raise QQError(
+                f"Attribute 'max-requeues' ({self.max_requeues}) cannot be negative."
+            )
+
+        if self.requeues < 0:
+            raise QQError(f"Number of requeues ({self.requeues}) cannot be negative.")
+
+        if self.archive_pack:
+            if self.archive_pack not in Packer.FORMATS:
+                raise QQError(
+                    f"Attribute 'archive-pack' ({self.archive_pack}) must be one of: {', '.join(Packer.FORMATS)}."
+                )
+
+            if not is_printf_pattern(self.archive_format):
+                raise QQError(
+                    f"Attribute 'archive-pack' requires a printf-style 'archive-format' ('{self.archive_format}' given)."
+                )
+
     def toDict(self) -> dict[str, object]:
-        """Return all fields as a dict."""
-        return {
-            k: str(v) if isinstance(v, Path) else v for k, v in asdict(self).items()
+        """Return all fields as a dict. Fields that are None are ignored."""
+        result = {
+            k: str(v) if isinstance(v, Path) else v
+            for k, v in asdict(self).items()
+            if v is not None
         }
+        if self.autosize:
+            result["autosize"] = self.autosize.toStr()
+
+        return result
 
     def toCommandLine(self) -> list[str]:
         """
@@ -98,7 +174,7 @@ class LoopInfo:
         Returns:
             list[str]: A list of command-line arguments ready to pass to ``qq submit``.
         """
-        return [
+        command_line = [
             "--loop-start",
             str(self.start),
             "--loop-end",
@@ -109,6 +185,61 @@ class LoopInfo:
             self.archive_format,
         ]
 
+        if self.reuse_work_dir:
+            command_line.append("--reuse-work-dir")
+
+        if self.window > 1:
+            command_line.extend(["--loop-window", str(self.window)])
+
+        if self.archive_pack:
+            command_line.extend(["--archive-pack", self.archive_pack])
+
+        if self.max_requeues:
+            command_line.extend(["--max-requeues", str(self.max_requeues)])
+
+        if self.autosize:
+            command_line.extend(["--autosize-base", self.autosize.toStr()])
+
+        return command_line
+
+    def getRequeueDelay(self) -> int:
+        """
+        Get the time after which a requeued cycle may start.
+
+        The delay doubles with each requeue of the same cycle
+        (see `CFG.loop_jobs.requeue_backoff`).
+
+        Returns:
+            int: Delay in seconds, or 0 if the current cycle has not been requeued.
+        """
+        if self.requeues == 0:
+            return 0
+
+        return min(
+            CFG.loop_jobs.requeue_backoff * 2 ** (self.requeues - 1),
+            CFG.loop_jobs.requeue_backoff_max,
+        )
+
+    def canRequeue(self) -> bool:
+        """
+        Check whether the current cycle can be submitted again after failing
+        due to an error of the qq infrastructure.
+
+        Returns:
+            bool: True if the cycle has not yet been requeued `max_requeues` times, else False.
+        """
+        return self.requeues < self.max_requeues
+
+    def getLastQueuedCycle(self) -> int:
+        """
+        Get the last cycle that is submitted in advance while the current cycle is running.
+
+        Returns:
+            int: The number of the last cycle within the submission window.
+            Equal to `current` if no cycles are submitted in advance.
+        """
+        return min(self.current + self.window - 1, self.end)
+
     def _getCycle(self) -> int:
         """
         Determine the current cycle number based on files in the archive directory.
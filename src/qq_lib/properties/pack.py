@@ -0,0 +1,231 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Pack-job metadata and per-task status tracking.
+
+A qq pack job runs many short tasks inside a single allocation. This module
+defines `PackTask`, describing one task of the pack and its execution status,
+and `PackInfo`, a dataclass holding the list of tasks and the resources
+assigned to each of them.
+
+Each task is either a directory (relative to the input directory) in which
+the submitted script is executed or an arbitrary command line executed
+in the working directory.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Self
+
+from qq_lib.core.error import QQError
+from qq_lib.core.logger import get_logger
+
+from .states import NaiveState
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PackTask:
+    """
+    A single task of a qq pack job.
+    """
+
+    # Task as specified in the task list.
+    task: str
+
+    # True if the task is a directory in which the script is executed, False if it is a command line.
+    is_dir: bool = False
+
+    # State of the task.
+    state: NaiveState = NaiveState.QUEUED
+
+    # Exit code of the task. None if the task has not finished yet.
+    exit_code: int | None = None
+
+    def toDict(self) -> dict[str, object]:
+        """Return all fields as a dict. Fields that are None are ignored."""
+        result: dict[str, object] = {
+            "task": self.task,
+            "is_dir": self.is_dir,
+            "state": str(self.state),
+        }
+        if self.exit_code is not None:
+            result["exit_code"] = self.exit_code
+
+        return result
+
+    @classmethod
+    def fromDict(cls, data: dict[str, object]) -> Self:
+        """
+        Construct a PackTask from a dictionary.
+
+        Args:
+            data (dict[str, object]): Dictionary created by `PackTask.toDict`.
+
+        Returns:
+            PackTask: The constructed task.
+        """
+        state = data.get("state")
+        return cls(
+            task=str(data["task"]),
+            is_dir=bool(data.get("is_dir", False)),
+            state=NaiveState.fromStr(state)
+            if isinstance(state, str)
+            else NaiveState.QUEUED,
+            exit_code=exit_code
+            if isinstance(exit_code := data.get("exit_code"), int)
+            else None,
+        )
+
+
+@dataclass
+class PackInfo:
+    """
+    Dataclass containing information about a qq pack job.
+    """
+
+    # Tasks of the pack.
+    tasks: list[PackTask] = field(default_factory=list)
+
+    # Number of CPU cores assigned to each task.
+    task_ncpus: int = 1
+
+    # Number of GPUs assigned to each task.
+    task_ngpus: int = 0
+
+    def __post_init__(self):
+        """
+        Validate the pack job information.
+
+        Raises:
+            QQError: If the pack contains no tasks or the per-task resources are invalid.
+        """
+        if not self.tasks:
+            raise QQError("A pack job requires at least one task.")
+
+        if self.task_ncpus < 1:
+            raise QQError(
+                f"Attribute 'pack-task-ncpus' ({self.task_ncpus}) must be at least 1."
+            )
+
+        if self.task_ngpus < 0:
+            raise QQError(
+                f"Attribute 'pack-task-ngpus' ({self.task_ngpus}) cannot be negative."
+            )
+
+    @classmethod
+    def fromTaskList(
+        cls,
+        tasks: list[str],
+        input_dir: Path,
+        task_ncpus: int = 1,
+        task_ngpus: int = 0,
+    ) -> Self:
+        """
+        Construct pack job information from a list of tasks.
+
+        Tasks naming an existing directory relative to the input directory are
+        directory tasks, all other tasks are command lines.
+
+        Args:
+            tasks (list[str]): Tasks as specified by the user.
+            input_dir (Path): The job submission directory.
+            task_ncpus (int): Number of CPU cores assigned to each task.
+            task_ngpus (int): Number of GPUs assigned to each task.
+
+        Returns:
+            PackInfo: The constructed pack job information.
+
+        Raises:
+            QQError: If the pack contains no tasks or the per-task resources are invalid.
+        """
+        return cls(
+            [
+                PackTask(
+                    task,
+                    is_dir=not Path(task).is_absolute() and (input_dir / task).is_dir(),
+                )
+                for task in tasks
+            ],
+            task_ncpus,
+            task_ngpus,
+        )
+
+    @classmethod
+    def fromFile(
+        cls,
+        file: Path,
+        input_dir: Path,
+        task_ncpus: int = 1,
+        task_ngpus: int = 0,
+    ) -> Self:
+        """
+        Construct pack job information from a task list file.
+
+        The file contains one task per line. Empty lines and lines starting with '#' are ignored.
+
+        Args:
+            file (Path): Path to the task list file.
+            input_dir (Path): The job submission directory.
+            task_ncpus (int): Number of CPU cores assigned to each task.
+            task_ngpus (int): Number of GPUs assigned to each task.
+
+        Returns:
+            PackInfo: The constructed pack job information.
+
+        Raises:
+            QQError: If the file cannot be read, contains no tasks,
+                or the per-task resources are invalid.
+        """
+        try:
+            lines = file.read_text().splitlines()
+        except Exception as e:
+            raise QQError(f"Could not read task list '{file}': {e}.") from e
+
+        tasks = [
+            stripped
+            for line in lines
+            if (stripped := line.strip()) and not stripped.startswith("#")
+        ]
+        logger.debug(f"Loaded {len(tasks)} tasks from '{file}'.")
+        return cls.fromTaskList(tasks, input_dir, task_ncpus, task_ngpus)
+
+    @classmethod
+    def fromDict(cls, data: dict[str, object]) -> Self:
+        """
+        Construct pack job information from a dictionary.
+
+        Args:
+            data (dict[str, object]): Dictionary created by `PackInfo.toDict`.
+
+        Returns:
+            PackInfo: The constructed pack job information.
+        """
+        tasks = data.get("tasks")
+        return cls(
+            [PackTask.fromDict(t) for t in tasks] if isinstance(tasks, list) else [],
+            int(data.get("task_ncpus", 1)),  # ty: ignore[invalid-argument-type]
+            int(data.get("task_ngpus", 0)),  # ty: ignore[invalid-argument-type]
+        )
+
+    def toDict(self) -> dict[str, object]:
+        """Return all fields as a dict."""
+        return {
+            "tasks": [t.toDict() for t in self.tasks],
+            "task_ncpus": self.task_ncpus,
+            "task_ngpus": self.task_ngpus,
+        }
+
+    def countTasks(self, state: NaiveState) -> int:
+        """
+        Count the tasks in the specified state.
+
+        Args:
+            state (NaiveState): State of the tasks to count.
+
+        Returns:
+            int: Number of tasks in the state.
+        """
+        return sum(1 for t in self.tasks if t.state == state)
@@ -6,6 +6,7 @@ import sys
 import click
 from click_help_colors import HelpColorsGroup
 
+from qq_lib.archive.cli import reindex
 from qq_lib.cd.cli import cd
 from qq_lib.clear.cli import clear
 from qq_lib.go.cli import go
@@ -14,6 +15,7 @@ from qq_lib.jobs.cli import jobs
 from qq_lib.kill.cli import kill
 from qq_lib.killall.cli import killall
 from qq_lib.nodes.cli import nodes
+from qq_lib.prestage.cli import prestage
 from qq_lib.queues.cli import queues
 from qq_lib.run.cli import run
 from qq_lib.shebang.cli import shebang
@@ -21,6 +23,7 @@ from qq_lib.stat.cli import stat
 from qq_lib.submit.cli import submit
 from qq_lib.sync.cli import sync
 from qq_lib.wipe.cli import wipe
+from qq_lib.workflow.cli import workflow
 
 from ._version import __version__
 
@@ -72,3 +75,6 @@ cli.add_command(queues)
 cli.add_command(nodes)
 cli.add_command(shebang)
 cli.add_command(wipe)
+cli.add_command(prestage)
+cli.add_command(reindex)
+cli.add_command(workflow)
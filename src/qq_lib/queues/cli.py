@@ -17,6 +17,7 @@ if TYPE_CHECKING:
 from qq_lib.core.click_format import GNUHelpColorsCommand
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
+from qq_lib.core.records import OutputFormat
 
 from .presenter import QueuesPresenter
 
@@ -38,8 +39,17 @@ If the `--all` flag is specified, display all queues, including those not availa
     help="Display all queues, including those not available to you.",
 )
 @click.option("--yaml", is_flag=True, help="Output queue metadata in YAML format.")
-def queues(all: bool, yaml: bool) -> NoReturn:
+@click.option(
+    "--format",
+    type=click.Choice([str(f) for f in OutputFormat], case_sensitive=False),
+    default=None,
+    help="Output queue metadata in a machine-readable format.",
+)
+def queues(all: bool, yaml: bool, format: str | None) -> NoReturn:
     try:
+        if yaml and format:
+            raise QQError("Options '--yaml' and '--format' cannot be used together.")
+
         BatchSystem = BatchMeta.fromEnvVarOrGuess()
         queues: list[BatchQueueInterface] = BatchSystem.getQueues()
         user = getpass.getuser()
@@ -48,7 +58,9 @@ def queues(all: bool, yaml: bool) -> NoReturn:
             queues = [q for q in queues if q.isAvailableToUser(user)]
 
         presenter = QueuesPresenter(queues, user, all)
-        if yaml:
+        if format:
+            presenter.dumpRecords(OutputFormat.fromStr(format))
+        elif yaml:
             presenter.dumpYaml()
         else:
             console = Console(record=False, markup=False)
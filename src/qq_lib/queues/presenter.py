@@ -9,6 +9,7 @@ from rich.text import Text
 from qq_lib.batch.interface.queue import BatchQueueInterface
 from qq_lib.core.common import format_duration_wdhhmmss, get_panel_width
 from qq_lib.core.config import CFG
+from qq_lib.core.records import OutputFormat, RecordWriter
 from qq_lib.properties.states import BatchState
 
 
@@ -41,6 +42,17 @@ class QueuesPresenter:
         for queue in self._queues:
             print(queue.toYaml())
 
+    def dumpRecords(self, format: OutputFormat) -> None:
+        """
+        Print machine-readable records of all queues to stdout.
+
+        Args:
+            format (OutputFormat): Format of the output.
+        """
+        RecordWriter(format, BatchQueueInterface.RECORD_FIELDS).writeAll(
+            queue.toRecord() for queue in self._queues
+        )
+
     def createQueuesInfoPanel(self, console: Console | None = None) -> Group:
         """
         Create a Rich panel displaying queue information.
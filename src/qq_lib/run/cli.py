@@ -9,9 +9,12 @@ from typing import NoReturn
 
 import click
 
+from qq_lib.batch.interface import BatchMeta
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError, QQRunCommunicationError, QQRunFatalError
 from qq_lib.core.logger import get_logger
+from qq_lib.core.retryer import Retryer
+from qq_lib.properties.array import ArrayIndex
 
 from .runner import Runner, log_fatal_error_and_exit
 
@@ -65,15 +68,18 @@ def run(script_path: str) -> NoReturn:
         sys.exit(CFG.exit_codes.not_qq_env)
 
     try:
-        # get the destination of the info file from env vars
-        if not (info_file := os.environ.get(CFG.env_vars.info_file)):
+        if not (input_machine := os.environ.get(CFG.env_vars.input_machine)):
             raise QQRunFatalError(
-                f"'{CFG.env_vars.info_file}' environment variable is not set."
+                f"'{CFG.env_vars.input_machine}' environment variable is not set."
             )
 
-        if not (input_machine := os.environ.get(CFG.env_vars.input_machine)):
+        # get the destination of the info file from env vars
+        # (members of array jobs get it from the index of the array)
+        if not (info_file := os.environ.get(CFG.env_vars.info_file)) and not (
+            info_file := getArrayInfoFile(input_machine)
+        ):
             raise QQRunFatalError(
-                f"'{CFG.env_vars.input_machine}' environment variable is not set."
+                f"'{CFG.env_vars.info_file}' environment variable is not set."
             )
 
         # initialize the runner
@@ -111,3 +117,40 @@ def ensureQQEnv() -> None:
             "This script must be run as a qq job within the batch system. "
             f"To submit it properly, use: '{CFG.binary_name} submit'."
         )
+
+
+def getArrayInfoFile(input_machine: str) -> Path | None:
+    """
+    Get the qq info file of the current member of an array job.
+
+    Args:
+        input_machine (str): The machine from which the array job was submitted.
+
+    Returns:
+        Path | None: Path to the qq info file of the member or None if
+        the job is not a member of a qq array job.
+
+    Raises:
+        QQRunFatalError: If the index of the array cannot be read or
+            does not contain the current member.
+    """
+    if not (index_file := os.environ.get(CFG.env_vars.array_index)):
+        return None
+
+    try:
+        batch_system = BatchMeta.fromEnvVarOrGuess()
+        if (index := batch_system.getArrayIndex()) is None:
+            raise QQError("Job has no associated array index")
+
+        array_index = Retryer(
+            ArrayIndex.fromFile,
+            Path(index_file),
+            host=input_machine,
+            max_tries=CFG.runner.retry_tries,
+            wait_seconds=CFG.runner.retry_wait,
+        ).run()
+        return array_index.getInfoFile(index)
+    except Exception as e:
+        raise QQRunFatalError(
+            f"Unable to find the qq info file of the array job member in '{index_file}' on '{input_machine}': {e}"
+        ) from e
@@ -0,0 +1,245 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Node-local cache of explicitly included input files.
+
+Files requested with the `--include` option are often large and identical across
+many jobs (force-field directories, equilibrated structures, container images).
+`InputCache` stores a single copy of each such file in a cache directory on scratch
+and copies it into the working directories of the individual jobs (using a reflink
+if the filesystem supports it), so that the file is transferred to the node only once
+per cache lifetime. Each job gets its own writable copy with the permissions
+and modification time of the source file.
+
+Only files on shared storage or on the current host may be staged using the cache;
+a path that is accessible locally may otherwise point to a different file
+than the same path on the input machine.
+
+Cached objects are keyed by the absolute path, size, and modification time
+of the source file. The least recently used objects are evicted once the total
+size of the cache exceeds the configured limit.
+"""
+
+import fcntl
+import hashlib
+import os
+import shutil
+import stat
+import tempfile
+from pathlib import Path
+
+from qq_lib.core.logger import get_logger
+from qq_lib.properties.size import Size
+
+logger = get_logger(__name__, show_time=True)
+
+# ioctl request cloning a file on copy-on-write filesystems (Linux FICLONE)
+FICLONE = 0x40049409
+
+
+class InputCache:
+    """
+    Content-addressed cache of input files shared by jobs running on the same node.
+    """
+
+    def __init__(self, directory: Path, max_size: Size):
+        """
+        Initialize the cache.
+
+        Args:
+            directory (Path): Directory in which the cached objects are stored.
+                Should be located on the same filesystem as the working directories.
+            max_size (Size): Maximal total size of the cached objects.
+        """
+        self._directory = directory
+        self._max_size = max_size.value * 1024  # in bytes
+
+    def stage(self, source: Path, destination: Path) -> bool:
+        """
+        Stage a file or a directory into the working directory using the cache.
+
+        The source must be located on shared storage or on the current host.
+        Files missing in the cache are copied into it first. Directories
+        are recreated at the destination with each file staged individually.
+
+        Args:
+            source (Path): Absolute path to the file or directory to stage.
+            destination (Path): Path at which the staged file or directory should be created.
+
+        Returns:
+            bool: True if the source was staged, False if it could not be staged
+            using the cache and has to be transferred in a standard way.
+        """
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+
+            if source.is_dir():
+                self._stageDirectory(source, destination)
+            elif source.is_file():
+                self._stageFile(source, destination)
+            else:
+                logger.debug(f"'{source}' is not accessible: not using input cache.")
+                return False
+        except OSError as e:
+            logger.debug(f"Could not stage '{source}' using input cache: {e}.")
+            return False
+
+        return True
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used objects until the cache fits into its size limit.
+        """
+        try:
+            objects = [
+                (entry.stat().st_mtime_ns, entry.stat().st_size, Path(entry.path))
+                for entry in os.scandir(self._directory)
+                if entry.is_file(follow_symlinks=False)
+                and not entry.name.startswith(".")
+            ]
+        except OSError as e:
+            logger.debug(f"Could not list input cache '{self._directory}': {e}.")
+            return
+
+        total = sum(size for _, size, _ in objects)
+        for _, size, path in sorted(objects):
+            if total <= self._max_size:
+                break
+
+            logger.debug(f"Evicting '{path}' from input cache.")
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                # already evicted by another job
+                pass
+            except OSError as e:
+                logger.debug(f"Could not evict '{path}' from input cache: {e}.")
+                continue
+
+            total -= size
+
+    def _stageDirectory(self, source: Path, destination: Path) -> None:
+        """
+        Recreate a directory at the destination and stage all files it contains.
+
+        Symbolic links are recreated as they are.
+
+        Args:
+            source (Path): The directory to stage.
+            destination (Path): Path of the directory to create.
+
+        Raises:
+            OSError: If any of the files cannot be staged.
+        """
+        for root, dirs, files in os.walk(source):
+            target_root = destination / Path(root).relative_to(source)
+            target_root.mkdir(parents=True, exist_ok=True)
+
+            for name in dirs + files:
+                item = Path(root) / name
+                if item.is_symlink():
+                    (target_root / name).unlink(missing_ok=True)
+                    (target_root / name).symlink_to(item.readlink())
+                elif name in files:
+                    self._stageFile(item, target_root / name)
+
+    def _stageFile(self, source: Path, destination: Path) -> None:
+        """
+        Copy a single file from the cache to the destination, caching it first if needed.
+
+        The staged file gets the permissions and modification time of the source file.
+
+        Args:
+            source (Path): The file to stage.
+            destination (Path): Path of the file to create.
+
+        Raises:
+            OSError: If the file cannot be cached or copied.
+        """
+        source_stat = source.stat()
+        cached = self._directory / InputCache._getKey(source, source_stat)
+
+        if cached.is_file():
+            logger.debug(f"Input cache hit for '{source}'.")
+        else:
+            if source_stat.st_size > self._max_size:
+                raise OSError(
+                    f"file is larger than the input cache ({source_stat.st_size} B)"
+                )
+
+            logger.debug(f"Input cache miss for '{source}': caching as '{cached}'.")
+            self._store(source, cached)
+            self.evict()
+
+        # mark the object as recently used
+        os.utime(cached)
+
+        # the job may modify the staged file, so it must not share data with the cached object
+        destination.unlink(missing_ok=True)
+        InputCache._clone(cached, destination)
+        destination.chmod(stat.S_IMODE(source_stat.st_mode))
+        os.utime(destination, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+
+    def _store(self, source: Path, cached: Path) -> None:
+        """
+        Atomically copy a file into the cache.
+
+        Args:
+            source (Path): The file to cache.
+            cached (Path): Path of the cached object.
+
+        Raises:
+            OSError: If the file cannot be copied.
+        """
+        fd, tmp = tempfile.mkstemp(dir=self._directory, prefix=".")
+        os.close(fd)
+        try:
+            shutil.copy2(source, tmp)
+            # copy2 preserves the modification time of the source which would make the object look stale
+            os.utime(tmp)
+            Path(tmp).replace(cached)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _clone(cached: Path, destination: Path) -> None:
+        """
+        Copy a cached object to the destination.
+
+        A reflink sharing the data blocks with the cached object is created
+        on copy-on-write filesystems; the content is copied otherwise.
+
+        Args:
+            cached (Path): The cached object.
+            destination (Path): Path of the file to create.
+
+        Raises:
+            OSError: If the object cannot be copied.
+        """
+        with cached.open("rb") as src, destination.open("wb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                return
+            except OSError as e:
+                logger.debug(f"Could not reflink '{cached}': {e}. Copying instead.")
+
+            shutil.copyfileobj(src, dst)
+
+    @staticmethod
+    def _getKey(source: Path, source_stat: os.stat_result) -> str:
+        """
+        Get the key identifying the content of a file in the cache.
+
+        Args:
+            source (Path): Absolute path to the file.
+            source_stat (os.stat_result): Result of `stat` for the file.
+
+        Returns:
+            str: The key of the file.
+        """
+        identity = (
+            f"{source.resolve()}\0{source_stat.st_size}\0{source_stat.st_mtime_ns}"
+        )
+        return hashlib.sha256(identity.encode()).hexdigest()
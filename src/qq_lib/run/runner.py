@@ -1,22 +1,29 @@
 # Released under MIT License.
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
+import math
 import os
+import resource
 import shutil
 import signal
 import socket
 import subprocess
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from time import sleep
+from time import monotonic, sleep
 from types import FrameType
 from typing import NoReturn
 
 import qq_lib
 from qq_lib.archive.archiver import Archiver
 from qq_lib.batch.interface.meta import BatchMeta
-from qq_lib.core.common import construct_loop_job_name
+from qq_lib.core.common import (
+    construct_info_file_path,
+    construct_loop_job_name,
+    construct_tombstone_path,
+    is_printf_pattern,
+)
 from qq_lib.core.config import CFG
 from qq_lib.core.error import (
     QQError,
@@ -25,11 +32,19 @@ from qq_lib.core.error import (
     QQRunFatalError,
 )
 from qq_lib.core.logger import get_logger
+from qq_lib.core.manifest import WorkDirManifest
 from qq_lib.core.retryer import Retryer
 from qq_lib.info.informer import Informer
+from qq_lib.properties.autosize import ResourceUsage
 from qq_lib.properties.job_type import JobType
+from qq_lib.properties.pack import PackInfo
+from qq_lib.properties.resources import Resources
+from qq_lib.properties.size import Size
 from qq_lib.properties.states import NaiveState
 
+from .input_cache import InputCache
+from .scheduler import PackScheduler
+
 logger = get_logger(__name__, show_time=True)
 
 
@@ -58,8 +73,14 @@ class Runner:
         # install a signal handler
         signal.signal(signal.SIGTERM, self._handle_sigterm)
 
-        # process running the wrapped script
-        self._process: subprocess.Popen[str] | None = None
+        # time at which the job started; used to measure the walltime consumed by the job
+        self._started = monotonic()
+
+        # process running the wrapped script (or the scheduler running the tasks of a pack job)
+        self._process: subprocess.Popen[str] | PackScheduler | None = None
+
+        # node-local cache for explicitly included files
+        self._input_cache: InputCache | None = None
 
         self._info_file = Path(info_file)
         logger.debug(f"Info file: '{self._info_file}'.")
@@ -124,10 +145,17 @@ class Runner:
                 self._informer.info.input_machine,
                 self._informer.info.input_dir,
                 self._batch_system,
+                loop_info.archive_pack,
             )
             self._should_resubmit = True
+            # should the working directory be retained for the next cycle?
+            self._reuse_work_dir = self._use_scratch and loop_info.reuse_work_dir
         else:
             self._archiver = None
+            self._reuse_work_dir = False
+
+        # working directory of the previous cycle adopted by this job
+        self._reused_work_dir: Path | None = None
 
     def prepare(self) -> None:
         """
@@ -138,11 +166,17 @@ class Runner:
         Raises:
             QQError: If working directory setup fails.
         """
+        retained = None
         if self._archiver:
             assert self._informer.info.loop_info is not None
             # prepare the directory for archiving
             self._archiver.makeArchiveDir()
 
+            # look for a working directory retained by the previous cycle
+            # this has to be done before the info file of the previous cycle is archived
+            if self._reuse_work_dir:
+                retained = self._getRetainedWorkDir()
+
             # archive runtime files from the previous cycle
             # this has to be done before the working directory is prepared,
             # otherwise the runtime files would get copied to the working directory
@@ -159,7 +193,8 @@ class Runner:
             )
 
         if self._use_scratch:
-            self._setUpScratchDir()
+            if not (retained and self._adoptWorkDir(retained)):
+                self._setUpScratchDir()
         else:
             self._setUpSharedDir()
 
@@ -190,6 +225,9 @@ class Runner:
         stdout_log = self._informer.info.stdout_file
         stderr_log = self._informer.info.stderr_file
 
+        if self._informer.info.job_type == JobType.PACK:
+            return self._executePack(script, stdout_log)
+
         logger.info(f"Executing script '{script}'.")
 
         try:
@@ -222,6 +260,45 @@ class Runner:
 
         return self._process.returncode
 
+    def _executePack(self, script: Path, stdout_log: str) -> int:
+        """
+        Execute the tasks of a pack job concurrently in the working directory.
+
+        The start and the completion of each task is reported into the job's
+        stdout file. The states of the tasks are periodically written into the qq info file.
+
+        Args:
+            script (Path): Path to the job script executed by directory tasks.
+            stdout_log (str): Path to the stdout file of the job.
+
+        Returns:
+            int: 0 if all tasks succeeded, otherwise the exit code of the first failed task.
+
+        Raises:
+            QQError: If the tasks cannot be executed.
+        """
+        assert (pack_info := self._informer.info.pack_info) is not None
+        resources = self._informer.info.resources
+
+        try:
+            scheduler = PackScheduler(
+                pack_info,
+                script,
+                self._work_dir,
+                self._informer.info.job_name,
+                int(os.environ.get(CFG.env_vars.ncpus) or resources.ncpus or 1),
+                int(os.environ.get(CFG.env_vars.ngpus) or resources.ngpus or 0),
+            )
+            self._process = scheduler
+
+            logger.info(f"Executing {len(pack_info.tasks)} tasks of the pack job.")
+            with Path(stdout_log).open("w") as out:
+                return scheduler.run(self._updateInfoPack, out)
+        except (QQError, QQRunCommunicationError):
+            raise
+        except Exception as e:
+            raise QQError(f"Failed to execute the tasks of the pack job: {e}") from e
+
     def finalize(self) -> None:
         """
         Finalize the execution of the job script.
@@ -237,7 +314,9 @@ class Runner:
         - On failure (non-zero return code):
             - Updates the qq info file to indicate the job "failed".
             - If `use_scratch` is True, files remain in the scratch directory
-            for debugging purposes. Only runtime files are copied to the input directory.
+            for debugging purposes. Only runtime files are copied to the input directory,
+            unless this is a pack job in which some tasks finished successfully
+            (see `CFG.runner.pack_stage_out_on_failure`); then all files are copied.
 
         Raises:
             QQError: If copying or deletion of files fails.
@@ -246,49 +325,57 @@ class Runner:
         assert self._process is not None
 
         if self._process.returncode == 0:
+            # measure the resources used by an autosized loop job
+            # this has to be done before the working directory is archived and removed
+            usage = self._measureUsage() if self._isAutosized() else None
+
             # archive files
             if self._archiver:
                 self._archiver.toArchive(self._work_dir)
 
             if self._use_scratch:
                 # copy files back to the input (submission) directory
-                Retryer(
-                    self._batch_system.syncWithExclusions,
-                    self._work_dir,
-                    self._input_dir,
-                    socket.gethostname(),
-                    self._informer.info.input_machine,
-                    # exclude files that were copied to workdir from the outside of input dir (--include option)
-                    # these files should not be copied to the input directory, since they were never inside it
-                    self._getExplicitlyIncludedFilesInWorkDir(),
-                    max_tries=CFG.runner.retry_tries,
-                    wait_seconds=CFG.runner.retry_wait,
-                ).run()
+                self._copyWorkDirToInputDir()
 
                 # remove the working directory from scratch
                 # directory is retained on scratch if the run fails for any reason
-                self._deleteWorkDir()
+                # or if it should be reused by the next cycle of a loop job
+                if not (self._reuse_work_dir and self._retainWorkDir()):
+                    self._deleteWorkDir()
 
             # update the qqinfo file
-            self._updateInfoFinished()
+            self._updateInfoFinished(usage)
 
             # if this is a loop job
             if self._informer.info.job_type == JobType.LOOP:
                 self._resubmit()
         else:
-            # copy runtime files to input directory
             if self._use_scratch:
-                self._copyRunTimeFilesToInputDir(retry=True)
+                if self._hasFinishedPackTasks():
+                    # results of the successful tasks must not be lost
+                    logger.info(
+                        "Some tasks of the pack job failed. Copying results of the finished tasks to the input directory."
+                    )
+                    self._copyWorkDirToInputDir()
+                else:
+                    # copy runtime files to input directory
+                    self._copyRunTimeFilesToInputDir(retry=True)
 
             # update the qqinfo file
             self._updateInfoFailed(self._process.returncode)
 
+            # cycles submitted in advance would never start
+            self._cancelQueuedCycles()
+
         logger.info(f"Job completed with an exit code of {self._process.returncode}.")
 
     def logFailureAndExit(self, exception: BaseException) -> NoReturn:
         """
         Record a failure state into the qq info file and exit the program.
 
+        If the failure was caused by the qq infrastructure rather than by the script,
+        the current cycle of a loop job is submitted again (see `Runner._shouldRequeue`).
+
         Args:
             exception (BaseException): The exception to log.
 
@@ -297,8 +384,11 @@ class Runner:
         """
         exit_code = getattr(exception, "exit_code", CFG.exit_codes.unexpected_error)
         try:
+            requeue = self._shouldRequeue(exception)
             self._updateInfoFailed(exit_code)
             logger.error(exception)
+            if requeue:
+                self._requeue()
             sys.exit(exit_code)
         except Exception as e:
             # unable to log the current state into the info file
@@ -339,6 +429,10 @@ class Runner:
 
         logger.info(f"Setting up working directory in '{self._work_dir}'.")
 
+        # use input data pre-staged while the job was queued
+        # files that changed since then are transferred by the following synchronization
+        self._adoptPrestagedDir()
+
         # move to the working directory
         Retryer(
             os.chdir,
@@ -347,14 +441,97 @@ class Runner:
             wait_seconds=CFG.runner.retry_wait,
         ).run()
 
+        self._copyInputToWorkDir()
+
+    def _adoptPrestagedDir(self) -> bool:
+        """
+        Move input data pre-staged by `qq prestage` into the working directory.
+
+        The pre-staged data are only used if they are present on the current node,
+        belong to this job, are not too old, and still match their manifest.
+        Otherwise, they are deleted and the standard stage-in is used.
+
+        Returns:
+            bool: True if the pre-staged data were adopted, False otherwise.
+        """
+        info = self._informer.info
+        if not (prestaged_node := info.prestaged_node) or not (
+            prestage_dir := self._batch_system.getPrestageDir(
+                info.job_id, info.username, str(info.resources.work_dir)
+            )
+        ):
+            return False
+
+        if not prestage_dir.is_dir():
+            # the job was pre-staged to a different node
+            logger.info(
+                f"Input data were pre-staged to '{prestaged_node}' but the job is running on '{socket.gethostname()}'."
+            )
+            try:
+                self._batch_system.deleteRemoteDir(prestaged_node, prestage_dir)
+            except QQError as e:
+                logger.warning(f"Could not delete pre-staged input data: {e}")
+            return False
+
+        manifest_file = prestage_dir / CFG.loop_jobs.manifest_file
+        try:
+            manifest = WorkDirManifest.fromFile(manifest_file)
+        except QQError as e:
+            logger.warning(e)
+            self._removeDirectory(prestage_dir)
+            return False
+
+        if (
+            manifest.job_id != info.job_id
+            or manifest.isExpired(timedelta(seconds=CFG.prestage.max_age))
+            or not manifest.matchesWorkDir()
+        ):
+            logger.info(f"Pre-staged input data in '{prestage_dir}' are not usable.")
+            self._removeDirectory(prestage_dir)
+            return False
+
+        logger.info(f"Using input data pre-staged in '{prestage_dir}'.")
+        try:
+            manifest_file.unlink()
+            # the pre-staged directory is on the same filesystem as the working directory
+            for entry in prestage_dir.iterdir():
+                entry.rename(self._work_dir / entry.name)
+            prestage_dir.rmdir()
+        except OSError as e:
+            # files that could not be moved will be copied from the input directory
+            logger.warning(f"Could not adopt pre-staged input data: {e}.")
+            self._removeDirectory(prestage_dir)
+            return False
+
+        return True
+
+    def _copyInputToWorkDir(self) -> None:
+        """
+        Copy files from the input directory and explicitly included files to the working directory.
+
+        Files that are already present in the working directory and have not changed
+        are not transferred again. If the working directory was retained by the previous
+        cycle of a loop job, files that were removed from the input directory
+        are also removed from the working directory.
+        """
         # files excluded from copying to the working directory
         qq_out = (
             self._informer.info.input_dir / self._informer.info.job_name
         ).with_suffix(CFG.suffixes.qq_out)
         excluded = self._informer.info.excluded_files + [self._info_file, qq_out]
+        # info files of the following cycles of a loop job submitted in advance
+        excluded.extend(self._informer.info.getQueuedCyclesInfoFiles())
         if self._archiver:
             excluded.append(self._archiver._archive)
 
+        # propagate deletions into the adopted working directory
+        # excluded files are not deleted; explicitly included files are protected the same way
+        delete = self._reused_work_dir is not None
+        if delete:
+            excluded.extend(
+                self._input_dir / f.name for f in self._informer.info.included_files
+            )
+
         # copy files from the input directory to the working directory
         logger.debug(
             f"Files excluded from being copied to the working directory: {excluded}."
@@ -366,12 +543,19 @@ class Runner:
             self._informer.info.input_machine,
             socket.gethostname(),
             excluded,
+            delete=delete,
             max_tries=CFG.runner.retry_tries,
             wait_seconds=CFG.runner.retry_wait,
         ).run()
 
         # copy explicitly included files to the working directory
         # this will copy files that were specified with the --include option, even if they are also in the list of excluded files
+        if CFG.input_cache.enabled and self._informer.info.included_files:
+            self._input_cache = InputCache(
+                self._batch_system.getInputCacheDir(self._work_dir),
+                Size.fromString(CFG.input_cache.max_size),
+            )
+
         logger.debug(
             f"Files explicitly requested to be copied to the working directory: {self._informer.info.included_files}."
         )
@@ -382,20 +566,246 @@ class Runner:
             wait_seconds=CFG.runner.retry_wait,
         ).run()
 
+    def _getRetainedWorkDir(self) -> WorkDirManifest | None:
+        """
+        Get the manifest of a working directory retained by the previous cycle of the loop job.
+
+        The working directory can only be reused if the previous cycle finished
+        successfully on the current host.
+
+        Returns:
+            WorkDirManifest | None: Manifest of the retained working directory
+            or None if there is no directory to reuse.
+        """
+        loop_info = self._informer.info.loop_info
+        if not loop_info or loop_info.current <= loop_info.start:
+            return None
+
+        previous_info_file = construct_info_file_path(
+            self._input_dir,
+            construct_loop_job_name(
+                self._informer.info.script_name, loop_info.current - 1
+            ),
+        )
+
+        try:
+            previous = Informer.fromFile(previous_info_file, self._input_machine).info
+        except QQError as e:
+            logger.debug(f"Could not load info about the previous cycle: {e}")
+            return None
+
+        if previous.job_state != NaiveState.FINISHED or not previous.work_dir:
+            logger.debug("Previous cycle did not retain its working directory.")
+            return None
+
+        if previous.main_node != socket.gethostname():
+            logger.info(
+                f"Working directory of the previous cycle is on '{previous.main_node}'. Not reusing it."
+            )
+            return None
+
+        manifest_file = previous.work_dir / CFG.loop_jobs.manifest_file
+        if not manifest_file.is_file():
+            logger.debug(f"No manifest found in '{previous.work_dir}'.")
+            return None
+
+        try:
+            manifest = WorkDirManifest.fromFile(manifest_file)
+        except QQError as e:
+            logger.warning(e)
+            return None
+
+        if (
+            manifest.job_id != previous.job_id
+            or manifest.input_dir.resolve() != self._input_dir.resolve()
+        ):
+            logger.debug(
+                f"Manifest '{manifest_file}' does not belong to the previous cycle."
+            )
+            return None
+
+        return manifest
+
+    def _adoptWorkDir(self, manifest: WorkDirManifest) -> bool:
+        """
+        Use a working directory retained by the previous cycle as the working directory.
+
+        Only files that changed in the input directory are copied to the adopted directory.
+        If the retained directory is too old or its content was modified,
+        it is deleted instead.
+
+        Args:
+            manifest (WorkDirManifest): Manifest of the retained working directory.
+
+        Returns:
+            bool: True if the directory was adopted, False otherwise.
+        """
+        if manifest.isExpired(timedelta(seconds=CFG.loop_jobs.reuse_max_age)):
+            logger.info(f"Retained working directory '{manifest.work_dir}' is too old.")
+            self._removeDirectory(manifest.work_dir)
+            return False
+
+        if not manifest.matchesWorkDir():
+            logger.info(
+                f"Content of the retained working directory '{manifest.work_dir}' has changed."
+            )
+            self._removeDirectory(manifest.work_dir)
+            return False
+
+        self._work_dir = manifest.work_dir
+        logger.info(f"Reusing working directory '{self._work_dir}'.")
+
+        Retryer(
+            os.chdir,
+            self._work_dir,
+            max_tries=CFG.runner.retry_tries,
+            wait_seconds=CFG.runner.retry_wait,
+        ).run()
+
+        # the directory is now owned by this job
+        (self._work_dir / CFG.loop_jobs.manifest_file).unlink(missing_ok=True)
+        self._reused_work_dir = self._work_dir
+
+        # only the files that changed are transferred
+        self._copyInputToWorkDir()
+        return True
+
+    def _retainWorkDir(self) -> bool:
+        """
+        Keep the working directory on the computing node so that the next cycle can reuse it.
+
+        Runtime files of the job, which are copied to the input directory, are removed
+        from the directory and a manifest describing the remaining content is written into it.
+        The directory is not retained if this is the last cycle, if the next
+        cycle will not be submitted, or if the directory exceeds the size limit.
+
+        Returns:
+            bool: True if the directory was retained, False otherwise.
+        """
+        loop_info = self._informer.info.loop_info
+        if (
+            not loop_info
+            or loop_info.current >= loop_info.end
+            or not self._should_resubmit
+        ):
+            return False
+
+        try:
+            # runtime files and an old manifest must not be part of the manifest
+            for file in (
+                self._informer.info.stdout_file,
+                self._informer.info.stderr_file,
+                CFG.loop_jobs.manifest_file,
+            ):
+                (self._work_dir / file).unlink(missing_ok=True)
+
+            manifest = WorkDirManifest.fromWorkDir(
+                self._informer.info.job_id,
+                socket.gethostname(),
+                self._input_dir,
+                self._work_dir,
+            )
+
+            if (
+                manifest.getSize()
+                > Size.fromString(CFG.loop_jobs.reuse_max_size).value * 1024
+            ):
+                logger.info(
+                    f"Working directory exceeds the size limit for reuse ({CFG.loop_jobs.reuse_max_size}). Not retaining it."
+                )
+                return False
+
+            manifest.toFile(self._work_dir / CFG.loop_jobs.manifest_file)
+        except (QQError, OSError) as e:
+            logger.warning(f"Could not retain the working directory: {e}")
+            return False
+
+        logger.info(
+            f"Retaining working directory '{self._work_dir}' for the next cycle."
+        )
+        return True
+
     def _deleteWorkDir(self) -> None:
         """
         Delete the entire working directory.
 
         Used only after successful execution in scratch space.
+
+        If deferred deletion is enabled, the working directory is renamed
+        to a tombstone and removed by a detached low-priority process,
+        so that the job does not have to wait for the deletion to finish.
+        Tombstones that are left behind can be removed using `qq wipe --orphans`.
         """
-        logger.debug(f"Removing working directory '{self._work_dir}'.")
+        self._removeDirectory(self._work_dir)
+
+    def _removeDirectory(self, directory: Path) -> None:
+        """
+        Delete a working directory, either in the background or synchronously.
+
+        Args:
+            directory (Path): The directory to delete.
+        """
+        if CFG.runner.deferred_deletion:
+            tombstone = construct_tombstone_path(directory)
+            try:
+                logger.debug(
+                    f"Renaming working directory '{directory}' to '{tombstone}'."
+                )
+                directory.rename(tombstone)
+            except Exception as e:
+                logger.warning(
+                    f"Could not rename working directory '{directory}': {e}. Deleting it synchronously."
+                )
+            else:
+                self._deleteTombstone(tombstone)
+                return
+
+        logger.debug(f"Removing working directory '{directory}'.")
         Retryer(
             shutil.rmtree,
-            self._work_dir,
+            directory,
             max_tries=CFG.runner.retry_tries,
             wait_seconds=CFG.runner.retry_wait,
         ).run()
 
+    def _deleteTombstone(self, tombstone: Path) -> None:
+        """
+        Remove a renamed working directory in a detached low-priority process.
+
+        The process is started in a new session, so it is not waited for.
+        If the process cannot be started, the tombstone is left in place.
+
+        Args:
+            tombstone (Path): The renamed working directory to delete.
+        """
+        # leave the tombstone so that the deletion process does not remove our current directory
+        try:
+            os.chdir(tombstone.parent)
+        except Exception as e:
+            logger.debug(f"Could not leave the working directory: {e}.")
+
+        command = []
+        if shutil.which("nice"):
+            command.extend(["nice", "-n", str(CFG.runner.deletion_niceness)])
+        if shutil.which("ionice"):
+            # idle I/O scheduling class
+            command.extend(["ionice", "-c", "3"])
+        command.extend(["rm", "-rf", str(tombstone)])
+
+        logger.debug(f"Deleting '{tombstone}' in the background: {command}.")
+        try:
+            subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Could not start deletion of '{tombstone}': {e}. Use '{CFG.binary_name} wipe --orphans' to remove it."
+            )
+
     def _updateInfoRunning(self) -> None:
         """
         Update the qq info file to mark the job as running.
@@ -421,9 +831,21 @@ class Runner:
                 self._work_dir,
             )
 
+            # record the working directory adopted from the previous cycle
+            if self._reused_work_dir and (loop_info := self._informer.info.loop_info):
+                loop_info.reused_work_dir = self._reused_work_dir
+
             Retryer(
-                self._informer.toFile,
+                self._informer.toJournal,
                 self._info_file,
+                [
+                    "job_state",
+                    "start_time",
+                    "main_node",
+                    "all_nodes",
+                    "work_dir",
+                    "loop_info",
+                ],
                 host=self._input_machine,
                 max_tries=CFG.runner.retry_tries,
                 wait_seconds=CFG.runner.retry_wait,
@@ -433,12 +855,46 @@ class Runner:
                 f"Could not update qqinfo file '{self._info_file}' at JOB START: {e}."
             ) from e
 
-    def _updateInfoFinished(self) -> None:
+    def _updateInfoPack(self, pack_info: PackInfo) -> None:
+        """
+        Update the qq info file with the states of the tasks of a pack job.
+
+        Logs errors as warnings if updating fails.
+
+        Args:
+            pack_info (PackInfo): The current pack job information.
+
+        Raises:
+            QQRunCommunicationError: If the job was killed without informing Runner.
+        """
+        logger.debug(f"Updating '{self._info_file}' with the states of pack tasks.")
+        self._reloadInfoAndEnsureValid()
+
+        try:
+            self._informer.info.pack_info = pack_info
+            # the whole file is rewritten which also compacts the journal
+            Retryer(
+                self._informer.toFile,
+                self._info_file,
+                host=self._input_machine,
+                max_tries=CFG.runner.retry_tries,
+                wait_seconds=CFG.runner.retry_wait,
+            ).run()
+        except Exception as e:
+            logger.warning(
+                f"Could not update qqinfo file '{self._info_file}' with the states of pack tasks: {e}."
+            )
+
+    def _updateInfoFinished(self, usage: ResourceUsage | None = None) -> None:
         """
         Update the qq info file to mark the job as successfully finished.
 
         Logs errors as warnings if updating fails.
 
+        Args:
+            usage (ResourceUsage | None): Resources used by the job to record in the info file.
+                The walltime consumed by the job is filled in.
+
         Raises:
             QQRunCommunicationError: If the job was killed without informing Runner.
         """
@@ -447,9 +903,13 @@ class Runner:
 
         try:
             self._informer.setFinished(datetime.now())
+            if usage:
+                usage.walltime = timedelta(seconds=round(monotonic() - self._started))
+                self._informer.info.usage = usage
             Retryer(
-                self._informer.toFile,
+                self._informer.toJournal,
                 self._info_file,
+                ["job_state", "completion_time", "job_exit_code", "usage"],
                 host=self._input_machine,
                 max_tries=CFG.runner.retry_tries,
                 wait_seconds=CFG.runner.retry_wait,
@@ -458,6 +918,9 @@ class Runner:
             logger.warning(
                 f"Could not update qqinfo file '{self._info_file}' at JOB COMPLETION: {e}."
             )
+            return
+
+        self._compactJournal()
 
     def _updateInfoFailed(self, return_code: int) -> None:
         """
@@ -477,8 +940,9 @@ class Runner:
         try:
             self._informer.setFailed(datetime.now(), return_code)
             Retryer(
-                self._informer.toFile,
+                self._informer.toJournal,
                 self._info_file,
+                ["job_state", "completion_time", "job_exit_code"],
                 host=self._input_machine,
                 max_tries=CFG.runner.retry_tries,
                 wait_seconds=CFG.runner.retry_wait,
@@ -487,6 +951,24 @@ class Runner:
             logger.warning(
                 f"Could not update qqinfo file '{self._info_file}' at JOB FAILURE: {e}."
             )
+            return
+
+        self._compactJournal()
+
+    def _compactJournal(self) -> None:
+        """
+        Incorporate the journal of the qq info file into the file once the job has ended.
+
+        Logs errors as warnings if compacting fails. The journal is then kept
+        and replayed whenever the info file is loaded.
+        """
+        logger.debug(f"Compacting the journal of '{self._info_file}'.")
+        try:
+            self._informer.compactJournal(self._info_file, host=self._input_machine)
+        except Exception as e:
+            logger.warning(
+                f"Could not compact the journal of qqinfo file '{self._info_file}': {e}."
+            )
 
     def _updateInfoKilled(self) -> None:
         """
@@ -504,12 +986,56 @@ class Runner:
         try:
             self._informer.setKilled(datetime.now())
             # no retrying here since we cannot afford multiple attempts here
-            self._informer.toFile(self._info_file, host=self._input_machine)
+            self._informer.toJournal(
+                self._info_file,
+                ["job_state", "completion_time"],
+                host=self._input_machine,
+            )
         except Exception as e:
             logger.warning(
                 f"Could not update qqinfo file '{self._info_file}' at JOB KILL: {e}."
             )
 
+    def _copyWorkDirToInputDir(self) -> None:
+        """
+        Copy all files from the working directory to the input directory.
+
+        Files explicitly included from outside of the input directory are not copied.
+
+        Raises:
+            QQError: If the files could not be copied after retrying.
+        """
+        Retryer(
+            self._batch_system.syncWithExclusions,
+            self._work_dir,
+            self._input_dir,
+            socket.gethostname(),
+            self._informer.info.input_machine,
+            # exclude files that were copied to workdir from the outside of input dir (--include option)
+            # these files should not be copied to the input directory, since they were never inside it
+            self._getExplicitlyIncludedFilesInWorkDir(),
+            max_tries=CFG.runner.retry_tries,
+            wait_seconds=CFG.runner.retry_wait,
+        ).run()
+
+    def _hasFinishedPackTasks(self) -> bool:
+        """
+        Check whether the job is a pack job with successfully finished tasks
+        whose results should be copied to the input directory even though the job failed.
+
+        Returns:
+            bool: True if the results should be copied, else False.
+        """
+        if not CFG.runner.pack_stage_out_on_failure or not isinstance(
+            self._process, PackScheduler
+        ):
+            return False
+
+        pack_info = self._informer.info.pack_info
+        return pack_info is not None and any(
+            task.state == NaiveState.FINISHED for task in pack_info.tasks
+        )
+
     def _copyRunTimeFilesToInputDir(self, retry: bool = True) -> None:
         """
         Copy .out and .err runtime files from the working directory to the input directory.
@@ -631,6 +1157,13 @@ class Runner:
             logger.info(
                 f"The script finished with an exit code of '{CFG.exit_codes.qq_run_no_resubmit}' indicating that the next cycle of the job should not be submitted. Not resubmitting."
             )
+            self._cancelQueuedCycles()
+            return
+
+        if loop_info.window > 1 and loop_info.getLastQueuedCycle() >= loop_info.end:
+            logger.info(
+                "All remaining cycles of the loop job are already submitted. Not resubmitting."
+            )
             return
 
         logger.info("Resubmitting the job.")
@@ -642,13 +1175,192 @@ class Runner:
             self._batch_system.resubmit,
             input_machine=self._informer.info.input_machine,
             input_dir=self._informer.info.input_dir,
-            command_line=self._informer.info.getCommandLineForResubmit(),
+            command_line=self._informer.info.getCommandLineForResubmit(
+                resources=self._getAutosizedResources()
+            ),
             max_tries=CFG.runner.retry_tries,
             wait_seconds=CFG.runner.retry_wait,
         ).run()
 
         logger.info("Job successfully resubmitted.")
 
+    def _shouldRequeue(self, exception: BaseException) -> bool:
+        """
+        Determine whether the current cycle of a loop job should be submitted again after a failure.
+
+        A cycle is requeued only if:
+          - The failure is an error of qq (e.g., a failed file transfer), not a mismatch of jobs.
+          - The script itself did not fail and the cycle has not been marked as finished.
+          - The job is a loop job without a submission window.
+          - The maximal number of requeues has not been reached yet.
+
+        Args:
+            exception (BaseException): The exception that caused the failure.
+
+        Returns:
+            bool: True if the cycle should be requeued, else False.
+        """
+        if not isinstance(exception, QQError) or isinstance(
+            exception, QQJobMismatchError
+        ):
+            return False
+
+        if self._process and self._process.returncode not in (None, 0):
+            logger.debug("The script failed. Not requeueing the cycle.")
+            return False
+
+        info = self._informer.info
+        return bool(
+            (loop_info := info.loop_info)
+            and info.job_state != NaiveState.FINISHED
+            and loop_info.window == 1
+            and loop_info.canRequeue()
+        )
+
+    def _requeue(self) -> None:
+        """
+        Submit the current cycle of the loop job again.
+
+        The cycle is submitted immediately, but its start is deferred by an exponentially
+        increasing backoff (see `LoopInfo.getRequeueDelay`), so that the allocation
+        of this job is not held while waiting. Errors are only reported.
+        """
+        loop_info = self._informer.info.loop_info
+        assert loop_info is not None
+
+        logger.info(
+            f"Requeueing cycle {loop_info.current} of the loop job ({loop_info.requeues + 1}/{loop_info.max_requeues})."
+        )
+
+        try:
+            Retryer(
+                self._batch_system.resubmit,
+                input_machine=self._informer.info.input_machine,
+                input_dir=self._informer.info.input_dir,
+                command_line=self._informer.info.getCommandLineForResubmit(
+                    requeue=True
+                ),
+                max_tries=CFG.runner.retry_tries,
+                wait_seconds=CFG.runner.retry_wait,
+            ).run()
+            logger.info("Cycle successfully requeued.")
+        except QQError as e:
+            logger.warning(f"Could not requeue the cycle: {e}")
+
+    def _isAutosized(self) -> bool:
+        """Check whether the job is a loop job with autosized resources."""
+        return bool(
+            self._informer.info.job_type == JobType.LOOP
+            and (loop_info := self._informer.info.loop_info)
+            and loop_info.autosize
+        )
+
+    def _measureUsage(self) -> ResourceUsage:
+        """
+        Measure the peak memory used by the job and the size of its working directory.
+
+        The peak memory is obtained from the batch system. If it is not available,
+        the peak memory of the largest process started by the job is used instead.
+        The size of the working directory is only measured if it is on scratch.
+
+        Returns:
+            ResourceUsage: Resources used by the job (without the walltime).
+        """
+        mem = None
+        try:
+            job = self._batch_system.getBatchJob(self._informer.info.job_id)
+            if (util := job.getUtilMem()) is not None and (requested := job.getMem()):
+                mem = Size(requested.value * util // 100, "kb")
+        except Exception as e:
+            logger.debug(f"Could not get memory usage from the batch system: {e}.")
+
+        if not mem:
+            # ru_maxrss is reported in kilobytes on Linux
+            mem = Size(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss, "kb")
+
+        work_size = None
+        if self._use_scratch:
+            try:
+                # WorkDirManifest._scan skips the manifest file, which is negligible
+                size = sum(s for s, _ in WorkDirManifest._scan(self._work_dir).values())
+                work_size = Size(math.ceil(size / 1024), "kb")
+            except QQError as e:
+                logger.debug(
+                    f"Could not measure the size of the working directory: {e}"
+                )
+
+        usage = ResourceUsage(mem=mem, work_size=work_size)
+        logger.debug(f"Measured resource usage: {usage}.")
+        return usage
+
+    def _getAutosizedResources(self) -> Resources | None:
+        """
+        Get the resources for the next cycle of an autosized loop job.
+
+        The resources are adjusted based on the usage recorded by this cycle
+        and by the recent cycles whose info files are stored in the archive.
+        Info files that cannot be read are skipped.
+
+        Returns:
+            Resources | None: The adjusted resources or None if the job is not autosized.
+        """
+        info = self._informer.info
+        if not (loop_info := info.loop_info) or not loop_info.autosize:
+            return None
+
+        history = [info.usage] if info.usage else []
+        if is_printf_pattern(loop_info.archive_format):
+            first = max(
+                loop_info.start, loop_info.current - CFG.loop_jobs.autosize_history + 1
+            )
+            for cycle in range(loop_info.current - 1, first - 1, -1):
+                file = (
+                    loop_info.archive
+                    / f"{loop_info.archive_format % cycle}{CFG.suffixes.qq_info}"
+                )
+                try:
+                    if usage := Informer.fromFile(file, info.input_machine).info.usage:
+                        history.append(usage)
+                except QQError as e:
+                    logger.debug(f"Could not read the usage of cycle {cycle}: {e}")
+
+        resources = loop_info.autosize.adjust(info.resources, history)
+        logger.info(
+            f"Resources of the next cycle: walltime={resources.walltime}, mem={resources.mem}, work-size={resources.work_size}."
+        )
+        return resources
+
+    def _cancelQueuedCycles(self) -> None:
+        """
+        Kill the following cycles of the loop job that were submitted in advance.
+
+        The cancelled cycles are marked as killed in their qq info files.
+        Cycles that cannot be cancelled are only reported.
+        """
+        for info_file in self._informer.info.getQueuedCyclesInfoFiles():
+            try:
+                informer = Informer.fromFile(
+                    info_file, self._informer.info.input_machine
+                )
+                if informer.info.job_state != NaiveState.QUEUED:
+                    logger.debug(
+                        f"Job '{informer.info.job_id}' is not queued. Not cancelling it."
+                    )
+                    continue
+
+                logger.info(
+                    f"Cancelling the next cycle of the loop job '{informer.info.job_id}'."
+                )
+                self._batch_system.jobKill(informer.info.job_id)
+                informer.setKilled(datetime.now())
+                informer.toJournal(
+                    info_file,
+                    ["job_state", "completion_time"],
+                    host=self._informer.info.input_machine,
+                )
+            except QQError as e:
+                logger.warning(f"Could not cancel the loop cycle '{info_file}': {e}")
+
     def _getExplicitlyIncludedFilesInWorkDir(self) -> list[Path]:
         """
         Return absolute paths to files and directories in the working directory
@@ -668,8 +1380,18 @@ class Runner:
     def _copyFiles(self, files: list[Path]):
         """
         Copy files and directories using the provided absolute paths to the working directory.
+
+        Files located on shared storage or on the current host are staged through
+        the node-local input cache, if available.
         """
         for file in files:
+            if (
+                self._input_cache
+                and self._isAccessibleForCache(file)
+                and self._input_cache.stage(file, self._work_dir / file.name)
+            ):
+                continue
+
             # we rsync each file or directory individually because each file can be provided in a different directory
             # this may be very slow if there is a large amount of files/directories to include
             self._batch_system.syncSelected(
@@ -680,6 +1402,28 @@ class Runner:
                 [file],
             )
 
+    def _isAccessibleForCache(self, file: Path) -> bool:
+        """
+        Check whether an explicitly included file can be staged using the input cache.
+
+        A file that is accessible from the current host is the same file as on the input
+        machine only if it resides on the current host or on shared storage.
+
+        Args:
+            file (Path): Absolute path to the file on the input machine.
+
+        Returns:
+            bool: True if the file can be read directly from the current host.
+        """
+        if self._informer.info.input_machine == socket.gethostname():
+            return True
+
+        if self._batch_system.isShared(file.parent):
+            return True
+
+        logger.debug(f"'{file}' is not on shared storage: not using input cache.")
+        return False
+
     def _cleanup(self) -> None:
         """
         Clean up after execution is interrupted or killed.
@@ -687,7 +1431,12 @@ class Runner:
         - Copies .out and .err file to the input directory.
         - Marks job as killed in the info file.
         - Terminates the subprocess.
+        - Copies files produced by the job to the input directory
+        within the remaining grace period (if enabled).
         """
+        # files are copied only until this time
+        deadline = monotonic() + CFG.runner.kill_stage_out_time
+
         # update the qq info file
         self._updateInfoKilled()
 
@@ -706,6 +1455,134 @@ class Runner:
         if self._use_scratch:
             self._copyRunTimeFilesToInputDir(retry=False)
 
+            # copy as much of the job's output as possible before the job is killed
+            if CFG.runner.kill_stage_out:
+                self._stageOutOnKill(deadline)
+
+    def _stageOutOnKill(self, deadline: float) -> None:
+        """
+        Copy files produced by the job from the working directory to the input directory.
+
+        Files matching `CFG.runner.kill_stage_out_patterns` are copied first,
+        followed by the remaining files from the newest to the oldest
+        (smaller files first for the same modification time).
+        Files are copied in small batches until the deadline is reached;
+        no transfer is allowed to run past the deadline.
+        Copied files are recorded in the info file after each batch.
+
+        No retrying since there is no time for that. Errors are logged as warnings.
+
+        Args:
+            deadline (float): Time (as returned by `time.monotonic`) after which
+                no further files are copied.
+        """
+        try:
+            files = self._getStageOutCandidates()
+        except OSError as e:
+            logger.warning(f"Could not list files in the working directory: {e}.")
+            return
+
+        logger.info(
+            f"Copying {len(files)} files produced by the job to the input directory."
+        )
+
+        saved = []
+        batch_size = max(CFG.runner.kill_stage_out_batch, 1)
+        for start in range(0, len(files), batch_size):
+            if (remaining := deadline - monotonic()) <= 0:
+                logger.warning(
+                    f"No time left to copy the remaining {len(files) - start} files produced by the job."
+                )
+                break
+
+            batch = files[start : start + batch_size]
+            try:
+                self._batch_system.syncSelected(
+                    self._work_dir,
+                    self._input_dir,
+                    socket.gethostname(),
+                    self._informer.info.input_machine,
+                    batch,
+                    timeout=remaining,
+                )
+            except QQError as e:
+                logger.warning(f"Could not copy files produced by the job: {e}")
+                continue
+
+            # recorded immediately, so that the files are known even if the job is killed during the next batch
+            saved.extend(f.relative_to(self._work_dir) for f in batch)
+            self._recordSavedFiles(saved)
+
+    def _recordSavedFiles(self, saved: list[Path]) -> None:
+        """
+        Record the files copied to the input directory after the job was killed in the info file.
+
+        Errors are logged as warnings.
+
+        Args:
+            saved (list[Path]): All files copied so far, relative to the working directory.
+        """
+        try:
+            self._informer.info.saved_files = list(saved)
+            self._informer.toJournal(
+                self._info_file, ["saved_files"], host=self._input_machine
+            )
+        except Exception as e:
+            logger.warning(
+                f"Could not record saved files in qqinfo file '{self._info_file}': {e}."
+            )
+
+    def _getStageOutCandidates(self) -> list[Path]:
+        """
+        Get files in the working directory that should be copied when the job is killed.
+
+        Only files modified after the job started are considered, since files copied
+        into the working directory retain their original modification times.
+        Runtime files and explicitly included files are skipped.
+
+        Returns:
+            list[Path]: Absolute paths to the files, ordered by priority.
+
+        Raises:
+            OSError: If the working directory cannot be scanned.
+        """
+        start_time = self._informer.info.start_time
+        threshold = start_time.timestamp() if start_time else 0.0
+
+        skipped = {
+            Path(self._informer.info.stdout_file).resolve(),
+            Path(self._informer.info.stderr_file).resolve(),
+        }
+        skipped_dirs = self._getExplicitlyIncludedFilesInWorkDir()
+        patterns = CFG.runner.kill_stage_out_patterns
+
+        candidates: list[tuple[int, float, int, Path]] = []
+        for root, dirs, files in os.walk(self._work_dir):
+            root = Path(root)
+            dirs[:] = [d for d in dirs if (root / d).resolve() not in skipped_dirs]
+
+            for name in files:
+                file = root / name
+                if file.resolve() in skipped or file.resolve() in skipped_dirs:
+                    continue
+
+                stat = file.stat(follow_symlinks=False)
+                if stat.st_mtime < threshold:
+                    continue
+
+                relative = file.relative_to(self._work_dir)
+                rank = next(
+                    (
+                        i
+                        for i, pattern in enumerate(patterns)
+                        if relative.match(pattern)
+                    ),
+                    len(patterns),
+                )
+                candidates.append((rank, -stat.st_mtime, stat.st_size, file))
+
+        return [file for *_, file in sorted(candidates)]
+
     def _handle_sigterm(self, _signum: int, _frame: FrameType | None) -> NoReturn:
         """
         Signal handler for SIGTERM.
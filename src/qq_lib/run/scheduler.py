@@ -0,0 +1,350 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Local scheduler of qq pack jobs.
+
+`PackScheduler` runs the tasks of a pack job inside the allocation of a single
+batch job. The allocated CPU cores and GPUs are partitioned into slots, each
+large enough for one task, and queued tasks are started whenever a slot is free.
+Each task is pinned to the CPU cores and GPUs of its slot.
+
+The scheduler mimics the interface of `subprocess.Popen` (`poll`, `terminate`,
+`kill`, `returncode`), so that `Runner` can handle it like the process
+of a standard job.
+"""
+
+import os
+import subprocess
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+from time import monotonic, sleep
+from typing import IO
+
+from qq_lib.core.config import CFG
+from qq_lib.core.error import QQError
+from qq_lib.core.logger import get_logger
+from qq_lib.properties.pack import PackInfo, PackTask
+from qq_lib.properties.states import NaiveState
+
+logger = get_logger(__name__, show_time=True)
+
+
+class PackScheduler:
+    """
+    Runs the tasks of a qq pack job concurrently within a single allocation.
+    """
+
+    def __init__(
+        self,
+        pack_info: PackInfo,
+        script: Path,
+        work_dir: Path,
+        job_name: str,
+        ncpus: int,
+        ngpus: int,
+    ):
+        """
+        Initialize the scheduler and partition the allocated resources into slots.
+
+        Args:
+            pack_info (PackInfo): Tasks of the pack job. Task states and exit codes
+                are updated in place.
+            script (Path): Path to the job script executed by directory tasks.
+            work_dir (Path): Working directory of the job.
+            job_name (str): Name of the job. Used to name the output files of the tasks.
+            ncpus (int): Number of CPU cores allocated to the job.
+            ngpus (int): Number of GPUs allocated to the job.
+
+        Raises:
+            QQError: If the allocated resources are not sufficient for a single task.
+        """
+        self._pack_info = pack_info
+        self._script = script
+        self._work_dir = work_dir
+        self._job_name = job_name
+        self._ngpus = ngpus
+
+        # CPU cores and GPUs of each slot
+        self._slots = self._createSlots(ncpus, ngpus)
+
+        # running tasks: slot -> (task index, process)
+        self._running: dict[int, tuple[int, subprocess.Popen[str]]] = {}
+
+        # overall exit code; None while the tasks are running
+        self.returncode: int | None = None
+
+    def run(
+        self, on_update: Callable[[PackInfo], None], log: IO[str] | None = None
+    ) -> int:
+        """
+        Run all queued tasks and wait for them to finish.
+
+        Args:
+            on_update (Callable[[PackInfo], None]): Called with the updated pack information
+                when the states of the tasks change, at most once per
+                `CFG.runner.pack_update_interval` seconds, and once all tasks are finished.
+            log (IO[str] | None): Optional stream into which the start and the completion
+                of each task is reported.
+
+        Returns:
+            int: 0 if all tasks succeeded, otherwise the exit code of the first failed task.
+        """
+        pending = deque(
+            i
+            for i, task in enumerate(self._pack_info.tasks)
+            if task.state == NaiveState.QUEUED
+        )
+        free = deque(range(len(self._slots)))
+        logger.info(
+            f"Running {len(pending)} tasks in {len(self._slots)} concurrent slots."
+        )
+
+        last_update = monotonic()
+        while pending or self._running:
+            while pending and free:
+                slot = free.popleft()
+                if not self._start(pending.popleft(), slot, log):
+                    free.appendleft(slot)
+
+            sleep(CFG.runner.subprocess_checks_wait_time)
+
+            if (
+                self._collect(free, log)
+                and monotonic() - last_update >= CFG.runner.pack_update_interval
+            ):
+                on_update(self._pack_info)
+                last_update = monotonic()
+
+        on_update(self._pack_info)
+
+        failed = [t for t in self._pack_info.tasks if t.state == NaiveState.FAILED]
+        logger.info(
+            f"Pack finished: {len(self._pack_info.tasks) - len(failed)} tasks succeeded, {len(failed)} failed."
+        )
+        self.returncode = self._getReturnCode()
+        return self.returncode
+
+    def poll(self) -> int | None:
+        """
+        Check whether any task is running.
+
+        Returns:
+            int | None: None if any task is still running, otherwise the overall exit code
+            of the tasks that have finished so far (see `PackScheduler.run`).
+        """
+        if any(process.poll() is None for _, process in self._running.values()):
+            return None
+
+        return self.returncode if self.returncode is not None else self._getReturnCode()
+
+    def terminate(self) -> None:
+        """Send SIGTERM to all running tasks."""
+        for _, process in self._running.values():
+            if process.poll() is None:
+                process.terminate()
+
+    def kill(self) -> None:
+        """Send SIGKILL to all running tasks."""
+        for _, process in self._running.values():
+            if process.poll() is None:
+                process.kill()
+
+    def _createSlots(
+        self, ncpus: int, ngpus: int
+    ) -> list[tuple[list[int] | None, list[str]]]:
+        """
+        Partition the allocated resources into slots for concurrently running tasks.
+
+        CPU cores are only assigned to the slots if the cores available to this process
+        are known and there are enough of them. GPUs are identified by the IDs
+        from CUDA_VISIBLE_DEVICES, if set, or by their indices.
+
+        Args:
+            ncpus (int): Number of CPU cores allocated to the job.
+            ngpus (int): Number of GPUs allocated to the job.
+
+        Returns:
+            list[tuple[list[int] | None, list[str]]]: CPU cores and GPUs of each slot.
+
+        Raises:
+            QQError: If the allocated resources are not sufficient for a single task.
+        """
+        task_ncpus = self._pack_info.task_ncpus
+        task_ngpus = self._pack_info.task_ngpus
+
+        n_slots = ncpus // task_ncpus
+        if task_ngpus:
+            n_slots = min(n_slots, ngpus // task_ngpus)
+
+        if n_slots < 1:
+            raise QQError(
+                f"Job has {ncpus} CPU cores and {ngpus} GPUs allocated, which is not enough "
+                f"for a single pack task requiring {task_ncpus} CPU cores and {task_ngpus} GPUs."
+            )
+
+        # there is no point in having more slots than tasks
+        n_slots = min(n_slots, len(self._pack_info.tasks))
+
+        cores = _available_cores()
+        if len(cores) < n_slots * task_ncpus:
+            logger.debug("Not enough known CPU cores. Pack tasks will not be pinned.")
+            cores = []
+
+        if visible := os.environ.get(CFG.env_vars.cuda_visible_devices):
+            gpus = visible.split(",")
+        else:
+            gpus = [str(i) for i in range(ngpus)]
+
+        return [
+            (
+                cores[i * task_ncpus : (i + 1) * task_ncpus] or None,
+                gpus[i * task_ngpus : (i + 1) * task_ngpus],
+            )
+            for i in range(n_slots)
+        ]
+
+    def _start(self, index: int, slot: int, log: IO[str] | None) -> bool:
+        """
+        Start a task in a slot.
+
+        If the task cannot be started, it is marked as failed.
+
+        Args:
+            index (int): Index of the task.
+            slot (int): Index of the slot.
+            log (IO[str] | None): Optional stream into which the start of the task is reported.
+
+        Returns:
+            bool: True if the task was started and occupies the slot, else False.
+        """
+        task = self._pack_info.tasks[index]
+        cores, gpus = self._slots[slot]
+        cwd, stdout, stderr = self._getTaskPaths(index, task)
+
+        env = os.environ.copy()
+        env[CFG.env_vars.pack_task] = str(index)
+        env[CFG.env_vars.ncpus] = str(self._pack_info.task_ncpus)
+        env[CFG.env_vars.ngpus] = str(self._pack_info.task_ngpus)
+        env[CFG.env_vars.omp_num_threads] = str(self._pack_info.task_ncpus)
+        if self._ngpus:
+            env[CFG.env_vars.cuda_visible_devices] = ",".join(gpus)
+
+        command = (
+            ["bash", str(self._script)] if task.is_dir else ["bash", "-c", task.task]
+        )
+
+        logger.debug(f"Starting task {index} '{task.task}' in slot {slot}.")
+        try:
+            with stdout.open("w") as out, stderr.open("w") as err:
+                process = subprocess.Popen(
+                    command,
+                    cwd=cwd,
+                    env=env,
+                    stdout=out,
+                    stderr=err,
+                    text=True,
+                    preexec_fn=(lambda: os.sched_setaffinity(0, cores))
+                    if cores
+                    else None,
+                )
+        except Exception as e:
+            logger.warning(f"Could not start task {index} '{task.task}': {e}.")
+            task.state = NaiveState.FAILED
+            task.exit_code = CFG.exit_codes.default
+            _report(log, f"Task {index} '{task.task}' could not be started: {e}.")
+            return False
+
+        task.state = NaiveState.RUNNING
+        self._running[slot] = (index, process)
+        _report(log, f"Task {index} '{task.task}' started.")
+        return True
+
+    def _collect(self, free: deque[int], log: IO[str] | None) -> bool:
+        """
+        Record the results of finished tasks and release their slots.
+
+        Args:
+            free (deque[int]): Free slots. Released slots are appended.
+            log (IO[str] | None): Optional stream into which the completion of the tasks is reported.
+
+        Returns:
+            bool: True if any task has finished, else False.
+        """
+        finished = [
+            (slot, index, process)
+            for slot, (index, process) in self._running.items()
+            if process.poll() is not None
+        ]
+
+        for slot, index, process in finished:
+            del self._running[slot]
+            free.append(slot)
+
+            task = self._pack_info.tasks[index]
+            task.exit_code = process.returncode
+            task.state = (
+                NaiveState.FINISHED if process.returncode == 0 else NaiveState.FAILED
+            )
+            _report(
+                log,
+                f"Task {index} '{task.task}' {str(task.state)} with an exit code of {process.returncode}.",
+            )
+
+        return bool(finished)
+
+    def _getReturnCode(self) -> int:
+        """
+        Get the overall exit code of the tasks.
+
+        Returns:
+            int: 0 if no task failed, otherwise the exit code of the first failed task.
+        """
+        for task in self._pack_info.tasks:
+            if task.state == NaiveState.FAILED:
+                return task.exit_code or CFG.exit_codes.default
+
+        return 0
+
+    def _getTaskPaths(self, index: int, task: PackTask) -> tuple[Path, Path, Path]:
+        """
+        Get the directory in which a task is executed and the paths to its output files.
+
+        Directory tasks are executed in their directory and write their output
+        there. Command tasks are executed in the working directory and write
+        their output into files numbered by the index of the task.
+
+        Args:
+            index (int): Index of the task.
+            task (PackTask): The task.
+
+        Returns:
+            tuple[Path, Path, Path]: Directory of the task, its stdout file, and its stderr file.
+        """
+        if task.is_dir:
+            cwd = self._work_dir / task.task
+            stem = self._job_name
+        else:
+            cwd = self._work_dir
+            stem = f"{self._job_name}.task{index:04d}"
+
+        return (
+            cwd,
+            cwd / f"{stem}{CFG.suffixes.stdout}",
+            cwd / f"{stem}{CFG.suffixes.stderr}",
+        )
+
+
+def _available_cores() -> list[int]:
+    """Get the sorted CPU cores this process may run on, or an empty list if unknown."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return []
+
+
+def _report(log: IO[str] | None, message: str) -> None:
+    """Write a line into the log stream, if there is any."""
+    if log:
+        log.write(f"{message}\n")
+        log.flush()
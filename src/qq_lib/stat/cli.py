@@ -6,14 +6,17 @@ import sys
 from typing import NoReturn
 
 import click
-from rich.console import Console
+from rich.console import Console, Group
 
-from qq_lib.batch.interface import BatchMeta
+from qq_lib.batch.interface import BatchJobInterface, BatchMeta
+from qq_lib.batch.interface.job_index import NodeJobIndex
 from qq_lib.core.click_format import GNUHelpColorsCommand
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
+from qq_lib.core.records import OutputFormat
 from qq_lib.jobs.presenter import JobsPresenter
+from qq_lib.jobs.watcher import JobsWatcher
 
 logger = get_logger(__name__)
 
@@ -37,25 +40,121 @@ logger = get_logger(__name__)
     help="Include both unfinished and finished jobs in the summary.",
 )
 @click.option("--yaml", is_flag=True, help="Output job metadata in YAML format.")
-def stat(extra: bool, all: bool, yaml: bool) -> NoReturn:
+@click.option(
+    "--format",
+    type=click.Choice([str(f) for f in OutputFormat], case_sensitive=False),
+    default=None,
+    help="Output job metadata in a machine-readable format.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep the summary open and refresh it periodically until interrupted by Ctrl+C.",
+)
+@click.option(
+    "--plain",
+    is_flag=True,
+    help="Write the jobs as plain rows as soon as they are formatted. Faster for large numbers of jobs.",
+)
+@click.option(
+    "--sort",
+    type=click.Choice(list(JobsPresenter.SORT_KEYS), case_sensitive=False),
+    default=None,
+    help="Sort the jobs by the specified key. Implies '--plain'.",
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Show at most the specified number of rows. Implies '--plain'.",
+)
+@click.option(
+    "--page",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Page of '--limit' rows to show. Implies '--plain'.",
+)
+@click.option(
+    "--by-node",
+    is_flag=True,
+    help="Show the running jobs grouped by the nodes they occupy.",
+)
+def stat(
+    extra: bool,
+    all: bool,
+    yaml: bool,
+    format: str | None,
+    watch: bool,
+    plain: bool,
+    sort: str | None,
+    limit: int | None,
+    page: int,
+    by_node: bool,
+) -> NoReturn:
     try:
+        plain = plain or bool(sort) or bool(limit) or page != 1
+        if sum([yaml, bool(format), watch, plain]) > 1:
+            raise QQError(
+                "Options '--yaml', '--format', '--watch', and '--plain' cannot be used together."
+            )
+        if by_node and any([all, yaml, format, watch, plain]):
+            raise QQError(
+                "Option '--by-node' cannot be used with '--all', '--yaml', '--format', '--watch', or '--plain'."
+            )
+
         batch_system = BatchMeta.fromEnvVarOrGuess()
 
-        if all:
-            jobs = batch_system.getAllBatchJobs()
-        else:
-            jobs = batch_system.getAllUnfinishedBatchJobs()
+        presenter = JobsPresenter(batch_system, [], extra, all)
+
+        if by_node:
+            # jobs on all nodes are indexed using a single query of the batch system
+            presenter.dumpByNode(
+                NodeJobIndex(
+                    batch_system.getAllUnfinishedBatchJobs(NodeJobIndex.COLUMNS)
+                )
+            )
+            sys.exit(0)
+        console = Console(record=False, markup=False)
+
+        # machine-readable outputs contain all information about the jobs
+        columns = None if yaml or format else presenter.getRequiredColumns(sort)
+
+        def get_jobs() -> list[BatchJobInterface]:
+            if all:
+                jobs = batch_system.getAllBatchJobs(columns)
+            else:
+                jobs = batch_system.getAllUnfinishedBatchJobs(columns)
+
+            if jobs:
+                batch_system.sortJobs(jobs)
+            return jobs
+
+        if watch:
+
+            def render(jobs: list[BatchJobInterface]) -> Group:
+                presenter.update(jobs)
+                return presenter.createJobsInfoPanel(console)
+
+            JobsWatcher(get_jobs, render, console).watch()
+            sys.exit(0)
+
+        jobs = get_jobs()
+        if format:
+            presenter.update(jobs)
+            presenter.dumpRecords(OutputFormat.fromStr(format))
+            sys.exit(0)
 
         if not jobs:
             logger.info("No jobs found.")
             sys.exit(0)
 
-        batch_system.sortJobs(jobs)
-        presenter = JobsPresenter(batch_system, jobs, extra, all)
+        presenter.update(jobs)
         if yaml:
             presenter.dumpYaml()
+        elif plain:
+            presenter.dumpPlain(sort, limit, page)
         else:
-            console = Console(record=False, markup=False)
             panel = presenter.createJobsInfoPanel(console)
             console.print(panel)
 
@@ -25,6 +25,6 @@ parameters from all available sources.
 
 from .factory import SubmitterFactory
 from .parser import Parser
-from .submitter import Submitter
+from .submitter import SubmitResult, Submitter
 
-__all__ = ["SubmitterFactory", "Parser", "Submitter"]
+__all__ = ["SubmitterFactory", "Parser", "SubmitResult", "Submitter"]
@@ -10,11 +10,16 @@ import click
 from click_option_group import optgroup
 
 from qq_lib.core.click_format import GNUHelpColorsCommand
-from qq_lib.core.common import available_work_dirs, get_runtime_files
+from qq_lib.core.common import (
+    available_work_dirs,
+    get_runtime_files,
+    split_files_list,
+)
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
 from qq_lib.submit.factory import SubmitterFactory
+from qq_lib.submit.submitter import SubmitResult, Submitter
 
 logger = get_logger(__name__)
 
@@ -29,6 +34,9 @@ Submit a qq job to a batch system from the command line.
 
 All the options can also be specified inside the submitted script itself
 using qq directives of this format: `# qq <option>=<value>`.
+
+With `--dirs`, a script named SCRIPT is submitted from each of the specified directories.
+With `--array`, the jobs from the specified directories are submitted as a single array job.
 """,
     cls=GNUHelpColorsCommand,
     help_options_color="bright_blue",
@@ -88,6 +96,23 @@ Each expression should follow the format `<type>=<job_id>[:<job_id>...]`, e.g.,
     default=None,
     help=f"Name of the batch system to submit the job to. If not specified, the system will use the environment variable '{CFG.env_vars.batch_system}' or attempt to auto-detect it.",
 )
+@optgroup.option(
+    "--dirs",
+    type=str,
+    default=None,
+    help=f"""A colon-, comma-, or space-separated list of directories to submit the job from.
+SCRIPT is then interpreted as the name of the script inside each directory. Jobs are submitted concurrently
+(at most {CFG.submitter.max_workers} at a time) and directories that cannot be used are reported at the end.
+Can only be specified on the command line.""",
+)
+@optgroup.option(
+    "--array",
+    type=str,
+    default=None,
+    help="""A colon-, comma-, or space-separated list of directories to submit the job from as a single array job.
+SCRIPT is then interpreted as the name of the script inside each directory. The scripts must request the same resources.
+The index of the array is written into the current directory. Can only be specified on the command line.""",
+)
 @optgroup.group(f"{click.style('Requested resources', fg='yellow')}")
 @optgroup.option(
     "--nnodes",
@@ -192,6 +217,13 @@ Overrides `--work-size-per-cpu` and `--work-size-per-node`.""",
 @optgroup.option(
     "--loop-end", type=int, default=None, help="Ending cycle for a loop job."
 )
+@optgroup.option(
+    "--loop-window",
+    type=int,
+    default=None,
+    help="""Number of cycles of a loop job to keep submitted in advance. Defaults to 1.
+Each cycle waits for the successful completion of the previous one, so the next cycle does not have to wait in the queue after the previous one finishes.""",
+)
 @optgroup.option(
     "--archive",
     type=str,
@@ -204,11 +236,86 @@ Overrides `--work-size-per-cpu` and `--work-size-per-node`.""",
     default=None,
     help="Filename format for archived files. Defaults to 'job%04d'.",
 )
+@optgroup.option(
+    "--archive-pack",
+    type=str,
+    default=None,
+    help="""Pack the archived files of each cycle into a single bundle instead of storing them individually.
+Supported formats: 'tar' (uncompressed), 'gz', 'xz', and 'zst' (requires Python 3.14+ or the 'zstandard' package).""",
+)
+@optgroup.option(
+    "--autosize",
+    is_flag=True,
+    default=False,
+    help="""Record the resources actually used by each cycle and adjust the walltime, memory, and work-size
+requested for the following cycles based on the usage of the recent cycles.
+The adjusted resources stay within multiples of the resources requested for the first cycle.""",
+)
+@optgroup.option(
+    "--autosize-base",
+    type=str,
+    default=None,
+    hidden=True,
+    help="Resources requested for the first autosized cycle of a loop job. Set by qq.",
+)
+@optgroup.option(
+    "--max-requeues",
+    type=int,
+    default=None,
+    help="""Maximal number of times a cycle of a loop job failing due to an error of the qq infrastructure
+(e.g., a failed SSH connection or file transfer) is submitted again. Failures of the script itself are never requeued. Defaults to 0.""",
+)
+@optgroup.option(
+    "--requeues",
+    type=int,
+    default=None,
+    hidden=True,
+    help="Number of times the current cycle of a loop job has already been submitted again. Set by qq.",
+)
+@optgroup.option(
+    "--reuse-work-dir",
+    is_flag=True,
+    default=False,
+    help="""Keep the working directory on the computing node after a successful cycle.
+If the next cycle runs on the same node, it reuses the directory and only copies files that changed.""",
+)
+@optgroup.group(
+    f"{click.style('Pack options', fg='yellow')}",
+    help="Only used when job-type is 'pack'.",
+)
+@optgroup.option(
+    "--pack-tasks",
+    type=str,
+    default=None,
+    help="""File with the tasks of a pack job, one task per line.
+A task naming a directory runs the script inside that directory, any other task is executed as a command line.""",
+)
+@optgroup.option(
+    "--pack-task-ncpus",
+    type=int,
+    default=None,
+    help="Number of CPU cores assigned to each task of a pack job. Defaults to 1.",
+)
+@optgroup.option(
+    "--pack-task-ngpus",
+    type=int,
+    default=None,
+    help="Number of GPUs assigned to each task of a pack job. Defaults to 0.",
+)
 def submit(script: str, **kwargs) -> NoReturn:
     """
     Submit a qq job to a batch system from the command line.
     """
     try:
+        dirs = kwargs.pop("dirs", None)
+        if array := kwargs.pop("array", None):
+            if dirs:
+                raise QQError("Options '--dirs' and '--array' cannot be combined.")
+            sys.exit(_submit_array(script, split_files_list(array), kwargs))
+
+        if dirs:
+            sys.exit(_submit_from_dirs(script, split_files_list(dirs), kwargs))
+
         if not (script_path := Path(script)).is_file():
             raise QQError(f"Script '{script}' does not exist or is not a file.")
 
@@ -231,3 +338,68 @@ def submit(script: str, **kwargs) -> NoReturn:
     except Exception as e:
         logger.critical(e, exc_info=True, stack_info=True)
         sys.exit(CFG.exit_codes.unexpected_error)
+
+
+def _submit_from_dirs(script: str, directories: list[Path], kwargs: dict) -> int:
+    """
+    Submit a script of the same name from multiple directories.
+
+    Args:
+        script (str): Name of the script inside each of the directories.
+        directories (list[Path]): Directories to submit the job from.
+        kwargs (dict): Options from the command line.
+
+    Returns:
+        int: Exit code of the command. Non-zero if any of the jobs was not submitted.
+    """
+    submitters, results = SubmitterFactory.makeSubmitters(
+        Path(script), directories, **kwargs
+    )
+    results.extend(Submitter.submitMany(submitters))
+    return _report_results(results)
+
+
+def _submit_array(script: str, directories: list[Path], kwargs: dict) -> int:
+    """
+    Submit a script of the same name from multiple directories as a single array job.
+
+    Args:
+        script (str): Name of the script inside each of the directories.
+        directories (list[Path]): Directories to submit the job from.
+        kwargs (dict): Options from the command line.
+
+    Returns:
+        int: Exit code of the command. Non-zero if any of the jobs was not submitted.
+
+    Raises:
+        QQError: If the jobs cannot be submitted as an array job.
+    """
+    submitters, results = SubmitterFactory.makeSubmitters(
+        Path(script), directories, **kwargs
+    )
+    results.extend(Submitter.submitArray(submitters, Path.cwd()))
+    return _report_results(results)
+
+
+def _report_results(results: list[SubmitResult]) -> int:
+    """
+    Log the results of submitting jobs from multiple directories.
+
+    Args:
+        results (list[SubmitResult]): Results of the individual submissions.
+
+    Returns:
+        int: Exit code of the command. Non-zero if any of the jobs was not submitted.
+    """
+    submitted = 0
+    for result in results:
+        if result.job_id:
+            logger.info(f"Job '{result.job_id}' submitted from '{result.input_dir}'.")
+            submitted += 1
+        else:
+            logger.error(
+                f"Could not submit job from '{result.input_dir}': {result.error}"
+            )
+
+    logger.info(f"Submitted {submitted} of {len(results)} jobs.")
+    return 0 if submitted == len(results) else CFG.exit_codes.default
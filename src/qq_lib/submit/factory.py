@@ -1,19 +1,29 @@
 # Released under MIT License.
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
+import math
 from dataclasses import fields
 from pathlib import Path
 
+from click import Parameter
+
 from qq_lib.batch.interface import BatchInterface, BatchMeta
-from qq_lib.core.common import split_files_list
+from qq_lib.core.common import (
+    equals_normalized,
+    get_directory_size,
+    split_files_list,
+)
 from qq_lib.core.error import QQError
+from qq_lib.properties.autosize import AutosizeInfo
 from qq_lib.properties.depend import Depend
 from qq_lib.properties.job_type import JobType
 from qq_lib.properties.loop import LoopInfo
+from qq_lib.properties.pack import PackInfo
 from qq_lib.properties.resources import Resources
+from qq_lib.properties.size import Size
 
 from .parser import Parser
-from .submitter import Submitter
+from .submitter import SubmitResult, Submitter
 
 
 class SubmitterFactory:
@@ -30,9 +40,7 @@ class SubmitterFactory:
             script (Path): Path to the script to submit.
             **kwargs: Keyword arguments from the command line.
         """
-        from qq_lib.submit.cli import submit
-
-        self._parser = Parser(script, submit.params)
+        self._parser = Parser(script, SubmitterFactory.getOptions())
         self._script = script
         self._input_dir = script.parent
         self._kwargs = kwargs
@@ -52,10 +60,10 @@ class SubmitterFactory:
         BatchSystem = self._getBatchSystem()
         queue = self._getQueue()
 
-        if (job_type := self._getJobType()) == JobType.LOOP:
-            loop_info = self._getLoopInfo()
-        else:
-            loop_info = None
+        job_type = self._getJobType()
+        resources = self._getResources(BatchSystem, queue)
+        loop_info = self._getLoopInfo(resources) if job_type == JobType.LOOP else None
+        pack_info = self._getPackInfo() if job_type == JobType.PACK else None
 
         return Submitter(
             BatchSystem,
@@ -63,13 +71,83 @@ class SubmitterFactory:
             self._getAccount(),
             self._script,
             job_type,
-            self._getResources(BatchSystem, queue),
+            resources,
             loop_info,
             self._getExclude(),
             self._getInclude(),
             self._getDepend(),
+            pack_info,
         )
 
+    @classmethod
+    def makeSubmitters(
+        cls, script: Path, directories: list[Path], **kwargs
+    ) -> tuple[list[Submitter], list[SubmitResult]]:
+        """
+        Construct submitters of a script located in multiple directories.
+
+        A submitter is only constructed from scratch (which requires querying the batch
+        system) once for each distinct set of qq directives. Directories containing
+        a script with the same directives as an already processed directory
+        reuse its submitter via `Submitter.forDirectory`. Submitters of jobs with
+        work-dir='auto' are never reused, since the working directory is selected
+        based on the size of the input data of each directory.
+
+        Args:
+            script (Path): Path to the script relative to each of the directories.
+            directories (list[Path]): Directories to submit the script from.
+            **kwargs: Keyword arguments from the command line.
+
+        Returns:
+            tuple[list[Submitter], list[SubmitResult]]: Submitters of the jobs and results
+            describing directories for which no submitter could be constructed.
+        """
+        submitters: list[Submitter] = []
+        failed: list[SubmitResult] = []
+        by_directives: dict[tuple[str, ...], Submitter] = {}
+
+        for directory in directories:
+            try:
+                factory = cls((directory / script).resolve(), **kwargs)
+                factory._parser.parse()
+                directives = factory._parser.getDirectives()
+
+                if (
+                    base := by_directives.get(directives)
+                ) and not factory._requestsAutoWorkDir():
+                    submitters.append(base.forDirectory(factory._input_dir))
+                else:
+                    submitter = factory.makeSubmitter()
+                    by_directives[directives] = submitter
+                    submitters.append(submitter)
+            except QQError as e:
+                failed.append(SubmitResult(directory.resolve(), error=str(e)))
+
+        return submitters, failed
+
+    @staticmethod
+    def getOptions() -> list[Parameter]:
+        """
+        Get the options of `qq submit`, which can also be specified as qq directives.
+
+        Returns:
+            list[Parameter]: Click parameters of the `qq submit` command.
+        """
+        # the command is defined in the CLI module which itself depends on this module
+        from qq_lib.submit.cli import submit
+
+        return submit.params
+
+    @staticmethod
+    def getOptionsByName() -> dict[str, Parameter]:
+        """
+        Get the options of `qq submit` keyed by their names as used in keyword arguments of the factory.
+
+        Returns:
+            dict[str, Parameter]: Click parameters keyed by their names in snake_case.
+        """
+        return {p.name: p for p in SubmitterFactory.getOptions() if p.name}
+
     def _getBatchSystem(self) -> type[BatchInterface]:
         """
         Determine which batch system to use for the job submission.
@@ -127,6 +205,8 @@ class SubmitterFactory:
         line with requirements specified inside the submitted script.
 
         The resources are then further modified to conform to the provided `BatchSystem` and submission `queue`.
+        If the type of the working directory is 'auto', it is selected by the batch system
+        based on the size of the input data.
 
         Args:
             BatchSystem (type[BatchInterface]): The batch system class to use.
@@ -135,22 +215,100 @@ class SubmitterFactory:
         Returns:
             Resources: A merged Resources object containing the final resource requirements.
         """
+        resources = self._getRequestedResources()
+        if self._requestsAutoWorkDir(resources):
+            resources = BatchSystem.selectWorkDir(
+                queue, resources, self._getInputSize()
+            )
+
+        return BatchSystem.transformResources(queue, resources)
+
+    def _getRequestedResources(self) -> Resources:
+        """
+        Merge the resources specified on the command line with the resources specified inside the submitted script.
+
+        Returns:
+            Resources: The resources requested by the user.
+        """
         field_names = {f.name for f in fields(Resources)}
         command_line_resources = Resources(
             **{k: v for k, v in self._kwargs.items() if k in field_names}
         )
 
-        return BatchSystem.transformResources(
-            queue,
-            Resources.mergeResources(
-                command_line_resources, self._parser.getResources()
-            ),
+        return Resources.mergeResources(
+            command_line_resources, self._parser.getResources()
         )
 
-    def _getLoopInfo(self) -> LoopInfo:
+    def _requestsAutoWorkDir(self, resources: Resources | None = None) -> bool:
+        """
+        Check whether the working directory should be selected based on the size of the input data.
+
+        Args:
+            resources (Resources | None): The resources requested by the user.
+                If None, they are obtained from the command line and the script.
+
+        Returns:
+            bool: True if the type of the working directory is 'auto', else False.
+        """
+        work_dir = (resources or self._getRequestedResources()).work_dir
+        return bool(work_dir) and equals_normalized(work_dir, "auto")
+
+    def _getInputSize(self) -> Size:
+        """
+        Get the total size of the data copied to the working directory of the job,
+        i.e., the size of the input directory and of the explicitly included files
+        without the excluded files and the archive of a loop job.
+
+        Returns:
+            Size: The size of the input data.
+
+        Raises:
+            QQError: If the size of the input data cannot be measured.
+        """
+        input_dir = self._input_dir.resolve()
+        include = [(self._input_dir / file).resolve() for file in self._getInclude()]
+        exclude = [(self._input_dir / file).resolve() for file in self._getExclude()]
+        if self._getJobType() == JobType.LOOP:
+            exclude.append(self._getArchive().resolve())
+
+        # only existing files inside the input directory are subtracted;
+        # explicitly included files are copied even if they are excluded
+        exclude = [
+            path
+            for path in exclude
+            if path != input_dir
+            and path.is_relative_to(input_dir)
+            and path not in include
+            and path.exists()
+        ]
+
+        size = (
+            get_directory_size(input_dir)
+            - sum(
+                get_directory_size(path)
+                for path in exclude
+                # files inside an excluded directory are already subtracted
+                if not any(
+                    path != other and path.is_relative_to(other) for other in exclude
+                )
+            )
+            + sum(
+                get_directory_size(path)
+                for path in include
+                # files inside the input directory are already counted
+                if path.exists() and not path.is_relative_to(input_dir)
+            )
+        )
+        return Size(math.ceil(size / 1024), "kb")
+
+    def _getLoopInfo(self, resources: Resources | None = None) -> LoopInfo:
         """
         Construct LoopInfo holding information about the loop job.
 
+        Args:
+            resources (Resources | None): Resources requested for the job. Used as the reference
+                for autosizing the resources of the following cycles.
+
         Returns:
             LoopInfo: An object containing loop job parameters.
 
@@ -160,12 +318,75 @@ class SubmitterFactory:
         return LoopInfo(
             self._kwargs.get("loop_start") or self._parser.getLoopStart() or 1,
             self._kwargs.get("loop_end") or self._parser.getLoopEnd(),
-            self._input_dir
-            / (self._kwargs.get("archive") or self._parser.getArchive() or "storage"),
+            self._getArchive(),
             self._kwargs.get("archive_format")
             or self._parser.getArchiveFormat()
             or "job%04d",
             input_dir=self._input_dir,
+            reuse_work_dir=bool(self._kwargs.get("reuse_work_dir"))
+            or self._parser.getReuseWorkDir(),
+            window=self._kwargs.get("loop_window") or self._parser.getLoopWindow() or 1,
+            archive_pack=self._kwargs.get("archive_pack")
+            or self._parser.getArchivePack(),
+            max_requeues=self._kwargs.get("max_requeues")
+            or self._parser.getMaxRequeues()
+            or 0,
+            requeues=self._kwargs.get("requeues") or 0,
+            autosize=self._getAutosizeInfo(resources),
+        )
+
+    def _getArchive(self) -> Path:
+        """
+        Get the path to the archive directory of a loop job.
+
+        Returns:
+            Path: The archive directory (`storage` inside the input directory by default).
+        """
+        return self._input_dir / (
+            self._kwargs.get("archive") or self._parser.getArchive() or "storage"
+        )
+
+    def _getAutosizeInfo(
+        self, resources: Resources | None
+    ) -> AutosizeInfo | str | None:
+        """
+        Get the resources used as the reference for autosizing the following cycles of a loop job.
+
+        Args:
+            resources (Resources | None): Resources requested for the job.
+
+        Returns:
+            AutosizeInfo | str | None: Reference resources (or their string representation
+            passed from the previous cycle), or None if the job is not autosized.
+        """
+        if autosize_base := self._kwargs.get("autosize_base"):
+            return autosize_base
+
+        if resources and (self._kwargs.get("autosize") or self._parser.getAutosize()):
+            return AutosizeInfo.fromResources(resources)
+
+        return None
+
+    def _getPackInfo(self) -> PackInfo:
+        """
+        Construct PackInfo holding the tasks of the pack job.
+
+        Returns:
+            PackInfo: An object containing the tasks and per-task resources.
+
+        Raises:
+            QQError: If the task list is not specified, cannot be read, or contains no tasks.
+        """
+        if not (
+            pack_tasks := self._kwargs.get("pack_tasks") or self._parser.getPackTasks()
+        ):
+            raise QQError("Attribute 'pack-tasks' is undefined.")
+
+        return PackInfo.fromFile(
+            self._input_dir / pack_tasks,
+            self._input_dir,
+            self._kwargs.get("pack_task_ncpus") or self._parser.getPackTaskNCPUs() or 1,
+            self._kwargs.get("pack_task_ngpus") or self._parser.getPackTaskNGPUs() or 0,
         )
 
     def _getExclude(self) -> list[Path]:
@@ -2,6 +2,7 @@
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
 import re
+import threading
 from dataclasses import fields
 from pathlib import Path
 
@@ -24,6 +25,10 @@ class Parser:
     Parser for qq job submission options (qq directives) specified in a script.
     """
 
+    # options parsed from the directives of previously parsed scripts
+    _cache: dict[tuple[frozenset[str], tuple[str, ...]], dict[str, object]] = {}
+    _cache_lock = threading.Lock()
+
     def __init__(self, script: Path, params: list[Parameter]):
         """
         Initialize the parser.
@@ -40,6 +45,7 @@ class Parser:
         )
 
         self._options: dict[str, object] = {}
+        self._directives: tuple[str, ...] = ()
 
     def parse(self) -> None:
         """
@@ -52,13 +58,81 @@ class Parser:
         Each valid `qq` line is parsed into key-value pairs, normalized to `snake_case`,
         and stored in `self._options`.
 
+        Parsed options are memoized, so scripts with identical `qq` directives
+        (e.g., copies of the same script in multiple directories) are only parsed once.
+
         Raises:
             QQError: If the script cannot be read, or if an option line is malformed or
                     contains an unknown option.
         """
+        self._directives = self._readDirectives()
+
+        cache_key = (frozenset(self._known_options), self._directives)
+        with Parser._cache_lock:
+            cached = Parser._cache.get(cache_key)
+
+        if cached is not None:
+            logger.debug(f"Using memoized options for '{self._script}': {cached}.")
+            self._options = dict(cached)
+            return
+
+        for line in self._directives:
+            # remove the leading '# qq' and split by whitespace or '='
+            parts = Parser._stripAndSplit(line)
+            if len(parts) < 2:
+                raise QQError(
+                    f"Invalid qq submit option line in '{str(self._script)}': {line}."
+                )
+
+            key, value = parts[-2], parts[-1]
+            snake_case_key = to_snake_case(key)
+
+            # handle workdir and worksize where two forms of the keyword are allowed
+            snake_case_key = snake_case_key.replace("workdir", "work_dir").replace(
+                "worksize", "work_size"
+            )
+
+            # is this a known option?
+            if snake_case_key in self._known_options:
+                try:
+                    self._options[snake_case_key] = int(value)
+                except ValueError:
+                    self._options[snake_case_key] = value
+            else:
+                raise QQError(
+                    f"Unknown qq submit option '{key}' in '{str(self._script)}': {line.strip()}.\nKnown options are '{' '.join(self._known_options)}'."
+                )
+
+        with Parser._cache_lock:
+            Parser._cache[cache_key] = dict(self._options)
+
+        logger.debug(f"Parsed options from '{self._script}': {self._options}.")
+
+    def getDirectives(self) -> tuple[str, ...]:
+        """
+        Return the `qq` directive lines found in the script by the last call to `parse`.
+
+        Scripts with identical directives are parsed into identical options.
+
+        Returns:
+            tuple[str, ...]: The directive lines in the order in which they appear in the script.
+        """
+        return self._directives
+
+    def _readDirectives(self) -> tuple[str, ...]:
+        """
+        Read the `qq` directive lines from the header of the script.
+
+        Returns:
+            tuple[str, ...]: The directive lines.
+
+        Raises:
+            QQError: If the script cannot be read.
+        """
         if not self._script.is_file():
             raise QQError(f"Could not open '{self._script}' as a file.")
 
+        directives = []
         with self._script.open() as f:
             # skip the first line (shebang)
             next(f, None)
@@ -77,33 +151,9 @@ class Parser:
                     logger.debug(f"Parser: ending parsing at line '{line}'.")
                     break  # stop parsing at other lines
 
-                # remove the leading '# qq' and split by whitespace or '='
-                parts = Parser._stripAndSplit(line)
-                if len(parts) < 2:
-                    raise QQError(
-                        f"Invalid qq submit option line in '{str(self._script)}': {line}."
-                    )
-
-                key, value = parts[-2], parts[-1]
-                snake_case_key = to_snake_case(key)
-
-                # handle workdir and worksize where two forms of the keyword are allowed
-                snake_case_key = snake_case_key.replace("workdir", "work_dir").replace(
-                    "worksize", "work_size"
-                )
-
-                # is this a known option?
-                if snake_case_key in self._known_options:
-                    try:
-                        self._options[snake_case_key] = int(value)
-                    except ValueError:
-                        self._options[snake_case_key] = value
-                else:
-                    raise QQError(
-                        f"Unknown qq submit option '{key}' in '{str(self._script)}': {line.strip()}.\nKnown options are '{' '.join(self._known_options)}'."
-                    )
+                directives.append(line)
 
-        logger.debug(f"Parsed options from '{self._script}': {self._options}.")
+        return tuple(directives)
 
     def getBatchSystem(self) -> type[BatchInterface] | None:
         """
@@ -197,6 +247,17 @@ class Parser:
             return loop_end
         return None
 
+    def getLoopWindow(self) -> int | None:
+        """
+        Return the number of loop cycles that should be submitted in advance.
+
+        Returns:
+            int | None: Size of the submission window, or None if not specified.
+        """
+        if isinstance(loop_window := self._options.get("loop_window"), int):
+            return loop_window
+        return None
+
     def getArchive(self) -> Path | None:
         """
         Return the archive directory path specified in the script.
@@ -220,6 +281,88 @@ class Parser:
             return archive_format
         return None
 
+    def getArchivePack(self) -> str | None:
+        """
+        Return the format of the bundles into which archived files are packed.
+
+        Returns:
+            str | None: Pack format, or None if not set.
+        """
+        if isinstance(archive_pack := self._options.get("archive_pack"), str):
+            return archive_pack.lower()
+        return None
+
+    def getPackTasks(self) -> Path | None:
+        """
+        Return the path to the task list of a pack job specified in the script.
+
+        Returns:
+            Path | None: Path to the task list file, or None if not set.
+        """
+        if pack_tasks := self._options.get("pack_tasks"):
+            return Path(pack_tasks)
+
+        return None
+
+    def getPackTaskNCPUs(self) -> int | None:
+        """
+        Return the number of CPU cores assigned to each task of a pack job.
+
+        Returns:
+            int | None: Number of CPU cores per task, or None if not specified.
+        """
+        if isinstance(ncpus := self._options.get("pack_task_ncpus"), int):
+            return ncpus
+        return None
+
+    def getPackTaskNGPUs(self) -> int | None:
+        """
+        Return the number of GPUs assigned to each task of a pack job.
+
+        Returns:
+            int | None: Number of GPUs per task, or None if not specified.
+        """
+        if isinstance(ngpus := self._options.get("pack_task_ngpus"), int):
+            return ngpus
+        return None
+
+    def getMaxRequeues(self) -> int | None:
+        """
+        Return the maximal number of requeues of a failed loop cycle.
+
+        Returns:
+            int | None: Maximal number of requeues, or None if not specified.
+        """
+        if isinstance(max_requeues := self._options.get("max_requeues"), int):
+            return max_requeues
+        return None
+
+    def getAutosize(self) -> bool:
+        """
+        Return whether the resources of the following cycles of a loop job should be autosized.
+
+        Returns:
+            bool: True if the option is set to a truthy value, else False.
+        """
+        autosize = self._options.get("autosize")
+        if isinstance(autosize, str):
+            return autosize.lower() in {"true", "yes", "1"}
+
+        return autosize == 1
+
+    def getReuseWorkDir(self) -> bool:
+        """
+        Return whether the working directory should be reused by the following cycles of a loop job.
+
+        Returns:
+            bool: True if the option is set to a truthy value, else False.
+        """
+        reuse = self._options.get("reuse_work_dir")
+        if isinstance(reuse, str):
+            return reuse.lower() in {"true", "yes", "1"}
+
+        return reuse == 1
+
     def getDepend(self) -> list[Depend]:
         """
         Return the list of job dependencies.
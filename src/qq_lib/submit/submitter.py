@@ -4,8 +4,10 @@
 import getpass
 import os
 import socket
-from contextlib import chdir
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import qq_lib
@@ -14,22 +16,42 @@ from qq_lib.core.common import (
     construct_info_file_path,
     construct_loop_job_name,
     get_info_file,
+    get_info_files,
+    get_runtime_files,
     hhmmss_to_duration,
 )
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.core.logger import get_logger
 from qq_lib.info.informer import Informer
-from qq_lib.properties.depend import Depend
+from qq_lib.properties.array import ArrayIndex
+from qq_lib.properties.depend import Depend, DependType
 from qq_lib.properties.info import Info
 from qq_lib.properties.job_type import JobType
 from qq_lib.properties.loop import LoopInfo
+from qq_lib.properties.pack import PackInfo
 from qq_lib.properties.resources import Resources
 from qq_lib.properties.states import NaiveState
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class SubmitResult:
+    """
+    Result of submitting a job from a single input directory.
+    """
+
+    # Input directory of the job
+    input_dir: Path
+
+    # Identifier of the submitted job or None if the job was not submitted
+    job_id: str | None = None
+
+    # Reason why the job was not submitted
+    error: str | None = None
+
+
 class Submitter:
     """
     Class to submit jobs to a batch system.
@@ -56,6 +78,7 @@ class Submitter:
         exclude: list[Path] | None = None,
         include: list[Path] | None = None,
         depend: list[Depend] | None = None,
+        pack_info: PackInfo | None = None,
     ):
         """
         Initialize a Submitter instance.
@@ -75,6 +98,7 @@ class Submitter:
                 even though they are not part of the job's input directory.
                 Paths are provided either absolute or relative to the input directory.
             depend (list[Depend] | None): Optional list of job dependencies.
+            pack_info (PackInfo | None): Optional information for pack jobs. Pass None if not applicable.
 
         Raises:
             QQError: If the script does not exist or has an invalid shebang line.
@@ -85,6 +109,7 @@ class Submitter:
         self._queue = queue
         self._account = account
         self._loop_info = loop_info
+        self._pack_info = pack_info
         self._script = script
         self._input_dir = script.resolve().parent
         self._script_name = script.name
@@ -115,8 +140,229 @@ class Submitter:
         Sets required environment variables, calls the batch system's
         job submission mechanism, and creates an info file with job metadata.
 
-        Note that this method temporarily changes the current working directory,
-        and is therefore not thread-safe.
+        For loop jobs with a submission window larger than one, all cycles
+        within the window that have not been submitted yet are submitted,
+        each depending on the successful completion of the previous cycle.
+
+        The submission command is executed in the input directory
+        without changing the working directory of the current process,
+        so this method can be called from multiple threads at once.
+
+        Returns:
+            str: The job ID of the submitted job. For loop jobs with a submission window,
+            the job ID of the first newly submitted cycle.
+
+        Raises:
+            QQError: If job submission fails.
+        """
+        if self._loop_info and self._loop_info.window > 1:
+            return self._submitLoopWindow()
+
+        return self._submitJob()
+
+    @staticmethod
+    def submitMany(
+        submitters: list["Submitter"], max_workers: int | None = None
+    ) -> list[SubmitResult]:
+        """
+        Submit multiple jobs concurrently.
+
+        Each job is submitted from its own input directory by a pool of worker threads.
+        A job is not submitted if its input directory contains qq runtime files
+        that do not belong to a previous cycle of the same loop job.
+        A failure to submit one job does not affect the other jobs.
+
+        Args:
+            submitters (list[Submitter]): Submitters of the individual jobs.
+            max_workers (int | None): Maximal number of jobs submitted at the same time.
+                Defaults to `CFG.submitter.max_workers`.
+
+        Returns:
+            list[SubmitResult]: Results of the submissions in the order of the submitters.
+        """
+        with ThreadPoolExecutor(
+            max_workers=max_workers or CFG.submitter.max_workers
+        ) as executor:
+            return list(executor.map(Submitter._submitGuarded, submitters))
+
+    def _submitGuarded(self) -> SubmitResult:
+        """
+        Submit the job unless its input directory is occupied by another qq job.
+
+        Returns:
+            SubmitResult: Result of the submission.
+        """
+        try:
+            # guard against multiple submissions from the same directory
+            if get_runtime_files(self._input_dir) and not self.continuesLoop():
+                raise QQError("Detected qq runtime files in the submission directory.")
+
+            job_id = self.submit()
+            logger.debug(f"Submitted job '{job_id}' from '{self._input_dir}'.")
+            return SubmitResult(self._input_dir, job_id=job_id)
+        except QQError as e:
+            logger.debug(f"Could not submit job from '{self._input_dir}': {e}")
+            return SubmitResult(self._input_dir, error=str(e))
+
+    @staticmethod
+    def submitArray(
+        submitters: list["Submitter"], array_dir: Path
+    ) -> list[SubmitResult]:
+        """
+        Submit jobs from multiple directories as a single array job.
+
+        The jobs must be identical except for their input directories. Array indices
+        are mapped to the input directories through an index file written into `array_dir`.
+        Each member of the array gets its own qq info file in its input directory.
+        Directories containing qq runtime files are not included in the array.
+
+        Args:
+            submitters (list[Submitter]): Submitters of the individual jobs.
+            array_dir (Path): Directory from which the array is submitted.
+
+        Returns:
+            list[SubmitResult]: Results of the submissions in the order of the submitters.
+
+        Raises:
+            QQError: If the jobs cannot be submitted as an array or if the submission fails.
+        """
+        results: dict[Path, SubmitResult] = {}
+        members: list[Submitter] = []
+        for submitter in submitters:
+            if get_runtime_files(submitter._input_dir):
+                results[submitter._input_dir] = SubmitResult(
+                    submitter._input_dir,
+                    error="Detected qq runtime files in the submission directory.",
+                )
+            else:
+                members.append(submitter)
+
+        if len(members) < 2:
+            raise QQError("An array job requires at least two submission directories.")
+
+        first = members[0]
+        if first._loop_info:
+            raise QQError("Loop jobs cannot be submitted as array jobs.")
+
+        for member in members[1:]:
+            if member._getArrayKey() != first._getArrayKey():
+                raise QQError(
+                    f"Job in '{member._input_dir}' differs from the job in '{first._input_dir}' in its submission options and cannot be part of the same array job."
+                )
+
+        # map array indices to the info files of the members
+        index_file = ArrayIndex.getPath(array_dir, first._job_name)
+        ArrayIndex([member._info_file for member in members]).toFile(index_file)
+
+        # the members find their info files and input directories in the index
+        env_vars = first._createEnvVarsDict()
+        del env_vars[CFG.env_vars.info_file]
+        del env_vars[CFG.env_vars.input_dir]
+        env_vars[CFG.env_vars.array_index] = str(index_file)
+
+        try:
+            array_id = first._batch_system.jobSubmitArray(
+                first._resources,
+                first._queue,
+                first._input_dir / first._script_name,
+                first._job_name,
+                first._depend,
+                env_vars,
+                array_dir,
+                len(members),
+                first._account,
+            )
+        except QQError:
+            index_file.unlink(missing_ok=True)
+            raise
+
+        logger.debug(f"Submitted array job '{array_id}' with {len(members)} members.")
+        for i, member in enumerate(members):
+            job_id = first._batch_system.getArrayMemberId(array_id, i)
+            try:
+                member._createInfoFile(job_id)
+                results[member._input_dir] = SubmitResult(
+                    member._input_dir, job_id=job_id
+                )
+            except QQError as e:
+                results[member._input_dir] = SubmitResult(
+                    member._input_dir, error=str(e)
+                )
+
+        return [results[submitter._input_dir] for submitter in submitters]
+
+    def forDirectory(self, directory: Path) -> "Submitter":
+        """
+        Create a submitter of the same job submitted from a different directory.
+
+        The directory must contain a script with the same name. All submission
+        options are preserved. For loop jobs, the archive is placed into the new
+        directory and the current cycle is determined from its content.
+        Excluded and included files specified relative to the original input
+        directory are made relative to the new directory.
+
+        Args:
+            directory (Path): The new input directory.
+
+        Returns:
+            Submitter: Submitter of the job in the new directory.
+
+        Raises:
+            QQError: If the script does not exist in the directory or is not a valid qq script.
+        """
+        directory = directory.resolve()
+
+        loop_info = None
+        if self._loop_info:
+            loop_info = LoopInfo(
+                self._loop_info.start,
+                self._loop_info.end,
+                directory / self._loop_info.archive.relative_to(self._input_dir)
+                if self._loop_info.archive.is_relative_to(self._input_dir)
+                else directory / self._loop_info.archive.name,
+                self._loop_info.archive_format,
+                input_dir=directory,
+                reuse_work_dir=self._loop_info.reuse_work_dir,
+                window=self._loop_info.window,
+                archive_pack=self._loop_info.archive_pack,
+                max_requeues=self._loop_info.max_requeues,
+                autosize=self._loop_info.autosize,
+            )
+
+        pack_info = None
+        if self._pack_info:
+            pack_info = PackInfo.fromTaskList(
+                [t.task for t in self._pack_info.tasks],
+                directory,
+                self._pack_info.task_ncpus,
+                self._pack_info.task_ngpus,
+            )
+
+        def rebase(paths: list[Path]) -> list[Path]:
+            return [
+                p.relative_to(self._input_dir)
+                if p.is_relative_to(self._input_dir)
+                else p
+                for p in paths
+            ]
+
+        return Submitter(
+            self._batch_system,
+            self._queue,
+            self._account,
+            directory / self._script_name,
+            self._job_type,
+            self._resources,
+            loop_info,
+            rebase(self._exclude),
+            rebase(self._include),
+            self._depend,
+            pack_info,
+        )
+
+    def _submitJob(self) -> str:
+        """
+        Submit the script to the batch system and create its qq info file.
 
         Returns:
             str: The job ID of the submitted job.
@@ -124,54 +370,144 @@ class Submitter:
         Raises:
             QQError: If job submission fails.
         """
-        # move to the script's parent directory and submit the script
-        # with PBS it is possible to submit the script from anywhere
-        # but with Slurm the input directory path is then not set correctly
-        # it is safer and easier to just move to the input directory,
-        # execute the command and then return back
-        with chdir(self._input_dir):
-            # submit the job
-            job_id = self._batch_system.jobSubmit(
-                self._resources,
-                self._queue,
-                self._script,
-                self._job_name,
-                self._depend,
-                self._createEnvVarsDict(),
-                self._account,
+        # submit the job
+        job_id = self._batch_system.jobSubmit(
+            self._resources,
+            self._queue,
+            self._input_dir / self._script_name,
+            self._job_name,
+            self._depend,
+            self._createEnvVarsDict(),
+            self._account,
+            start_time=self._getStartTime(),
+        )
+
+        self._createInfoFile(job_id)
+        return job_id
+
+    def _getStartTime(self) -> datetime | None:
+        """
+        Get the time before which the job must not start.
+
+        A requeued cycle of a loop job is queued immediately, but it is only
+        allowed to start after the backoff of the requeue.
+
+        Returns:
+            datetime | None: The earliest start time or None if the job may start at any time.
+        """
+        if not self._loop_info or not (delay := self._loop_info.getRequeueDelay()):
+            return None
+
+        logger.info(f"Job will not start earlier than in {delay} seconds.")
+        return datetime.now() + timedelta(seconds=delay)
+
+    def _createInfoFile(self, job_id: str) -> None:
+        """
+        Create the qq info file of the submitted job.
+
+        Args:
+            job_id (str): The job ID of the submitted job.
+
+        Raises:
+            QQError: If the info file cannot be written.
+        """
+        informer = Informer(
+            Info(
+                batch_system=self._batch_system,
+                qq_version=qq_lib.__version__,
+                username=getpass.getuser(),
+                job_id=job_id,
+                job_name=self._job_name,
+                script_name=self._script_name,
+                queue=self._queue,
+                job_type=self._job_type,
+                input_machine=socket.gethostname(),
+                input_dir=self._input_dir,
+                job_state=NaiveState.QUEUED,
+                submission_time=datetime.now(),
+                stdout_file=str(Path(self._job_name).with_suffix(CFG.suffixes.stdout)),
+                stderr_file=str(Path(self._job_name).with_suffix(CFG.suffixes.stderr)),
+                resources=self._resources,
+                loop_info=self._loop_info,
+                pack_info=self._pack_info,
+                excluded_files=self._exclude,
+                included_files=self._include,
+                depend=self._depend,
+                account=self._account,
             )
+        )
+        informer.toFile(self._info_file)
 
-            # create job qq info file
-            informer = Informer(
-                Info(
-                    batch_system=self._batch_system,
-                    qq_version=qq_lib.__version__,
-                    username=getpass.getuser(),
-                    job_id=job_id,
-                    job_name=self._job_name,
-                    script_name=self._script_name,
-                    queue=self._queue,
-                    job_type=self._job_type,
-                    input_machine=socket.gethostname(),
-                    input_dir=self._input_dir,
-                    job_state=NaiveState.QUEUED,
-                    submission_time=datetime.now(),
-                    stdout_file=str(
-                        Path(self._job_name).with_suffix(CFG.suffixes.stdout)
-                    ),
-                    stderr_file=str(
-                        Path(self._job_name).with_suffix(CFG.suffixes.stderr)
-                    ),
-                    resources=self._resources,
-                    loop_info=self._loop_info,
-                    excluded_files=self._exclude,
-                    included_files=self._include,
-                    depend=self._depend,
-                    account=self._account,
-                )
+    def _submitLoopWindow(self) -> str:
+        """
+        Submit all cycles of the loop job within the submission window that are not yet submitted.
+
+        Each newly submitted cycle depends on the successful completion of the previous cycle
+        if the previous cycle has already been submitted.
+
+        Returns:
+            str: The job ID of the first newly submitted cycle.
+
+        Raises:
+            QQError: If all cycles within the window are already submitted
+                or if job submission fails.
+        """
+        assert self._loop_info is not None
+
+        job_ids = []
+        previous_id = None
+        for cycle in range(
+            self._loop_info.current, self._loop_info.getLastQueuedCycle() + 1
+        ):
+            cycle_submitter = self._forCycle(cycle)
+
+            if cycle_submitter._info_file.is_file():
+                # the cycle has already been submitted by one of the previous cycles
+                previous_id = Info.loadHeader(cycle_submitter._info_file).job_id
+                logger.debug(f"Cycle {cycle} is already submitted as '{previous_id}'.")
+                continue
+
+            if previous_id:
+                cycle_submitter._depend = self._depend + [
+                    Depend(DependType.AFTER_SUCCESS, [previous_id])
+                ]
+
+            previous_id = cycle_submitter._submitJob()
+            logger.debug(f"Submitted cycle {cycle} as '{previous_id}'.")
+            job_ids.append(previous_id)
+
+        if not job_ids:
+            raise QQError(
+                "All cycles of the loop job within the submission window are already submitted."
+            )
+
+        if len(job_ids) > 1:
+            logger.info(
+                f"Submitted {len(job_ids)} cycles of the loop job in advance: {' '.join(job_ids)}."
             )
-            informer.toFile(self._info_file)
-            return job_id
+
+        return job_ids[0]
+
+    def _forCycle(self, cycle: int) -> "Submitter":
+        """
+        Create a copy of the submitter for the specified cycle of the loop job.
+
+        Args:
+            cycle (int): The cycle of the loop job to submit.
+
+        Returns:
+            Submitter: Submitter of the specified cycle.
+        """
+        assert self._loop_info is not None
+
+        submitter = copy(self)
+        submitter._loop_info = copy(self._loop_info)
+        submitter._loop_info.current = cycle
+        submitter._job_name = submitter._constructJobName()
+        submitter._info_file = construct_info_file_path(
+            self._input_dir, submitter._job_name
+        )
+        return submitter
 
     def continuesLoop(self) -> bool:
         """
@@ -185,6 +521,14 @@ class Submitter:
           - The previous job finished successfully.
           - The previous loop cycle number is exactly one less than the current one.
 
+        A job is also considered a valid continuation if it requeues a cycle
+        that failed due to an error of the qq infrastructure, i.e., the info file
+        belongs to the same cycle, the cycle failed, and the number of requeues
+        of the job is one higher than the number of requeues of the failed cycle.
+
+        For loop jobs with a submission window, info files of the cycles
+        that were submitted in advance and are still queued may also be present.
+
         Returns:
             bool: True if the job is a valid continuation of a previous loop job,
                   False otherwise.
@@ -202,14 +546,104 @@ class Submitter:
             ):
                 logger.debug("Valid loop job with a correct cycle.")
                 return True
+
+            if self._requeuesCycle(informer):
+                logger.debug("Valid requeue of a failed loop cycle.")
+                return True
+
             logger.debug(
                 "Detected info file is either not a loop job or does not correspond to the previous cycle."
             )
             return False
+        except QQError as e:
+            logger.debug(f"Could not read an info file: {e}.")
+            return self._continuesLoopWindow()
+
+    def _requeuesCycle(self, informer: Informer) -> bool:
+        """
+        Determine whether the submitted job requeues the failed cycle described by the informer.
+
+        Args:
+            informer (Informer): Informer of the job found in the input directory.
+
+        Returns:
+            bool: True if the job is a valid requeue of the failed cycle, else False.
+        """
+        return bool(
+            (previous := informer.info.loop_info)
+            and self._loop_info
+            and informer.info.job_state == NaiveState.FAILED
+            and previous.current == self._loop_info.current
+            and self._loop_info.requeues == previous.requeues + 1
+            and self._loop_info.requeues <= self._loop_info.max_requeues
+        )
+
+    def _continuesLoopWindow(self) -> bool:
+        """
+        Determine whether the submitted job continues a loop job with pre-submitted cycles.
+
+        A job is considered a valid continuation if the previous cycle finished successfully
+        and all other info files in the input directory belong to cycles within
+        the submission window that are still queued.
+
+        Returns:
+            bool: True if the job is a valid continuation of a previous loop job,
+                  False otherwise.
+        """
+        if not self._loop_info or self._loop_info.window <= 1:
+            return False
+
+        expected = {
+            self._forCycle(cycle)._info_file: cycle
+            for cycle in range(
+                self._loop_info.current - 1, self._loop_info.getLastQueuedCycle() + 1
+            )
+        }
+
+        try:
+            info_files = [f.resolve() for f in get_info_files(self._input_dir)]
+            if not info_files:
+                return False
+
+            for info_file in info_files:
+                if (cycle := expected.get(info_file)) is None:
+                    logger.debug(
+                        f"Info file '{info_file}' is not part of the loop job."
+                    )
+                    return False
+
+                state = Info.loadHeader(info_file).job_state
+                if (
+                    cycle < self._loop_info.current and state != NaiveState.FINISHED
+                ) or (cycle >= self._loop_info.current and state != NaiveState.QUEUED):
+                    logger.debug(
+                        f"Cycle {cycle} of the loop job is in an unexpected state ({str(state)})."
+                    )
+                    return False
         except QQError as e:
             logger.debug(f"Could not read an info file: {e}.")
             return False
 
+        # the previous cycle must be present
+        return self._forCycle(self._loop_info.current - 1)._info_file in info_files
+
+    def _getArrayKey(self) -> tuple:
+        """
+        Get the submission options which must be shared by all members of an array job.
+
+        Returns:
+            tuple: The batch system, queue, account, job type, job name, resources and dependencies.
+        """
+        return (
+            self._batch_system,
+            self._queue,
+            self._account,
+            self._job_type,
+            self._job_name,
+            self._resources,
+            self._depend,
+        )
+
     def getInputDir(self) -> Path:
         """
         Get path to the job's input directory.
@@ -247,6 +681,10 @@ class Submitter:
         """Get loop job information."""
         return self._loop_info
 
+    def getPackInfo(self) -> PackInfo | None:
+        """Get pack job information."""
+        return self._pack_info
+
     def getExclude(self) -> list[Path] | None:
         """Get a list of excluded files."""
         return self._exclude
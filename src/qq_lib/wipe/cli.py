@@ -46,7 +46,11 @@ When the `--force` flag is used, `{CFG.binary_name} wipe` attempts to wipe the w
 regardless of its state, including jobs that are queued, running or successfully finished.
 You should be very careful when using this option as it may delete useful data or cause your job to crash!
 
-If the working directory matches the input directory, `{CFG.binary_name} wipe` will never delete it, even if you use the `--force` flag.""",
+If the working directory matches the input directory, `{CFG.binary_name} wipe` will never delete it, even if you use the `--force` flag.
+
+When the `--orphans` flag is used, `{CFG.binary_name} wipe` instead deletes working directories of successfully finished jobs
+that were left behind on the computing node: directories scheduled for deletion in the background
+and directories of loop jobs retained for a following cycle that never reused them.""",
     cls=GNUHelpColorsCommand,
     help_options_color="bright_blue",
 )
@@ -68,7 +72,14 @@ If the working directory matches the input directory, `{CFG.binary_name} wipe` w
     is_flag=True,
     help="Delete the working directory of the job forcibly, ignoring its current state and without confirmation.",
 )
-def wipe(job: str | None, yes: bool = False, force: bool = False) -> NoReturn:
+@click.option(
+    "--orphans",
+    is_flag=True,
+    help="Delete leftover working directories of finished jobs that were not removed in the background.",
+)
+def wipe(
+    job: str | None, yes: bool = False, force: bool = False, orphans: bool = False
+) -> NoReturn:
     """
     Delete the working directory of the specified qq job or qq job(s) submitted from the current directory.
     """
@@ -83,7 +94,9 @@ def wipe(job: str | None, yes: bool = False, force: bool = False) -> NoReturn:
             ):
                 raise QQError("No qq job info file found.")
 
-        repeater = Repeater(informers, _wipe_work_dir, force, yes)
+        repeater = Repeater(
+            informers, _wipe_orphans if orphans else _wipe_work_dir, force, yes
+        )
         repeater.onException(QQNotSuitableError, handle_not_suitable_error)
         repeater.onException(QQError, handle_general_qq_error)
         repeater.run()
@@ -128,3 +141,35 @@ def _wipe_work_dir(informer: Informer, force: bool, yes: bool) -> None:
         logger.info(f"Deleted the working directory of the job '{job_id}'.")
     else:
         logger.info("Operation aborted.")
+
+
+def _wipe_orphans(informer: Informer, force: bool, yes: bool) -> None:
+    """
+    Attempt to delete the leftover working directory of the job associated with the specified Informer.
+
+    Args:
+        informer (Informer): Informer associated with the job.
+        force (bool): Whether to delete the leftover directory regardless of the job's state.
+        yes (bool): Whether to skip confirmation before deleting.
+
+    Raises:
+        QQNotSuitableError: If the job has not left a working directory behind.
+        QQError: If the leftover directory cannot be deleted.
+    """
+    wiper = Wiper.fromInformer(informer)
+    wiper.printInfo(console)
+
+    if not force:
+        wiper.ensureSuitableForOrphans()
+
+    if (
+        force
+        or yes
+        or yes_or_no_prompt(
+            "Do you want to delete the job's leftover working directory?"
+        )
+    ):
+        job_id = wiper.wipeOrphans()
+        logger.info(f"Deleted the leftover working directory of the job '{job_id}'.")
+    else:
+        logger.info("Operation aborted.")
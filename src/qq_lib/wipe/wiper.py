@@ -1,7 +1,10 @@
 # Released under MIT License.
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
+from pathlib import Path
 
+from qq_lib.core.common import construct_tombstone_path
+from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError, QQNotSuitableError
 from qq_lib.core.logger import get_logger
 from qq_lib.core.navigator import Navigator
@@ -78,6 +81,94 @@ class Wiper(Navigator):
 
         return self._informer.info.job_id
 
+    def ensureSuitableForOrphans(self) -> None:
+        """
+        Verify that the job is in a state where it may have left a tombstone behind.
+
+        Tombstones are only created when a job finishes successfully
+        and its working directory is scheduled for deferred deletion.
+
+        Raises:
+            QQNotSuitableError: If the job has not finished successfully
+            or if the working directory is not defined.
+        """
+        if not self._isFinished():
+            raise QQNotSuitableError(
+                f"Job is {str(self._informer.getRealState()).lower()}. Only finished jobs can leave a deleted working directory behind."
+            )
+
+        if not self.hasDestination():
+            raise QQNotSuitableError("Job does not have a working directory.")
+
+    def wipeOrphans(self) -> str:
+        """
+        Delete the leftover working directory of the job on the computing node.
+
+        A leftover working directory is either a tombstone (a working directory
+        that was scheduled for deferred deletion but was not removed, typically
+        because the deletion process was terminated together with the job's allocation)
+        or a working directory retained for the next cycle of a loop job
+        which was never reused.
+
+        Returns:
+            str: The identifier of the job which leftover directory was deleted.
+
+        Raises:
+            QQNotSuitableError: If no leftover directory exists for the job.
+            QQError: If the host or working directory are not defined
+            or if the directory cannot be deleted.
+        """
+        if not self.hasDestination():
+            raise QQError(
+                "Host ('main_node') or working directory ('work_dir') are not defined."
+            )
+
+        assert self._work_dir is not None and self._main_node is not None
+        tombstone = self._getTombstone()
+        entries = self._batch_system.listRemoteDir(self._main_node, tombstone.parent)
+
+        if tombstone in entries:
+            leftover = tombstone
+        elif self._isRetained(entries):
+            leftover = self._work_dir
+        else:
+            raise QQNotSuitableError(
+                "No leftover working directory found: nothing to delete."
+            )
+
+        logger.info(f"Deleting leftover directory '{leftover}' on '{self._main_node}'.")
+        self._batch_system.deleteRemoteDir(self._main_node, leftover)
+
+        return self._informer.info.job_id
+
+    def _isRetained(self, entries: list[Path]) -> bool:
+        """
+        Check whether the working directory was retained for the next cycle of a loop job.
+
+        Args:
+            entries (list[Path]): Content of the parent directory of the working directory.
+
+        Returns:
+            bool: True if the working directory exists and contains a manifest.
+        """
+        assert self._work_dir is not None and self._main_node is not None
+        work_dir = self._work_dir.resolve()
+        if work_dir not in entries or self._workDirIsInputDir():
+            return False
+
+        try:
+            content = self._batch_system.listRemoteDir(self._main_node, work_dir)
+        except QQError as e:
+            logger.debug(e)
+            return False
+
+        return (work_dir / CFG.loop_jobs.manifest_file) in content
+
+    def _getTombstone(self) -> Path:
+        """Get the path to the tombstone of the job's working directory."""
+        assert self._work_dir is not None
+        return construct_tombstone_path(self._work_dir).resolve()
+
     def _workDirIsInputDir(self) -> bool:
         """Check whether the working directory of the job is the input directory of the job."""
         # note that we cannot just compare directory paths, since
@@ -0,0 +1,22 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Submission of multi-step workflows.
+
+This module provides the `Workflow` class, which submits a dependency graph
+of job steps described in a workflow file, the `WorkflowState` class, which
+records the jobs submitted for each step, and the `WorkflowPresenter` class,
+which summarizes the progress of a submitted workflow.
+"""
+
+from .presenter import WorkflowPresenter
+from .state import WorkflowState
+from .workflow import Workflow, WorkflowStep
+
+__all__ = [
+    "Workflow",
+    "WorkflowPresenter",
+    "WorkflowState",
+    "WorkflowStep",
+]
@@ -0,0 +1,70 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+import sys
+from pathlib import Path
+from typing import NoReturn
+
+import click
+
+from qq_lib.core.click_format import GNUHelpColorsCommand
+from qq_lib.core.config import CFG
+from qq_lib.core.error import QQError
+from qq_lib.core.logger import get_logger
+
+from .workflow import Workflow
+
+logger = get_logger(__name__)
+
+
+@click.command(
+    short_help="Submit a multi-step workflow.",
+    help=f"""Submit all steps of a workflow described in a YAML or TOML file.
+
+{click.style("WORKFLOW", fg="green")}   Path to the workflow file.
+
+Each step of the workflow submits a script from one or more directories
+(relative to the workflow file) with its own options of `{CFG.binary_name} submit`
+and may depend on other steps. All steps are submitted at once: the dependencies
+between the steps are translated into dependencies of the batch system
+and independent steps are submitted concurrently.
+
+The jobs submitted for each step are recorded in a state file (`{CFG.suffixes.qq_workflow}`)
+next to the workflow file. Use `{CFG.binary_name} jobs --workflow WORKFLOW` to follow the progress of the workflow.""",
+    cls=GNUHelpColorsCommand,
+    help_options_color="bright_blue",
+)
+@click.argument(
+    "workflow_file",
+    type=str,
+    metavar=click.style("WORKFLOW", fg="green"),
+)
+def workflow(workflow_file: str) -> NoReturn:
+    """
+    Submit a multi-step workflow.
+    """
+    try:
+        state = Workflow.fromFile(Path(workflow_file)).submit()
+
+        submitted = total = 0
+        for name, results in state.steps.items():
+            for result in results:
+                total += 1
+                if result.job_id:
+                    submitted += 1
+                    logger.info(
+                        f"Step '{name}': job '{result.job_id}' submitted from '{result.input_dir}'."
+                    )
+                else:
+                    logger.error(
+                        f"Step '{name}': could not submit job from '{result.input_dir}': {result.error}"
+                    )
+
+        logger.info(f"Submitted {submitted} of {total} jobs of the workflow.")
+        sys.exit(0 if submitted == total else CFG.exit_codes.default)
+    except QQError as e:
+        logger.error(e)
+        sys.exit(CFG.exit_codes.default)
+    except Exception as e:
+        logger.critical(e, exc_info=True, stack_info=True)
+        sys.exit(CFG.exit_codes.unexpected_error)
@@ -0,0 +1,75 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from rich.table import Table
+from rich.text import Text
+
+from qq_lib.batch.interface.job import BatchJobInterface
+from qq_lib.core.config import CFG
+from qq_lib.properties.states import BatchState
+
+from .state import WorkflowState
+
+
+class WorkflowPresenter:
+    """
+    Presents the progress of the steps of a submitted workflow.
+    """
+
+    def __init__(self, state: WorkflowState, jobs: list[BatchJobInterface]):
+        """
+        Initialize the presenter.
+
+        Args:
+            state (WorkflowState): State of the workflow.
+            jobs (list[BatchJobInterface]): Batch jobs of the user. Jobs that do not
+                belong to the workflow are ignored.
+        """
+        self._state = state
+        self._jobs = {job.getId(): job for job in jobs}
+
+    def createSummaryTable(self) -> Table:
+        """
+        Create a table summarizing the states of the jobs of each workflow step.
+
+        Jobs unknown to the batch system are counted as unknown,
+        jobs that were never submitted are counted separately.
+
+        Returns:
+            Table: A Rich table with one row per workflow step.
+        """
+        table = Table(
+            title=f"Workflow {self._state.workflow.name}",
+            box=None,
+            padding=(0, 2),
+            header_style=CFG.presenter.key_style,
+        )
+        table.add_column("Step", style=CFG.presenter.key_style)
+        table.add_column("Jobs", justify="right", style=CFG.presenter.value_style)
+        table.add_column("States")
+
+        for name, results in self._state.steps.items():
+            counts: dict[BatchState, int] = {}
+            not_submitted = 0
+            for result in results:
+                if not result.job_id:
+                    not_submitted += 1
+                    continue
+
+                job = self._jobs.get(result.job_id)
+                job_state = job.getState() if job else BatchState.UNKNOWN
+                counts[job_state] = counts.get(job_state, 0) + 1
+
+            states = Text(" ").join(
+                Text(f"{count} {state}", style=state.color)
+                for state, count in sorted(counts.items(), key=lambda x: x[0].value)
+            )
+            if not_submitted:
+                states.append(
+                    f"{' ' if counts else ''}{not_submitted} not submitted",
+                    style=CFG.presenter.notes_style,
+                )
+
+            table.add_row(name, str(len(results)), states)
+
+        return table
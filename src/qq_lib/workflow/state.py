@@ -0,0 +1,150 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Persistent state of submitted workflows.
+
+After a workflow is submitted, the jobs submitted for each of its steps are recorded
+in a state file (`.qqworkflow`) placed next to the workflow file. The state file
+allows `qq jobs --workflow` to summarize the progress of the workflow.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Self
+
+import yaml
+
+from qq_lib.core.config import CFG
+from qq_lib.core.error import QQError
+from qq_lib.core.logger import get_logger
+from qq_lib.submit.submitter import SubmitResult
+
+logger = get_logger(__name__)
+
+
+class WorkflowState:
+    """
+    Jobs submitted for the individual steps of a workflow.
+    """
+
+    def __init__(
+        self,
+        workflow: Path,
+        steps: dict[str, list[SubmitResult]],
+        submission_time: datetime | None = None,
+    ):
+        """
+        Initialize the workflow state.
+
+        Args:
+            workflow (Path): Path to the workflow file.
+            steps (dict[str, list[SubmitResult]]): Results of the submissions
+                of the individual steps in topological order.
+            submission_time (datetime | None): Time of the submission. Defaults to now.
+        """
+        self.workflow = workflow
+        self.steps = steps
+        self.submission_time = submission_time or datetime.now()
+
+    @classmethod
+    def fromFile(cls, file: Path) -> Self:
+        """
+        Load the workflow state from a file.
+
+        Args:
+            file (Path): Path to the state file.
+
+        Returns:
+            WorkflowState: The loaded workflow state.
+
+        Raises:
+            QQError: If the file does not exist or is not a valid state file.
+        """
+        logger.debug(f"Loading workflow state from '{file}'.")
+        try:
+            with file.open("r") as input:
+                data = yaml.safe_load(input)
+
+            return cls(
+                Path(data["workflow"]),
+                {
+                    name: [
+                        SubmitResult(
+                            Path(job["input_dir"]),
+                            job_id=job.get("job_id"),
+                            error=job.get("error"),
+                        )
+                        for job in jobs
+                    ]
+                    for name, jobs in data["steps"].items()
+                },
+                datetime.strptime(data["submission_time"], CFG.date_formats.standard),
+            )
+        except Exception as e:
+            raise QQError(f"Could not read workflow state '{file}': {e}.") from e
+
+    def toFile(self, file: Path) -> None:
+        """
+        Write the workflow state into a file.
+
+        Args:
+            file (Path): Path to the state file.
+
+        Raises:
+            QQError: If the file cannot be written.
+        """
+        logger.debug(f"Exporting workflow state into '{file}'.")
+        data = {
+            "workflow": str(self.workflow),
+            "submission_time": self.submission_time.strftime(CFG.date_formats.standard),
+            "steps": {
+                name: [
+                    {
+                        k: v
+                        for k, v in (
+                            ("input_dir", str(r.input_dir)),
+                            ("job_id", r.job_id),
+                            ("error", r.error),
+                        )
+                        if v is not None
+                    }
+                    for r in results
+                ]
+                for name, results in self.steps.items()
+            },
+        }
+
+        try:
+            with file.open("w") as output:
+                output.write("# qq workflow state file\n")
+                yaml.dump(data, output, default_flow_style=False, sort_keys=False)
+        except Exception as e:
+            raise QQError(f"Could not write workflow state '{file}': {e}.") from e
+
+    def getJobIds(self) -> dict[str, str]:
+        """
+        Get the identifiers of all submitted jobs of the workflow.
+
+        Returns:
+            dict[str, str]: Job identifiers mapped to the names of their steps.
+        """
+        return {
+            r.job_id: name
+            for name, results in self.steps.items()
+            for r in results
+            if r.job_id
+        }
+
+    @staticmethod
+    def getPath(workflow: Path) -> Path:
+        """
+        Get the path to the state file of a workflow.
+
+        Args:
+            workflow (Path): Path to the workflow file or to the state file itself.
+
+        Returns:
+            Path: Path to the state file.
+        """
+        return workflow.with_suffix(CFG.suffixes.qq_workflow)
@@ -0,0 +1,399 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+"""
+Multi-step workflows submitted as a dependency graph.
+
+A workflow file (YAML or TOML) describes steps of a pipeline. Each step submits
+a script from one or more directories with its own options of `qq submit` and may
+depend on other steps. `Workflow` submits all steps up front: the steps are ordered
+topologically, the edges of the graph are translated into dependencies of the batch
+system, and mutually independent steps are submitted concurrently.
+
+Example of a workflow file:
+
+    steps:
+      prep:
+        script: prep.sh
+        dir: prep
+        options: {ncpus: 8, walltime: 2h}
+      production:
+        script: run.sh
+        dirs: [run1, run2, run3]
+        after: [prep]
+      analysis:
+        script: analyze.sh
+        dir: analysis
+        after: [production]
+        depend_type: afterany
+"""
+
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Self
+
+import click
+import yaml
+
+from qq_lib.core.error import QQError
+from qq_lib.core.logger import get_logger
+from qq_lib.properties.depend import Depend, DependType
+from qq_lib.submit.factory import SubmitterFactory
+from qq_lib.submit.submitter import SubmitResult, Submitter
+
+from .state import WorkflowState
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class WorkflowStep:
+    """
+    A single step of a workflow.
+    """
+
+    # Name of the step.
+    name: str
+
+    # Path to the script relative to each of the input directories.
+    script: Path
+
+    # Input directories of the step.
+    dirs: list[Path]
+
+    # Options of `qq submit` (resources, queue, ...) used for the step.
+    options: dict[str, object] = field(default_factory=dict)
+
+    # Names of the steps this step depends on.
+    after: list[str] = field(default_factory=list)
+
+    # Type of the dependency on the steps listed in `after`.
+    depend_type: DependType = DependType.AFTER_SUCCESS
+
+
+class Workflow:
+    """
+    Dependency graph of workflow steps.
+    """
+
+    # keys allowed in the definition of a step
+    _STEP_KEYS = {"script", "dir", "dirs", "options", "after", "depend_type"}
+
+    # options of `qq submit` that cannot be used in a step
+    _FORBIDDEN_OPTIONS = {"script", "dirs", "array"}
+
+    def __init__(self, file: Path, steps: list[WorkflowStep]):
+        """
+        Initialize the workflow and validate its dependency graph.
+
+        Args:
+            file (Path): Path to the workflow file.
+            steps (list[WorkflowStep]): Steps of the workflow.
+
+        Raises:
+            QQError: If the workflow has no steps, a step depends on an unknown step,
+                or the dependencies contain a cycle.
+        """
+        self._file = file.resolve()
+        self._steps = {step.name: step for step in steps}
+
+        if not self._steps:
+            raise QQError(f"Workflow '{file}' contains no steps.")
+
+        for step in steps:
+            if unknown := [name for name in step.after if name not in self._steps]:
+                raise QQError(
+                    f"Step '{step.name}' depends on unknown steps: {', '.join(unknown)}."
+                )
+
+        self._levels = self._getLevels()
+
+    @classmethod
+    def fromFile(cls, file: Path) -> Self:
+        """
+        Load a workflow from a YAML or TOML file.
+
+        Input directories of the steps are relative to the directory of the workflow file.
+
+        Args:
+            file (Path): Path to the workflow file.
+
+        Returns:
+            Workflow: The loaded workflow.
+
+        Raises:
+            QQError: If the file cannot be read or parsed or if the workflow is invalid.
+        """
+        try:
+            if file.suffix == ".toml":
+                with file.open("rb") as input:
+                    data = tomllib.load(input)
+            else:
+                with file.open("r") as input:
+                    data = yaml.safe_load(input)
+        except Exception as e:
+            raise QQError(f"Could not read workflow file '{file}': {e}.") from e
+
+        if not isinstance(data, dict) or not isinstance(
+            steps := data.get("steps"), dict
+        ):
+            raise QQError(f"Workflow file '{file}' does not define any steps.")
+
+        base = file.resolve().parent
+        return cls(
+            file, [cls._parseStep(name, raw, base) for name, raw in steps.items()]
+        )
+
+    def getSteps(self) -> list[WorkflowStep]:
+        """
+        Get the steps of the workflow in topological order.
+
+        Returns:
+            list[WorkflowStep]: Steps ordered so that each step follows the steps it depends on.
+        """
+        return [step for level in self._levels for step in level]
+
+    def submit(self, max_workers: int | None = None) -> WorkflowState:
+        """
+        Submit all steps of the workflow.
+
+        Steps are submitted level by level. All steps of a level only depend on the steps
+        of previous levels and are submitted concurrently. A step is not submitted
+        if any job of a step it depends on was not submitted.
+
+        The state of the workflow is written next to the workflow file after each level,
+        so that jobs which were already submitted are recorded even if a later level fails.
+
+        Args:
+            max_workers (int | None): Maximal number of jobs submitted at the same time.
+                Defaults to `CFG.submitter.max_workers`.
+
+        Returns:
+            WorkflowState: Jobs submitted for each step.
+
+        Raises:
+            QQError: If the workflow has already been submitted or its state cannot be written.
+        """
+        state_file = WorkflowState.getPath(self._file)
+        if state_file.exists():
+            raise QQError(
+                f"Workflow state file '{state_file}' already exists. Is the workflow already submitted?"
+            )
+
+        results: dict[str, list[SubmitResult]] = {}
+        try:
+            for level in self._levels:
+                self._submitLevel(level, results, max_workers)
+                self._getState(results).toFile(state_file)
+        except BaseException:
+            # jobs that are already queued must not be lost
+            if any(r.job_id for step_results in results.values() for r in step_results):
+                logger.debug(f"Recording submitted jobs in '{state_file}'.")
+                self._getState(results).toFile(state_file)
+            raise
+
+        return self._getState(results)
+
+    def _submitLevel(
+        self,
+        level: list[WorkflowStep],
+        results: dict[str, list[SubmitResult]],
+        max_workers: int | None,
+    ) -> None:
+        """
+        Submit mutually independent steps of the workflow.
+
+        Args:
+            level (list[WorkflowStep]): Steps to submit.
+            results (dict[str, list[SubmitResult]]): Results of the already submitted steps.
+                Results of the submitted steps are added to it.
+            max_workers (int | None): Maximal number of jobs submitted at the same time.
+        """
+        submitters: list[tuple[str, Submitter]] = []
+        for step in level:
+            if not_submitted := [
+                name
+                for name in step.after
+                if not results[name] or any(not r.job_id for r in results[name])
+            ]:
+                error = f"Steps it depends on were not submitted: {', '.join(not_submitted)}."
+                results[step.name] = [
+                    SubmitResult(d.resolve(), error=error) for d in step.dirs
+                ]
+                continue
+
+            logger.debug(f"Preparing submission of step '{step.name}'.")
+            step_submitters, results[step.name] = SubmitterFactory.makeSubmitters(
+                step.script, step.dirs, **self._getSubmitOptions(step, results)
+            )
+            submitters.extend((step.name, s) for s in step_submitters)
+
+        for (name, _), result in zip(
+            submitters,
+            Submitter.submitMany([s for _, s in submitters], max_workers),
+        ):
+            results[name].append(result)
+
+    def _getState(self, results: dict[str, list[SubmitResult]]) -> WorkflowState:
+        """
+        Get the state of the workflow from the results of the submitted steps.
+
+        Args:
+            results (dict[str, list[SubmitResult]]): Results of the already submitted steps.
+
+        Returns:
+            WorkflowState: Jobs submitted for each step, in topological order.
+        """
+        return WorkflowState(
+            self._file,
+            {
+                step.name: results[step.name]
+                for step in self.getSteps()
+                if step.name in results
+            },
+        )
+
+    def _getLevels(self) -> list[list[WorkflowStep]]:
+        """
+        Order the steps into levels of mutually independent steps.
+
+        Returns:
+            list[list[WorkflowStep]]: Levels of steps. Each step only depends
+            on steps of the previous levels.
+
+        Raises:
+            QQError: If the dependencies of the steps contain a cycle.
+        """
+        levels: list[list[WorkflowStep]] = []
+        placed: set[str] = set()
+        remaining = list(self._steps.values())
+
+        while remaining:
+            level = [s for s in remaining if all(a in placed for a in s.after)]
+            if not level:
+                raise QQError(
+                    f"Dependencies of workflow steps contain a cycle: {', '.join(s.name for s in remaining)}."
+                )
+
+            levels.append(level)
+            placed.update(s.name for s in level)
+            remaining = [s for s in remaining if s.name not in placed]
+
+        return levels
+
+    @staticmethod
+    def _getSubmitOptions(
+        step: WorkflowStep, results: dict[str, list[SubmitResult]]
+    ) -> dict[str, object]:
+        """
+        Get the options of `qq submit` for a step including its dependencies.
+
+        Args:
+            step (WorkflowStep): The step to submit.
+            results (dict[str, list[SubmitResult]]): Results of the already submitted steps.
+
+        Returns:
+            dict[str, object]: Keyword arguments for `SubmitterFactory`.
+        """
+        options = dict(step.options)
+        if step.after:
+            depend = Depend(
+                step.depend_type,
+                [r.job_id for name in step.after for r in results[name] if r.job_id],
+            )
+            options["depend"] = " ".join(
+                filter(None, [str(options.get("depend") or ""), depend.toStr()])
+            )
+
+        return options
+
+    @staticmethod
+    def _convertOption(name: str, param: click.Parameter, value: object) -> object:
+        """
+        Convert the value of an option of a step the same way `qq submit` converts it.
+
+        Args:
+            name (str): Name of the step.
+            param (click.Parameter): The corresponding parameter of `qq submit`.
+            value (object): Value of the option loaded from the workflow file.
+
+        Returns:
+            object: The converted value.
+
+        Raises:
+            QQError: If the value is not a scalar or cannot be converted.
+        """
+        if value is None:
+            return None
+
+        if isinstance(value, list | dict):
+            raise QQError(
+                f"Option '{param.name}' of step '{name}' must be a single value, not '{value}'."
+            )
+
+        try:
+            return param.type.convert(value, param, None)
+        except click.BadParameter as e:
+            raise QQError(
+                f"Invalid value of option '{param.name}' of step '{name}': {e.message}"
+            ) from e
+
+    @staticmethod
+    def _parseStep(name: str, raw: object, base: Path) -> WorkflowStep:
+        """
+        Parse the definition of a workflow step.
+
+        Args:
+            name (str): Name of the step.
+            raw (object): Definition of the step loaded from the workflow file.
+            base (Path): Directory relative to which the input directories are resolved.
+
+        Returns:
+            WorkflowStep: The parsed step.
+
+        Raises:
+            QQError: If the definition of the step is invalid.
+        """
+        if not isinstance(raw, dict) or not raw.get("script"):
+            raise QQError(f"Step '{name}' does not specify a script.")
+
+        if unknown := set(raw) - Workflow._STEP_KEYS:
+            raise QQError(
+                f"Step '{name}' contains unknown keys: {', '.join(sorted(unknown))}."
+            )
+
+        if "dir" in raw and "dirs" in raw:
+            raise QQError(f"Step '{name}' cannot specify both 'dir' and 'dirs'.")
+
+        dirs = raw.get("dirs", [raw.get("dir", ".")])
+        after = raw.get("after", [])
+        options = raw.get("options", {})
+        if (
+            not isinstance(dirs, list)
+            or not dirs
+            or not isinstance(after, list | str)
+            or not isinstance(options, dict)
+        ):
+            raise QQError(f"Step '{name}' is not a valid workflow step.")
+
+        params = SubmitterFactory.getOptionsByName()
+        options = {str(k).replace("-", "_"): v for k, v in options.items()}
+        if unknown := set(options) - (set(params) - Workflow._FORBIDDEN_OPTIONS):
+            raise QQError(
+                f"Step '{name}' uses unsupported options: {', '.join(sorted(unknown))}."
+            )
+
+        options = {
+            key: Workflow._convertOption(name, params[key], value)
+            for key, value in options.items()
+        }
+
+        return WorkflowStep(
+            name=name,
+            script=Path(raw["script"]),
+            dirs=[base / str(d) for d in dirs],
+            options=options,
+            after=[after] if isinstance(after, str) else [str(a) for a in after],
+            depend_type=DependType.fromStr(str(raw.get("depend_type", "afterok"))),
+        )
@@ -2,13 +2,17 @@
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
 import re
+import shutil
 import socket
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from qq_lib.archive.archiver import CFG, Archiver
+from qq_lib.archive.index import ArchiveIndex
 from qq_lib.batch.pbs import PBS
+from qq_lib.core.error import QQError
 
 
 def test_remove_files(tmp_path):
@@ -477,3 +481,333 @@ def test_archive_runtime_files_nothing_to_archive(
     assert not (archive_dir / "other.txt").exists()
     assert not (archive_dir / "script+0006.qqinfo").exists()
     assert not (archive_dir / "script+0004.qqout").exists()
+
+
+def _fake_sync_selected(src_dir, dest_dir, _src_host, _dest_host, files):
+    for f in files:
+        shutil.copy2(src_dir / f.name, dest_dir / f.name)
+
+
+def _read_index(archive_dir):
+    return ArchiveIndex.fromString((archive_dir / CFG.archiver.index_file).read_text())
+
+
+def test_archive_to_builds_index(monkeypatch, archiver, archive_dir, work_dir):
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+    archiver.makeArchiveDir()
+    # file archived before the index existed
+    touch_files(archive_dir, ["job0001.dat"])
+    touch_files(work_dir, ["job0002.dat", "job0002.tpr", "other.txt"])
+
+    with patch.object(PBS, "syncSelected", side_effect=_fake_sync_selected):
+        archiver.toArchive(work_dir)
+
+    index = _read_index(archive_dir)
+    assert index.getFiles(1) == ["job0001.dat"]
+    assert sorted(index.getFiles(2)) == ["job0002.dat", "job0002.tpr"]
+    assert not list(archive_dir.glob("*.tmp"))
+
+
+def test_archive_to_appends_to_index(monkeypatch, archiver, archive_dir, work_dir):
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+    archiver.makeArchiveDir()
+    (archive_dir / CFG.archiver.index_file).write_text("1\tjob0001.dat\n")
+    touch_files(work_dir, ["job0002.dat"])
+
+    with (
+        patch.object(PBS, "syncSelected", side_effect=_fake_sync_selected),
+        patch.object(Archiver, "_writeIndex") as mock_write,
+        patch.object(Archiver, "_scanIndex") as mock_scan,
+    ):
+        archiver.toArchive(work_dir)
+
+    # the index is not rebuilt nor rewritten
+    mock_write.assert_not_called()
+    mock_scan.assert_not_called()
+    assert (archive_dir / CFG.archiver.index_file).read_text() == (
+        "1\tjob0001.dat\n2\tjob0002.dat\n"
+    )
+
+
+def test_archive_append_index_local(archive_dir, input_dir):
+    archiver = Archiver(archive_dir, "job%04d", socket.gethostname(), input_dir, PBS)
+    archive_dir.mkdir()
+    (archive_dir / CFG.archiver.index_file).write_text("1\tjob0001.dat\n")
+
+    with patch("qq_lib.archive.archiver.append_to_file") as mock_append:
+        archiver._updateIndex([archive_dir / "job0002.dat"])
+
+    mock_append.assert_called_once_with(
+        archive_dir / CFG.archiver.index_file, "2\tjob0002.dat\n"
+    )
+
+
+def test_archive_append_index_remote(archive_dir, input_dir):
+    archiver = Archiver(archive_dir, "job%04d", "remote.host", input_dir, PBS)
+
+    with (
+        patch.object(PBS, "isRemoteFile", return_value=True) as mock_exists,
+        patch.object(PBS, "readRemoteFile") as mock_read,
+        patch.object(PBS, "appendRemoteFile") as mock_append,
+        patch.object(PBS, "writeRemoteFile") as mock_write,
+    ):
+        archiver._updateIndex([archive_dir / "job0002.dat"])
+
+    # the existence of the index is checked without downloading it
+    mock_exists.assert_called_once_with(
+        "remote.host", archive_dir / CFG.archiver.index_file
+    )
+    mock_read.assert_not_called()
+    mock_append.assert_called_once_with(
+        "remote.host", archive_dir / CFG.archiver.index_file, "2\tjob0002.dat\n"
+    )
+    mock_write.assert_not_called()
+
+
+def test_archive_index_is_read_once_and_kept_in_sync(archive_dir, input_dir):
+    archiver = Archiver(archive_dir, "job%04d", "remote.host", input_dir, PBS)
+
+    with (
+        patch.object(
+            PBS, "readRemoteFile", return_value="1\tjob0001.dat\n"
+        ) as mock_read,
+        patch.object(PBS, "isRemoteFile") as mock_exists,
+        patch.object(PBS, "appendRemoteFile"),
+    ):
+        assert archiver._getArchivedFiles(1) == [archive_dir / "job0001.dat"]
+        archiver._updateIndex([archive_dir / "job0002.dat"])
+        assert archiver._getArchivedFiles(2) == [archive_dir / "job0002.dat"]
+
+    mock_read.assert_called_once()
+    mock_exists.assert_not_called()
+
+
+def test_archive_runtime_files_updates_index(
+    monkeypatch, archiver, input_dir, archive_dir
+):
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+    archiver.makeArchiveDir()
+    (archive_dir / CFG.archiver.index_file).write_text("5\tjob0005.dat\n")
+    touch_files(input_dir, ["script+0005.qqinfo", "script+0005.out"])
+
+    archiver.archiveRunTimeFiles("script\\+0005", 5)
+
+    assert sorted(_read_index(archive_dir).getFiles(5)) == [
+        "job0005.dat",
+        "job0005.out",
+        "job0005.qqinfo",
+    ]
+
+
+def test_archive_to_does_not_index_regex_format(
+    monkeypatch, input_dir, archive_dir, work_dir
+):
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+    archiver = Archiver(archive_dir, r"job\d+", "fake_host", input_dir, PBS)
+    archiver.makeArchiveDir()
+    touch_files(work_dir, ["job2.dat"])
+
+    with patch.object(PBS, "syncSelected", side_effect=_fake_sync_selected):
+        archiver.toArchive(work_dir)
+
+    assert not (archive_dir / CFG.archiver.index_file).exists()
+
+
+def test_archive_from_uses_index(monkeypatch, archiver, archive_dir, work_dir):
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+    archiver.makeArchiveDir()
+    touch_files(archive_dir, ["job0003.dat", "job0003.qqinfo", "job0003.extra"])
+    (archive_dir / CFG.archiver.index_file).write_text(
+        "3\tjob0003.dat\n3\tjob0003.qqinfo\n"
+    )
+
+    with (
+        patch.object(PBS, "syncSelected") as mock_sync,
+        patch.object(Archiver, "_getFiles") as mock_get_files,
+    ):
+        archiver.fromArchive(work_dir, cycle=3)
+
+    mock_get_files.assert_not_called()
+    assert mock_sync.call_args.args[4] == [archive_dir / "job0003.dat"]
+
+
+def test_archive_from_falls_back_to_scan_for_unindexed_cycle(
+    monkeypatch, archiver, archive_dir, work_dir
+):
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+    archiver.makeArchiveDir()
+    touch_files(archive_dir, ["job0003.dat", "job0004.dat"])
+    (archive_dir / CFG.archiver.index_file).write_text("3\tjob0003.dat\n")
+
+    with patch.object(PBS, "syncSelected") as mock_sync:
+        archiver.fromArchive(work_dir, cycle=4)
+
+    assert mock_sync.call_args.args[4] == [(archive_dir / "job0004.dat").resolve()]
+
+
+def test_archive_from_scans_without_index(monkeypatch, archiver, archive_dir, work_dir):
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+    archiver.makeArchiveDir()
+    touch_files(archive_dir, ["job0003.dat", "job0004.dat"])
+
+    with patch.object(PBS, "syncSelected") as mock_sync:
+        archiver.fromArchive(work_dir, cycle=3)
+
+    assert mock_sync.call_args.args[4] == [(archive_dir / "job0003.dat").resolve()]
+
+
+def test_archive_rebuild_index(archive_dir, input_dir):
+    archive_dir.mkdir()
+    touch_files(archive_dir, ["job0001.dat", "job0002.dat", "job0002.qqinfo", "x.txt"])
+    (archive_dir / CFG.archiver.index_file).write_text("7\tjob0007.dat\n")
+
+    archiver = Archiver(archive_dir, "job%04d", socket.gethostname(), input_dir, PBS)
+    index = archiver.rebuildIndex()
+
+    assert index.getCycles() == [1, 2]
+    assert len(index) == 3
+    assert _read_index(archive_dir).getCycles() == [1, 2]
+    assert not list(archive_dir.glob("*.tmp"))
+
+
+def test_archive_rebuild_index_regex_format_raises(archive_dir, input_dir):
+    archive_dir.mkdir()
+    archiver = Archiver(archive_dir, r"job\d+", socket.gethostname(), input_dir, PBS)
+
+    with pytest.raises(QQError, match="cannot be indexed"):
+        archiver.rebuildIndex()
+
+
+def test_archive_write_index_remote(archive_dir, input_dir):
+    archiver = Archiver(archive_dir, "job%04d", "remote.host", input_dir, PBS)
+
+    with (
+        patch.object(PBS, "writeRemoteFile") as mock_write,
+        patch.object(PBS, "moveRemoteFiles") as mock_move,
+    ):
+        archiver._writeIndex("1\tjob0001.dat\n")
+
+    tmp_file = mock_write.call_args.args[1]
+    assert mock_write.call_args.args[0] == "remote.host"
+    assert tmp_file.parent == archive_dir
+    mock_move.assert_called_once_with(
+        "remote.host", [tmp_file], [archive_dir / CFG.archiver.index_file]
+    )
+
+
+def test_archive_read_index_missing_returns_none(archive_dir, input_dir):
+    archiver = Archiver(archive_dir, "job%04d", "remote.host", input_dir, PBS)
+
+    with patch.object(PBS, "readRemoteFile", side_effect=QQError("missing")):
+        assert archiver._readIndex() is None
+
+
+@pytest.fixture
+def packed_archiver(input_dir, archive_dir):
+    return Archiver(
+        archive=archive_dir,
+        archive_format="job%04d",
+        input_machine=socket.gethostname(),
+        input_dir=input_dir,
+        batch_system=PBS,
+        pack="gz",
+    )
+
+
+def test_archive_unsupported_pack_raises(input_dir, archive_dir):
+    with pytest.raises(QQError, match="Unsupported pack format"):
+        Archiver(archive_dir, "job%04d", "fake_host", input_dir, PBS, pack="rar")
+
+
+def test_archive_to_packs_files_per_cycle(
+    monkeypatch, packed_archiver, archive_dir, work_dir
+):
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+    packed_archiver.makeArchiveDir()
+    touch_files(work_dir, ["job0002.log", "job0003.gro", "job0003.tpr", "other.txt"])
+
+    with patch.object(PBS, "syncSelected", side_effect=_fake_sync_selected):
+        packed_archiver.toArchive(work_dir)
+
+    assert sorted(f.name for f in archive_dir.iterdir()) == [
+        CFG.archiver.index_file,
+        "job0002.tar.gz",
+        "job0003.tar.gz",
+    ]
+    assert _read_index(archive_dir).getFiles(3) == ["job0003.tar.gz"]
+    # archived files and local bundles are removed from the working directory
+    assert sorted(f.name for f in work_dir.iterdir()) == ["other.txt"]
+
+
+def test_archive_to_packs_into_new_bundle_for_archived_cycle(
+    monkeypatch, packed_archiver, archive_dir, work_dir
+):
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+    packed_archiver.makeArchiveDir()
+    touch_files(archive_dir, ["job0003.tar.gz"])
+    (archive_dir / CFG.archiver.index_file).write_text("3\tjob0003.tar.gz\n")
+    touch_files(work_dir, ["job0003.log"])
+
+    with patch.object(PBS, "syncSelected", side_effect=_fake_sync_selected):
+        packed_archiver.toArchive(work_dir)
+
+    assert (archive_dir / "job0003_2.tar.gz").is_file()
+    assert _read_index(archive_dir).getFiles(3) == [
+        "job0003.tar.gz",
+        "job0003_2.tar.gz",
+    ]
+
+
+def test_archive_from_extracts_cycle_from_bundles(
+    monkeypatch, packed_archiver, work_dir
+):
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+    packed_archiver.makeArchiveDir()
+    (work_dir / "job0003.gro").write_text("coordinates")
+    touch_files(work_dir, ["job0003.tpr", "job0002.log"])
+
+    with patch.object(PBS, "syncSelected", side_effect=_fake_sync_selected):
+        packed_archiver.toArchive(work_dir)
+
+    assert not list(work_dir.iterdir())
+
+    with patch.object(PBS, "syncSelected") as mock_sync:
+        packed_archiver.fromArchive(work_dir, cycle=3)
+
+    # local bundles are extracted directly from the archive
+    mock_sync.assert_not_called()
+    assert sorted(f.name for f in work_dir.iterdir()) == ["job0003.gro", "job0003.tpr"]
+    assert (work_dir / "job0003.gro").read_text() == "coordinates"
+
+
+def test_archive_from_copies_remote_bundle_before_extracting(
+    monkeypatch, input_dir, archive_dir, work_dir
+):
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+    archiver = Archiver(archive_dir, "job%04d", "fake_host", input_dir, PBS, "xz")
+    archiver.makeArchiveDir()
+    touch_files(work_dir, ["job0004.gro", "job0004.qqinfo"])
+    archiver._packer.pack(
+        [work_dir / "job0004.gro", work_dir / "job0004.qqinfo"],
+        archive_dir / "job0004.tar.xz",
+    )
+    archiver._removeFiles([work_dir / "job0004.gro", work_dir / "job0004.qqinfo"])
+    touch_files(archive_dir, ["job0004.extra"])
+    (archive_dir / CFG.archiver.index_file).write_text(
+        "4\tjob0004.tar.xz\n4\tjob0004.extra\n"
+    )
+
+    with patch.object(
+        PBS, "syncSelected", side_effect=_fake_sync_selected
+    ) as mock_sync:
+        archiver.fromArchive(work_dir, cycle=4)
+
+    assert [call.args[4] for call in mock_sync.call_args_list] == [
+        [archive_dir / "job0004.extra"],
+        [archive_dir / "job0004.tar.xz"],
+    ]
+    # qq runtime files are not extracted and the copied bundle is removed
+    assert sorted(f.name for f in work_dir.iterdir()) == [
+        "job0004.extra",
+        "job0004.gro",
+    ]
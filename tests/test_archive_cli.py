@@ -0,0 +1,108 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from qq_lib.archive.cli import _get_loop_info, reindex
+from qq_lib.batch.pbs import PBS
+from qq_lib.core.config import CFG
+from qq_lib.core.error import QQError
+
+
+def test_reindex_with_explicit_archive_and_format(tmp_path):
+    archive = tmp_path / "storage"
+    archive.mkdir()
+    for name in ["md0001.gro", "md0002.gro", "other.txt"]:
+        (archive / name).touch()
+
+    with patch("qq_lib.archive.cli.BatchMeta.fromEnvVarOrGuess", return_value=PBS):
+        result = CliRunner().invoke(
+            reindex, [str(archive), "--archive-format", "md%04d"]
+        )
+
+    assert result.exit_code == 0
+    assert (archive / CFG.archiver.index_file).read_text() == (
+        "1\tmd0001.gro\n2\tmd0002.gro\n"
+    )
+
+
+def test_reindex_uses_loop_job_in_current_directory(tmp_path, monkeypatch):
+    archive = tmp_path / "storage"
+    archive.mkdir()
+    (archive / "job0003.gro").touch()
+    monkeypatch.chdir(tmp_path)
+
+    loop_info = MagicMock(archive=archive, archive_format="job%04d")
+    with (
+        patch("qq_lib.archive.cli._get_loop_info", return_value=loop_info),
+        patch("qq_lib.archive.cli.BatchMeta.fromEnvVarOrGuess", return_value=PBS),
+    ):
+        result = CliRunner().invoke(reindex, [])
+
+    assert result.exit_code == 0
+    assert (archive / CFG.archiver.index_file).read_text() == "3\tjob0003.gro\n"
+
+
+def test_reindex_missing_archive_fails(tmp_path):
+    result = CliRunner().invoke(
+        reindex, [str(tmp_path / "missing"), "--archive-format", "md%04d"]
+    )
+
+    assert result.exit_code == CFG.exit_codes.default
+
+
+def test_reindex_without_loop_job_fails(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(reindex, [])
+
+    assert result.exit_code == CFG.exit_codes.default
+
+
+def test_get_loop_info_returns_newest_loop_job(tmp_path):
+    files = [tmp_path / "a.qqinfo", tmp_path / "b.qqinfo"]
+    loop_info = MagicMock()
+
+    informers = {
+        files[0]: MagicMock(info=MagicMock(loop_info=MagicMock())),
+        files[1]: MagicMock(info=MagicMock(loop_info=loop_info)),
+    }
+
+    with (
+        patch("qq_lib.archive.cli.get_info_files", return_value=files),
+        patch(
+            "qq_lib.archive.cli.Informer.fromFile",
+            side_effect=lambda f: informers[f],
+        ),
+    ):
+        assert _get_loop_info(tmp_path) is loop_info
+
+
+def test_get_loop_info_skips_standard_jobs_and_invalid_files(tmp_path):
+    files = [tmp_path / "a.qqinfo", tmp_path / "b.qqinfo", tmp_path / "c.qqinfo"]
+    loop_info = MagicMock()
+
+    def from_file(f: Path):
+        if f == files[2]:
+            raise QQError("invalid")
+        if f == files[1]:
+            return MagicMock(info=MagicMock(loop_info=None))
+        return MagicMock(info=MagicMock(loop_info=loop_info))
+
+    with (
+        patch("qq_lib.archive.cli.get_info_files", return_value=files),
+        patch("qq_lib.archive.cli.Informer.fromFile", side_effect=from_file),
+    ):
+        assert _get_loop_info(tmp_path) is loop_info
+
+
+def test_get_loop_info_raises_without_loop_job(tmp_path):
+    with (
+        patch("qq_lib.archive.cli.get_info_files", return_value=[]),
+        pytest.raises(QQError, match="No loop job found"),
+    ):
+        _get_loop_info(tmp_path)
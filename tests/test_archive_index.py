@@ -0,0 +1,88 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+import pytest
+
+from qq_lib.archive.index import ArchiveIndex
+
+
+def test_archive_index_add_and_get_files():
+    index = ArchiveIndex()
+    index.add(3, ["job0003.gro", "job0003.tpr"])
+    index.add(3, ["job0003.gro", "job0003.cpt"])
+    index.add(4, ["job0004.gro"])
+
+    assert index.getFiles(3) == ["job0003.gro", "job0003.tpr", "job0003.cpt"]
+    assert index.getFiles(4) == ["job0004.gro"]
+    assert index.getFiles(5) == []
+    assert index.getCycles() == [3, 4]
+    assert len(index) == 4
+
+
+def test_archive_index_get_files_returns_copy():
+    index = ArchiveIndex({1: ["job0001.gro"]})
+    index.getFiles(1).append("job0001.tpr")
+
+    assert index.getFiles(1) == ["job0001.gro"]
+
+
+def test_archive_index_string_roundtrip():
+    index = ArchiveIndex({2: ["job0002.gro"], 1: ["job0001.gro", "job0001.tpr"]})
+
+    content = index.toString()
+    assert content == "1\tjob0001.gro\n1\tjob0001.tpr\n2\tjob0002.gro\n"
+
+    restored = ArchiveIndex.fromString(content)
+    assert restored.getFiles(1) == ["job0001.gro", "job0001.tpr"]
+    assert restored.getFiles(2) == ["job0002.gro"]
+
+
+def test_archive_index_from_string_ignores_malformed_lines():
+    content = "1\tjob0001.gro\ngarbage\nx\tjob0002.gro\n\n2\tjob0002.gro\n3\t"
+
+    index = ArchiveIndex.fromString(content)
+
+    assert index.getCycles() == [1, 2]
+    assert len(index) == 2
+
+
+def test_archive_index_from_string_repeated_entries():
+    index = ArchiveIndex.fromString("1\tjob0001.gro\n1\tjob0001.gro\n")
+
+    assert index.getFiles(1) == ["job0001.gro"]
+
+
+def test_archive_index_format_entries_appends_lines():
+    content = ArchiveIndex({1: ["job0001.gro"]}).toString()
+    content += ArchiveIndex.formatEntries({2: ["job0002.gro"]})
+
+    assert ArchiveIndex.fromString(content).getCycles() == [1, 2]
+
+
+def test_archive_index_from_files():
+    index = ArchiveIndex.fromFiles(
+        ["job0001.gro", "job0002.tpr", "job0002.qqinfo", "other.txt", ".qqindex"],
+        "job%04d",
+    )
+
+    assert index.getFiles(1) == ["job0001.gro"]
+    assert index.getFiles(2) == ["job0002.tpr", "job0002.qqinfo"]
+    assert len(index) == 3
+
+
+@pytest.mark.parametrize(
+    "name, archive_format, expected",
+    [
+        ("job0012.tpr", "job%04d", 12),
+        ("job12.tpr", "job%d", 12),
+        ("md2_0005.gro", "md2_%04d", 5),
+        ("job0003_prev.gro", "job%04d", 3),
+        ("r01_c0003.gro", "r%02d_c%04d", 1),
+        ("job0003.part.gro", "job%04d", 3),
+        ("job12.tpr", "job%04d", None),
+        ("other.txt", "job%04d", None),
+        ("md.2_0005.gro", "md2_%04d", None),
+    ],
+)
+def test_archive_index_get_cycle(name, archive_format, expected):
+    assert ArchiveIndex.getCycle(name, archive_format) == expected
@@ -0,0 +1,87 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+import io
+import tarfile
+from unittest.mock import patch
+
+import pytest
+
+from qq_lib.archive.packer import Packer
+from qq_lib.core.error import QQError
+
+
+def test_packer_unsupported_format_raises():
+    with pytest.raises(QQError, match="Unsupported pack format"):
+        Packer("rar")
+
+
+@pytest.mark.parametrize(
+    "pack, suffix",
+    [("tar", ".tar"), ("gz", ".tar.gz"), ("xz", ".tar.xz"), ("zst", ".tar.zst")],
+)
+def test_packer_suffix_and_is_bundle(tmp_path, pack, suffix):
+    packer = Packer(pack)
+
+    assert packer.suffix == suffix
+    assert packer.isBundle(tmp_path / f"job0001{suffix}")
+    assert not packer.isBundle(tmp_path / "job0001.dat")
+
+
+@pytest.mark.parametrize("pack", ["tar", "gz", "xz"])
+def test_packer_pack_and_extract_roundtrip(tmp_path, pack):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "job0002.gro").write_text("coordinates")
+    (src / "job0002.log").write_text("log")
+    (src / "job0002.dir").mkdir()
+    (src / "job0002.dir" / "nested.txt").write_text("nested")
+
+    packer = Packer(pack)
+    bundle = tmp_path / f"job0002{packer.suffix}"
+    packer.pack([src / "job0002.gro", src / "job0002.log", src / "job0002.dir"], bundle)
+
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    extracted = packer.extract(bundle, dest, lambda name: name != "job0002.log")
+
+    assert extracted == ["job0002.gro", "job0002.dir"]
+    assert (dest / "job0002.gro").read_text() == "coordinates"
+    assert (dest / "job0002.dir" / "nested.txt").read_text() == "nested"
+    assert not (dest / "job0002.log").exists()
+
+
+def test_packer_pack_failure_removes_bundle(tmp_path):
+    packer = Packer("gz")
+    bundle = tmp_path / "job0001.tar.gz"
+
+    with pytest.raises(QQError, match="Could not create bundle"):
+        packer.pack([tmp_path / "missing.dat"], bundle)
+
+    assert not bundle.exists()
+
+
+def test_packer_extract_refuses_unsafe_members(tmp_path):
+    bundle = tmp_path / "job0001.tar"
+    with tarfile.open(bundle, "w") as tar:
+        info = tarfile.TarInfo("../escaped.txt")
+        info.size = 4
+        tar.addfile(info, io.BytesIO(b"data"))
+
+    dest = tmp_path / "dest"
+    dest.mkdir()
+
+    with pytest.raises(QQError, match="Could not extract bundle"):
+        Packer("tar").extract(bundle, dest, lambda _: True)
+
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+def test_packer_zst_unavailable_raises(tmp_path):
+    (tmp_path / "job0001.dat").touch()
+
+    with (
+        patch("qq_lib.archive.packer.load_zstd", return_value=None),
+        pytest.raises(QQError, match="Zstandard compression is not available"),
+    ):
+        Packer("zst").pack([tmp_path / "job0001.dat"], tmp_path / "job0001.tar.zst")
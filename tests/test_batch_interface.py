@@ -54,6 +54,53 @@ def test_navigate_same_host_error():
         mock_run.assert_not_called()
 
 
+@pytest.mark.parametrize("returncode, expected", [(0, True), (1, False)])
+def test_is_remote_file(returncode, expected):
+    with patch(
+        "subprocess.run", return_value=MagicMock(returncode=returncode)
+    ) as mock_run:
+        assert BatchInterface.isRemoteFile("host", Path("/dir/file")) is expected
+
+    assert mock_run.call_args.args[0][-2:] == ["host", "test -f /dir/file"]
+
+
+def test_is_remote_file_ssh_failure_raises():
+    with (
+        patch(
+            "subprocess.run",
+            return_value=MagicMock(returncode=BatchInterface._SSH_FAIL),
+        ),
+        pytest.raises(QQError, match="Could not connect"),
+    ):
+        BatchInterface.isRemoteFile("host", Path("/dir/file"))
+
+
+def test_read_remote_files():
+    with patch(
+        "subprocess.run",
+        return_value=MagicMock(returncode=0, stdout="1content\n\x000\x00"),
+    ) as mock_run:
+        result = BatchInterface.readRemoteFiles(
+            "host", [Path("/dir/file"), Path("/dir/missing")]
+        )
+
+    assert result == ["content\n", None]
+    # both files are read using a single connection
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args[0][-2] == "host"
+
+
+def test_read_remote_files_failure_raises():
+    with (
+        patch(
+            "subprocess.run",
+            return_value=MagicMock(returncode=1, stdout="1", stderr="error"),
+        ),
+        pytest.raises(QQError, match="Could not read remote files"),
+    ):
+        BatchInterface.readRemoteFiles("host", [Path("/dir/file")])
+
+
 def test_guess_pbs():
     BatchMeta._registry.clear()
     BatchMeta.register(PBS)
@@ -200,6 +247,27 @@ def test_sync_with_exclusions_preserves_dest_files(tmp_path):
     assert not (src / "keep.txt").exists()
 
 
+def test_sync_with_exclusions_delete_removes_dest_files(tmp_path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    src.mkdir()
+    dest.mkdir()
+
+    (src / "new.txt").write_text("new_data")
+    (src / "exclude.txt").write_text("exclude")
+    (dest / "removed.txt").write_text("removed")
+    (dest / "exclude.txt").write_text("keep_me")
+
+    BatchInterface.syncWithExclusions(
+        src, dest, None, None, exclude_files=[src / "exclude.txt"], delete=True
+    )
+
+    assert (dest / "new.txt").read_text() == "new_data"
+    assert not (dest / "removed.txt").exists()
+    # excluded files are protected from deletion
+    assert (dest / "exclude.txt").read_text() == "keep_me"
+
+
 def test_sync_with_exclusions_skips_excluded_files(tmp_path):
     src = tmp_path / "src"
     dest = tmp_path / "dest"
@@ -293,6 +361,25 @@ def test_translate_rsync_excluded_command_local_to_local():
     ]
 
 
+def test_translate_rsync_excluded_command_delete():
+    src = Path("/source")
+    dest = Path("/dest")
+    cmd = BatchInterface._translateRsyncExcludedCommand(
+        src, dest, None, None, [Path("skip.txt")], delete=True
+    )
+    assert cmd == [
+        "rsync",
+        "-e",
+        "ssh -o GSSAPIAuthentication=yes -o PasswordAuthentication=no",
+        "-rltD",
+        "--delete",
+        "--exclude",
+        "skip.txt",
+        "/source/",
+        "/dest",
+    ]
+
+
 def test_translate_rsync_excluded_command_local_to_remote():
     src = Path("/source")
     dest = Path("/dest")
@@ -453,6 +540,18 @@ def test_sync_selected_rsync_timeout(tmp_path):
         )
 
 
+def test_sync_selected_uses_provided_timeout(tmp_path):
+    with patch(
+        "qq_lib.batch.interface.interface.subprocess.run",
+        return_value=MagicMock(returncode=0),
+    ) as mock_run:
+        BatchInterface.syncSelected(
+            tmp_path, tmp_path / "dest", None, None, [tmp_path / "a.txt"], timeout=2.5
+        )
+
+    assert mock_run.call_args.kwargs["timeout"] == 2.5
+
+
 def test_translate_rsync_included_command_local_to_local():
     src = Path("/source")
     dest = Path("/dest")
@@ -466,6 +565,8 @@ def test_translate_rsync_included_command_local_to_local():
         "ssh -o GSSAPIAuthentication=yes -o PasswordAuthentication=no",
         "-rltD",
         "--include",
+        "dir/",
+        "--include",
         "file1.txt",
         "--include",
         "file1.txt/***",
@@ -690,3 +791,33 @@ def test_batchinterface_delete_remote_dir_raises_error(mock_run):
         BatchInterface.deleteRemoteDir("remote_host", Path("/remote/dir"))
 
     mock_run.assert_called_once()
+
+
+def test_get_input_cache_dir_is_next_to_work_dir():
+    work_dir = Path("/scratch/project/user/qq-jobs/job_12345")
+
+    assert BatchInterface.getInputCacheDir(work_dir) == Path(
+        f"/scratch/project/user/qq-jobs/{CFG.input_cache.directory}"
+    )
+
+
+def test_get_prestage_dir_is_not_supported_by_default():
+    assert BatchInterface.getPrestageDir("123", "user", "scratch_local") is None
+
+
+def test_translate_rsync_included_command_includes_parent_directories():
+    included = [Path("a/b/file1.txt"), Path("a/file2.txt"), Path("file3.txt")]
+
+    cmd = BatchInterface._translateRsyncIncludedCommand(
+        Path("/source"), Path("/dest"), None, None, included
+    )
+
+    assert cmd[4:10] == [
+        "--include",
+        "a/",
+        "--include",
+        "a/b/",
+        "--include",
+        "a/b/file1.txt",
+    ]
+    assert cmd.count("a/") == 1
@@ -0,0 +1,181 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from unittest.mock import patch
+
+import pytest
+
+from qq_lib.batch.interface.inventory import NodeInventory
+from qq_lib.batch.pbs.node import PBSNode
+from qq_lib.core.error import QQError
+from qq_lib.properties.resources import Resources
+
+
+@pytest.fixture(params=["array", "numpy"])
+def backend(request):
+    if request.param == "numpy":
+        numpy = pytest.importorskip("numpy")
+        with patch("qq_lib.batch.interface.inventory.load_numpy", return_value=numpy):
+            yield request.param
+    else:
+        with patch("qq_lib.batch.interface.inventory.load_numpy", return_value=None):
+            yield request.param
+
+
+def _node(name: str, ncpus: int, assigned: int, **available: str) -> PBSNode:
+    return PBSNode.fromDict(
+        name,
+        {
+            "state": "free",
+            "resources_available.ncpus": str(ncpus),
+            "resources_assigned.ncpus": str(assigned),
+        }
+        | {f"resources_available.{k}": v for k, v in available.items()},
+    )
+
+
+@pytest.fixture
+def nodes():
+    return [
+        _node("cpu1", 64, 0, mem="256gb", scratch_local="1tb", cl_cpu="True"),
+        _node("cpu2", 64, 32, mem="256gb", scratch_local="100gb", cl_cpu="True"),
+        _node(
+            "gpu1",
+            128,
+            0,
+            mem="512gb",
+            ngpus="4",
+            scratch_ssd="2tb",
+            cl_gpu="True",
+            broken="True",
+        ),
+        _node("gpu2", 128, 64, mem="512gb", ngpus="2", cl_gpu="True"),
+    ]
+
+
+def _names(nodes):
+    return [n.getName() for n in nodes]
+
+
+@pytest.mark.usefixtures("backend")
+def test_node_inventory_columns(nodes):
+    inventory = NodeInventory(nodes)
+
+    assert len(inventory) == 4
+    assert list(inventory.getColumn("ncpus")) == [64, 64, 128, 128]
+    assert list(inventory.getColumn("free_cpus")) == [64, 32, 128, 64]
+    assert list(inventory.getColumn("free_gpus")) == [0, 0, 4, 2]
+    # missing resources are stored as zero; sizes are in kilobytes
+    assert list(inventory.getColumn("free_ssd_scratch")) == [0, 0, 2 * 1024**3, 0]
+    assert inventory.withProperty("cl_gpu") == 0b1100
+    assert inventory.withProperty("unknown") == 0
+
+
+@pytest.mark.usefixtures("backend")
+def test_node_inventory_unknown_column_raises(nodes):
+    with pytest.raises(QQError, match="Unknown column"):
+        NodeInventory(nodes).getColumn("walltime")
+
+
+@pytest.mark.usefixtures("backend")
+def test_node_inventory_at_least_and_get_nodes(nodes):
+    inventory = NodeInventory(nodes)
+
+    mask = inventory.atLeast("free_cpus", 64)
+
+    assert mask == 0b1101
+    assert _names(inventory.getNodes(mask)) == ["cpu1", "gpu1", "gpu2"]
+    assert _names(inventory.getNodes()) == ["cpu1", "cpu2", "gpu1", "gpu2"]
+
+
+@pytest.mark.usefixtures("backend")
+def test_node_inventory_any_fits(nodes):
+    inventory = NodeInventory(nodes)
+
+    assert inventory.anyFits("free_local_scratch", 500 * 1024**2)
+    assert not inventory.anyFits("free_local_scratch", 2 * 1024**3)
+
+
+@pytest.mark.usefixtures("backend")
+def test_node_inventory_fit_cpus_gpus_and_memory(nodes):
+    inventory = NodeInventory(nodes)
+
+    assert _names(inventory.fit(Resources(ncpus=64, ngpus=2, mem="256gb"))) == [
+        "gpu1",
+        "gpu2",
+    ]
+    assert _names(inventory.fit(Resources(ncpus=100))) == ["gpu1"]
+
+
+@pytest.mark.usefixtures("backend")
+def test_node_inventory_fit_scratch(nodes):
+    inventory = NodeInventory(nodes)
+
+    assert _names(
+        inventory.fit(Resources(work_dir="scratch_local", work_size="500gb"))
+    ) == ["cpu1"]
+    assert _names(
+        inventory.fit(Resources(work_dir="scratch-ssd", work_size="500gb"))
+    ) == ["gpu1"]
+    # input_dir requires no scratch
+    assert len(inventory.fit(Resources(work_dir="input_dir", work_size="5tb"))) == 4
+
+
+@pytest.mark.usefixtures("backend")
+def test_node_inventory_fit_per_node_requirements(nodes):
+    inventory = NodeInventory(nodes)
+
+    # 128 CPUs split over 2 nodes
+    assert _names(inventory.fit(Resources(nnodes=2, ncpus=128))) == [
+        "cpu1",
+        "gpu1",
+        "gpu2",
+    ]
+    # memory per CPU is multiplied by the CPUs per node
+    assert _names(inventory.fit(Resources(ncpus=64, mem_per_cpu="6gb"))) == [
+        "gpu1",
+        "gpu2",
+    ]
+
+
+@pytest.mark.usefixtures("backend")
+def test_node_inventory_fit_properties(nodes):
+    inventory = NodeInventory(nodes)
+
+    assert _names(inventory.fit(Resources(props="cl_gpu,^broken"))) == ["gpu2"]
+    assert _names(inventory.fit(Resources(props="cl_cpu"))) == ["cpu1", "cpu2"]
+    assert inventory.fit(Resources(props="unknown")) == []
+
+
+@pytest.mark.usefixtures("backend")
+def test_node_inventory_fit_ignores_valued_properties(nodes):
+    inventory = NodeInventory(nodes)
+
+    assert len(inventory.fit(Resources(props="cluster=zenon"))) == 4
+
+
+def test_node_inventory_empty():
+    inventory = NodeInventory([])
+
+    assert len(inventory) == 0
+    assert inventory.fit(Resources(ncpus=1)) == []
+    assert not inventory.anyFits("free_cpus", 0)
+
+
+def test_node_inventory_parse_resources():
+    resources = NodeInventory.parseResources(
+        "ncpus=64,ngpus=2 mem=256gb,work-dir=scratch_local,work-size=500gb,cl_gpu,^broken"
+    )
+
+    assert resources.ncpus == 64
+    assert resources.ngpus == 2
+    assert resources.mem.value == 256 * 1024**2
+    assert resources.work_dir == "scratch_local"
+    assert resources.work_size.value == 500 * 1024**2
+    assert resources.props == {"cl_gpu": "true", "broken": "false"}
+
+
+@pytest.mark.parametrize("spec", ["ncpus=many", "ncpus=4,ncpus=8", "mem=lots"])
+def test_node_inventory_parse_resources_invalid(spec):
+    with pytest.raises(QQError):
+        NodeInventory.parseResources(spec)
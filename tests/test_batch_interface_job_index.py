@@ -0,0 +1,80 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from unittest.mock import MagicMock
+
+from qq_lib.batch.interface.job_index import NodeJobIndex
+
+
+def _job(job_id: str, user: str | None, nodes: list[str] | None) -> MagicMock:
+    job = MagicMock()
+    job.getId.return_value = job_id
+    job.getUser.return_value = user
+    job.getNodes.return_value = nodes
+    job.getShortNodes.return_value = nodes
+    return job
+
+
+def test_node_job_index_maps_nodes_to_jobs():
+    job1 = _job("1", "alice", ["node1.example.org", "node2.example.org"])
+    job2 = _job("2", "bob", ["node2.example.org"])
+    queued = _job("3", "alice", None)
+
+    index = NodeJobIndex([job1, job2, queued])
+
+    assert index.getNodes() == ["node1", "node2"]
+    assert index.getJobs("node1") == [job1]
+    assert index.getJobs("node2") == [job1, job2]
+    # the domain is ignored
+    assert index.getJobs("node2.example.org") == [job1, job2]
+    assert index.getJobs("node3") == []
+
+
+def test_node_job_index_reads_each_job_once():
+    job = _job("1", "alice", ["node1", "node1", "node2"])
+
+    index = NodeJobIndex([job])
+
+    job.getNodes.assert_called_once()
+    job.getShortNodes.assert_not_called()
+    job.getUser.assert_called_once()
+    # a node listed multiple times for the same job is indexed once
+    assert index.getJobs("node1") == [job]
+
+
+def test_node_job_index_falls_back_to_short_nodes():
+    job = _job("1", "alice", None)
+    job.getShortNodes.return_value = ["node1"]
+
+    index = NodeJobIndex([job])
+
+    assert index.getJobs("node1") == [job]
+
+
+def test_node_job_index_nodes_of_user():
+    index = NodeJobIndex(
+        [
+            _job("1", "alice", ["node3"]),
+            _job("2", "bob", ["node1"]),
+            _job("3", "alice", ["node1", "node3"]),
+        ]
+    )
+
+    assert index.getNodesOfUser("alice") == ["node3", "node1"]
+    assert index.getNodesOfUser("bob") == ["node1"]
+    assert index.getNodesOfUser("carol") == []
+
+
+def test_node_job_index_users_of_node():
+    index = NodeJobIndex(
+        [
+            _job("1", "alice", ["node1"]),
+            _job("2", "bob", ["node1"]),
+            _job("3", "alice", ["node1"]),
+            _job("4", None, ["node1"]),
+        ]
+    )
+
+    assert index.getUsers("node1") == {"alice": 2, "bob": 1, "?": 1}
+    assert index.formatUsers("node1") == "alice (2), bob, ?"
+    assert index.formatUsers("node2") == ""
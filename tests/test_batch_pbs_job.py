@@ -77,22 +77,28 @@ def test_get_state(sample_dump_file):
 
     assert pbs_job_info.getState() == BatchState.RUNNING
 
+    # decoded fields are cached, the cache has to be reset after changing the information
     pbs_job_info._info["job_state"] = "Q"
+    pbs_job_info._cache.clear()
     assert pbs_job_info.getState() == BatchState.QUEUED
 
     pbs_job_info._info["job_state"] = "F"
+    pbs_job_info._cache.clear()
     # no exit code
     assert pbs_job_info.getState() == BatchState.FAILED
 
     pbs_job_info._info["job_state"] = "F"
     pbs_job_info._info["Exit_status"] = " 0 "
+    pbs_job_info._cache.clear()
     assert pbs_job_info.getState() == BatchState.FINISHED
 
     pbs_job_info._info["job_state"] = "F"
     pbs_job_info._info["Exit_status"] = " 3"
+    pbs_job_info._cache.clear()
     assert pbs_job_info.getState() == BatchState.FAILED
 
     pbs_job_info._info["job_state"] = "z"
+    pbs_job_info._cache.clear()
     assert pbs_job_info.getState() == BatchState.UNKNOWN
 
 
@@ -543,6 +549,54 @@ def test_from_dict_creates_instance():
     assert job._info is info
 
 
+def test_from_dict_compact_keeps_only_used_information():
+    info = {
+        "Job_Name": "abc",
+        "job_state": "R",
+        "credential_id": "user@EXAMPLE",
+        "Variable_List": f"PBS_O_LOGNAME=user,PBS_O_WORKDIR=/path/to/input_dir,{CFG.env_vars.info_file}=/path/to/job.qqinfo,SCRATCH=/scratch/user",
+    }
+    job = PBSJob.fromDict("job123", info, compact=True)
+
+    assert set(job._info) == {"Job_Name", "job_state", "Variable_List"}
+    assert (
+        job._info["Variable_List"]
+        == f"PBS_O_WORKDIR=/path/to/input_dir,{CFG.env_vars.info_file}=/path/to/job.qqinfo"
+    )
+    assert job.getInputDir() == Path("/path/to/input_dir").resolve()
+    assert job.getInfoFile() == Path("/path/to/job.qqinfo")
+    # the original dictionary is not modified
+    assert "credential_id" in info
+
+
+def test_pbs_job_getters_decode_fields_once():
+    job = PBSJob.fromDict(
+        "job123",
+        {"Resource_List.walltime": "02:00:00", "ctime": "Sun Sep 21 00:00:00 2025"},
+    )
+
+    with patch(
+        "qq_lib.batch.pbs.job.hhmmss_to_duration", return_value=timedelta(hours=2)
+    ) as mock_parse:
+        assert job.getWalltime() == timedelta(hours=2)
+        assert job.getWalltime() == timedelta(hours=2)
+
+    mock_parse.assert_called_once_with("02:00:00")
+    assert job.getSubmissionTime() is job.getSubmissionTime()
+
+
+def test_pbs_job_update_resets_cached_fields():
+    job = PBSJob.fromDict("job123", {"job_state": "R"})
+    assert job.getState() == BatchState.RUNNING
+
+    with patch("qq_lib.batch.pbs.job.subprocess.run") as mock_run:
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = "Job Id: job123\n    job_state = Q\n"
+        job.update()
+
+    assert job.getState() == BatchState.QUEUED
+
+
 def test_pbs_job_info_get_input_machine():
     job = _make_jobinfo_with_info({"Submit_Host": "random.machine.org"})
     assert job.getInputMachine() == "random.machine.org"
@@ -741,3 +795,64 @@ def test_pbs_job_get_id_int_returns_none_on_conversion_failure():
     job._job_id = "123x"
     with patch("qq_lib.batch.pbs.job.re.match", return_value=None):
         assert job.getIdInt() is None
+
+
+@pytest.mark.parametrize(
+    "job_id, array_id, array_index",
+    [
+        ("1234.server", None, None),
+        ("1234[].server", "1234[].server", None),
+        ("1234[17].server", "1234[].server", 17),
+    ],
+)
+def test_pbs_job_array_id_and_index(job_id, array_id, array_index):
+    job = _make_jobinfo_with_info({})
+    job._job_id = job_id
+
+    assert job.getArrayId() == array_id
+    assert job.getArrayIndex() == array_index
+
+
+def test_pbs_job_array_begun_is_running():
+    job = _make_jobinfo_with_info({"job_state": "B"})
+    assert job.getState() == BatchState.RUNNING
+
+
+def test_pbs_job_get_info_file_of_array_member(tmp_path):
+    index = tmp_path / "job.qqarray"
+    index.write_text("/dir0/job.qqinfo\n/dir1/job.qqinfo\n")
+
+    job = _make_jobinfo_with_info(
+        {"Variable_List": f"PBS_O_HOST=host,{CFG.env_vars.array_index}={index}"}
+    )
+    job._job_id = "1234[1].server"
+
+    assert job.getInfoFile() == Path("/dir1/job.qqinfo")
+
+
+def test_pbs_job_to_record(sample_dump_file):
+    job = PBSJob.fromDict(
+        "123456.fake-cluster.example.com",
+        parse_pbs_dump_to_dictionary(sample_dump_file),
+    )
+
+    record = job.toRecord()
+
+    assert list(record) == PBSJob.RECORD_FIELDS
+    assert record["id"] == "123456.fake-cluster.example.com"
+    assert record["name"] == "example_job"
+    assert record["state"] == str(job.getState())
+    assert record["ncpus"] == job.getNCPUs()
+    assert record["walltime_seconds"] == int(job.getWalltime().total_seconds())
+    assert record["submission_time"] == job.getSubmissionTime().isoformat()
+    assert record["nodes"] == job.getNodes()
+
+
+def test_pbs_job_to_record_missing_values():
+    record = _make_jobinfo_with_info({}).toRecord()
+
+    assert record["id"] == "1234"
+    assert record["name"] is None
+    assert record["mem_kb"] is None
+    assert record["start_time"] is None
+    assert record["nodes"] is None
@@ -448,3 +448,29 @@ def test_pbs_node_to_yaml():
     assert isinstance(result, str)
     assert isinstance(parsed_result, dict)
     assert parsed_result == expected_dict
+
+
+def test_pbs_node_to_record():
+    node = PBSNode.fromDict(
+        "nodeA",
+        {
+            "state": "free",
+            "resources_available.ncpus": "32",
+            "resources_assigned.ncpus": "8",
+            "resources_available.mem": "64gb",
+            "resources_available.scratch_local": "100gb",
+            "resources_assigned.scratch_local": "40gb",
+            "resources_available.cl_nodeA": "True",
+        },
+    )
+
+    record = node.toRecord()
+
+    assert list(record) == PBSNode.RECORD_FIELDS
+    assert record["name"] == "nodeA"
+    assert record["ncpus"] == 32
+    assert record["free_cpus"] == 24
+    assert record["cpu_mem_kb"] == 64 * 1024 * 1024
+    assert record["free_local_scratch_kb"] == 60 * 1024 * 1024
+    assert record["gpu_mem_kb"] is None
+    assert record["properties"] == ["cl_nodeA"]
@@ -6,6 +6,7 @@
 import os
 import shutil
 import socket
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -18,6 +19,7 @@ from qq_lib.batch.pbs.pbs import CFG
 from qq_lib.core.error import QQError
 from qq_lib.properties.depend import Depend, DependType
 from qq_lib.properties.resources import Resources
+from qq_lib.properties.size import Size
 
 
 @pytest.fixture
@@ -82,6 +84,15 @@ def test_shared_guard_does_not_set_env_var():
         assert env_vars[CFG.env_vars.guard] == "true"
 
 
+def test_shared_guard_checks_input_dir():
+    env_vars = {}
+
+    with patch.object(PBS, "isShared", return_value=True) as mock_shared:
+        PBS._sharedGuard(Resources(work_dir="scratch_local"), env_vars, Path("/dir"))
+
+    mock_shared.assert_called_once_with(Path("/dir"))
+
+
 @pytest.mark.parametrize("dir", ["input_dir", "job_dir"])
 def test_shared_guard_input_dir_does_not_raise(dir):
     env_vars = {}
@@ -117,7 +128,9 @@ def test_sync_with_exclusions_shared_storage_sets_local(monkeypatch):
 
     with patch.object(BatchInterface, "syncWithExclusions") as mock_sync:
         PBS.syncWithExclusions(src_dir, dest_dir, "host1", "host2", exclude_files)
-        mock_sync.assert_called_once_with(src_dir, dest_dir, None, None, exclude_files)
+        mock_sync.assert_called_once_with(
+            src_dir, dest_dir, None, None, exclude_files, delete=False
+        )
 
     monkeypatch.delenv(CFG.env_vars.shared_submit)
 
@@ -139,7 +152,7 @@ def test_sync_with_exclusions_local_src(monkeypatch):
             src_dir, dest_dir, local_host, "remotehost", exclude_files
         )
         mock_sync.assert_called_once_with(
-            src_dir, dest_dir, None, "remotehost", exclude_files
+            src_dir, dest_dir, None, "remotehost", exclude_files, delete=False
         )
 
 
@@ -160,7 +173,7 @@ def test_sync_with_exclusions_local_dest(monkeypatch):
             src_dir, dest_dir, "remotehost", local_host, exclude_files
         )
         mock_sync.assert_called_once_with(
-            src_dir, dest_dir, "remotehost", None, exclude_files
+            src_dir, dest_dir, "remotehost", None, exclude_files, delete=False
         )
 
 
@@ -178,7 +191,9 @@ def test_sync_with_exclusions_one_remote(monkeypatch):
     ):
         # source local, destination local -> uses None
         PBS.syncWithExclusions(src_dir, dest_dir, None, local_host, exclude_files)
-        mock_sync.assert_called_once_with(src_dir, dest_dir, None, None, exclude_files)
+        mock_sync.assert_called_once_with(
+            src_dir, dest_dir, None, None, exclude_files, delete=False
+        )
 
 
 def test_sync_with_exclusions_both_remote_raises(monkeypatch):
@@ -196,6 +211,19 @@ def test_sync_with_exclusions_both_remote_raises(monkeypatch):
         PBS.syncWithExclusions(src_dir, dest_dir, "remote1", "remote2", exclude_files)
 
 
+def test_sync_with_exclusions_passes_delete(monkeypatch):
+    src_dir = Path("/src")
+    dest_dir = Path("/dest")
+
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+
+    with patch.object(BatchInterface, "syncWithExclusions") as mock_sync:
+        PBS.syncWithExclusions(src_dir, dest_dir, "host1", "host2", None, delete=True)
+        mock_sync.assert_called_once_with(
+            src_dir, dest_dir, None, None, None, delete=True
+        )
+
+
 def test_sync_selected_shared_storage_sets_local(monkeypatch):
     src_dir = Path("/src")
     dest_dir = Path("/dest")
@@ -205,7 +233,9 @@ def test_sync_selected_shared_storage_sets_local(monkeypatch):
 
     with patch.object(BatchInterface, "syncSelected") as mock_sync:
         PBS.syncSelected(src_dir, dest_dir, "host1", "host2", include_files)
-        mock_sync.assert_called_once_with(src_dir, dest_dir, None, None, include_files)
+        mock_sync.assert_called_once_with(
+            src_dir, dest_dir, None, None, include_files, timeout=None
+        )
 
     monkeypatch.delenv(CFG.env_vars.shared_submit)
 
@@ -224,7 +254,7 @@ def test_sync_selected_local_src(monkeypatch):
     ):
         PBS.syncSelected(src_dir, dest_dir, local_host, "remotehost", include_files)
         mock_sync.assert_called_once_with(
-            src_dir, dest_dir, None, "remotehost", include_files
+            src_dir, dest_dir, None, "remotehost", include_files, timeout=None
         )
 
 
@@ -242,7 +272,7 @@ def test_sync_selected_local_dest(monkeypatch):
     ):
         PBS.syncSelected(src_dir, dest_dir, "remotehost", local_host, include_files)
         mock_sync.assert_called_once_with(
-            src_dir, dest_dir, "remotehost", None, include_files
+            src_dir, dest_dir, "remotehost", None, include_files, timeout=None
         )
 
 
@@ -259,7 +289,9 @@ def test_sync_selected_one_remote(monkeypatch):
         patch("socket.gethostname", return_value=local_host),
     ):
         PBS.syncSelected(src_dir, dest_dir, None, local_host, include_files)
-        mock_sync.assert_called_once_with(src_dir, dest_dir, None, None, include_files)
+        mock_sync.assert_called_once_with(
+            src_dir, dest_dir, None, None, include_files, timeout=None
+        )
 
 
 def test_sync_selected_both_remote_raises(monkeypatch):
@@ -310,6 +342,29 @@ def test_read_remote_file_remote():
         assert result == "data"
 
 
+def test_read_remote_files_shared_storage(tmp_path, monkeypatch):
+    file_path = tmp_path / "testfile.txt"
+    file_path.write_text("data")
+
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+
+    with patch.object(BatchInterface, "readRemoteFiles") as mock_read:
+        result = PBS.readRemoteFiles(
+            "remotehost", [file_path, tmp_path / "missing.txt"]
+        )
+    assert result == ["data", None]
+    mock_read.assert_not_called()
+
+
+def test_read_remote_files_remote():
+    files = [Path("/remote/file.txt"), Path("/remote/other.txt")]
+    with patch.object(
+        BatchInterface, "readRemoteFiles", return_value=["data", None]
+    ) as mock_read:
+        assert PBS.readRemoteFiles("remotehost", files) == ["data", None]
+        mock_read.assert_called_once_with("remotehost", files)
+
+
 def test_write_remote_file_shared_storage(tmp_path, monkeypatch):
     file_path = tmp_path / "output.txt"
     content = "Test content"
@@ -340,6 +395,44 @@ def test_write_remote_file_remote():
         mock_write.assert_called_once_with("remotehost", file_path, content)
 
 
+def test_append_remote_file_shared_storage(tmp_path, monkeypatch):
+    file_path = tmp_path / "output.txt"
+    file_path.write_text("first\n")
+
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+
+    PBS.appendRemoteFile("remotehost", file_path, "second\n")
+    assert file_path.read_text() == "first\nsecond\n"
+
+
+def test_append_remote_file_remote():
+    file_path = Path("/remote/output.txt")
+
+    with patch.object(BatchInterface, "appendRemoteFile") as mock_append:
+        PBS.appendRemoteFile("remotehost", file_path, "data")
+        mock_append.assert_called_once_with("remotehost", file_path, "data")
+
+
+def test_is_remote_file_shared_storage(tmp_path, monkeypatch):
+    file_path = tmp_path / "output.txt"
+    file_path.write_text("data")
+
+    monkeypatch.setenv(CFG.env_vars.shared_submit, "true")
+
+    with patch.object(BatchInterface, "isRemoteFile") as mock_exists:
+        assert PBS.isRemoteFile("remotehost", file_path)
+        assert not PBS.isRemoteFile("remotehost", tmp_path / "missing.txt")
+    mock_exists.assert_not_called()
+
+
+def test_is_remote_file_remote():
+    file_path = Path("/remote/output.txt")
+
+    with patch.object(BatchInterface, "isRemoteFile", return_value=True) as mock_exists:
+        assert PBS.isRemoteFile("remotehost", file_path)
+        mock_exists.assert_called_once_with("remotehost", file_path)
+
+
 def test_make_remote_dir_shared_storage(tmp_path, monkeypatch):
     dir_path = tmp_path / "newdir"
 
@@ -946,6 +1039,22 @@ def test_translate_submit_multiple_dependencies():
     assert cmd == expected
 
 
+def test_translate_submit_with_start_time():
+    res = Resources(nnodes=1, ncpus=1, mem="1gb", work_dir="input_dir")
+    cmd = PBS._translateSubmit(
+        res,
+        "queue",
+        Path("tmp"),
+        "script.sh",
+        "job",
+        [],
+        {},
+        start_time=datetime(2025, 9, 21, 12, 30, 5),
+    )
+    expected = f"qsub -N job -q queue -j eo -e tmp/job{CFG.suffixes.qq_out} -l ncpus=1,mpiprocs=1,mem=1048576kb -a 202509211230.05 script.sh"
+    assert cmd == expected
+
+
 def test_translate_submit_complex_with_depend():
     res = Resources(
         nnodes=2,
@@ -1123,6 +1232,111 @@ def test_transform_resources_missing_work_dir_raises():
         PBS.transformResources("gpu", Resources())
 
 
+def _auto_node(name: str, **available: str) -> PBSNode:
+    return PBSNode.fromDict(
+        name,
+        {"state": "free"}
+        | {f"resources_available.{k}": v for k, v in available.items()},
+    )
+
+
+def _select_work_dir(nodes, provided, input_size="1gb"):
+    with (
+        patch("qq_lib.batch.pbs.pbs.PBSQueue") as mock_queue,
+        patch.object(PBS, "_getDefaultServerResources", return_value=Resources()),
+        patch.object(PBS, "getNodes", return_value=nodes),
+        patch("qq_lib.batch.pbs.pbs.getpass.getuser", return_value="user"),
+    ):
+        mock_queue.return_value.getDefaultResources.return_value = Resources()
+        return PBS.selectWorkDir("default", provided, Size.fromString(input_size))
+
+
+def test_select_work_dir_prefers_ssd_scratch():
+    nodes = [
+        _auto_node("node1", scratch_local="100gb"),
+        _auto_node("node2", scratch_ssd="10gb", scratch_local="100gb"),
+    ]
+
+    res = _select_work_dir(nodes, Resources(work_dir="auto", ncpus=4))
+
+    assert res.work_dir == "scratch_ssd"
+    assert res.work_size == Size(2, "gb")
+    assert res.ncpus == 4
+
+
+def test_select_work_dir_falls_back_to_larger_scratch():
+    nodes = [_auto_node("node1", scratch_ssd="10gb", scratch_local="100gb")]
+
+    res = _select_work_dir(nodes, Resources(work_dir="auto"), "20gb")
+
+    assert res.work_dir == "scratch_local"
+    assert res.work_size == Size(40, "gb")
+
+
+def test_select_work_dir_keeps_larger_requested_work_size():
+    nodes = [_auto_node("node1", scratch_local="100gb")]
+
+    res = _select_work_dir(
+        nodes, Resources(work_dir="auto", work_size="50gb", mem="4gb")
+    )
+
+    assert res.work_dir == "scratch_local"
+    assert res.work_size == Size(50, "gb")
+
+
+def test_select_work_dir_uses_min_size_for_small_input():
+    nodes = [_auto_node("node1", scratch_local="100gb")]
+
+    res = _select_work_dir(nodes, Resources(work_dir="auto"), "1mb")
+
+    assert res.work_size == Size.fromString(CFG.pbs_options.auto_work_dir_min_size)
+
+
+def test_select_work_dir_selects_shm_if_memory_allows():
+    nodes = [_auto_node("node1", mem="64gb", scratch_ssd="100gb")]
+
+    res = _select_work_dir(
+        nodes, Resources(work_dir="auto", ncpus=4, mem_per_cpu="2gb"), "100mb"
+    )
+
+    assert res.work_dir == "scratch_shm"
+    # the in-RAM scratch is added to the memory of the job
+    assert res.mem == Size(9, "gb")
+    assert res.mem_per_cpu is None
+    assert res.work_size is None
+
+
+def test_select_work_dir_skips_shm_without_enough_memory():
+    nodes = [_auto_node("node1", mem="8gb", scratch_ssd="100gb")]
+
+    res = _select_work_dir(nodes, Resources(work_dir="auto", mem="8gb"), "100mb")
+
+    assert res.work_dir == "scratch_ssd"
+    assert res.mem == Size(8, "gb")
+
+
+def test_select_work_dir_no_scratch_fits_raises():
+    nodes = [_auto_node("node1", scratch_local="10gb")]
+
+    with pytest.raises(QQError, match="No node has a scratch directory"):
+        _select_work_dir(nodes, Resources(work_dir="auto"), "20gb")
+
+
+def test_select_work_dir_falls_back_to_local_scratch_without_node_info():
+    with (
+        patch("qq_lib.batch.pbs.pbs.PBSQueue") as mock_queue,
+        patch.object(PBS, "_getDefaultServerResources", return_value=Resources()),
+        patch.object(PBS, "getNodes", side_effect=QQError("pbsnodes failed.")),
+        patch("qq_lib.batch.pbs.pbs.logger.warning") as mock_warning,
+    ):
+        mock_queue.return_value.getDefaultResources.return_value = Resources()
+        res = PBS.selectWorkDir("default", Resources(work_dir="auto"), Size(10, "gb"))
+
+    assert res.work_dir == "scratch_local"
+    assert res.work_size == Size(20, "gb")
+    mock_warning.assert_called_once()
+
+
 @pytest.fixture
 def sample_multi_dump_file():
     return """Job Id: 123456.fake-cluster.example.com
@@ -1151,6 +1365,27 @@ Job Id: 123458.fake-cluster.example.com
 """
 
 
+def test_get_batch_jobs_with_columns_compacts_jobs():
+    dump = """Job Id: 123456.fake-cluster.example.com
+    Job_Name = example_job_1
+    job_state = R
+    credential_id = user@EXAMPLE
+    Variable_List = PBS_O_WORKDIR=/path/to/input_dir,SCRATCH=/scratch/user
+"""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0, stdout=dump, stderr="")
+
+        (full,) = PBS.getBatchJobs("user")
+        (compact,) = PBS.getBatchJobs("user", {"S", "Job ID"})
+
+    assert "credential_id" in full._info  # ty: ignore[unresolved-attribute]
+    assert compact._info == {  # ty: ignore[unresolved-attribute]
+        "Job_Name": "example_job_1",
+        "job_state": "R",
+        "Variable_List": "PBS_O_WORKDIR=/path/to/input_dir",
+    }
+
+
 def test_get_jobs_info_using_command_success(sample_multi_dump_file):
     with patch("subprocess.run") as mock_run:
         mock_run.return_value = MagicMock(
@@ -1459,6 +1694,7 @@ def test_pbs_get_supported_work_dir_types_returns_combined_list():
         "scratch_shm",
         "input_dir",
         "job_dir",
+        "auto",
     ]
     assert PBS.getSupportedWorkDirTypes() == expected
 
@@ -1483,3 +1719,90 @@ def test_pbs_create_work_dir_on_scratch_creates_work_dir():
     assert result == expected_work_dir
 
     mkdir_mock.assert_called_once_with(exist_ok=True)
+
+
+@pytest.mark.parametrize(
+    "work_dir_type, expected",
+    [
+        ("scratch_local", Path("/scratch/user/.qqprestage/123.server")),
+        ("scratch-ssd", Path("/scratch.ssd/user/.qqprestage/123.server")),
+        ("scratch_shm", Path("/dev/shm/scratch.shm/user/.qqprestage/123.server")),
+        ("scratch_shared", None),
+        ("input_dir", None),
+    ],
+)
+def test_pbs_get_prestage_dir(work_dir_type, expected):
+    with patch.object(CFG.prestage, "directory", ".qqprestage"):
+        assert PBS.getPrestageDir("123.server", "user", work_dir_type) == expected
+
+
+def test_pbs_get_input_cache_dir_is_outside_of_allocated_scratch():
+    work_dir = Path("/scratch/user/job_12345") / CFG.pbs_options.scratch_dir_inner
+
+    assert PBS.getInputCacheDir(work_dir) == Path(
+        f"/scratch/user/{CFG.input_cache.directory}"
+    )
+
+
+@patch("qq_lib.batch.pbs.pbs.subprocess.run")
+@patch.object(PBS, "_translateSubmit", return_value="qsub cmd")
+@patch.object(PBS, "_collectAMSEnvVars", return_value={})
+@patch.object(PBS, "_sharedGuard")
+def test_pbs_job_submit_runs_in_input_dir(_guard, _ams, _translate, mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stdout="123.pbs\n")
+
+    result = PBS.jobSubmit(
+        Resources(), "default", Path("/tmp/dir/job.sh"), "job", [], {}
+    )
+
+    assert result == "123.pbs"
+    assert mock_run.call_args.kwargs["cwd"] == Path("/tmp/dir")
+    _guard.assert_called_once_with(Resources(), {}, Path("/tmp/dir"))
+
+
+def test_translate_submit_array():
+    res = Resources(nnodes=1, ncpus=1, mem="1gb", work_dir="input_dir")
+    assert (
+        PBS._translateSubmit(
+            res, "gpu", Path("tmp"), "script.sh", "job.sh", [], {}, array_size=3
+        )
+        == f"qsub -N job.sh -q gpu -j eo -e tmp/job.^array_index^{CFG.suffixes.qq_out} -J 0-2 -l ncpus=1,mpiprocs=1,mem=1048576kb script.sh"
+    )
+
+
+@patch("qq_lib.batch.pbs.pbs.subprocess.run")
+@patch.object(PBS, "_translateSubmit", return_value="qsub cmd")
+@patch.object(PBS, "_collectAMSEnvVars", return_value={})
+@patch.object(PBS, "_sharedGuard")
+def test_pbs_job_submit_array_runs_in_array_dir(_guard, _ams, mock_translate, mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stdout="123[].pbs\n")
+
+    result = PBS.jobSubmitArray(
+        Resources(),
+        "default",
+        Path("/tmp/dir/job.sh"),
+        "job.sh",
+        [],
+        {},
+        Path("/tmp"),
+        4,
+    )
+
+    assert result == "123[].pbs"
+    assert mock_run.call_args.kwargs["cwd"] == Path("/tmp")
+    assert mock_translate.call_args.args[2] == Path("/tmp")
+    assert mock_translate.call_args.args[-1] == 4
+
+
+@patch.dict("qq_lib.batch.pbs.pbs.os.environ", {"PBS_ARRAY_INDEX": "7"})
+def test_pbs_get_array_index():
+    assert PBS.getArrayIndex() == 7
+
+
+@patch.dict("qq_lib.batch.pbs.pbs.os.environ", {}, clear=True)
+def test_pbs_get_array_index_none_outside_array():
+    assert PBS.getArrayIndex() is None
+
+
+def test_pbs_get_array_member_id():
+    assert PBS.getArrayMemberId("123[].pbs.server", 5) == "123[5].pbs.server"
@@ -507,3 +507,29 @@ def test_pbsqueue_get_default_resources_returns_empty_when_no_defaults():
     }
 
     assert queue.getDefaultResources() == Resources()
+
+
+def test_pbsqueue_to_record():
+    queue = PBSQueue.fromDict(
+        "gpu",
+        {
+            "queue_type": "Execution",
+            "Priority": "75",
+            "total_jobs": "42",
+            "state_count": "Transit:0 Queued:10 Held:2 Waiting:0 Running:30 Exiting:0 Begun:0",
+            "resources_max.walltime": "24:00:00",
+            "enabled": "True",
+            "started": "True",
+        },
+    )
+
+    record = queue.toRecord()
+
+    assert list(record) == PBSQueue.RECORD_FIELDS
+    assert record["name"] == "gpu"
+    assert record["priority"] == queue.getPriority()
+    assert record["total_jobs"] == queue.getTotalJobs()
+    assert record["running_jobs"] == queue.getRunningJobs()
+    assert record["max_walltime_seconds"] == 24 * 3600
+    assert record["destinations"] == queue.getDestinations()
+    assert record["from_route_only"] is False
@@ -3,9 +3,14 @@
 
 from dataclasses import fields
 
+import pytest
+
 from qq_lib.batch.slurm.common import (
+    SACCT_FIELDS,
     default_resources_from_dict,
+    expand_node_list,
     parse_slurm_dump_to_dictionary,
+    sacct_fields_for_columns,
 )
 from qq_lib.properties.resources import Resources
 from qq_lib.properties.size import Size
@@ -87,3 +92,46 @@ def test_default_resources_from_dict_ignores_unlimited_values():
     for f in fields(Resources):
         value = getattr(result, f.name)
         assert value is None
+
+
+def test_sacct_fields_for_columns_none_returns_all_fields():
+    assert sacct_fields_for_columns(None) == SACCT_FIELDS
+
+
+def test_sacct_fields_for_columns_minimal_columns():
+    assert (
+        sacct_fields_for_columns(["S", "Job ID", "NCPUs"])
+        == "JobID,State,AllocCPUs,ReqCPUs,AllocTRES,ReqTRES,AllocNodes,ReqNodes,Reason"
+    )
+
+
+def test_sacct_fields_for_columns_keeps_order_of_all_fields():
+    fields = sacct_fields_for_columns(["Exit", "Times", "Job Name", "%CPU"]).split(",")
+
+    assert fields == [f for f in SACCT_FIELDS.split(",") if f in fields]
+    assert {"JobName", "Submit", "Start", "End", "TimeLimit", "ExitCode"} <= set(fields)
+    assert "User" not in fields
+    assert "WorkDir" not in fields
+
+
+@pytest.mark.parametrize(
+    "compact,expected",
+    [
+        ("node1", ("node1",)),
+        ("node[01-03,07],gpu1", ("node01", "node02", "node03", "node07", "gpu1")),
+        ("node[8-10]", ("node8", "node9", "node10")),
+        (
+            "rack[1-2]-node[1-2]",
+            ("rack1-node1", "rack1-node2", "rack2-node1", "rack2-node2"),
+        ),
+    ],
+)
+def test_expand_node_list(compact, expected):
+    assert expand_node_list(compact) == expected
+
+
+@pytest.mark.parametrize(
+    "compact", ["", "node[01-03", "node]1", "node[[1]]", "node[a-b]", "node[3-1]"]
+)
+def test_expand_node_list_invalid_returns_none(compact):
+    assert expand_node_list(compact) is None
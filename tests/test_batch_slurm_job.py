@@ -650,6 +650,7 @@ def test_slurm_job_get_info_file_returns_path_when_file_exists(monkeypatch):
 
 def test_slurm_job_get_info_file_returns_none_when_file_missing(monkeypatch):
     job = SlurmJob.__new__(SlurmJob)
+    job._job_id = "12345"
     monkeypatch.setattr(job, "getInputDir", lambda: Path("/tmp"))
     monkeypatch.setattr(job, "getName", lambda: "missingfile")
     monkeypatch.setattr(
@@ -747,6 +748,48 @@ def test_slurm_job_from_sacct_string_returns_valid_instance():
     assert job._info["NumNodes"] == "1"
 
 
+def test_slurm_job_get_nodes_expands_node_list_once():
+    job = SlurmJob.fromDict("123", {"NodeList": "node[01-02]"})
+
+    with patch.object(
+        SlurmJob, "_expandNodeList", return_value=["node01", "node02"]
+    ) as mock_expand:
+        assert job.getNodes() == ["node01", "node02"]
+        assert job.getMainNode() == "node01"
+
+    mock_expand.assert_called_once_with("node[01-02]")
+
+
+@patch("qq_lib.batch.slurm.job.subprocess.run")
+def test_slurm_job_init_compact_keeps_only_used_information(mock_run):
+    mock_run.return_value = MagicMock(
+        returncode=0,
+        stdout="JobId=123 JobName=job JobState=RUNNING Command=/path/to/script.sh Comment=none",
+    )
+
+    full = SlurmJob("123")
+    compact = SlurmJob("123", compact=True)
+
+    assert "Command" in full._info
+    assert compact._info == {"JobId": "123", "JobName": "job", "JobState": "RUNNING"}
+    assert compact.getState() == BatchState.RUNNING
+
+
+def test_slurm_job_from_sacct_string_with_narrowed_format():
+    format = "JobID,State,AllocCPUs,ReqCPUs,Submit,Reason"
+    job = SlurmJob.fromSacctString(
+        "222222|PENDING|0|8|2025-11-05T11:53:40|Dependency", format
+    )
+
+    assert job._job_id == "222222"
+    assert job._info["JobState"] == "PENDING"
+    assert job._info["SubmitTime"] == "2025-11-05T11:53:40"
+    assert job._info["NumCPUs"] == "8"
+    assert job.getState() == BatchState.HELD
+    assert job.getName() is None
+    assert job.getQueue() is None
+
+
 def test_slurm_job_from_sacct_string_raises_error_when_field_count_invalid():
     bad_str = "too|few|fields"
     with pytest.raises(QQError):
@@ -757,12 +800,20 @@ def test_slurm_job_from_sacct_string_raises_error_when_field_count_invalid():
 def test_slurm_job_expand_node_list_returns_expanded_list(mock_run):
     mock_result = MagicMock()
     mock_result.returncode = 0
-    mock_result.stdout = "node01\nnode02\nnode03\n"
+    mock_result.stdout = "nodea\nnodeb\n"
     mock_run.return_value = mock_result
 
+    # expressions that cannot be expanded without Slurm are passed to scontrol
+    result = SlurmJob._expandNodeList("node[a-b]")
+    assert result == ["nodea", "nodeb"]
+    mock_run.assert_called_once()
+
+
+@patch("qq_lib.batch.slurm.job.subprocess.run")
+def test_slurm_job_expand_node_list_without_scontrol(mock_run):
     result = SlurmJob._expandNodeList("node[01-03]")
     assert result == ["node01", "node02", "node03"]
-    mock_run.assert_called_once()
+    mock_run.assert_not_called()
 
 
 @patch("qq_lib.batch.slurm.job.subprocess.run")
@@ -775,8 +826,8 @@ def test_slurm_job_expand_node_list_returns_unexpanded_on_failure(
     mock_result.stderr = "error"
     mock_run.return_value = mock_result
 
-    result = SlurmJob._expandNodeList("node[01-03]")
-    assert result == ["node[01-03]"]
+    result = SlurmJob._expandNodeList("node[a-c]")
+    assert result == ["node[a-c]"]
     mock_warning.assert_called_once()
 
 
@@ -969,3 +1020,28 @@ def test_slurm_job_step_from_sacct_string_raises_on_invalid_field_count():
         QQError, match="Number of items in a sacct string for a slurm step"
     ):
         SlurmJob._stepFromSacctString(s)
+
+
+@pytest.mark.parametrize(
+    "job_id, array_id, array_index",
+    [
+        ("123", None, None),
+        ("123.batch", None, None),
+        ("123_4", "123", 4),
+        ("123_[5-99]", "123", None),
+    ],
+)
+def test_slurm_job_array_id_and_index(job_id, array_id, array_index):
+    job = SlurmJob.__new__(SlurmJob)
+    job._job_id = job_id
+
+    assert job.getArrayId() == array_id
+    assert job.getArrayIndex() == array_index
+
+
+def test_slurm_job_get_info_file_of_array_member(tmp_path):
+    (tmp_path / "job.qqarray").write_text("/dir0/job.qqinfo\n/dir1/job.qqinfo\n")
+
+    job = SlurmJob.fromDict("123_0", {"WorkDir": str(tmp_path), "JobName": "job.sh"})
+
+    assert job.getInfoFile() == Path("/dir0/job.qqinfo")
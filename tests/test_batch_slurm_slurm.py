@@ -2,11 +2,13 @@
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
 
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from qq_lib.batch.slurm.common import SACCT_FIELDS, sacct_fields_for_columns
 from qq_lib.batch.slurm.job import SlurmJob
 from qq_lib.batch.slurm.node import SlurmNode
 from qq_lib.batch.slurm.slurm import Slurm
@@ -75,9 +77,9 @@ def test_slurm_get_batch_jobs_calls_slurmjob(mock_job, mock_run):
 
     mock_run.assert_called_once()
     assert len(jobs) == 3
-    mock_job.assert_any_call("111")
-    mock_job.assert_any_call("222")
-    mock_job.assert_any_call("333")
+    mock_job.assert_any_call("111", False)
+    mock_job.assert_any_call("222", False)
+    mock_job.assert_any_call("333", False)
 
 
 @patch("qq_lib.batch.slurm.slurm.subprocess.run")
@@ -104,8 +106,8 @@ def test_slurm_get_batch_jobs_skips_empty_lines(mock_job, mock_run):
     jobs = Slurm._getBatchJobsUsingSqueueCommand("squeue -u user")
 
     assert len(jobs) == 2
-    mock_job.assert_any_call("111")
-    mock_job.assert_any_call("222")
+    mock_job.assert_any_call("111", False)
+    mock_job.assert_any_call("222", False)
     mock_run.assert_called_once()
 
 
@@ -121,8 +123,8 @@ def test_slurm_get_batch_jobs_sacct_calls_fromsacctstring(mock_from_sacct, mock_
 
     mock_run.assert_called_once()
     assert len(jobs) == 2
-    mock_from_sacct.assert_any_call("job1|info")
-    mock_from_sacct.assert_any_call("job2|info")
+    mock_from_sacct.assert_any_call("job1|info", SACCT_FIELDS)
+    mock_from_sacct.assert_any_call("job2|info", SACCT_FIELDS)
 
 
 @patch("qq_lib.batch.slurm.slurm.subprocess.run")
@@ -149,8 +151,8 @@ def test_slurm_get_batch_jobs_sacct_skips_empty_lines(mock_from_sacct, mock_run)
     jobs = Slurm._getBatchJobsUsingSacctCommand("sacct -u user")
 
     assert len(jobs) == 2
-    mock_from_sacct.assert_any_call("job1|info")
-    mock_from_sacct.assert_any_call("job2|info")
+    mock_from_sacct.assert_any_call("job1|info", SACCT_FIELDS)
+    mock_from_sacct.assert_any_call("job2|info", SACCT_FIELDS)
     mock_run.assert_called_once()
 
 
@@ -473,6 +475,25 @@ def test_slurm_translate_submit_with_dependencies():
     assert command.endswith(script)
 
 
+def test_slurm_translate_submit_with_start_time():
+    res = Resources(nnodes=1, ncpus=1, mem="1gb", work_dir="input_dir")
+
+    command = Slurm._translateSubmit(
+        res,
+        "short",
+        Path("/data"),
+        "job.sh",
+        "job",
+        [],
+        {},
+        None,
+        start_time=datetime(2025, 9, 21, 12, 30, 5),
+    )
+
+    assert "--begin=2025-09-21T12:30:05 " in command
+    assert command.endswith("job.sh")
+
+
 def test_slurm_translate_submit_with_props_true_only():
     res = Resources()
     res.nnodes = 1
@@ -558,12 +579,25 @@ def test_slurm_read_remote_file_delegates(mock_read):
     assert result == "content"
 
 
+@patch("qq_lib.batch.slurm.slurm.PBS.readRemoteFiles", return_value=["content"])
+def test_slurm_read_remote_files_delegates(mock_read):
+    result = Slurm.readRemoteFiles("host1", [Path("/tmp/file.txt")])
+    mock_read.assert_called_once_with("host1", [Path("/tmp/file.txt")])
+    assert result == ["content"]
+
+
 @patch("qq_lib.batch.slurm.slurm.PBS.writeRemoteFile")
 def test_slurm_write_remote_file_delegates(mock_write):
     Slurm.writeRemoteFile("host2", Path("/tmp/file.txt"), "data")
     mock_write.assert_called_once_with("host2", Path("/tmp/file.txt"), "data")
 
 
+@patch("qq_lib.batch.slurm.slurm.PBS.isRemoteFile", return_value=True)
+def test_slurm_is_remote_file_delegates(mock_exists):
+    assert Slurm.isRemoteFile("host2", Path("/tmp/file.txt"))
+    mock_exists.assert_called_once_with("host2", Path("/tmp/file.txt"))
+
+
 @patch("qq_lib.batch.slurm.slurm.PBS.makeRemoteDir")
 def test_slurm_make_remote_dir_delegates(mock_make):
     Slurm.makeRemoteDir("host3", Path("/tmp/dir"))
@@ -592,7 +626,12 @@ def test_slurm_sync_with_exclusions_delegates(mock_sync):
         Path("/src"), Path("/dest"), "src_host", "dest_host", [Path("ignore.txt")]
     )
     mock_sync.assert_called_once_with(
-        Path("/src"), Path("/dest"), "src_host", "dest_host", [Path("ignore.txt")]
+        Path("/src"),
+        Path("/dest"),
+        "src_host",
+        "dest_host",
+        [Path("ignore.txt")],
+        False,
     )
 
 
@@ -602,7 +641,12 @@ def test_slurm_sync_selected_delegates(mock_sync):
         Path("/src"), Path("/dest"), "src_host", "dest_host", [Path("include.txt")]
     )
     mock_sync.assert_called_once_with(
-        Path("/src"), Path("/dest"), "src_host", "dest_host", [Path("include.txt")]
+        Path("/src"),
+        Path("/dest"),
+        "src_host",
+        "dest_host",
+        [Path("include.txt")],
+        None,
     )
 
 
@@ -678,6 +722,34 @@ def test_slurm_get_all_batch_jobs(mock_squeue, mock_sacct):
     assert set(result) == {mock_squeue_job, mock_sacct_job}
 
 
+@patch(
+    "qq_lib.batch.slurm.slurm.Slurm._getBatchJobsUsingSqueueCommand", return_value=[]
+)
+@patch("qq_lib.batch.slurm.slurm.Slurm._getBatchJobsUsingSacctCommand", return_value=[])
+def test_slurm_get_batch_jobs_narrows_sacct_fields_to_columns(mock_sacct, _):
+    Slurm.getBatchJobs("user2", {"S", "Job ID", "Job Name"})
+
+    command, format = mock_sacct.call_args.args
+    assert format == sacct_fields_for_columns({"S", "Job ID", "Job Name"})
+    assert f"--format={format}" in command
+    assert "JobName" in format
+    assert "WorkDir" not in format
+
+
+@patch(
+    "qq_lib.batch.slurm.slurm.Slurm._getBatchJobsUsingSqueueCommand", return_value=[]
+)
+@patch("qq_lib.batch.slurm.slurm.Slurm._getBatchJobsUsingSacctCommand", return_value=[])
+def test_slurm_get_all_unfinished_batch_jobs_requests_all_fields_by_default(
+    mock_sacct, _
+):
+    Slurm.getAllUnfinishedBatchJobs()
+
+    command, format = mock_sacct.call_args.args
+    assert format == SACCT_FIELDS
+    assert f"--format={SACCT_FIELDS}" in command
+
+
 @patch("qq_lib.batch.slurm.slurm.subprocess.run")
 @patch("qq_lib.batch.slurm.slurm.Slurm._translateKill", return_value="scancel 123")
 def test_slurm_job_kill_runs_successfully(mock_translate, mock_run):
@@ -746,7 +818,7 @@ def test_slurm_job_submit_success(mock_guard, mock_translate, mock_run):
 
     result = Slurm.jobSubmit(res, "qgpu", script, "job1", [], {}, "acc")
 
-    mock_guard.assert_called_once_with(res, {})
+    mock_guard.assert_called_once_with(res, {}, script.parent)
     mock_translate.assert_called_once()
     mock_run.assert_called_once()
     assert result == "56789"
@@ -763,7 +835,7 @@ def test_slurm_job_submit_raises_on_error(mock_guard, mock_translate, mock_run):
     with pytest.raises(QQError, match="Failed to submit script"):
         Slurm.jobSubmit(res, "qgpu", script, "fail_job", [], {}, None)
 
-    mock_guard.assert_called_once_with(res, {})
+    mock_guard.assert_called_once_with(res, {}, script.parent)
     mock_translate.assert_called_once()
     mock_run.assert_called_once()
 
@@ -897,3 +969,70 @@ def test_slurm_get_nodes_failure_raises_qqerror(mock_run):
 def test_slurm_delete_remote_dir_delegates(mock_make):
     Slurm.deleteRemoteDir("host3", Path("/tmp/dir"))
     mock_make.assert_called_once_with("host3", Path("/tmp/dir"))
+
+
+@patch("qq_lib.batch.slurm.slurm.subprocess.run")
+@patch("qq_lib.batch.slurm.slurm.Slurm._translateSubmit", return_value="sbatch cmd")
+@patch("qq_lib.batch.slurm.slurm.PBS._sharedGuard")
+def test_slurm_job_submit_runs_in_input_dir(_mock_guard, _mock_translate, mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stdout="Submitted batch job 1\n")
+
+    Slurm.jobSubmit(Resources(), "qgpu", Path("/tmp/dir/job.sh"), "job", [], {})
+
+    assert mock_run.call_args.kwargs["cwd"] == Path("/tmp/dir")
+
+
+@patch.dict(
+    "qq_lib.batch.slurm.slurm.os.environ",
+    {
+        "SLURM_JOB_ID": "12350",
+        "SLURM_ARRAY_JOB_ID": "12345",
+        "SLURM_ARRAY_TASK_ID": "5",
+    },
+)
+def test_slurm_get_job_id_returns_member_id_inside_array():
+    assert Slurm.getJobId() == "12345_5"
+
+
+@patch.dict("qq_lib.batch.slurm.slurm.os.environ", {"SLURM_ARRAY_TASK_ID": "3"})
+def test_slurm_get_array_index():
+    assert Slurm.getArrayIndex() == 3
+
+
+def test_slurm_get_array_member_id():
+    assert Slurm.getArrayMemberId("12345", 2) == "12345_2"
+
+
+def test_slurm_translate_submit_array():
+    res = Resources(nnodes=1, ncpus=1, mem="1gb", work_dir="scratch_local")
+
+    command = Slurm._translateSubmit(
+        res, "cpu", Path("/tmp"), "run.sh", "run.sh", [], {}, None, array_size=10
+    )
+
+    assert "-e /tmp/run.%a.qqout" in command
+    assert "-o /tmp/run.%a.qqout" in command
+    assert "--array 0-9 " in command
+
+
+@patch("qq_lib.batch.slurm.slurm.subprocess.run")
+@patch("qq_lib.batch.slurm.slurm.Slurm._translateSubmit", return_value="sbatch cmd")
+@patch("qq_lib.batch.slurm.slurm.PBS._sharedGuard")
+def test_slurm_job_submit_array_runs_in_array_dir(mock_guard, mock_translate, mock_run):
+    mock_run.return_value = MagicMock(
+        returncode=0, stdout="Submitted batch job 56789\n"
+    )
+
+    result = Slurm.jobSubmitArray(
+        Resources(), "cpu", Path("/tmp/a/job.sh"), "job.sh", [], {}, Path("/tmp"), 2
+    )
+
+    assert result == "56789"
+    mock_guard.assert_called_once()
+    assert mock_run.call_args.kwargs["cwd"] == Path("/tmp")
+    assert mock_translate.call_args.args[-1] == 2
+
+
+def test_slurm_select_work_dir_not_supported():
+    with pytest.raises(QQError, match="'auto' is not supported for Slurm"):
+        Slurm.selectWorkDir("default", Resources(work_dir="auto"), Size(1, "gb"))
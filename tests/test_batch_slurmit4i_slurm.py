@@ -224,7 +224,7 @@ def test_slurmit4i_sync_with_exclusions_delegates_correctly(mock_sync):
         [Path("ignore.txt")],
     )
     mock_sync.assert_called_once_with(
-        Path("/data/src"), Path("/data/dest"), None, None, [Path("ignore.txt")]
+        Path("/data/src"), Path("/data/dest"), None, None, [Path("ignore.txt")], False
     )
 
 
@@ -238,7 +238,7 @@ def test_slurmit4i_sync_selected_delegates_correctly(mock_sync):
         [Path("file.txt")],
     )
     mock_sync.assert_called_once_with(
-        Path("/data/src"), Path("/data/dest"), None, None, [Path("file.txt")]
+        Path("/data/src"), Path("/data/dest"), None, None, [Path("file.txt")], None
     )
 
 
@@ -277,6 +277,13 @@ def test_slurmit4i_read_remote_file_raises_on_missing_file(tmp_path):
         SlurmIT4I.readRemoteFile("host", file)
 
 
+def test_slurmit4i_read_remote_files_reads_successfully(tmp_path):
+    file = tmp_path / "file.txt"
+    file.write_text("hello world")
+    result = SlurmIT4I.readRemoteFiles("host", [file, tmp_path / "missing.txt"])
+    assert result == ["hello world", None]
+
+
 def test_slurmit4i_write_remote_file_writes_successfully(tmp_path):
     file = tmp_path / "output.txt"
     SlurmIT4I.writeRemoteFile("host", file, "data content")
@@ -293,6 +300,20 @@ def test_slurmit4i_write_remote_file_raises_on_readonly_dir(tmp_path):
         SlurmIT4I.writeRemoteFile("host", file, "cannot write")
 
 
+def test_slurmit4i_append_remote_file_creates_and_appends(tmp_path):
+    file = tmp_path / "output.txt"
+    SlurmIT4I.appendRemoteFile("host", file, "first\n")
+    SlurmIT4I.appendRemoteFile("host", file, "second\n")
+    assert file.read_text() == "first\nsecond\n"
+
+
+def test_slurmit4i_is_remote_file(tmp_path):
+    file = tmp_path / "output.txt"
+    assert not SlurmIT4I.isRemoteFile("host", file)
+    file.write_text("data")
+    assert SlurmIT4I.isRemoteFile("host", file)
+
+
 def test_slurmit4i_make_remote_dir_creates_successfully(tmp_path):
     directory = tmp_path / "newdir"
     SlurmIT4I.makeRemoteDir("host", directory)
@@ -80,6 +80,7 @@ def test_clearer_collect_excluded_files(tmp_path, state):
     else:
         expected_files = {
             dummy_info_file,
+            dummy_info_file.with_suffix(CFG.suffixes.qq_journal),
             tmp_path / dummy_stdout,
             tmp_path / dummy_stderr,
             (tmp_path / dummy_job_name).with_suffix(CFG.suffixes.qq_out),
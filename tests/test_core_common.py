@@ -16,14 +16,18 @@ from qq_lib.batch.interface.meta import BatchMeta
 from qq_lib.batch.pbs import PBS, PBSJob
 from qq_lib.core.common import (
     CFG,
+    append_to_file,
     available_work_dirs,
     construct_info_file_path,
+    construct_journal_path,
     construct_loop_job_name,
+    construct_tombstone_path,
     convert_absolute_to_relative,
     dhhmmss_to_duration,
     equals_normalized,
     format_duration,
     format_duration_wdhhmmss,
+    get_directory_size,
     get_files_with_suffix,
     get_info_file,
     get_info_file_from_job_id,
@@ -859,12 +863,32 @@ def test_raises_if_no_info_files_found(mock_get_info_files):
     mock_get_info_files.assert_called_once_with(Path())
 
 
+def test_get_directory_size(tmp_path):
+    (tmp_path / "a.txt").write_text("x" * 100)
+    (tmp_path / "sub" / "deep").mkdir(parents=True)
+    (tmp_path / "sub" / "b.txt").write_text("x" * 20)
+    (tmp_path / "sub" / "deep" / "c.txt").write_text("x" * 3)
+    # symbolic links are not followed
+    (tmp_path / "link").symlink_to(tmp_path / "sub", target_is_directory=True)
+
+    size = get_directory_size(tmp_path)
+
+    assert size == 123 + (tmp_path / "link").lstat().st_size
+    assert get_directory_size(tmp_path / "a.txt") == 100
+
+
+def test_get_directory_size_missing_raises(tmp_path):
+    with pytest.raises(QQError, match="Could not measure the size"):
+        get_directory_size(tmp_path / "missing")
+
+
 def test_get_runtime_files(tmp_path):
     expected_files = [
         tmp_path / f"f1{CFG.suffixes.qq_info}",
         tmp_path / f"f2{CFG.suffixes.qq_out}",
         tmp_path / f"f3{CFG.suffixes.stdout}",
         tmp_path / f"f4{CFG.suffixes.stderr}",
+        tmp_path / f"f5{CFG.suffixes.qq_journal}",
     ]
 
     def mock_get_files_with_suffix(directory, suffix):
@@ -1065,6 +1089,32 @@ def test_construct_info_file_path_returns_expected_path():
     assert result == expected
 
 
+def test_construct_journal_path_replaces_info_suffix():
+    info_file = Path(f"/tmp/jobs/script+0003{CFG.suffixes.qq_info}")
+
+    assert construct_journal_path(info_file) == Path(
+        f"/tmp/jobs/script+0003{CFG.suffixes.qq_journal}"
+    )
+
+
+def test_append_to_file_creates_and_appends(tmp_path):
+    file = tmp_path / "journal"
+
+    append_to_file(file, "first\n")
+    append_to_file(file, "second\n")
+
+    assert file.read_text() == "first\nsecond\n"
+
+
+def test_construct_tombstone_path_is_sibling_of_work_dir():
+    work_dir = Path("/scratch/user/job_123/main")
+
+    result = construct_tombstone_path(work_dir)
+
+    assert result == Path(f"/scratch/user/job_123/main{CFG.suffixes.tombstone}")
+    assert result.parent == work_dir.parent
+
+
 def test_available_work_dirs_returns_joined_list():
     mock_batch_system = MagicMock()
     mock_batch_system.getSupportedWorkDirTypes.return_value = ["a", "b"]
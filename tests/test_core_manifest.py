@@ -0,0 +1,147 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from qq_lib.core.config import CFG
+from qq_lib.core.error import QQError
+from qq_lib.core.manifest import WorkDirManifest
+
+
+@pytest.fixture
+def work_dir(tmp_path):
+    work_dir = tmp_path / "main"
+    (work_dir / "sub").mkdir(parents=True)
+    (work_dir / "a.txt").write_text("aaa")
+    (work_dir / "sub" / "b.txt").write_text("bbbbb")
+    return work_dir
+
+
+def test_manifest_from_work_dir_collects_files(work_dir):
+    manifest = WorkDirManifest.fromWorkDir("123", "node1", Path("/input"), work_dir)
+
+    assert manifest.job_id == "123"
+    assert manifest.host == "node1"
+    assert manifest.input_dir == Path("/input")
+    assert manifest.work_dir == work_dir
+    assert set(manifest.files) == {"a.txt", str(Path("sub") / "b.txt")}
+    assert manifest.files["a.txt"][0] == 3
+    assert manifest.getSize() == 8
+
+
+def test_manifest_scan_skips_manifest_file(work_dir):
+    (work_dir / CFG.loop_jobs.manifest_file).write_text("{}")
+
+    manifest = WorkDirManifest.fromWorkDir("1", "node", Path("/input"), work_dir)
+
+    assert CFG.loop_jobs.manifest_file not in manifest.files
+
+
+def test_manifest_scan_raises_for_missing_directory(tmp_path):
+    with pytest.raises(QQError, match="Could not scan directory"):
+        WorkDirManifest.fromWorkDir("1", "node", Path("/input"), tmp_path / "none")
+
+
+def test_manifest_to_file_and_from_file_roundtrip(work_dir, tmp_path):
+    manifest = WorkDirManifest.fromWorkDir("123", "node1", Path("/input"), work_dir)
+    # strip microseconds which are not stored
+    manifest.created = manifest.created.replace(microsecond=0)
+    file = tmp_path / "manifest.json"
+
+    manifest.toFile(file)
+    loaded = WorkDirManifest.fromFile(file)
+
+    assert loaded == manifest
+
+
+def test_manifest_from_file_raises_for_invalid_file(tmp_path):
+    file = tmp_path / "manifest.json"
+    file.write_text("not a manifest")
+
+    with pytest.raises(QQError, match="Could not load manifest"):
+        WorkDirManifest.fromFile(file)
+
+
+def test_manifest_to_file_raises_if_not_writable(tmp_path):
+    manifest = WorkDirManifest("1", "node", Path("/input"), tmp_path, datetime.now())
+
+    with pytest.raises(QQError, match="Could not write manifest"):
+        manifest.toFile(tmp_path / "missing" / "manifest.json")
+
+
+def test_manifest_matches_unchanged_work_dir(work_dir):
+    manifest = WorkDirManifest.fromWorkDir("1", "node", Path("/input"), work_dir)
+
+    assert manifest.matchesWorkDir()
+
+
+@pytest.mark.parametrize("change", ["modify", "add", "remove"])
+def test_manifest_does_not_match_changed_work_dir(work_dir, change):
+    manifest = WorkDirManifest.fromWorkDir("1", "node", Path("/input"), work_dir)
+
+    if change == "modify":
+        (work_dir / "a.txt").write_text("a different content")
+    elif change == "add":
+        (work_dir / "c.txt").write_text("c")
+    else:
+        (work_dir / "sub" / "b.txt").unlink()
+
+    assert not manifest.matchesWorkDir()
+
+
+def test_manifest_does_not_match_missing_work_dir(work_dir):
+    manifest = WorkDirManifest.fromWorkDir("1", "node", Path("/input"), work_dir)
+    manifest.work_dir = work_dir.parent / "missing"
+
+    assert not manifest.matchesWorkDir()
+
+
+def test_manifest_is_expired():
+    manifest = WorkDirManifest(
+        "1", "node", Path("/input"), Path("/work"), datetime.now() - timedelta(hours=2)
+    )
+
+    assert manifest.isExpired(timedelta(hours=1))
+    assert not manifest.isExpired(timedelta(hours=3))
+
+
+def test_manifest_to_string_from_string_roundtrip(work_dir):
+    manifest = WorkDirManifest.fromWorkDir("123", "node1", Path("/input"), work_dir)
+
+    loaded = WorkDirManifest.fromString(manifest.toString())
+
+    assert loaded.job_id == manifest.job_id
+    assert loaded.work_dir == manifest.work_dir
+    assert loaded.files == manifest.files
+
+
+def test_manifest_from_input_dir_describes_copy(work_dir, tmp_path):
+    (work_dir / "job.qqinfo").write_text("info")
+    (work_dir / "sub" / "cache").mkdir()
+    (work_dir / "sub" / "cache" / "c.txt").write_text("c")
+    (work_dir / "cache").mkdir()
+    (work_dir / "cache" / "d.txt").write_text("d")
+    copy = tmp_path / "copy"
+
+    manifest = WorkDirManifest.fromInputDir(
+        "123",
+        "node1",
+        work_dir,
+        copy,
+        [Path("job.qqinfo"), Path("cache")],
+    )
+
+    assert manifest.input_dir == work_dir
+    assert manifest.work_dir == copy
+    assert set(manifest.files) == {"a.txt", str(Path("sub") / "b.txt")}
+
+
+def test_manifest_from_input_dir_excludes_nested_path(work_dir, tmp_path):
+    manifest = WorkDirManifest.fromInputDir(
+        "123", "node1", work_dir, tmp_path / "copy", [Path("sub/b.txt")]
+    )
+
+    assert set(manifest.files) == {"a.txt"}
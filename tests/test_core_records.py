@@ -0,0 +1,124 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+import io
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from qq_lib.core.error import QQError
+from qq_lib.core.records import OutputFormat, RecordWriter, to_record_value
+from qq_lib.properties.size import Size
+from qq_lib.properties.states import BatchState
+
+FIELDS = ["id", "ncpus", "nodes", "done"]
+RECORDS = [
+    {"id": "1", "ncpus": 4, "nodes": ["node1", "node2"], "done": False},
+    {"id": "2", "ncpus": None, "nodes": None},
+]
+
+
+def _write(format: OutputFormat, records: list) -> str:
+    stream = io.StringIO()
+    RecordWriter(format, FIELDS, stream).writeAll(iter(records))
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("json", OutputFormat.JSON),
+        ("NDJSON", OutputFormat.NDJSON),
+        ("csv", OutputFormat.CSV),
+    ],
+)
+def test_output_format_from_str(string, expected):
+    assert OutputFormat.fromStr(string) == expected
+    assert str(expected) == string.lower()
+
+
+def test_output_format_from_str_invalid():
+    with pytest.raises(QQError, match="Could not recognize an output format"):
+        OutputFormat.fromStr("xml")
+
+
+def test_record_writer_json():
+    output = _write(OutputFormat.JSON, RECORDS)
+
+    assert json.loads(output) == [
+        {"id": "1", "ncpus": 4, "nodes": ["node1", "node2"], "done": False},
+        {"id": "2", "ncpus": None, "nodes": None, "done": None},
+    ]
+
+
+def test_record_writer_json_empty():
+    assert json.loads(_write(OutputFormat.JSON, [])) == []
+
+
+def test_record_writer_ndjson():
+    lines = _write(OutputFormat.NDJSON, RECORDS).splitlines()
+
+    assert len(lines) == 2
+    assert json.loads(lines[0])["nodes"] == ["node1", "node2"]
+    assert list(json.loads(lines[1])) == FIELDS
+
+
+def test_record_writer_ndjson_empty():
+    assert _write(OutputFormat.NDJSON, []) == ""
+
+
+def test_record_writer_csv():
+    output = _write(OutputFormat.CSV, RECORDS)
+
+    assert output.splitlines() == [
+        "id,ncpus,nodes,done",
+        "1,4,node1 node2,false",
+        "2,,,",
+    ]
+
+
+def test_record_writer_csv_empty_writes_header():
+    assert _write(OutputFormat.CSV, []) == "id,ncpus,nodes,done\n"
+
+
+def test_record_writer_writes_records_as_they_come():
+    stream = io.StringIO()
+    writer = RecordWriter(OutputFormat.NDJSON, FIELDS, stream)
+
+    writer.write(RECORDS[0])
+    assert stream.getvalue().count("\n") == 1
+
+    writer.write(RECORDS[1])
+    assert stream.getvalue().count("\n") == 2
+
+
+def test_record_writer_json_closed_on_error():
+    def records():
+        yield RECORDS[0]
+        raise QQError("failed")
+
+    stream = io.StringIO()
+    with pytest.raises(QQError):
+        RecordWriter(OutputFormat.JSON, FIELDS, stream).writeAll(records())
+
+    assert len(json.loads(stream.getvalue())) == 1
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (datetime(2025, 9, 21, 12, 30), "2025-09-21T12:30:00"),
+        (timedelta(hours=1, minutes=2, seconds=3), 3723),
+        (Size(2, "mb"), 2048),
+        (Path("/tmp/job"), "/tmp/job"),
+        (BatchState.RUNNING, "running"),
+        ([Path("a"), "b"], ["a", "b"]),
+        (None, None),
+        (7, 7),
+        ("text", "text"),
+    ],
+)
+def test_to_record_value(value, expected):
+    assert to_record_value(value) == expected
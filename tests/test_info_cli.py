@@ -133,3 +133,20 @@ def test_info_invokes_repeater_with_job_id_and_exits_success():
 
     assert result.exit_code == 0
     repeater_mock.run.assert_called_once()
+
+
+def test_info_command_format_writes_records():
+    runner = CliRunner()
+    informer_mock = MagicMock()
+    informer_mock.toRecord.return_value = {"job_id": "123", "state": "running"}
+
+    with (
+        patch("qq_lib.info.cli.Informer.fromJobId", return_value=informer_mock),
+        patch("qq_lib.info.cli.Repeater") as repeater_cls,
+    ):
+        result = runner.invoke(info, ["123", "--format", "ndjson"])
+
+    assert result.exit_code == 0
+    assert '"job_id": "123"' in result.output
+    assert '"state": "running"' in result.output
+    repeater_cls.assert_not_called()
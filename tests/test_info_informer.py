@@ -7,10 +7,13 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from qq_lib.batch.pbs import PBS
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError, QQJobMismatchError
 from qq_lib.info.informer import Informer
 from qq_lib.properties.info import Info
+from qq_lib.properties.job_type import JobType
+from qq_lib.properties.resources import Resources
 from qq_lib.properties.states import BatchState, NaiveState, RealState
 
 
@@ -548,3 +551,62 @@ def test_informer_from_batch_job_returns_informer_on_success():
 
     assert result is informer_mock
     assert result._batch_info is batch_job
+
+
+def test_informer_to_record():
+    info = Info(
+        batch_system=PBS,
+        qq_version="0.7.0",
+        username="user",
+        job_id="12345.fake.server.com",
+        job_name="script.sh",
+        queue="default",
+        script_name="script.sh",
+        job_type=JobType.STANDARD,
+        input_machine="fake.machine.com",
+        input_dir=Path("/shared/storage"),
+        job_state=NaiveState.QUEUED,
+        submission_time=datetime(2025, 9, 21, 12, 0, 0),
+        stdout_file="stdout.log",
+        stderr_file="stderr.log",
+        resources=Resources(ncpus=8, mem="16gb", walltime="2:00:00"),
+    )
+    informer = Informer(info)
+
+    with (
+        patch.object(Informer, "getRealState", return_value=RealState.QUEUED),
+        patch.object(Informer, "getComment", return_value="Not running") as comment,
+    ):
+        record = informer.toRecord()
+
+    comment.assert_called_once()
+    assert list(record) == Informer.RECORD_FIELDS
+    assert record["job_id"] == "12345.fake.server.com"
+    assert record["job_type"] == "standard"
+    assert record["state"] == "queued"
+    assert record["input_dir"] == "/shared/storage"
+    assert record["work_dir"] is None
+    assert record["ncpus"] == 8
+    assert record["mem_kb"] == 16 * 1024 * 1024
+    assert record["walltime_seconds"] == 7200
+    assert record["loop_cycle"] is None
+    assert record["submission_time"] == "2025-09-21T12:00:00"
+    assert record["start_time"] is None
+    assert record["comment"] == "Not running"
+
+
+def test_informer_to_record_skips_comment_of_finished_job():
+    info = MagicMock()
+    info.loop_info = None
+    info.resources.walltime = None
+    informer = Informer(info)
+
+    with (
+        patch.object(Informer, "getRealState", return_value=RealState.FINISHED),
+        patch.object(Informer, "getComment") as comment,
+    ):
+        record = informer.toRecord()
+
+    comment.assert_not_called()
+    assert record["comment"] is None
+    assert record["state"] == "finished"
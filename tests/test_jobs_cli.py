@@ -2,6 +2,7 @@
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
 
+import json
 from unittest.mock import patch
 
 import pytest
@@ -12,6 +13,8 @@ from qq_lib.batch.pbs import PBS, PBSJob
 from qq_lib.batch.pbs.common import parse_multi_pbs_dump_to_dictionaries
 from qq_lib.jobs.cli import jobs
 from qq_lib.jobs.presenter import JobsPresenter
+from qq_lib.submit.submitter import SubmitResult
+from qq_lib.workflow import WorkflowState
 
 
 @pytest.fixture
@@ -148,6 +151,43 @@ def test_jobs_command_yaml_flag_outputs_yaml(parsed_jobs):
             assert yaml_repr.strip() in output
 
 
+def test_jobs_command_requests_only_shown_columns(parsed_jobs):
+    runner = CliRunner()
+
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(
+            PBS, "getUnfinishedBatchJobs", return_value=parsed_jobs
+        ) as mock_get,
+        patch.object(
+            PBS, "jobsPresenterColumnsToShow", return_value={"S", "Job ID", "Queue"}
+        ),
+    ):
+        result = runner.invoke(
+            jobs, ["--user", "user1", "--sort", "name"], catch_exceptions=False
+        )
+
+    assert result.exit_code == 0
+    mock_get.assert_called_once_with("user1", {"S", "Job ID", "Queue", "Job Name"})
+
+
+def test_jobs_command_format_requests_all_columns(parsed_jobs):
+    runner = CliRunner()
+
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(
+            PBS, "getUnfinishedBatchJobs", return_value=parsed_jobs
+        ) as mock_get,
+    ):
+        result = runner.invoke(
+            jobs, ["--user", "user1", "--format", "ndjson"], catch_exceptions=False
+        )
+
+    assert result.exit_code == 0
+    mock_get.assert_called_once_with("user1", None)
+
+
 def test_jobs_command_no_jobs():
     """
     Test that the command exits cleanly when no jobs are returned.
@@ -169,3 +209,135 @@ def test_jobs_command_no_jobs():
         assert result.exit_code == 0
         assert "No jobs found." in result.output
         mock_sort.assert_not_called()
+
+
+def test_jobs_command_workflow_filters_jobs(parsed_jobs, tmp_path):
+    workflow_file = tmp_path / "workflow.yaml"
+    WorkflowState(
+        workflow_file,
+        {"prep": [SubmitResult(tmp_path, job_id=parsed_jobs[0].getId())]},
+    ).toFile(WorkflowState.getPath(workflow_file))
+
+    runner = CliRunner()
+
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(PBS, "getBatchJobs", return_value=parsed_jobs),
+        patch.object(
+            PBS,
+            "getUnfinishedBatchJobs",
+            side_effect=Exception("getUnfinishedBatchJobs should not be called"),
+        ),
+        patch.object(PBS, "sortJobs"),
+    ):
+        result = runner.invoke(
+            jobs, ["--workflow", str(workflow_file)], catch_exceptions=False
+        )
+
+    assert result.exit_code == 0
+    assert "prep" in result.output
+    assert parsed_jobs[0].getName() in result.output
+    assert parsed_jobs[1].getName() not in result.output
+
+
+def test_jobs_command_watch_uses_watcher(parsed_jobs):
+    runner = CliRunner()
+
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(PBS, "getUnfinishedBatchJobs", return_value=parsed_jobs),
+        patch.object(PBS, "sortJobs"),
+        patch("qq_lib.jobs.cli.JobsWatcher") as mock_watcher,
+    ):
+        result = runner.invoke(jobs, ["--watch"], catch_exceptions=False)
+
+        assert result.exit_code == 0
+        fetch, render, _ = mock_watcher.call_args[0]
+        assert fetch() == parsed_jobs
+        assert render(parsed_jobs) is not None
+
+    mock_watcher.return_value.watch.assert_called_once()
+
+
+def test_jobs_command_watch_with_yaml_fails():
+    runner = CliRunner()
+
+    with patch("qq_lib.jobs.cli.JobsWatcher") as mock_watcher:
+        result = runner.invoke(jobs, ["--watch", "--yaml"])
+
+    assert result.exit_code == 91
+    mock_watcher.assert_not_called()
+
+
+def test_jobs_command_format_ndjson_outputs_records(parsed_jobs):
+    runner = CliRunner()
+
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(PBS, "getUnfinishedBatchJobs", return_value=parsed_jobs),
+        patch.object(PBS, "sortJobs"),
+    ):
+        result = runner.invoke(jobs, ["--format", "ndjson"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert [r["id"] for r in records] == [job.getId() for job in parsed_jobs]
+    assert records[0]["ncpus"] == 4
+    assert records[0]["state"] == "running"
+
+
+def test_jobs_command_format_without_jobs_outputs_empty_array():
+    runner = CliRunner()
+
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(PBS, "getUnfinishedBatchJobs", return_value=[]),
+    ):
+        result = runner.invoke(jobs, ["--format", "json"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert result.output.strip() == "[]"
+
+
+def test_jobs_command_limit_uses_plain_output(parsed_jobs):
+    runner = CliRunner()
+
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(PBS, "getUnfinishedBatchJobs", return_value=parsed_jobs),
+        patch.object(PBS, "sortJobs"),
+        patch.object(JobsPresenter, "dumpPlain") as mock_plain,
+        patch.object(JobsPresenter, "createJobsInfoPanel") as mock_panel,
+    ):
+        result = runner.invoke(
+            jobs, ["--limit", "1", "--sort", "cpus"], catch_exceptions=False
+        )
+
+    assert result.exit_code == 0
+    mock_plain.assert_called_once_with("cpus", 1, 1)
+    mock_panel.assert_not_called()
+
+
+def test_jobs_command_plain_outputs_rows(parsed_jobs):
+    runner = CliRunner()
+
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(PBS, "getUnfinishedBatchJobs", return_value=parsed_jobs),
+        patch.object(PBS, "sortJobs"),
+    ):
+        result = runner.invoke(jobs, ["--plain"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert "COLLECTED JOBS" not in result.output
+    for job in parsed_jobs:
+        assert JobsPresenter._shortenJobId(job.getId()) in result.output
+    assert "Jobs:" in result.output
+
+
+def test_jobs_command_plain_with_watch_fails():
+    runner = CliRunner()
+
+    result = runner.invoke(jobs, ["--page", "2", "--watch"])
+
+    assert result.exit_code == 91
@@ -1,7 +1,7 @@
 # Released under MIT License.
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
-
+import heapq
 import io
 import sys
 from datetime import datetime, timedelta
@@ -13,6 +13,7 @@ from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
 
+from qq_lib.batch.interface.job_index import NodeJobIndex
 from qq_lib.batch.pbs import PBSJob
 from qq_lib.batch.pbs.common import parse_multi_pbs_dump_to_dictionaries
 from qq_lib.batch.pbs.pbs import PBS
@@ -1201,6 +1202,61 @@ def test_create_job_row_returns_row_with_requested_headers():
     assert "4" in result[2]
 
 
+def test_create_job_row_only_computes_shown_columns():
+    job = Mock()
+    state = Mock(toCode=Mock(return_value="R"), color="green")
+    job.getState.return_value = state
+    job.getNCPUs.return_value = 4
+    job.getNGPUs.return_value = 0
+    job.getNNodes.return_value = 1
+    job.getUser.return_value = "user1"
+
+    presenter = JobsPresenter.__new__(JobsPresenter)
+    presenter._all = True
+    presenter._stats = Mock()
+
+    with patch.object(JobsPresenter, "_getJobTimes") as mock_times:
+        result = presenter._createJobRow(job, ["S", "User", "NCPUs"])
+
+    assert len(result) == 3
+    assert "user1" in result[1]
+    mock_times.assert_not_called()
+    for getter in [
+        job.getName,
+        job.getQueue,
+        job.getWalltime,
+        job.getUtilCPU,
+        job.getUtilMem,
+        job.getExitCode,
+        job.getShortNodes,
+    ]:
+        getter.assert_not_called()
+
+
+def test_get_required_columns_returns_visible_headers_and_sort_column():
+    presenter = JobsPresenter.__new__(JobsPresenter)
+    presenter._extra = False
+
+    with patch.object(
+        JobsPresenter, "_getVisibleHeaders", return_value=["S", "Job ID", "NCPUs"]
+    ):
+        assert presenter.getRequiredColumns() == {"S", "Job ID", "NCPUs"}
+        assert presenter.getRequiredColumns("started") == {
+            "S",
+            "Job ID",
+            "NCPUs",
+            "Times",
+        }
+        assert presenter.getRequiredColumns("cpus") == {"S", "Job ID", "NCPUs"}
+
+
+def test_get_required_columns_returns_none_with_extra():
+    presenter = JobsPresenter.__new__(JobsPresenter)
+    presenter._extra = True
+
+    assert presenter.getRequiredColumns() is None
+
+
 def test_create_job_row_calls_add_job_on_stats():
     job = Mock()
     state = Mock(toCode=Mock(return_value="R"), color="green")
@@ -1237,6 +1293,7 @@ def test_create_basic_jobs_table_creates_row_for_each_job_with_headers():
     job3 = Mock()
     presenter = JobsPresenter.__new__(JobsPresenter)
     presenter._jobs = [job1, job2, job3]
+    presenter._rows = {}
 
     with (
         patch.object(
@@ -1276,3 +1333,333 @@ def test_create_basic_jobs_table_creates_row_for_each_job_with_headers():
         numalign="center",
     )
     assert result == "output"
+
+
+def _make_array_member(job_id, array_id, state, ncpus=2):
+    job = Mock()
+    job.getId.return_value = job_id
+    job.getArrayId.return_value = array_id
+    job.getState.return_value = state
+    job.getUser.return_value = "user1"
+    job.getName.return_value = "run.sh"
+    job.getQueue.return_value = "default"
+    job.getNCPUs.return_value = ncpus
+    job.getNGPUs.return_value = 0
+    job.getNNodes.return_value = 1
+    job.getWalltime.return_value = timedelta(hours=1)
+    job.getSubmissionTime.return_value = datetime.now()
+    job.getStartTime.return_value = datetime.now()
+    job.getShortNodes.return_value = ["node1"]
+    job.getUtilCPU.return_value = None
+    job.getUtilMem.return_value = None
+    job.getExitCode.return_value = None
+    return job
+
+
+def test_jobs_presenter_collapses_array_members_into_summary_row():
+    members = [
+        _make_array_member("55_0", "55", BatchState.FINISHED),
+        _make_array_member("55_1", "55", BatchState.RUNNING),
+        _make_array_member("55_2", "55", BatchState.RUNNING),
+        _make_array_member("55_[3-9]", "55", BatchState.QUEUED),
+    ]
+    other = _make_array_member("60", None, BatchState.QUEUED)
+
+    presenter = JobsPresenter(PBS, members[:2] + [other] + members[2:], False, True)
+    with patch.object(
+        JobsPresenter,
+        "_getVisibleHeaders",
+        return_value=["S", "Job ID", "NCPUs", "Node"],
+    ):
+        table = presenter._createBasicJobsTable()
+
+    lines = table.splitlines()
+    assert len(lines) == 3
+    assert "55[]" in lines[1]
+    assert "8" in lines[1]
+    assert "2R" in lines[1]
+    assert "1Q" in lines[1]
+    assert "1F" in lines[1]
+    assert "60" in lines[2]
+
+    # statistics include every member
+    assert presenter._stats.n_jobs[BatchState.RUNNING] == 2
+    assert presenter._stats.n_jobs[BatchState.QUEUED] == 2
+    assert presenter._stats.n_jobs[BatchState.FINISHED] == 1
+
+
+def test_jobs_presenter_array_row_uses_most_significant_state():
+    members = [
+        _make_array_member("7[0].pbs", "7[].pbs", BatchState.FAILED),
+        _make_array_member("7[1].pbs", "7[].pbs", BatchState.FINISHED),
+    ]
+
+    presenter = JobsPresenter(PBS, members, False, False)
+    row = presenter._createArrayRow(members, ["S", "Job ID"])
+
+    assert BatchState.FAILED.toCode() in row[0]
+    assert "7[]" in row[1]
+
+
+def test_jobs_presenter_insert_extra_info_uses_one_line_per_array():
+    members = [
+        _make_array_member("55_0", "55", BatchState.RUNNING),
+        _make_array_member("55_1", "55", BatchState.RUNNING),
+    ]
+    members[0].getInputDir.return_value = "/dirA"
+    members[0].getInputMachine.return_value = None
+    members[0].getComment.return_value = None
+
+    presenter = JobsPresenter.__new__(JobsPresenter)
+    presenter._jobs = members
+
+    result = presenter._insertExtraInfo("HEADER\nROW1")
+
+    assert "/dirA" in result
+    members[1].getInputDir.assert_not_called()
+
+
+def test_remove_job_reverts_add_job():
+    stats = JobsStatistics()
+    stats.addJob(BatchState.RUNNING, 4, 1, 1)
+    stats.addJob(BatchState.QUEUED, 8, 0, 2)
+
+    stats.removeJob(BatchState.RUNNING, 4, 1, 1)
+
+    assert stats.n_jobs == {BatchState.QUEUED: 1}
+    assert stats.n_allocated_cpus == 0
+    assert stats.n_allocated_gpus == 0
+    assert stats.n_allocated_nodes == 0
+    assert stats.n_requested_cpus == 8
+    assert stats.n_requested_nodes == 2
+
+
+def test_jobs_presenter_update_reuses_unchanged_rows():
+    running = _make_array_member("1", None, BatchState.RUNNING, ncpus=4)
+    queued = _make_array_member("2", None, BatchState.QUEUED, ncpus=8)
+    presenter = JobsPresenter(PBS, [running, queued], False, False)
+
+    with patch.object(
+        JobsPresenter, "_getVisibleHeaders", return_value=["S", "Job ID", "Times"]
+    ):
+        presenter._createBasicJobsTable()
+
+        # job 2 starts running, job 3 is submitted
+        started = _make_array_member("2", None, BatchState.RUNNING, ncpus=8)
+        new = _make_array_member("3", None, BatchState.QUEUED, ncpus=2)
+        presenter.update([running, started, new])
+        with patch.object(
+            presenter, "_createJobRow", wraps=presenter._createJobRow
+        ) as mock_create_row:
+            table = presenter._createBasicJobsTable()
+
+    assert mock_create_row.call_count == 2
+    mock_create_row.assert_any_call(started, ["S", "Job ID", "Times"])
+    mock_create_row.assert_any_call(new, ["S", "Job ID", "Times"])
+    assert len(table.splitlines()) == 4
+
+    # statistics are not counted twice
+    assert presenter._stats.n_jobs == {BatchState.RUNNING: 2, BatchState.QUEUED: 1}
+    assert presenter._stats.n_allocated_cpus == 12
+    assert presenter._stats.n_requested_cpus == 2
+
+
+def test_jobs_presenter_update_removes_finished_jobs_from_statistics():
+    job1 = _make_array_member("1", None, BatchState.RUNNING, ncpus=4)
+    job2 = _make_array_member("2", None, BatchState.RUNNING, ncpus=8)
+    presenter = JobsPresenter(PBS, [job1, job2], False, False)
+
+    with patch.object(JobsPresenter, "_getVisibleHeaders", return_value=["Job ID"]):
+        presenter._createBasicJobsTable()
+        presenter.update([job2])
+        table = presenter._createBasicJobsTable()
+
+    assert len(table.splitlines()) == 2
+    assert presenter._stats.n_jobs == {BatchState.RUNNING: 1}
+    assert presenter._stats.n_allocated_cpus == 8
+
+
+def test_jobs_presenter_refresh_row_updates_times():
+    job = _make_array_member("1", None, BatchState.RUNNING)
+    presenter = JobsPresenter(PBS, [job], False, False)
+    row = ["state", "old time"]
+
+    with patch.object(
+        JobsPresenter, "_formatTime", return_value="new time"
+    ) as mock_format:
+        presenter._refreshRow([job], row, ["S", "Times"])
+
+    assert row == ["state", "new time"]
+    mock_format.assert_called_once()
+
+
+def _plain_jobs(n: int) -> list:
+    jobs = []
+    for i in range(n):
+        job = _make_array_member(str(i + 1), None, BatchState.RUNNING, ncpus=i + 1)
+        job.getName.return_value = f"job{i + 1}"
+        job.getShortNodes.return_value = None
+        job.getEstimated.return_value = None
+        jobs.append(job)
+    return jobs
+
+
+def _dump_plain(presenter, **kwargs) -> str:
+    stream = io.StringIO()
+    with patch.object(
+        JobsPresenter,
+        "_getVisibleHeaders",
+        return_value=["S", "Job ID", "Job Name", "NCPUs"],
+    ):
+        presenter.dumpPlain(stream=stream, **kwargs)
+    return stream.getvalue()
+
+
+def test_jobs_presenter_dump_plain_writes_rows_and_statistics():
+    presenter = JobsPresenter(PBS, _plain_jobs(3), False, False)
+
+    output = _dump_plain(presenter)
+
+    lines = output.splitlines()
+    assert "\033" not in output
+    assert lines[0].split() == ["S", "Job", "ID", "Job", "Name", "NCPUs"]
+    assert lines[1].split() == ["R", "1", "job1", "1"]
+    assert lines[3].split() == ["R", "3", "job3", "3"]
+    assert "Jobs: R 3" in output
+    assert "Allocated: 6 CPUs" in output
+    assert "Showing rows" not in output
+
+
+def test_jobs_presenter_dump_plain_keeps_colors_on_terminal():
+    presenter = JobsPresenter(PBS, _plain_jobs(1), False, False)
+    stream = io.StringIO()
+    stream.isatty = lambda: True
+
+    with patch.object(JobsPresenter, "_getVisibleHeaders", return_value=["S"]):
+        presenter.dumpPlain(stream=stream)
+
+    assert "\033[" in stream.getvalue()
+
+
+def test_jobs_presenter_dump_plain_pages_and_counts_all_jobs():
+    presenter = JobsPresenter(PBS, _plain_jobs(5), False, False)
+
+    output = _dump_plain(presenter, limit=2, page=2)
+
+    rows = output.split("\n\n")[0].splitlines()[1:]
+    assert [row.split()[1] for row in rows] == ["3", "4"]
+    # statistics include the jobs that are not shown
+    assert "R 5" in output
+    assert "Allocated: 15 CPUs" in output
+    assert "Showing rows 3-4 of 5 (page 2 of 3)." in output
+
+
+def test_jobs_presenter_dump_plain_page_out_of_range():
+    presenter = JobsPresenter(PBS, _plain_jobs(2), False, False)
+
+    output = _dump_plain(presenter, limit=5, page=3)
+
+    assert "No rows on page 3 of 1." in output
+    assert "R 2" in output
+
+
+def test_jobs_presenter_dump_plain_sorts_top_rows():
+    presenter = JobsPresenter(PBS, _plain_jobs(6), False, False)
+
+    with patch(
+        "qq_lib.jobs.presenter.heapq.nlargest", wraps=heapq.nlargest
+    ) as mock_heap:
+        output = _dump_plain(presenter, sort="cpus", limit=2)
+
+    mock_heap.assert_called_once()
+    assert mock_heap.call_args[0][0] == 2
+    rows = output.split("\n\n")[0].splitlines()[1:]
+    assert [row.split()[1] for row in rows] == ["6", "5"]
+
+
+def test_jobs_presenter_dump_plain_sorts_all_rows_without_limit():
+    presenter = JobsPresenter(PBS, _plain_jobs(3)[::-1], False, False)
+
+    output = _dump_plain(presenter, sort="name")
+
+    rows = output.split("\n\n")[0].splitlines()[1:]
+    assert [row.split()[2] for row in rows] == ["job1", "job2", "job3"]
+
+
+def test_jobs_presenter_dump_plain_writes_in_chunks(monkeypatch):
+    monkeypatch.setattr(CFG.jobs_presenter, "plain_chunk_size", 2)
+    jobs = _plain_jobs(5)
+    jobs[4].getName.return_value = "a_much_longer_name"
+    presenter = JobsPresenter(PBS, jobs, False, False)
+    stream = io.StringIO()
+
+    with (
+        patch.object(JobsPresenter, "_getVisibleHeaders", return_value=["Job Name"]),
+        patch.object(stream, "flush") as mock_flush,
+    ):
+        presenter.dumpPlain(stream=stream)
+
+    # three chunks of rows and the statistics
+    assert mock_flush.call_count == 4
+    lines = stream.getvalue().splitlines()
+    assert lines[1] == "  job1  "
+    # the column is widened for the later chunk
+    assert lines[5] == "a_much_longer_name"
+
+
+def test_jobs_presenter_dump_plain_without_jobs_writes_header():
+    presenter = JobsPresenter(PBS, [], False, False)
+
+    output = _dump_plain(presenter)
+
+    assert output.splitlines()[0].split()[0] == "S"
+    assert "Σ 0" in output
+
+
+def test_jobs_statistics_create_plain_summary():
+    stats = JobsStatistics()
+    stats.addJob(BatchState.RUNNING, 4, 1, 1)
+    stats.addJob(BatchState.QUEUED, 8, 0, 2)
+
+    summary = stats.createPlainSummary().splitlines()
+
+    assert summary[0] == f"Jobs: R 1  Q 1  {CFG.jobs_presenter.sum_jobs_code} 2"
+    assert summary[1] == "Requested: 8 CPUs  0 GPUs  2 nodes"
+    assert summary[2] == "Allocated: 4 CPUs  1 GPUs  1 nodes"
+    assert len(summary) == 3
+
+
+def _index_job(job_id: str, user: str, nodes: list[str]) -> Mock:
+    job = Mock()
+    job.getId.return_value = job_id
+    job.getUser.return_value = user
+    job.getNodes.return_value = nodes
+    return job
+
+
+def test_jobs_presenter_dump_by_node_sorts_nodes_naturally():
+    index = NodeJobIndex(
+        [
+            _index_job("12.server", "alice", ["node10", "node2"]),
+            _index_job("13.server", "bob", ["node2"]),
+        ]
+    )
+    presenter = JobsPresenter(PBS, [], False, False)
+    stream = io.StringIO()
+
+    presenter.dumpByNode(index, stream)
+
+    lines = stream.getvalue().splitlines()
+    assert lines[1].split() == ["node2", "2", "alice,", "bob", "12", "13"]
+    assert lines[2].split() == ["node10", "1", "alice", "12"]
+    assert lines[-1] == "2 nodes are occupied by 2 jobs of 2 users."
+    assert "\033" not in stream.getvalue()
+
+
+def test_jobs_presenter_dump_by_node_without_running_jobs():
+    presenter = JobsPresenter(PBS, [], False, False)
+    stream = io.StringIO()
+
+    presenter.dumpByNode(NodeJobIndex([]), stream)
+
+    assert stream.getvalue() == "No jobs are running.\n"
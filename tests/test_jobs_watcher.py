@@ -0,0 +1,82 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from rich.console import Console
+from rich.text import Text
+
+from qq_lib.core.config import CFG
+from qq_lib.jobs.watcher import JobsWatcher
+from qq_lib.properties.states import BatchState
+
+
+def _job(job_id: str, state: BatchState) -> MagicMock:
+    job = MagicMock()
+    job.getId.return_value = job_id
+    job.getState.return_value = state
+    return job
+
+
+@pytest.fixture
+def intervals(monkeypatch):
+    monkeypatch.setattr(CFG.jobs_presenter, "watch_min_interval", 2.0)
+    monkeypatch.setattr(CFG.jobs_presenter, "watch_max_interval", 10.0)
+    monkeypatch.setattr(CFG.jobs_presenter, "watch_backoff", 2.0)
+
+
+@pytest.mark.usefixtures("intervals")
+def test_jobs_watcher_refresh_renders_fetched_jobs():
+    jobs = [_job("1", BatchState.RUNNING)]
+    render = MagicMock(return_value=Text("rendered"))
+    watcher = JobsWatcher(lambda: jobs, render, Console())
+
+    watcher.refresh()
+
+    render.assert_called_once_with(jobs)
+
+
+@pytest.mark.usefixtures("intervals")
+def test_jobs_watcher_interval_grows_while_nothing_changes():
+    jobs = [_job("1", BatchState.RUNNING)]
+    watcher = JobsWatcher(lambda: jobs, lambda _: Text(""), Console())
+
+    observed = []
+    for _ in range(4):
+        watcher.refresh()
+        observed.append(watcher._interval)
+
+    assert observed == [2.0, 4.0, 8.0, 10.0]
+
+
+@pytest.mark.usefixtures("intervals")
+def test_jobs_watcher_interval_resets_on_change():
+    fetched = [
+        [_job("1", BatchState.QUEUED)],
+        [_job("1", BatchState.QUEUED)],
+        [_job("1", BatchState.RUNNING)],
+        [_job("1", BatchState.RUNNING), _job("2", BatchState.QUEUED)],
+    ]
+    watcher = JobsWatcher(lambda: fetched.pop(0), lambda _: Text(""), Console())
+
+    observed = []
+    for _ in range(4):
+        watcher.refresh()
+        observed.append(watcher._interval)
+
+    assert observed == [2.0, 4.0, 2.0, 2.0]
+
+
+@pytest.mark.usefixtures("intervals")
+def test_jobs_watcher_watch_stops_on_keyboard_interrupt():
+    fetch = MagicMock(return_value=[])
+    watcher = JobsWatcher(fetch, lambda _: Text(""), Console(file=MagicMock()))
+
+    with patch(
+        "qq_lib.jobs.watcher.sleep", side_effect=[None, KeyboardInterrupt]
+    ) as mock_sleep:
+        watcher.watch()
+
+    assert fetch.call_count == 2
+    assert mock_sleep.call_count == 2
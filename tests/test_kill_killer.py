@@ -1,8 +1,6 @@
 # Released under MIT License.
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
-import stat
-import tempfile
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -14,33 +12,6 @@ from qq_lib.kill.killer import Killer
 from qq_lib.properties.states import RealState
 
 
-def test_killer_lock_file_removes_write_permissions():
-    with tempfile.NamedTemporaryFile() as tmp_file:
-        file_path = Path(tmp_file.name)
-        # set initial permissions
-        file_path.chmod(
-            stat.S_IRUSR
-            | stat.S_IWUSR
-            | stat.S_IRGRP
-            | stat.S_IWGRP
-            | stat.S_IROTH
-            | stat.S_IWOTH
-        )
-
-        killer = Killer.__new__(Killer)
-        killer._lockFile(file_path)
-
-        new_mode = file_path.stat().st_mode
-
-        # all write permissions removed
-        assert not (new_mode & stat.S_IWUSR)
-        assert not (new_mode & stat.S_IWGRP)
-        assert not (new_mode & stat.S_IWOTH)
-
-        # read permissions are intact
-        assert new_mode & stat.S_IRUSR
-
-
 @pytest.mark.parametrize(
     "state,expected",
     [
@@ -130,7 +101,7 @@ def test_killer_is_unknown_inconsistent_returns_correctly(state, expected):
     assert killer._isUnknownInconsistent() is expected
 
 
-def test_killer_update_info_file_calls_informer_and_locks_file():
+def test_killer_update_info_file_calls_informer_and_records_kill():
     mock_file = Path("/tmp/fake_info_file.txt")
     killer = Killer.__new__(Killer)
     killer._info_file = mock_file
@@ -138,17 +109,16 @@ def test_killer_update_info_file_calls_informer_and_locks_file():
     mock_informer = MagicMock()
     killer._informer = mock_informer
 
-    with (
-        patch.object(killer, "_lockFile") as mock_lock,
-        patch("qq_lib.kill.killer.datetime") as mock_datetime,
-    ):
+    with patch("qq_lib.kill.killer.datetime") as mock_datetime:
         mock_datetime.now.return_value = datetime(2025, 1, 1)
 
         killer._updateInfoFile()
 
         mock_informer.setKilled.assert_called_once_with(datetime(2025, 1, 1))
-        mock_informer.toFile.assert_called_once_with(mock_file)
-        mock_lock.assert_called_once_with(mock_file)
+        mock_informer.toJournal.assert_called_once_with(
+            mock_file, ["job_state", "completion_time"]
+        )
+        mock_informer.toFile.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 from click.testing import CliRunner
 
+from qq_lib.batch.pbs.node import PBSNode
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
 from qq_lib.nodes.cli import nodes
@@ -33,7 +34,7 @@ def test_nodes_command_prints_available_nodes():
     assert result.exit_code == 0
     mock_meta.assert_called_once()
     mock_batch.getNodes.assert_called_once()
-    mock_presenter_cls.assert_called_once_with([mock_node], "user", False)
+    mock_presenter_cls.assert_called_once_with([mock_node], "user", False, None)
     mock_presenter.createNodesInfoPanel.assert_called_once()
 
 
@@ -59,7 +60,7 @@ def test_nodes_command_prints_all_nodes_with_flag():
     assert result.exit_code == 0
     mock_meta.assert_called_once()
     mock_batch.getNodes.assert_called_once()
-    mock_presenter_cls.assert_called_once_with([mock_node], "testuser", True)
+    mock_presenter_cls.assert_called_once_with([mock_node], "testuser", True, None)
     mock_presenter.createNodesInfoPanel.assert_called_once()
 
 
@@ -85,7 +86,7 @@ def test_nodes_command_outputs_yaml_when_flag_set():
     assert result.exit_code == 0
     mock_meta.assert_called_once()
     mock_batch.getNodes.assert_called_once()
-    mock_presenter_cls.assert_called_once_with([mock_node], "testuser", False)
+    mock_presenter_cls.assert_called_once_with([mock_node], "testuser", False, None)
     mock_presenter.dumpYaml.assert_called_once()
 
 
@@ -119,3 +120,150 @@ def test_nodes_command_handles_unexpected_exception_and_exits_99():
 
     assert result.exit_code == CFG.exit_codes.unexpected_error
     mock_logger.critical.assert_called_once()
+
+
+def test_nodes_command_format_dumps_records():
+    runner = CliRunner()
+    mock_node = MagicMock()
+    mock_node.isAvailableToUser.return_value = True
+
+    with (
+        patch("qq_lib.nodes.cli.BatchMeta.fromEnvVarOrGuess") as mock_meta,
+        patch("qq_lib.nodes.cli.NodesPresenter") as mock_presenter_cls,
+        patch("qq_lib.nodes.cli.getpass.getuser", return_value="user"),
+    ):
+        mock_meta.return_value.getNodes.return_value = [mock_node]
+        result = runner.invoke(nodes, ["--format", "CSV"])
+
+    assert result.exit_code == 0
+    mock_presenter_cls.return_value.dumpRecords.assert_called_once()
+    assert str(mock_presenter_cls.return_value.dumpRecords.call_args[0][0]) == "csv"
+    mock_presenter_cls.return_value.createNodesInfoPanel.assert_not_called()
+
+
+def test_nodes_command_format_with_yaml_fails():
+    runner = CliRunner()
+
+    with patch("qq_lib.nodes.cli.BatchMeta.fromEnvVarOrGuess") as mock_meta:
+        result = runner.invoke(nodes, ["--format", "json", "--yaml"])
+
+    assert result.exit_code == CFG.exit_codes.default
+    mock_meta.assert_not_called()
+
+
+def test_nodes_command_plain_dumps_plain_tables():
+    runner = CliRunner()
+    mock_node = MagicMock()
+    mock_node.isAvailableToUser.return_value = True
+
+    with (
+        patch("qq_lib.nodes.cli.BatchMeta.fromEnvVarOrGuess") as mock_meta,
+        patch("qq_lib.nodes.cli.NodesPresenter") as mock_presenter_cls,
+        patch("qq_lib.nodes.cli.getpass.getuser", return_value="user"),
+    ):
+        mock_meta.return_value.getNodes.return_value = [mock_node]
+        result = runner.invoke(nodes, ["--plain"])
+
+    assert result.exit_code == 0
+    mock_presenter_cls.return_value.dumpPlain.assert_called_once()
+    mock_presenter_cls.return_value.createNodesInfoPanel.assert_not_called()
+
+
+def test_nodes_command_plain_with_yaml_fails():
+    runner = CliRunner()
+
+    with patch("qq_lib.nodes.cli.BatchMeta.fromEnvVarOrGuess") as mock_meta:
+        result = runner.invoke(nodes, ["--plain", "--yaml"])
+
+    assert result.exit_code == CFG.exit_codes.default
+    mock_meta.assert_not_called()
+
+
+def _fit_node(name: str, ncpus: str, state: str = "free") -> PBSNode:
+    return PBSNode.fromDict(name, {"state": state, "resources_available.ncpus": ncpus})
+
+
+def test_nodes_command_fit_shows_only_candidate_nodes():
+    runner = CliRunner()
+    small, large, down = (
+        _fit_node("node1", "8"),
+        _fit_node("node2", "64"),
+        _fit_node("node3", "64", "down"),
+    )
+
+    with (
+        patch("qq_lib.nodes.cli.BatchMeta.fromEnvVarOrGuess") as mock_meta,
+        patch("qq_lib.nodes.cli.NodesPresenter") as mock_presenter_cls,
+        patch("qq_lib.nodes.cli.Console"),
+        patch("qq_lib.nodes.cli.getpass.getuser", return_value="user"),
+    ):
+        mock_meta.return_value.getNodes.return_value = [small, large, down]
+        # unavailable nodes are never candidates, even with --all
+        result = runner.invoke(nodes, ["--all", "--fit", "ncpus=32"])
+
+    assert result.exit_code == 0
+    mock_presenter_cls.assert_called_once_with([large], "user", True, None)
+
+
+def test_nodes_command_fit_no_candidates_fails():
+    runner = CliRunner()
+
+    with (
+        patch("qq_lib.nodes.cli.BatchMeta.fromEnvVarOrGuess") as mock_meta,
+        patch("qq_lib.nodes.cli.NodesPresenter") as mock_presenter_cls,
+        patch("qq_lib.nodes.cli.getpass.getuser", return_value="user"),
+    ):
+        mock_meta.return_value.getNodes.return_value = [_fit_node("node1", "8")]
+        result = runner.invoke(nodes, ["--fit", "ncpus=32"])
+
+    assert result.exit_code == CFG.exit_codes.default
+    mock_presenter_cls.assert_not_called()
+
+
+def test_nodes_command_fit_invalid_resources_fails():
+    runner = CliRunner()
+
+    with (
+        patch("qq_lib.nodes.cli.BatchMeta.fromEnvVarOrGuess") as mock_meta,
+        patch("qq_lib.nodes.cli.getpass.getuser", return_value="user"),
+    ):
+        mock_meta.return_value.getNodes.return_value = [_fit_node("node1", "8")]
+        result = runner.invoke(nodes, ["--fit", "ncpus=many"])
+
+    assert result.exit_code == CFG.exit_codes.default
+
+
+def test_nodes_command_jobs_builds_index_from_one_query():
+    runner = CliRunner()
+    mock_node = MagicMock()
+    mock_node.isAvailableToUser.return_value = True
+
+    with (
+        patch("qq_lib.nodes.cli.BatchMeta.fromEnvVarOrGuess") as mock_meta,
+        patch("qq_lib.nodes.cli.NodesPresenter") as mock_presenter_cls,
+        patch("qq_lib.nodes.cli.NodeJobIndex") as mock_index_cls,
+        patch("qq_lib.nodes.cli.Console"),
+        patch("qq_lib.nodes.cli.getpass.getuser", return_value="user"),
+    ):
+        mock_batch = mock_meta.return_value
+        mock_batch.getNodes.return_value = [mock_node]
+        result = runner.invoke(nodes, ["--jobs"])
+
+    assert result.exit_code == 0
+    mock_batch.getAllUnfinishedBatchJobs.assert_called_once_with(mock_index_cls.COLUMNS)
+    mock_index_cls.assert_called_once_with(
+        mock_batch.getAllUnfinishedBatchJobs.return_value
+    )
+    mock_presenter_cls.assert_called_once_with(
+        [mock_node], "user", False, mock_index_cls.return_value
+    )
+
+
+def test_nodes_command_jobs_with_yaml_fails():
+    runner = CliRunner()
+
+    with patch("qq_lib.nodes.cli.BatchMeta.fromEnvVarOrGuess") as mock_meta:
+        result = runner.invoke(nodes, ["--jobs", "--yaml"])
+
+    assert result.exit_code == CFG.exit_codes.default
+    mock_meta.assert_not_called()
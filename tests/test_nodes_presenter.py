@@ -2,6 +2,7 @@
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
 
+import json
 import sys
 from io import StringIO
 from unittest.mock import MagicMock, patch
@@ -14,173 +15,122 @@ from rich.rule import Rule
 from rich.table import Table
 from rich.text import Text
 
+from qq_lib.batch.interface.job_index import NodeJobIndex
 from qq_lib.batch.pbs.node import PBSNode
 from qq_lib.core.config import CFG
+from qq_lib.core.records import OutputFormat
 from qq_lib.nodes.presenter import NodeGroup, NodeGroupStats, NodesPresenter
 from qq_lib.properties.size import Size
 
 
-@patch.object(NodeGroup, "_shouldShowProperties", return_value=True)
-@patch.object(NodeGroup, "_shouldShowSharedScratch", return_value=True)
-@patch.object(NodeGroup, "_shouldShowSSDScratch", return_value=True)
-@patch.object(NodeGroup, "_shouldShowLocalScratch", return_value=True)
-@patch.object(NodeGroup, "_shouldShowGPUMem", return_value=True)
-@patch.object(NodeGroup, "_shouldShowGPUs", return_value=True)
+@patch.object(NodeGroup, "_scanNodes")
 @patch.object(NodeGroup, "_setSharedProperties")
 @patch.object(NodeGroup, "_sortNodes")
-def test_node_group_init(
-    mock_sort,
-    mock_set_props,
-    mock_show_gpus,
-    mock_show_gpu_mem,
-    mock_show_local,
-    mock_show_ssd,
-    mock_show_shared,
-    mock_show_props,
-):
+def test_node_group_init(mock_sort, mock_set_props, mock_scan):
     nodes = [MagicMock(), MagicMock()]
     group = NodeGroup("gpu_nodes", nodes, "user1")
 
     mock_sort.assert_called_once()
     mock_set_props.assert_called_once()
-    mock_show_gpus.assert_called_once()
-    mock_show_gpu_mem.assert_called_once()
-    mock_show_local.assert_called_once()
-    mock_show_ssd.assert_called_once()
-    mock_show_shared.assert_called_once()
-    mock_show_props.assert_called_once()
+    mock_scan.assert_called_once()
 
     assert group.name == "gpu_nodes"
     assert group.nodes == nodes
     assert isinstance(group.stats, NodeGroupStats)
     assert group._user == "user1"
+
+
+def _make_scan_node(**values) -> MagicMock:
+    node = MagicMock()
+    node.getNCPUs.return_value = values.get("ncpus", 8)
+    node.getNFreeCPUs.return_value = values.get("free_cpus", 4)
+    node.getNGPUs.return_value = values.get("ngpus", 0)
+    node.getNFreeGPUs.return_value = values.get("free_gpus", 0)
+    node.getGPUMemory.return_value = values.get("gpu_mem")
+    node.getLocalScratch.return_value = values.get("local")
+    node.getSSDScratch.return_value = values.get("ssd")
+    node.getSharedScratch.return_value = values.get("shared")
+    node.getProperties.return_value = values.get("props", [])
+    return node
+
+
+def _scan(*nodes, shared_properties=()) -> NodeGroup:
+    group = NodeGroup.__new__(NodeGroup)
+    group.nodes = list(nodes)
+    group.stats = NodeGroupStats()
+    group._shared_properties = list(shared_properties)
+    group._scanNodes()
+    return group
+
+
+def test_node_group_scan_nodes_shows_all_columns():
+    group = _scan(
+        _make_scan_node(ngpus=0, local=Size(0, "gb"), props=["fast"]),
+        _make_scan_node(
+            ngpus=4,
+            gpu_mem=Size(4, "gb"),
+            local=Size(1024, "gb"),
+            ssd=Size(1024, "gb"),
+            shared=Size(1024, "gb"),
+            props=["fast", "gpu"],
+        ),
+        shared_properties=["fast"],
+    )
+
     assert group._show_gpus is True
+    assert group._show_gpu_mem is True
     assert group._show_local is True
     assert group._show_ssd is True
     assert group._show_shared is True
     assert group._show_props is True
 
 
-def test_node_group_should_show_gpus_returns_true_if_any_node_has_gpus():
-    node1 = MagicMock(spec=["getNGPUs"])
-    node1.getNGPUs.return_value = 0
-    node2 = MagicMock(spec=["getNGPUs"])
-    node2.getNGPUs.return_value = 4
-    group = NodeGroup.__new__(NodeGroup)
-    group.nodes = [node1, node2]
-    assert group._shouldShowGPUs() is True
-
-
-def test_node_group_should_show_gpus_returns_false_if_no_node_has_gpus():
-    node1 = MagicMock(spec=["getNGPUs"])
-    node1.getNGPUs.return_value = 0
-    node2 = MagicMock(spec=["getNGPUs"])
-    node2.getNGPUs.return_value = 0
-    group = NodeGroup.__new__(NodeGroup)
-    group.nodes = [node1, node2]
-    assert group._shouldShowGPUs() is False
-
-
-def test_node_group_should_show_gpu_mem_returns_true_if_any_node_has_gpu_mem():
-    node1 = MagicMock(spec=["getGPUMemory"])
-    node1.getGPUMemory.return_value = Size(0, "kb")
-    node2 = MagicMock(spec=["getGPUMemory"])
-    node2.getGPUMemory.return_value = Size(4, "gb")
-    group = NodeGroup.__new__(NodeGroup)
-    group.nodes = [node1, node2]
-    assert group._shouldShowGPUMem() is True
-
-
-def test_node_group_should_show_gpu_mem_returns_false_if_no_node_has_gpu_mem():
-    node1 = MagicMock(spec=["getGPUMemory"])
-    node1.getGPUMemory.return_value = Size(0, "kb")
-    node2 = MagicMock(spec=["getGPUMemory"])
-    node2.getGPUMemory.return_value = Size(0, "gb")
-    group = NodeGroup.__new__(NodeGroup)
-    group.nodes = [node1, node2]
-    assert group._shouldShowGPUMem() is False
-
-
-def test_node_group_should_show_local_scratch_returns_true_if_any_has_space():
-    node1 = MagicMock(spec=["getLocalScratch"])
-    node1.getLocalScratch.return_value = Size(0, "gb")
-    node2 = MagicMock(spec=["getLocalScratch"])
-    node2.getLocalScratch.return_value = Size(1024, "gb")
-    group = NodeGroup.__new__(NodeGroup)
-    group.nodes = [node1, node2]
-    assert group._shouldShowLocalScratch() is True
-
-
-def test_node_group_should_show_local_scratch_returns_false_if_all_zero():
-    node1 = MagicMock(spec=["getLocalScratch"])
-    node1.getLocalScratch.return_value = Size(0)
-    node2 = MagicMock(spec=["getLocalScratch"])
-    node2.getLocalScratch.return_value = Size(0)
-    group = NodeGroup.__new__(NodeGroup)
-    group.nodes = [node1, node2]
-    assert group._shouldShowLocalScratch() is False
-
-
-def test_node_group_should_show_ssd_scratch_returns_true_if_any_has_space():
-    node1 = MagicMock(spec=["getSSDScratch"])
-    node1.getSSDScratch.return_value = Size(0, "kb")
-    node2 = MagicMock(spec=["getSSDScratch"])
-    node2.getSSDScratch.return_value = Size(1024, "gb")
-    group = NodeGroup.__new__(NodeGroup)
-    group.nodes = [node1, node2]
-    assert group._shouldShowSSDScratch() is True
+def test_node_group_scan_nodes_hides_empty_columns():
+    group = _scan(
+        _make_scan_node(
+            ngpus=0,
+            gpu_mem=Size(0, "kb"),
+            local=Size(0),
+            ssd=Size(0, "kb"),
+            shared=Size(0, "kb"),
+            props=["fast", "gpu"],
+        ),
+        _make_scan_node(ngpus=None, props=["fast", "gpu"]),
+        shared_properties=["fast", "gpu"],
+    )
 
+    assert group._show_gpus is False
+    assert group._show_gpu_mem is False
+    assert group._show_local is False
+    assert group._show_ssd is False
+    assert group._show_shared is False
+    assert group._show_props is False
 
-def test_node_group_should_show_ssd_scratch_returns_false_if_all_zero():
-    node1 = MagicMock(spec=["getSSDScratch"])
-    node1.getSSDScratch.return_value = Size(0, "kb")
-    node2 = MagicMock(spec=["getSSDScratch"])
-    node2.getSSDScratch.return_value = Size(0, "kb")
-    group = NodeGroup.__new__(NodeGroup)
-    group.nodes = [node1, node2]
-    assert group._shouldShowSSDScratch() is False
 
+def test_node_group_scan_nodes_collects_stats():
+    group = _scan(
+        _make_scan_node(ncpus=16, free_cpus=8, ngpus=2, free_gpus=1, props=["gpu"]),
+        _make_scan_node(ncpus=8, free_cpus=0, props=["fast"]),
+    )
 
-def test_node_group_should_show_shared_scratch_returns_true_if_any_has_space():
-    node1 = MagicMock(spec=["getSharedScratch"])
-    node1.getSharedScratch.return_value = Size(0)
-    node2 = MagicMock(spec=["getSharedScratch"])
-    node2.getSharedScratch.return_value = Size(1024, "gb")
-    group = NodeGroup.__new__(NodeGroup)
-    group.nodes = [node1, node2]
-    assert group._shouldShowSharedScratch() is True
+    assert group.stats == NodeGroupStats(
+        n_nodes=2,
+        n_cpus=24,
+        n_free_cpus=8,
+        n_gpus=2,
+        n_free_gpus=1,
+        properties={"gpu", "fast"},
+    )
 
 
-def test_node_group_should_show_shared_scratch_returns_false_if_all_zero():
-    node1 = MagicMock(spec=["getSharedScratch"])
-    node1.getSharedScratch.return_value = Size(0, "kb")
-    node2 = MagicMock(spec=["getSharedScratch"])
-    node2.getSharedScratch.return_value = Size(0)
-    group = NodeGroup.__new__(NodeGroup)
-    group.nodes = [node1, node2]
-    assert group._shouldShowSharedScratch() is False
+def test_node_group_scan_nodes_reads_each_node_once():
+    node = _make_scan_node(ngpus=2, local=Size(1, "gb"), props=["gpu"])
 
+    _scan(node, _make_scan_node(), _make_scan_node())
 
-def test_node_group_should_show_properties_returns_true_if_not_all_shared():
-    node1 = MagicMock(spec=["getProperties"])
-    node1.getProperties.return_value = ["fast", "gpu"]
-    node2 = MagicMock(spec=["getProperties"])
-    node2.getProperties.return_value = ["fast"]
-    group = NodeGroup.__new__(NodeGroup)
-    group.nodes = [node1, node2]
-    group._shared_properties = {"fast"}
-    assert group._shouldShowProperties() is True
-
-
-def test_node_group_should_show_properties_returns_false_if_all_shared():
-    node1 = MagicMock(spec=["getProperties"])
-    node1.getProperties.return_value = ["fast", "gpu"]
-    node2 = MagicMock(spec=["getProperties"])
-    node2.getProperties.return_value = ["fast", "gpu"]
-    group = NodeGroup.__new__(NodeGroup)
-    group.nodes = [node1, node2]
-    group._shared_properties = {"fast", "gpu"}
-    assert group._shouldShowProperties() is False
+    node.getNGPUs.assert_called_once()
+    node.getLocalScratch.assert_called_once()
+    node.getProperties.assert_called_once()
 
 
 @patch(
@@ -219,6 +169,7 @@ def test_node_group_add_node_row_all_shows(
 
     group = NodeGroup.__new__(NodeGroup)
     group._user = "user1"
+    group._index = None
     group._show_gpus = True
     group._show_gpu_mem = True
     group._show_local = True
@@ -234,7 +185,7 @@ def test_node_group_add_node_row_all_shows(
     group._addNodeRow(node, table)
 
     node.isAvailableToUser.assert_called_once_with("user1")
-    group.stats.addNode.assert_called_once_with(16, 8, 2, 1, ["gpu", "fast"])
+    group.stats.addNode.assert_not_called()
     mock_state_mark.assert_called_once_with(8, 16, 1, 2, True)
     mock_proc_units.assert_any_call(8, 16, True)
     mock_size.assert_any_call("32gb", "64gb", CFG.nodes_presenter.main_text_style)
@@ -278,6 +229,7 @@ def test_node_group_add_node_row_all_shows_false(
 
     group = NodeGroup.__new__(NodeGroup)
     group._user = "user2"
+    group._index = None
     group._show_gpus = False
     group._show_gpu_mem = False
     group._show_local = False
@@ -293,7 +245,7 @@ def test_node_group_add_node_row_all_shows_false(
     group._addNodeRow(node, table)
 
     node.isAvailableToUser.assert_called_once_with("user2")
-    group.stats.addNode.assert_called_once_with(8, 4, 0, 0, [])
+    group.stats.addNode.assert_not_called()
     mock_state_mark.assert_called_once_with(4, 8, 0, 0, False)
     mock_proc_units.assert_any_call(4, 8, False)
     mock_props.assert_not_called()
@@ -421,6 +373,7 @@ def test_node_group_create_nodes_table(mock_add_row):
     group._show_ssd = True
     group._show_shared = True
     group._show_props = True
+    group._index = None
 
     table = group.createNodesTable()
 
@@ -457,6 +410,7 @@ def test_node_group_create_nodes_table_respects_disabled_columns(mock_add_row):
     group._show_ssd = False
     group._show_shared = False
     group._show_props = False
+    group._index = None
 
     table = group.createNodesTable()
 
@@ -820,6 +774,7 @@ def test_nodes_presenter_create_node_groups_creates_group_for_common_prefix(
     presenter = NodesPresenter.__new__(NodesPresenter)
     presenter._nodes = [node1, node2, node3, node4]
     presenter._user = "user1"
+    presenter._index = None
 
     result = presenter._createNodeGroups()
 
@@ -842,11 +797,12 @@ def test_nodes_presenter_create_node_groups_assigns_all_to_all_nodes_when_no_pre
     presenter = NodesPresenter.__new__(NodesPresenter)
     presenter._nodes = [node1, node2]
     presenter._user = "user1"
+    presenter._index = None
 
     result = presenter._createNodeGroups()
 
     mock_nodegroup.assert_called_once_with(
-        CFG.nodes_presenter.all_nodes_group_name, [node1, node2], "user1"
+        CFG.nodes_presenter.all_nodes_group_name, [node1, node2], "user1", None
     )
     assert result == [mock_nodegroup.return_value]
 
@@ -870,6 +826,7 @@ def test_nodes_presenter_create_node_groups_two_groups(mock_nodegroup):
     presenter = NodesPresenter.__new__(NodesPresenter)
     presenter._nodes = [node1, node2, node3, node4, node5, node6]
     presenter._user = "userA"
+    presenter._index = None
 
     result = presenter._createNodeGroups()
 
@@ -898,6 +855,7 @@ def test_nodes_presenter_create_node_groups_merges_small_groups_together(
     presenter = NodesPresenter.__new__(NodesPresenter)
     presenter._nodes = [node1, node2, node3, node4, node5]
     presenter._user = "userB"
+    presenter._index = None
 
     result = presenter._createNodeGroups()
 
@@ -1079,3 +1037,146 @@ def test_nodes_presenter_dump_yaml_roundtrip():
         assert orig._info.keys() == loaded._info.keys()
         for key in orig._info:
             assert orig._info[key] == loaded._info[key]
+
+
+def _make_plain_nodes() -> list[PBSNode]:
+    return [
+        PBSNode.fromDict(
+            f"node{i}",
+            {
+                "state": "free",
+                "resources_available.ncpus": "8",
+                "resources_assigned.ncpus": str(i),
+                "resources_available.ngpus": "2" if i == 0 else "0",
+                "resources_available.mem": "32gb",
+                "resources_available.cl_node": "True",
+                "resources_available.fast": "True" if i == 1 else "False",
+            },
+        )
+        for i in range(3)
+    ]
+
+
+def test_node_group_create_plain_nodes_table_without_color():
+    group = NodeGroup("node", _make_plain_nodes(), "user")
+
+    lines = group.createPlainNodesTable(color=False).splitlines()
+
+    assert lines[0].split() == [
+        "Name",
+        "NCPUs",
+        "CPU",
+        "Mem",
+        "NGPUs",
+        "Extra",
+        "Properties",
+    ]
+    assert len(lines) == 4
+    assert "\033" not in "\n".join(lines)
+    assert "node0" in lines[1] and "8 / 8" in lines[1] and "2 / 2" in lines[1]
+    assert "node1" in lines[2] and "7 / 8" in lines[2] and "fast" in lines[2]
+    assert "fast" not in lines[3]
+
+
+def test_node_group_create_plain_nodes_table_with_color():
+    group = NodeGroup("node", _make_plain_nodes(), "user")
+
+    table = group.createPlainNodesTable(color=True)
+
+    assert "\033[" in table
+    assert "node2" in table
+
+
+def test_node_group_stats_create_plain_stats_table():
+    stats = NodeGroupStats(
+        n_nodes=3, n_cpus=24, n_free_cpus=21, n_gpus=2, n_free_gpus=2
+    )
+
+    lines = stats.createPlainStatsTable(color=False).splitlines()
+
+    assert lines[0].split() == ["CPUs", "GPUs", "Nodes"]
+    assert lines[1].split() == ["Total", "24", "2", "3"]
+    assert lines[2].split() == ["Free", "21", "2"]
+
+
+def test_node_group_stats_create_plain_stats_table_without_gpus():
+    stats = NodeGroupStats(n_nodes=1, n_cpus=8, n_free_cpus=8)
+
+    lines = stats.createPlainStatsTable(color=False).splitlines()
+
+    assert lines[0].split() == ["CPUs", "Nodes"]
+
+
+def test_nodes_presenter_dump_plain_multiple_groups():
+    nodes = _make_plain_nodes() + [
+        PBSNode.fromDict("alpha1", {"resources_available.ncpus": "4"})
+    ]
+    presenter = NodesPresenter(nodes, "user", True)
+
+    stream = StringIO()
+    presenter.dumpPlain(stream)
+    output = stream.getvalue()
+
+    assert "NODE GROUP: node" in output
+    assert f"NODE GROUP: {CFG.nodes_presenter.others_group_name}" in output
+    assert "OVERALL STATISTICS" in output
+    assert "Shared properties: cl_node" in output
+    assert "All properties:" in output
+    assert "alpha1" in output
+    # stream is not a terminal
+    assert "\033" not in output
+
+
+def test_nodes_presenter_dump_plain_single_group_has_no_overall_statistics():
+    presenter = NodesPresenter(_make_plain_nodes(), "user", True)
+
+    stream = StringIO()
+    presenter.dumpPlain(stream)
+
+    assert "OVERALL STATISTICS" not in stream.getvalue()
+
+
+def test_nodes_presenter_style():
+    assert NodesPresenter._style("text", "bright_green bold", False) == "text"
+
+    styled = NodesPresenter._style("text", "bright_green bold", True)
+    assert styled.startswith("\033[")
+    assert "text" in styled
+    assert styled.endswith("\033[0m")
+
+
+def _make_index(*jobs: tuple[str, str, list[str]]) -> NodeJobIndex:
+    mocks = []
+    for job_id, user, job_nodes in jobs:
+        job = MagicMock()
+        job.getId.return_value = job_id
+        job.getUser.return_value = user
+        job.getNodes.return_value = job_nodes
+        mocks.append(job)
+    return NodeJobIndex(mocks)
+
+
+def test_node_group_plain_nodes_table_with_jobs():
+    index = _make_index(
+        ("1.server", "alice", ["node0.example.org"]),
+        ("2.server", "alice", ["node0.example.org", "node1.example.org"]),
+        ("3.server", "bob", ["node1.example.org"]),
+    )
+    group = NodeGroup("node", _make_plain_nodes(), "user", index)
+
+    lines = group.createPlainNodesTable(color=False).splitlines()
+
+    assert lines[0].split()[-1] == "Jobs"
+    assert lines[1].endswith("alice (2)")
+    assert lines[2].endswith("alice, bob")
+    assert lines[3].split()[-1] != "bob"
+
+
+def test_nodes_presenter_dump_records_with_jobs(capsys):
+    index = _make_index(("1.server", "alice", ["node1"]))
+    presenter = NodesPresenter(_make_plain_nodes(), "user", True, index)
+
+    presenter.dumpRecords(OutputFormat.NDJSON)
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["jobs"] for r in records] == [[], ["1.server"], []]
@@ -0,0 +1,86 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from qq_lib.core.config import CFG
+from qq_lib.core.error import QQError, QQNotSuitableError
+from qq_lib.prestage.cli import _prestage_job, prestage
+
+
+@patch("qq_lib.prestage.cli.logger.info")
+@patch("qq_lib.prestage.cli.Prestager.fromInformer")
+def test_prestage_job_prestages_immediately(mock_from_informer, mock_logger_info):
+    mock_prestager = MagicMock()
+    mock_prestager.prestage.return_value = "node1"
+    mock_from_informer.return_value = mock_prestager
+
+    informer = MagicMock()
+    informer.info.job_id = "job123"
+    _prestage_job(informer, wait=False)
+
+    mock_prestager.ensureSuitable.assert_called_once()
+    mock_prestager.waitUntilDue.assert_not_called()
+    mock_prestager.prestage.assert_called_once()
+    mock_logger_info.assert_called_with(
+        "Pre-staged input data of the job 'job123' to 'node1'."
+    )
+
+
+@pytest.mark.parametrize("due, waited", [(False, True), (True, False)])
+@patch("qq_lib.prestage.cli.Prestager.fromInformer")
+def test_prestage_job_waits_until_due(mock_from_informer, due, waited):
+    mock_prestager = MagicMock()
+    mock_prestager.isDue.return_value = due
+    mock_from_informer.return_value = mock_prestager
+
+    _prestage_job(MagicMock(), wait=True)
+
+    assert mock_prestager.waitUntilDue.called is waited
+    mock_prestager.prestage.assert_called_once()
+
+
+@patch("qq_lib.prestage.cli.Prestager.fromInformer")
+def test_prestage_job_raises_not_suitable_error(mock_from_informer):
+    mock_prestager = MagicMock()
+    mock_prestager.ensureSuitable.side_effect = QQNotSuitableError("not queued")
+    mock_from_informer.return_value = mock_prestager
+
+    with pytest.raises(QQNotSuitableError, match="not queued"):
+        _prestage_job(MagicMock(), wait=False)
+
+    mock_prestager.prestage.assert_not_called()
+
+
+def test_prestage_invokes_repeater_with_wait():
+    runner = CliRunner()
+    informer = MagicMock()
+
+    with (
+        patch("qq_lib.prestage.cli.Informer.fromJobId", return_value=informer),
+        patch("qq_lib.prestage.cli.Repeater") as mock_repeater_cls,
+    ):
+        result = runner.invoke(prestage, ["12345", "--wait"])
+
+    assert result.exit_code == 0
+    args = mock_repeater_cls.call_args.args
+    assert args[0] == [informer]
+    assert args[1] == _prestage_job
+    assert args[2] is True
+    mock_repeater_cls.return_value.run.assert_called_once()
+
+
+def test_prestage_no_info_files_exits_with_error():
+    runner = CliRunner()
+
+    with (
+        patch("qq_lib.prestage.cli.get_info_files", return_value=[]),
+        patch("qq_lib.prestage.cli.logger") as mock_logger,
+    ):
+        result = runner.invoke(prestage, [])
+
+    assert result.exit_code == CFG.exit_codes.default
+    assert isinstance(mock_logger.error.call_args.args[0], QQError)
@@ -0,0 +1,221 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from qq_lib.core.config import CFG
+from qq_lib.core.error import QQError, QQNotSuitableError
+from qq_lib.core.manifest import WorkDirManifest
+from qq_lib.prestage.prestager import Prestager
+from qq_lib.properties.states import RealState
+
+
+def _make_prestager(input_dir=Path("/input"), state=RealState.QUEUED):
+    prestager = Prestager.__new__(Prestager)
+    prestager._state = state
+    prestager._info_file = input_dir / "job.qqinfo"
+    prestager._batch_system = MagicMock()
+    prestager._batch_system.getPrestageDir.return_value = Path(
+        "/scratch/user/.qqprestage/123.server"
+    )
+    prestager._informer = MagicMock()
+    prestager._informer.info.job_id = "123.server"
+    prestager._informer.info.username = "user"
+    prestager._informer.info.job_name = "job"
+    prestager._informer.info.input_dir = input_dir
+    prestager._informer.info.resources.work_dir = "scratch_local"
+    prestager._informer.info.excluded_files = []
+    prestager._informer.info.loop_info = None
+    prestager._informer.info.prestaged_node = None
+    prestager._informer.usesScratch.return_value = True
+    return prestager
+
+
+@pytest.mark.parametrize("state", [RealState.QUEUED, RealState.HELD, RealState.WAITING])
+def test_prestager_ensure_suitable_passes(tmp_path, state):
+    prestager = _make_prestager(tmp_path, state)
+
+    prestager.ensureSuitable()
+
+
+@pytest.mark.parametrize(
+    "state", [RealState.RUNNING, RealState.BOOTING, RealState.FINISHED]
+)
+def test_prestager_ensure_suitable_raises_if_not_queued(tmp_path, state):
+    prestager = _make_prestager(tmp_path, state)
+
+    with pytest.raises(QQNotSuitableError, match="only be pre-staged for queued"):
+        prestager.ensureSuitable()
+
+
+def test_prestager_ensure_suitable_raises_without_scratch(tmp_path):
+    prestager = _make_prestager(tmp_path)
+    prestager._informer.usesScratch.return_value = False
+
+    with pytest.raises(QQNotSuitableError, match="does not use scratch"):
+        prestager.ensureSuitable()
+
+
+def test_prestager_ensure_suitable_raises_if_unsupported(tmp_path):
+    prestager = _make_prestager(tmp_path)
+    prestager._batch_system.getPrestageDir.return_value = None
+
+    with pytest.raises(QQNotSuitableError, match="scratch_local"):
+        prestager.ensureSuitable()
+
+
+def test_prestager_ensure_suitable_raises_if_input_dir_inaccessible(tmp_path):
+    prestager = _make_prestager(tmp_path / "missing")
+
+    with pytest.raises(QQNotSuitableError, match="not accessible"):
+        prestager.ensureSuitable()
+
+
+def test_prestager_get_estimated_returns_main_node():
+    prestager = _make_prestager()
+    time = datetime(2025, 1, 1, 12, 0)
+    prestager._informer.getEstimated.return_value = (time, "node1 + node2")
+
+    assert prestager.getEstimated() == (time, "node1")
+
+
+def test_prestager_get_estimated_returns_none():
+    prestager = _make_prestager()
+    prestager._informer.getEstimated.return_value = None
+
+    assert prestager.getEstimated() is None
+
+
+@pytest.mark.parametrize(
+    "offset, expected",
+    [
+        (timedelta(seconds=60), True),
+        (timedelta(seconds=CFG.prestage.lead_time + 600), False),
+    ],
+)
+def test_prestager_is_due(offset, expected):
+    prestager = _make_prestager()
+    prestager._informer.getEstimated.return_value = (datetime.now() + offset, "node1")
+
+    assert prestager.isDue() is expected
+
+
+def test_prestager_is_due_without_estimate():
+    prestager = _make_prestager()
+    prestager._informer.getEstimated.return_value = None
+
+    assert not prestager.isDue()
+
+
+def test_prestager_wait_until_due():
+    prestager = _make_prestager()
+    prestager.isDue = MagicMock(side_effect=[False, False, True])
+    prestager.update = MagicMock()
+    prestager.ensureSuitable = MagicMock()
+
+    with patch("qq_lib.prestage.prestager.sleep") as mock_sleep:
+        prestager.waitUntilDue()
+
+    assert mock_sleep.call_count == 2
+    assert prestager.update.call_count == 2
+    assert prestager.ensureSuitable.call_count == 2
+
+
+def test_prestager_wait_until_due_raises_not_suitable():
+    prestager = _make_prestager()
+    prestager.isDue = MagicMock(return_value=False)
+    prestager.update = MagicMock()
+    prestager.ensureSuitable = MagicMock(side_effect=QQNotSuitableError("started"))
+
+    with (
+        patch("qq_lib.prestage.prestager.sleep"),
+        pytest.raises(QQNotSuitableError),
+    ):
+        prestager.waitUntilDue()
+
+
+def test_prestager_prestage_copies_input_dir(tmp_path):
+    (tmp_path / "md.mdp").write_text("mdp")
+    (tmp_path / "job.qqinfo").write_text("info")
+    (tmp_path / "ignored.txt").write_text("ignored")
+    prestager = _make_prestager(tmp_path)
+    prestager._informer.info.excluded_files = [tmp_path / "ignored.txt"]
+    prestager._informer.getEstimated.return_value = (datetime.now(), "node1")
+    prestager._recordPrestagedNode = MagicMock()
+    prestage_dir = Path("/scratch/user/.qqprestage/123.server")
+
+    assert prestager.prestage() == "node1"
+
+    batch = prestager._batch_system
+    batch.makeRemoteDir.assert_any_call("node1", prestage_dir.parent)
+    batch.makeRemoteDir.assert_any_call("node1", prestage_dir)
+    batch.syncWithExclusions.assert_called_once()
+    args = batch.syncWithExclusions.call_args.args
+    assert args[:4] == (tmp_path, prestage_dir, None, "node1")
+    assert tmp_path / "ignored.txt" in args[4]
+    assert tmp_path / "job.qqinfo" in args[4]
+    batch.deleteRemoteDir.assert_not_called()
+
+    host, manifest_file, content = batch.writeRemoteFile.call_args.args
+    assert host == "node1"
+    assert manifest_file == prestage_dir / CFG.loop_jobs.manifest_file
+    manifest = WorkDirManifest.fromString(content)
+    assert manifest.job_id == "123.server"
+    assert manifest.work_dir == prestage_dir
+    assert list(manifest.files) == ["md.mdp"]
+
+    prestager._recordPrestagedNode.assert_called_once_with("node1")
+
+
+def test_prestager_prestage_removes_data_on_previous_node(tmp_path):
+    prestager = _make_prestager(tmp_path)
+    prestager._informer.info.prestaged_node = "node0"
+    prestager._informer.getEstimated.return_value = (datetime.now(), "node1")
+    prestager._recordPrestagedNode = MagicMock()
+    prestager._batch_system.deleteRemoteDir.side_effect = QQError("unreachable")
+
+    with patch("qq_lib.prestage.prestager.logger"):
+        assert prestager.prestage() == "node1"
+
+    prestager._batch_system.deleteRemoteDir.assert_called_once_with(
+        "node0", Path("/scratch/user/.qqprestage/123.server")
+    )
+    prestager._batch_system.syncWithExclusions.assert_called_once()
+
+
+def test_prestager_prestage_raises_without_estimate(tmp_path):
+    prestager = _make_prestager(tmp_path)
+    prestager._informer.getEstimated.return_value = None
+
+    with pytest.raises(QQError, match="not known"):
+        prestager.prestage()
+
+    prestager._batch_system.syncWithExclusions.assert_not_called()
+
+
+def test_prestager_record_prestaged_node():
+    prestager = _make_prestager()
+    prestager.update = MagicMock()
+
+    prestager._recordPrestagedNode("node1")
+
+    assert prestager._informer.info.prestaged_node == "node1"
+    prestager._informer.toFile.assert_called_once_with(prestager._info_file)
+
+
+def test_prestager_record_prestaged_node_raises_if_job_started():
+    prestager = _make_prestager()
+
+    def start():
+        prestager._state = RealState.RUNNING
+
+    prestager.update = MagicMock(side_effect=start)
+
+    with pytest.raises(QQError, match="will not be used"):
+        prestager._recordPrestagedNode("node1")
+
+    prestager._informer.toFile.assert_not_called()
@@ -0,0 +1,51 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from pathlib import Path
+
+import pytest
+
+from qq_lib.core.error import QQError
+from qq_lib.properties.array import CFG, ArrayIndex
+
+
+def test_array_index_roundtrip(tmp_path):
+    file = ArrayIndex.getPath(tmp_path, "job.sh")
+    assert file == tmp_path / f"job{CFG.suffixes.qq_array}"
+
+    ArrayIndex([Path("/a/job.qqinfo"), Path("/b/job.qqinfo")]).toFile(file)
+    index = ArrayIndex.fromFile(file)
+
+    assert len(index) == 2
+    assert index.getInfoFile(0) == Path("/a/job.qqinfo")
+    assert index.getInfoFile(1) == Path("/b/job.qqinfo")
+
+
+def test_array_index_to_file_refuses_to_overwrite(tmp_path):
+    file = tmp_path / "job.qqarray"
+    file.write_text("/a/job.qqinfo\n")
+
+    with pytest.raises(QQError, match="already exists"):
+        ArrayIndex([Path("/b/job.qqinfo")]).toFile(file)
+
+    assert file.read_text() == "/a/job.qqinfo\n"
+
+
+@pytest.mark.parametrize("index", [-1, 2])
+def test_array_index_get_info_file_out_of_range(index):
+    with pytest.raises(QQError, match="out of range"):
+        ArrayIndex([Path("/a"), Path("/b")]).getInfoFile(index)
+
+
+def test_array_index_from_missing_file_raises(tmp_path):
+    with pytest.raises(QQError, match="Could not read array index"):
+        ArrayIndex.fromFile(tmp_path / "missing.qqarray")
+
+
+def test_array_index_find_info_file(tmp_path):
+    file = tmp_path / "job.qqarray"
+    file.write_text("/a/job.qqinfo\n/b/job.qqinfo\n")
+
+    assert ArrayIndex.findInfoFile(file, 1) == Path("/b/job.qqinfo")
+    assert ArrayIndex.findInfoFile(file, 5) is None
+    assert ArrayIndex.findInfoFile(tmp_path / "missing.qqarray", 0) is None
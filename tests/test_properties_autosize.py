@@ -0,0 +1,129 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from datetime import timedelta
+
+import pytest
+
+from qq_lib.core.error import QQError
+from qq_lib.properties.autosize import AutosizeInfo, ResourceUsage
+from qq_lib.properties.resources import Resources
+from qq_lib.properties.size import Size
+
+
+def test_resource_usage_roundtrip_through_dict():
+    usage = ResourceUsage(
+        walltime=timedelta(hours=26, minutes=3, seconds=4),
+        mem=Size(3, "gb"),
+        work_size=Size(500, "mb"),
+    )
+
+    data = usage.toDict()
+
+    assert data == {
+        "walltime": "26:03:04",
+        "mem": "3145728kb",
+        "work_size": "512000kb",
+    }
+    assert ResourceUsage.fromDict(data) == usage
+
+
+def test_resource_usage_to_dict_skips_none():
+    assert ResourceUsage(mem=Size(1, "gb")).toDict() == {"mem": "1048576kb"}
+    assert ResourceUsage.fromDict({}) == ResourceUsage()
+
+
+def test_autosize_info_from_resources_absolute():
+    resources = Resources(
+        walltime="24h", mem="16gb", work_size="10gb", work_dir="scratch_local"
+    )
+
+    info = AutosizeInfo.fromResources(resources)
+
+    assert info.walltime == "24:00:00"
+    assert info.mem == Size(16, "gb")
+    assert info.work_size == Size(10, "gb")
+
+
+def test_autosize_info_from_resources_per_cpu_and_input_dir():
+    resources = Resources(
+        ncpus=4, mem_per_cpu="2gb", work_size_per_cpu="1gb", work_dir="input_dir"
+    )
+
+    info = AutosizeInfo.fromResources(resources)
+
+    assert info.walltime is None
+    assert info.mem == Size(8, "gb")
+    assert info.work_size is None
+
+
+def test_autosize_info_string_roundtrip():
+    info = AutosizeInfo("12:00:00", Size(4, "gb"), Size(20, "gb"))
+
+    assert info.toStr() == "walltime=12:00:00,mem=4194304kb,work-size=20971520kb"
+    assert AutosizeInfo.fromStr(info.toStr()) == info
+    assert AutosizeInfo.fromStr("") == AutosizeInfo()
+
+
+@pytest.mark.parametrize("string", ["ncpus=4", "mem", "walltime="])
+def test_autosize_info_from_str_invalid(string):
+    with pytest.raises(QQError, match="Invalid autosize specification"):
+        AutosizeInfo.fromStr(string)
+
+
+def _usage(hours: int, mem_gb: int, work_gb: int | None = None) -> ResourceUsage:
+    return ResourceUsage(
+        walltime=timedelta(hours=hours),
+        mem=Size(mem_gb, "gb"),
+        work_size=Size(work_gb, "gb") if work_gb is not None else None,
+    )
+
+
+def test_autosize_info_adjust_uses_percentile_with_headroom():
+    info = AutosizeInfo("10:00:00", Size(16, "gb"), Size(100, "gb"))
+    resources = Resources(
+        walltime="10:00:00", mem="16gb", work_size="100gb", work_dir="scratch_local"
+    )
+    history = [_usage(4, 4, 40), _usage(3, 2, 40), _usage(4, 4, 40)]
+
+    adjusted = info.adjust(resources, history)
+
+    assert adjusted.walltime == "05:00:00"
+    assert adjusted.mem == Size(5, "gb")
+    assert adjusted.work_size == Size(50, "gb")
+    # the original resources are not modified
+    assert resources.walltime == "10:00:00"
+
+
+def test_autosize_info_adjust_respects_bounds():
+    info = AutosizeInfo("10:00:00", Size(16, "gb"))
+    resources = Resources(walltime="10:00:00", mem="16gb", work_dir="input_dir")
+
+    shrunk = info.adjust(resources, [_usage(0, 0), _usage(0, 0)])
+    grown = info.adjust(resources, [_usage(100, 100), _usage(100, 100)])
+
+    assert shrunk.walltime == "02:30:00"
+    assert shrunk.mem == Size(4, "gb")
+    assert grown.walltime == "20:00:00"
+    assert grown.mem == Size(32, "gb")
+
+
+def test_autosize_info_adjust_requires_enough_samples():
+    info = AutosizeInfo("10:00:00", Size(16, "gb"))
+    resources = Resources(walltime="10:00:00", mem="16gb", work_dir="input_dir")
+
+    adjusted = info.adjust(resources, [_usage(1, 1)])
+
+    assert adjusted.walltime == "10:00:00"
+    assert adjusted.mem == Size(16, "gb")
+
+
+def test_autosize_info_adjust_replaces_per_cpu_memory():
+    info = AutosizeInfo(None, Size(8, "gb"))
+    resources = Resources(ncpus=4, mem_per_cpu="2gb", work_dir="input_dir")
+
+    adjusted = info.adjust(resources, [_usage(1, 4), _usage(1, 4)])
+
+    assert adjusted.mem == Size(5, "gb")
+    assert adjusted.mem_per_cpu is None
+    assert adjusted.walltime is None
@@ -2,9 +2,11 @@
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
 
-from datetime import datetime
+import json
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -12,10 +14,13 @@ import yaml
 from qq_lib.batch.interface import BatchMeta
 from qq_lib.batch.pbs import PBS
 from qq_lib.core.error import QQError
-from qq_lib.properties.info import CFG, Info
+from qq_lib.properties.autosize import AutosizeInfo, ResourceUsage
+from qq_lib.properties.info import CFG, Info, InfoHeader
 from qq_lib.properties.job_type import JobType
 from qq_lib.properties.loop import LoopInfo
+from qq_lib.properties.pack import PackInfo, PackTask
 from qq_lib.properties.resources import Resources
+from qq_lib.properties.size import Size
 from qq_lib.properties.states import NaiveState
 
 
@@ -281,6 +286,148 @@ def test_from_file_missing_required_field(tmp_path):
         Info.fromFile(file)
 
 
+def test_export_to_file_json(sample_info, tmp_path, monkeypatch):
+    monkeypatch.setattr(CFG.info_file, "format", "json")
+    file_path = tmp_path / "job.qqinfo"
+    sample_info.toFile(file_path)
+
+    header, body = file_path.read_text().splitlines()
+
+    assert json.loads(header) == {
+        "qq_info_format": 1,
+        "job_id": sample_info.job_id,
+        "job_state": "running",
+        "input_dir": "/shared/storage",
+    }
+    assert json.loads(body) == sample_info._toDict()
+
+
+def test_export_to_file_unknown_format(sample_info, tmp_path, monkeypatch):
+    monkeypatch.setattr(CFG.info_file, "format", "xml")
+
+    with pytest.raises(QQError, match="Unknown format of qq info files"):
+        sample_info.toFile(tmp_path / "job.qqinfo")
+
+    assert not (tmp_path / "job.qqinfo").exists()
+
+
+@pytest.mark.parametrize("format", ["yaml", "json"])
+def test_load_from_file_roundtrip(sample_info, tmp_path, monkeypatch, format):
+    monkeypatch.setattr(CFG.info_file, "format", format)
+    file_path = tmp_path / "job.qqinfo"
+    sample_info.toFile(file_path)
+
+    # the format is detected from the content of the file
+    monkeypatch.setattr(CFG.info_file, "format", "yaml")
+    loaded_info = Info.fromFile(file_path)
+
+    assert loaded_info == sample_info
+
+
+def test_load_from_file_json_remote(sample_info, monkeypatch):
+    monkeypatch.setattr(CFG.info_file, "format", "json")
+    content = sample_info._toJson()
+
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(PBS, "readRemoteFiles", return_value=[content, None]) as read,
+    ):
+        loaded_info = Info.fromFile(Path("/remote/job.qqinfo"), "host")
+
+    # the info file and its journal are read using a single connection
+    read.assert_called_once_with(
+        "host", [Path("/remote/job.qqinfo"), Path("/remote/job.qqjournal")]
+    )
+    # a missing journal is treated as empty
+    assert loaded_info == sample_info
+
+
+def test_load_from_file_remote_replays_journal(sample_info):
+    content = sample_info._toYaml()
+    journal = (
+        f'{{"job_id": "{sample_info.job_id}", "fields": {{"job_state": "finished"}}}}\n'
+    )
+
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(PBS, "readRemoteFiles", return_value=[content, journal]),
+    ):
+        loaded_info = Info.fromFile(Path("/remote/job.qqinfo"), "host")
+
+    assert loaded_info.job_state == NaiveState.FINISHED
+    assert loaded_info.journal_offset == len(journal)
+
+
+def test_load_from_file_remote_missing_raises():
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(PBS, "readRemoteFiles", return_value=[None, None]),
+        pytest.raises(QQError, match="does not exist"),
+    ):
+        Info.fromFile(Path("/remote/job.qqinfo"), "host")
+
+
+def test_from_file_invalid_json(tmp_path):
+    file = tmp_path / "bad.qqinfo"
+    file.write_text('{"qq_info_format": 1, "job_id": "1"}\n{"job_id": ')
+
+    with pytest.raises(QQError, match=r"Could not parse the qq info file"):
+        Info.fromFile(file)
+
+
+def test_from_file_unsupported_json_version(tmp_path):
+    file = tmp_path / "future.qqinfo"
+    file.write_text('{"qq_info_format": 2, "job_id": "1"}\n{}\n')
+
+    with pytest.raises(QQError, match=r"Unsupported version"):
+        Info.fromFile(file)
+
+
+@pytest.mark.parametrize("format", ["yaml", "json"])
+def test_load_header(sample_info, tmp_path, monkeypatch, format):
+    monkeypatch.setattr(CFG.info_file, "format", format)
+    file_path = tmp_path / "job.qqinfo"
+    sample_info.toFile(file_path)
+
+    header = Info.loadHeader(file_path)
+
+    assert header == InfoHeader(
+        job_id=sample_info.job_id,
+        job_state=NaiveState.RUNNING,
+        input_dir=Path("/shared/storage"),
+    )
+
+
+def test_load_header_json_decodes_only_header(tmp_path):
+    file = tmp_path / "job.qqinfo"
+    # the body is not valid but is never read
+    file.write_text(
+        '{"qq_info_format": 1, "job_id": "1", "job_state": "queued", "input_dir": "/a"}\n'
+        "not json\n"
+    )
+
+    header = Info.loadHeader(file)
+
+    assert header.job_id == "1"
+    assert header.job_state == NaiveState.QUEUED
+    assert header.input_dir == Path("/a")
+    with pytest.raises(QQError, match=r"Could not parse the qq info file"):
+        Info.fromFile(file)
+
+
+def test_load_header_missing_field(tmp_path):
+    file = tmp_path / "job.qqinfo"
+    file.write_text("job_id: '1'\njob_state: running\n")
+
+    with pytest.raises(QQError, match=r"Invalid qq info file .*input_dir"):
+        Info.loadHeader(file)
+
+
+def test_load_header_missing_file(tmp_path):
+    with pytest.raises(QQError, match="does not exist"):
+        Info.loadHeader(tmp_path / "missing.qqinfo")
+
+
 def test_get_command_line_for_resubmit_basic(sample_info):
     sample_info.resources = Resources()
     sample_info.account = None
@@ -336,3 +483,99 @@ def test_get_command_line_full(sample_info):
         "--archive-format",
         "job%3d",
     ]
+
+
+def test_get_command_line_for_resubmit_requeue(sample_info):
+    sample_info.resources = Resources()
+    sample_info.account = None
+    sample_info.excluded_files = []
+    sample_info.job_type = JobType.LOOP
+    sample_info.loop_info = LoopInfo(
+        start=1,
+        end=10,
+        archive=Path("archive"),
+        archive_format="job%04d",
+        max_requeues=3,
+        requeues=1,
+    )
+
+    command_line = sample_info.getCommandLineForResubmit(requeue=True)
+
+    assert "--depend" not in command_line
+    assert command_line[-4:] == ["--max-requeues", "3", "--requeues", "2"]
+
+
+def test_get_queued_cycles_info_files_not_loop_job(sample_info):
+    assert sample_info.getQueuedCyclesInfoFiles() == []
+
+
+def test_get_queued_cycles_info_files_without_window(sample_info):
+    sample_info.loop_info = LoopInfo(
+        start=1, end=10, archive=Path("archive"), archive_format="job%04d", current=3
+    )
+
+    assert sample_info.getQueuedCyclesInfoFiles() == []
+
+
+def test_get_queued_cycles_info_files_with_window(sample_info):
+    sample_info.loop_info = LoopInfo(
+        start=1,
+        end=5,
+        archive=Path("archive"),
+        archive_format="job%04d",
+        current=3,
+        window=4,
+    )
+
+    assert sample_info.getQueuedCyclesInfoFiles() == [
+        Path("/shared/storage/script+0004.qqinfo"),
+        Path("/shared/storage/script+0005.qqinfo"),
+    ]
+
+
+def test_from_dict_roundtrip_pack_info(sample_info):
+    sample_info.job_type = JobType.PACK
+    sample_info.pack_info = PackInfo(
+        [
+            PackTask("sim1", is_dir=True, state=NaiveState.FINISHED, exit_code=0),
+            PackTask("echo done"),
+        ],
+        task_ncpus=2,
+    )
+
+    reconstructed = Info._fromDict(sample_info._toDict())
+
+    assert reconstructed.job_type == JobType.PACK
+    assert reconstructed.pack_info == sample_info.pack_info
+
+
+def test_from_dict_roundtrip_usage_and_autosize(sample_info):
+    sample_info.job_type = JobType.LOOP
+    sample_info.loop_info = LoopInfo(
+        start=1,
+        end=10,
+        archive=Path("archive"),
+        archive_format="job%04d",
+        autosize=AutosizeInfo("10:00:00", Size(16, "gb")),
+    )
+    sample_info.usage = ResourceUsage(
+        walltime=timedelta(hours=2), mem=Size(3, "gb"), work_size=None
+    )
+
+    reconstructed = Info._fromDict(sample_info._toDict())
+
+    assert reconstructed.usage == sample_info.usage
+    assert reconstructed.loop_info.autosize == sample_info.loop_info.autosize
+
+
+def test_get_command_line_for_resubmit_with_resources(sample_info):
+    sample_info.resources = Resources(ncpus=8)
+    sample_info.account = None
+    sample_info.excluded_files = []
+
+    command_line = sample_info.getCommandLineForResubmit(
+        resources=Resources(ncpus=4, walltime="01:00:00")
+    )
+
+    assert command_line[command_line.index("--ncpus") + 1] == "4"
+    assert command_line[command_line.index("--walltime") + 1] == "01:00:00"
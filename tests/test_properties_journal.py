@@ -0,0 +1,223 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+import json
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from qq_lib.batch.interface import BatchMeta
+from qq_lib.batch.pbs import PBS
+from qq_lib.core.config import CFG
+from qq_lib.properties.info import Info
+from qq_lib.properties.job_type import JobType
+from qq_lib.properties.journal import InfoJournal
+from qq_lib.properties.resources import Resources
+from qq_lib.properties.states import NaiveState
+
+
+@pytest.fixture(autouse=True)
+def register():
+    BatchMeta.register(PBS)
+
+
+@pytest.fixture
+def info():
+    return Info(
+        batch_system=PBS,
+        qq_version="0.7.0",
+        username="user",
+        job_id="12345.server",
+        job_name="script.sh",
+        queue="default",
+        script_name="script.sh",
+        job_type=JobType.STANDARD,
+        input_machine="machine",
+        input_dir=Path("/shared/storage"),
+        job_state=NaiveState.QUEUED,
+        submission_time=datetime(2025, 9, 21, 12, 0, 0),
+        stdout_file="script.out",
+        stderr_file="script.err",
+        resources=Resources(ncpus=8, work_dir="scratch_local"),
+    )
+
+
+@pytest.fixture
+def info_file(info, tmp_path):
+    file = tmp_path / "script.qqinfo"
+    info.toFile(file)
+    return file
+
+
+def _journal(info_file: Path) -> Path:
+    return info_file.with_suffix(CFG.suffixes.qq_journal)
+
+
+def test_info_journal_parses_complete_records():
+    content = (
+        '{"job_id": "1", "fields": {"job_state": "running"}}\n'
+        "not json\n"
+        '{"job_id": "1"}\n'
+        '{"job_id": "1", "fields": {"job_st'
+    )
+
+    journal = InfoJournal(content)
+
+    # malformed records are skipped, the incomplete last record is not consumed
+    assert len(journal) == 1
+    assert journal.size == content.rindex("\n") + 1
+
+
+def test_info_journal_apply_ignores_other_jobs_and_updates_of_killed_jobs():
+    journal = InfoJournal(
+        '{"job_id": "2", "fields": {"job_state": "failed"}}\n'
+        '{"job_id": "1", "fields": {"job_state": "killed", "completion_time": "t1"}}\n'
+        '{"job_id": "1", "fields": {"job_state": "running", "main_node": "node"}}\n'
+        '{"job_id": "1", "fields": {"saved_files": ["a.txt"]}}\n'
+    )
+
+    data = journal.apply({"job_id": "1", "job_state": "queued"})
+
+    assert data == {
+        "job_id": "1",
+        "job_state": "killed",
+        "completion_time": "t1",
+        "saved_files": ["a.txt"],
+    }
+
+
+def test_info_journal_from_file_missing(tmp_path):
+    journal = InfoJournal.fromFile(tmp_path / "missing.qqinfo")
+
+    assert len(journal) == 0
+    assert journal.size == 0
+
+
+def test_info_to_journal_appends_record(info, info_file):
+    info.job_state = NaiveState.RUNNING
+    info.main_node = "node1"
+    info.toJournal(info_file, ["job_state", "main_node", "work_dir"])
+
+    # the info file itself is not rewritten
+    assert "queued" in info_file.read_text()
+    assert json.loads(_journal(info_file).read_text()) == {
+        "job_id": "12345.server",
+        "fields": {"job_state": "running", "main_node": "node1"},
+    }
+
+
+def test_info_from_file_replays_journal(info, info_file):
+    info.job_state = NaiveState.RUNNING
+    info.start_time = datetime(2025, 9, 21, 13, 0, 0)
+    info.toJournal(info_file, ["job_state", "start_time"])
+    info.job_state = NaiveState.FINISHED
+    info.job_exit_code = 0
+    info.toJournal(info_file, ["job_state", "job_exit_code"])
+
+    loaded = Info.fromFile(info_file)
+
+    assert loaded.job_state == NaiveState.FINISHED
+    assert loaded.start_time == datetime(2025, 9, 21, 13, 0, 0)
+    assert loaded.job_exit_code == 0
+    assert loaded.journal_offset == _journal(info_file).stat().st_size
+
+
+def test_info_from_file_keeps_killed_state(info, info_file):
+    # qq kill marks the job as killed
+    killer = Info.fromFile(info_file)
+    killer.job_state = NaiveState.KILLED
+    killer.toJournal(info_file, ["job_state"])
+
+    # qq run of a booting job has not noticed it yet
+    info.job_state = NaiveState.RUNNING
+    info.toJournal(info_file, ["job_state"])
+
+    assert Info.fromFile(info_file).job_state == NaiveState.KILLED
+
+
+def test_info_from_file_ignores_stale_journal(info_file):
+    _journal(info_file).write_text(
+        '{"job_id": "999.server", "fields": {"job_state": "failed"}}\n'
+    )
+
+    assert Info.fromFile(info_file).job_state == NaiveState.QUEUED
+
+
+def test_info_to_file_compacts_journal(info_file):
+    loaded = Info.fromFile(info_file)
+    loaded.job_state = NaiveState.RUNNING
+    loaded.toJournal(info_file, ["job_state"])
+
+    # rewriting the file incorporates the replayed records
+    loaded = Info.fromFile(info_file)
+    loaded.toFile(info_file)
+    assert "running" in info_file.read_text()
+
+    # records appended after the compaction are still replayed
+    loaded.job_state = NaiveState.KILLED
+    loaded.toJournal(info_file, ["job_state"])
+
+    reloaded = Info.fromFile(info_file)
+    assert reloaded.job_state == NaiveState.KILLED
+    assert reloaded.journal_offset == _journal(info_file).stat().st_size
+
+
+def test_info_to_file_compaction_keeps_concurrent_records(info_file):
+    runner = Info.fromFile(info_file)
+    runner.job_state = NaiveState.RUNNING
+    runner.toJournal(info_file, ["job_state"])
+    runner = Info.fromFile(info_file)
+
+    # qq kill appends a record after qq run has loaded the file
+    killer = Info.fromFile(info_file)
+    killer.job_state = NaiveState.KILLED
+    killer.toJournal(info_file, ["job_state"])
+
+    # qq run rewrites the file
+    runner.toFile(info_file)
+
+    assert Info.fromFile(info_file).job_state == NaiveState.KILLED
+
+
+def test_info_compact_journal(info_file):
+    loaded = Info.fromFile(info_file)
+    loaded.job_state = NaiveState.RUNNING
+    loaded.toJournal(info_file, ["job_state"])
+    loaded.toFile(info_file)
+    loaded.job_state = NaiveState.FINISHED
+    loaded.job_exit_code = 0
+    loaded.toJournal(info_file, ["job_state", "job_exit_code"])
+
+    loaded = Info.fromFile(info_file)
+    loaded.compactJournal(info_file)
+
+    # all records are incorporated into the file and the journal is truncated
+    assert _journal(info_file).read_text() == ""
+    reloaded = Info.fromFile(info_file)
+    assert reloaded.job_state == NaiveState.FINISHED
+    assert reloaded.job_exit_code == 0
+    assert reloaded.journal_offset is None
+
+    # records appended after the compaction are replayed from the start
+    reloaded.job_state = NaiveState.KILLED
+    reloaded.toJournal(info_file, ["job_state"])
+    assert Info.fromFile(info_file).job_state == NaiveState.KILLED
+
+
+def test_info_journal_clear_remote():
+    with patch.object(PBS, "writeRemoteFile") as mock_write:
+        InfoJournal.clear(Path("/remote/job.qqinfo"), PBS, "host")
+
+    mock_write.assert_called_once_with("host", Path("/remote/job.qqjournal"), "")
+
+
+@pytest.mark.parametrize("format", ["yaml", "json"])
+def test_info_load_header_replays_journal(info, info_file, monkeypatch, format):
+    monkeypatch.setattr(CFG.info_file, "format", format)
+    info.toFile(info_file)
+    info.job_state = NaiveState.FINISHED
+    info.toJournal(info_file, ["job_state"])
+
+    assert Info.loadHeader(info_file).job_state == NaiveState.FINISHED
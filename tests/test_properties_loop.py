@@ -7,8 +7,11 @@ from pathlib import Path
 
 import pytest
 
+from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError
+from qq_lib.properties.autosize import AutosizeInfo
 from qq_lib.properties.loop import LoopInfo
+from qq_lib.properties.size import Size
 
 
 def test_valid_constructor(tmp_path):
@@ -239,3 +242,230 @@ def test_to_command_line_archive_name_only():
         "--archive-format",
         "md%03d",
     ]
+
+
+def test_loop_info_reuse_work_dir_defaults(tmp_path):
+    info = LoopInfo(
+        start=1,
+        end=5,
+        archive=tmp_path / "archive",
+        archive_format="job%04d",
+    )
+
+    assert info.reuse_work_dir is False
+    assert info.reused_work_dir is None
+    assert "--reuse-work-dir" not in info.toCommandLine()
+    assert "reused_work_dir" not in info.toDict()
+
+
+def test_loop_info_reused_work_dir_is_converted_to_path(tmp_path):
+    info = LoopInfo(
+        start=1,
+        end=5,
+        archive=tmp_path / "archive",
+        archive_format="job%04d",
+        current=2,
+        reuse_work_dir=True,
+        reused_work_dir="/scratch/job_1/main",
+    )
+
+    assert info.reused_work_dir == Path("/scratch/job_1/main")
+    assert info.toDict()["reused_work_dir"] == "/scratch/job_1/main"
+    assert info.toDict()["reuse_work_dir"] is True
+
+
+def test_to_command_line_with_reuse_work_dir(tmp_path):
+    info = LoopInfo(
+        start=1,
+        end=10,
+        archive=tmp_path / "archive",
+        archive_format="job%04d",
+        reuse_work_dir=True,
+    )
+
+    assert info.toCommandLine()[-1] == "--reuse-work-dir"
+
+
+def test_loop_info_roundtrip_through_dict(tmp_path):
+    info = LoopInfo(
+        start=1,
+        end=10,
+        archive=tmp_path / "archive",
+        archive_format="job%04d",
+        current=3,
+        reuse_work_dir=True,
+        reused_work_dir=Path("/scratch/main"),
+    )
+
+    data = info.toDict()
+    restored = LoopInfo(
+        **{k: Path(v) if k == "archive" else v for k, v in data.items()}
+    )
+
+    assert restored == info
+
+
+def test_loop_info_window_defaults_to_one(tmp_path):
+    info = LoopInfo(
+        start=1,
+        end=5,
+        archive=tmp_path / "archive",
+        archive_format="job%04d",
+    )
+
+    assert info.window == 1
+    assert info.getLastQueuedCycle() == info.current
+    assert "--loop-window" not in info.toCommandLine()
+
+
+def test_loop_info_window_invalid_raises(tmp_path):
+    with pytest.raises(QQError, match="loop-window"):
+        LoopInfo(
+            start=1,
+            end=5,
+            archive=tmp_path / "archive",
+            archive_format="job%04d",
+            window=0,
+        )
+
+
+def test_loop_info_window_to_command_line_and_dict(tmp_path):
+    info = LoopInfo(
+        start=1,
+        end=10,
+        archive=tmp_path / "archive",
+        archive_format="job%04d",
+        window=4,
+    )
+
+    assert info.toCommandLine()[-2:] == ["--loop-window", "4"]
+    assert info.toDict()["window"] == 4
+
+
+@pytest.mark.parametrize(
+    "current, window, expected",
+    [(1, 1, 1), (1, 4, 4), (8, 4, 10), (10, 4, 10)],
+)
+def test_loop_info_get_last_queued_cycle(tmp_path, current, window, expected):
+    info = LoopInfo(
+        start=1,
+        end=10,
+        archive=tmp_path / "archive",
+        archive_format="job%04d",
+        current=current,
+        window=window,
+    )
+
+    assert info.getLastQueuedCycle() == expected
+
+
+def test_loop_info_archive_pack_to_command_line_and_dict(tmp_path):
+    info = LoopInfo(
+        start=1,
+        end=10,
+        archive=tmp_path / "archive",
+        archive_format="job%04d",
+        archive_pack="zst",
+    )
+
+    assert info.toCommandLine()[-2:] == ["--archive-pack", "zst"]
+    assert info.toDict()["archive_pack"] == "zst"
+
+
+def test_loop_info_archive_pack_invalid_raises(tmp_path):
+    with pytest.raises(QQError, match="archive-pack"):
+        LoopInfo(
+            start=1,
+            end=5,
+            archive=tmp_path / "archive",
+            archive_format="job%04d",
+            archive_pack="rar",
+        )
+
+
+def test_loop_info_archive_pack_requires_printf_format(tmp_path):
+    with pytest.raises(QQError, match="printf-style"):
+        LoopInfo(
+            start=1,
+            end=5,
+            archive=tmp_path / "archive",
+            archive_format=r"job\d+",
+            archive_pack="gz",
+        )
+
+
+def test_loop_info_requeues_to_command_line_and_dict(tmp_path):
+    info = LoopInfo(
+        start=1,
+        end=10,
+        archive=tmp_path / "archive",
+        archive_format="job%04d",
+        max_requeues=3,
+        requeues=1,
+    )
+
+    assert info.toCommandLine()[-2:] == ["--max-requeues", "3"]
+    assert info.toDict()["max_requeues"] == 3
+    assert info.toDict()["requeues"] == 1
+    assert info.canRequeue()
+
+
+def test_loop_info_can_requeue_false_when_exhausted(tmp_path):
+    info = LoopInfo(
+        start=1,
+        end=10,
+        archive=tmp_path / "archive",
+        archive_format="job%04d",
+        max_requeues=2,
+        requeues=2,
+    )
+
+    assert not info.canRequeue()
+    assert "--max-requeues" in info.toCommandLine()
+
+
+@pytest.mark.parametrize(
+    "requeues, expected",
+    [(0, 0), (1, 60), (2, 120), (3, 240), (5, 600)],
+)
+def test_loop_info_get_requeue_delay(tmp_path, monkeypatch, requeues, expected):
+    monkeypatch.setattr(CFG.loop_jobs, "requeue_backoff", 60)
+    monkeypatch.setattr(CFG.loop_jobs, "requeue_backoff_max", 600)
+    info = LoopInfo(
+        start=1,
+        end=10,
+        archive=tmp_path / "archive",
+        archive_format="job%04d",
+        max_requeues=5,
+        requeues=requeues,
+    )
+
+    assert info.getRequeueDelay() == expected
+
+
+def test_loop_info_max_requeues_negative_raises(tmp_path):
+    with pytest.raises(QQError, match="max-requeues"):
+        LoopInfo(
+            start=1,
+            end=5,
+            archive=tmp_path / "archive",
+            archive_format="job%04d",
+            max_requeues=-1,
+        )
+
+
+def test_loop_info_autosize_to_command_line_and_dict(tmp_path):
+    info = LoopInfo(
+        start=1,
+        end=10,
+        archive=tmp_path / "archive",
+        archive_format="job%04d",
+        autosize="walltime=10:00:00,mem=16gb",
+    )
+
+    assert info.autosize == AutosizeInfo("10:00:00", Size(16, "gb"))
+    assert info.toCommandLine()[-2:] == [
+        "--autosize-base",
+        "walltime=10:00:00,mem=16777216kb",
+    ]
+    assert info.toDict()["autosize"] == "walltime=10:00:00,mem=16777216kb"
@@ -0,0 +1,79 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+import pytest
+
+from qq_lib.core.error import QQError
+from qq_lib.properties.pack import PackInfo, PackTask
+from qq_lib.properties.states import NaiveState
+
+
+def test_pack_info_from_file_classifies_tasks(tmp_path):
+    (tmp_path / "sim1").mkdir()
+    task_list = tmp_path / "tasks.txt"
+    task_list.write_text("# comment\nsim1\n\n  python analyze.py --frame 1  \n/sim1\n")
+
+    pack_info = PackInfo.fromFile(task_list, tmp_path, task_ncpus=2)
+
+    assert [t.task for t in pack_info.tasks] == [
+        "sim1",
+        "python analyze.py --frame 1",
+        "/sim1",
+    ]
+    assert [t.is_dir for t in pack_info.tasks] == [True, False, False]
+    assert all(t.state == NaiveState.QUEUED for t in pack_info.tasks)
+    assert pack_info.task_ncpus == 2
+    assert pack_info.task_ngpus == 0
+
+
+def test_pack_info_from_file_missing_raises(tmp_path):
+    with pytest.raises(QQError, match="Could not read task list"):
+        PackInfo.fromFile(tmp_path / "missing.txt", tmp_path)
+
+
+def test_pack_info_from_file_without_tasks_raises(tmp_path):
+    task_list = tmp_path / "tasks.txt"
+    task_list.write_text("# only a comment\n\n")
+
+    with pytest.raises(QQError, match="at least one task"):
+        PackInfo.fromFile(task_list, tmp_path)
+
+
+@pytest.mark.parametrize(
+    "ncpus, ngpus, message",
+    [(0, 0, "pack-task-ncpus"), (1, -1, "pack-task-ngpus")],
+)
+def test_pack_info_invalid_resources_raise(ncpus, ngpus, message):
+    with pytest.raises(QQError, match=message):
+        PackInfo([PackTask("true")], ncpus, ngpus)
+
+
+def test_pack_info_dict_roundtrip():
+    pack_info = PackInfo(
+        [
+            PackTask("sim1", is_dir=True, state=NaiveState.FINISHED, exit_code=0),
+            PackTask("false", state=NaiveState.FAILED, exit_code=1),
+            PackTask("true"),
+        ],
+        task_ncpus=4,
+        task_ngpus=1,
+    )
+
+    data = pack_info.toDict()
+    assert "exit_code" not in data["tasks"][2]
+
+    assert PackInfo.fromDict(data) == pack_info
+
+
+def test_pack_info_count_tasks():
+    pack_info = PackInfo(
+        [
+            PackTask("a", state=NaiveState.FINISHED),
+            PackTask("b", state=NaiveState.FINISHED),
+            PackTask("c", state=NaiveState.RUNNING),
+        ]
+    )
+
+    assert pack_info.countTasks(NaiveState.FINISHED) == 2
+    assert pack_info.countTasks(NaiveState.RUNNING) == 1
+    assert pack_info.countTasks(NaiveState.FAILED) == 0
@@ -114,3 +114,21 @@ def test_queues_command_handles_unexpected_exception_and_exits_99():
 
     assert result.exit_code == CFG.exit_codes.unexpected_error
     mock_logger.critical.assert_called_once()
+
+
+def test_queues_command_format_dumps_records():
+    runner = CliRunner()
+    mock_queue = MagicMock()
+    mock_queue.isAvailableToUser.return_value = True
+
+    with (
+        patch("qq_lib.queues.cli.BatchMeta.fromEnvVarOrGuess") as mock_meta,
+        patch("qq_lib.queues.cli.QueuesPresenter") as mock_presenter_cls,
+        patch("qq_lib.queues.cli.getpass.getuser", return_value="user"),
+    ):
+        mock_meta.return_value.getQueues.return_value = [mock_queue]
+        result = runner.invoke(queues, ["--format", "json"])
+
+    assert result.exit_code == 0
+    mock_presenter_cls.return_value.dumpRecords.assert_called_once()
+    mock_presenter_cls.return_value.createQueuesInfoPanel.assert_not_called()
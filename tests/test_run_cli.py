@@ -2,6 +2,7 @@
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -140,3 +141,61 @@ def test_run_exits_93_on_qqruncommunicationerror(monkeypatch):
 
     assert result.exit_code == CFG.exit_codes.qq_run_communication
     assert "comm error" in result.output
+
+
+def test_run_resolves_info_file_of_array_member(monkeypatch, tmp_path):
+    runner = CliRunner()
+
+    index_file = tmp_path / "job.qqarray"
+    index_file.write_text("/dir0/job.qqinfo\n/dir1/job.qqinfo\n")
+
+    monkeypatch.setenv(CFG.env_vars.guard, "1")
+    monkeypatch.delenv(CFG.env_vars.info_file, raising=False)
+    monkeypatch.setenv(CFG.env_vars.array_index, str(index_file))
+    monkeypatch.setenv(CFG.env_vars.input_machine, "random.host.org")
+
+    batch_system = MagicMock()
+    batch_system.getArrayIndex.return_value = 1
+    batch_system.readRemoteFile.return_value = index_file.read_text()
+
+    dummy_runner = MagicMock()
+    dummy_runner.execute.return_value = 0
+
+    with (
+        patch("qq_lib.run.cli.BatchMeta.fromEnvVarOrGuess", return_value=batch_system),
+        patch(
+            "qq_lib.properties.array.BatchMeta.fromEnvVarOrGuess",
+            return_value=batch_system,
+        ),
+        patch("qq_lib.run.cli.Runner", return_value=dummy_runner) as mock_runner,
+    ):
+        result = runner.invoke(run, ["script.sh"])
+
+    assert result.exit_code == 0
+    mock_runner.assert_called_once_with(Path("/dir1/job.qqinfo"), "random.host.org")
+
+
+def test_run_exits_92_if_array_member_not_in_index(monkeypatch, tmp_path):
+    runner = CliRunner()
+
+    monkeypatch.setenv(CFG.env_vars.guard, "1")
+    monkeypatch.delenv(CFG.env_vars.info_file, raising=False)
+    monkeypatch.setenv(CFG.env_vars.array_index, str(tmp_path / "job.qqarray"))
+    monkeypatch.setenv(CFG.env_vars.input_machine, "random.host.org")
+
+    batch_system = MagicMock()
+    batch_system.getArrayIndex.return_value = 5
+    batch_system.readRemoteFile.return_value = "/dir0/job.qqinfo\n"
+
+    with (
+        patch("qq_lib.run.cli.BatchMeta.fromEnvVarOrGuess", return_value=batch_system),
+        patch(
+            "qq_lib.properties.array.BatchMeta.fromEnvVarOrGuess",
+            return_value=batch_system,
+        ),
+        patch.object(CFG.runner, "retry_tries", 1),
+    ):
+        result = runner.invoke(run, ["script.sh"])
+
+    assert result.exit_code == CFG.exit_codes.qq_run_fatal
+    assert "out of range" in result.output
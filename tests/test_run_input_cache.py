@@ -0,0 +1,169 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from qq_lib.properties.size import Size
+from qq_lib.run.input_cache import InputCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return InputCache(tmp_path / "cache", Size(10, "kb"))
+
+
+@pytest.fixture
+def source(tmp_path):
+    source = tmp_path / "input" / "topol.tpr"
+    source.parent.mkdir()
+    source.write_text("topology")
+    return source
+
+
+def _objects(cache):
+    return sorted(p for p in cache._directory.iterdir() if not p.name.startswith("."))
+
+
+def test_input_cache_stage_file_caches_and_copies(cache, source, tmp_path):
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    source.chmod(0o640)
+
+    assert cache.stage(source, work_dir / "topol.tpr")
+
+    staged = work_dir / "topol.tpr"
+    assert staged.read_text() == "topology"
+    objects = _objects(cache)
+    assert len(objects) == 1
+    assert objects[0].read_text() == "topology"
+    # the staged file is an independent copy with the mode and mtime of the source
+    assert not objects[0].samefile(staged)
+    assert staged.stat().st_mode & 0o777 == 0o640
+    assert staged.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+
+def test_input_cache_staged_file_can_be_modified(cache, source, tmp_path):
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+
+    assert cache.stage(source, work_dir / "topol.tpr")
+    (work_dir / "topol.tpr").write_text("modified")
+
+    # the cached object is not affected
+    assert _objects(cache)[0].read_text() == "topology"
+
+
+def test_input_cache_stage_file_reuses_cached_object(cache, source, tmp_path):
+    work1 = tmp_path / "work1"
+    work2 = tmp_path / "work2"
+    work1.mkdir()
+    work2.mkdir()
+
+    assert cache.stage(source, work1 / "topol.tpr")
+    assert cache.stage(source, work2 / "topol.tpr")
+
+    assert len(_objects(cache)) == 1
+    assert (work1 / "topol.tpr").read_text() == "topology"
+    assert (work2 / "topol.tpr").read_text() == "topology"
+
+
+def test_input_cache_stage_modified_file_creates_new_object(cache, source, tmp_path):
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    assert cache.stage(source, work_dir / "topol.tpr")
+
+    source.write_text("modified topology")
+    assert cache.stage(source, work_dir / "topol.tpr")
+
+    assert (work_dir / "topol.tpr").read_text() == "modified topology"
+    assert len(_objects(cache)) == 2
+
+
+def test_input_cache_stage_directory(cache, tmp_path):
+    source = tmp_path / "input" / "forcefield.ff"
+    (source / "sub").mkdir(parents=True)
+    (source / "ffbonded.itp").write_text("bonded")
+    (source / "sub" / "ions.itp").write_text("ions")
+    (source / "link.itp").symlink_to("ffbonded.itp")
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+
+    assert cache.stage(source, work_dir / "forcefield.ff")
+
+    staged = work_dir / "forcefield.ff"
+    assert (staged / "ffbonded.itp").read_text() == "bonded"
+    assert (staged / "sub" / "ions.itp").read_text() == "ions"
+    assert (staged / "link.itp").is_symlink()
+    assert (staged / "link.itp").readlink() == Path("ffbonded.itp")
+    assert len(_objects(cache)) == 2
+
+
+def test_input_cache_stage_inaccessible_source_returns_false(cache, tmp_path):
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+
+    assert not cache.stage(tmp_path / "missing.txt", work_dir / "missing.txt")
+    assert not (work_dir / "missing.txt").exists()
+
+
+def test_input_cache_stage_file_larger_than_cache_returns_false(cache, tmp_path):
+    source = tmp_path / "large.bin"
+    source.write_bytes(b"x" * 20 * 1024)
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+
+    assert not cache.stage(source, work_dir / "large.bin")
+    assert _objects(cache) == []
+
+
+def test_input_cache_evict_removes_least_recently_used(tmp_path):
+    cache = InputCache(tmp_path / "cache", Size(10, "kb"))
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+
+    sources = []
+    for i in range(3):
+        source = tmp_path / f"file{i}.bin"
+        source.write_bytes(b"x" * 4 * 1024)
+        sources.append(source)
+
+    assert cache.stage(sources[0], work_dir / "file0.bin")
+    assert cache.stage(sources[1], work_dir / "file1.bin")
+    # make the first object the most recently used
+    first = _objects(cache)
+    now = time.time()
+    for obj in first:
+        os.utime(obj, (now - 100, now - 100))
+    cache.stage(sources[0], work_dir / "file0.bin")
+
+    # caching the third file exceeds the limit and evicts the second one
+    assert cache.stage(sources[2], work_dir / "file2.bin")
+
+    keys = {p.name for p in _objects(cache)}
+    assert keys == {
+        InputCache._getKey(sources[0], sources[0].stat()),
+        InputCache._getKey(sources[2], sources[2].stat()),
+    }
+    # the staged copy of the evicted object is still available in the working directory
+    assert (work_dir / "file1.bin").read_bytes() == b"x" * 4 * 1024
+
+
+def test_input_cache_evict_ignores_missing_directory(tmp_path):
+    cache = InputCache(tmp_path / "missing", Size(1, "kb"))
+
+    cache.evict()
+
+
+def test_input_cache_key_depends_on_size_and_mtime(source):
+    key = InputCache._getKey(source, source.stat())
+
+    os.utime(source, ns=(0, 0))
+
+    assert InputCache._getKey(source, source.stat()) != key
+    assert InputCache._getKey(Path(source), source.stat()) == InputCache._getKey(
+        source, source.stat()
+    )
@@ -4,7 +4,7 @@
 import os
 import shutil
 import signal
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -16,9 +16,16 @@ from qq_lib.core.error import (
     QQRunCommunicationError,
     QQRunFatalError,
 )
+from qq_lib.core.manifest import WorkDirManifest
+from qq_lib.properties.autosize import AutosizeInfo, ResourceUsage
 from qq_lib.properties.job_type import JobType
+from qq_lib.properties.loop import LoopInfo
+from qq_lib.properties.pack import PackInfo, PackTask
+from qq_lib.properties.resources import Resources
+from qq_lib.properties.size import Size
 from qq_lib.properties.states import NaiveState
 from qq_lib.run.runner import CFG, Runner, log_fatal_error_and_exit
+from qq_lib.run.scheduler import PackScheduler
 
 
 def test_runner_init_success():
@@ -183,6 +190,7 @@ def test_runner_init_creates_archiver_when_loop_info_present():
             informer.info.input_machine,
             informer.info.input_dir,
             batch,
+            loop_info.archive_pack,
         )
         mock_batchmeta.assert_called_once()
         mock_retryer.assert_called_once()
@@ -231,6 +239,7 @@ def test_runner_cleanup_with_running_process():
         patch("qq_lib.run.runner.sleep") as mock_sleep,
         patch("qq_lib.run.runner.CFG") as cfg_mock,
         patch.object(Runner, "_copyRunTimeFilesToInputDir") as mock_copy,
+        patch.object(Runner, "_stageOutOnKill"),
     ):
         cfg_mock.runner.sigterm_to_sigkill = 3
         runner._cleanup()
@@ -255,6 +264,7 @@ def test_runner_cleanup_with_timeout():
         patch("qq_lib.run.runner.logger") as mock_logger,
         patch("qq_lib.run.runner.sleep") as mock_sleep,
         patch.object(Runner, "_copyRunTimeFilesToInputDir") as mock_copy,
+        patch.object(Runner, "_stageOutOnKill"),
     ):
         runner._cleanup()
 
@@ -277,6 +287,7 @@ def test_runner_cleanup_without_running_process():
     with (
         patch("qq_lib.run.runner.logger"),
         patch.object(Runner, "_copyRunTimeFilesToInputDir") as mock_copy,
+        patch.object(Runner, "_stageOutOnKill"),
     ):
         runner._cleanup()
 
@@ -316,6 +327,155 @@ def test_runner_cleanup_with_running_process_no_scratch():
     process_mock.kill.assert_not_called()
 
 
+def test_runner_cleanup_stages_out_files_with_deadline():
+    runner = Runner.__new__(Runner)
+    runner._updateInfoKilled = MagicMock()
+    runner._use_scratch = True
+    runner._process = None
+    runner._copyRunTimeFilesToInputDir = MagicMock()
+    runner._stageOutOnKill = MagicMock()
+
+    with (
+        patch("qq_lib.run.runner.monotonic", return_value=100.0),
+        patch.object(CFG.runner, "kill_stage_out_time", 20),
+    ):
+        runner._cleanup()
+
+    runner._copyRunTimeFilesToInputDir.assert_called_once_with(retry=False)
+    runner._stageOutOnKill.assert_called_once_with(120.0)
+
+
+def test_runner_cleanup_stage_out_disabled():
+    runner = Runner.__new__(Runner)
+    runner._updateInfoKilled = MagicMock()
+    runner._use_scratch = True
+    runner._process = None
+    runner._copyRunTimeFilesToInputDir = MagicMock()
+    runner._stageOutOnKill = MagicMock()
+
+    with patch.object(CFG.runner, "kill_stage_out", False):
+        runner._cleanup()
+
+    runner._stageOutOnKill.assert_not_called()
+
+
+def _make_killed_runner(tmp_path):
+    runner = Runner.__new__(Runner)
+    runner._work_dir = tmp_path / "work"
+    runner._work_dir.mkdir()
+    runner._input_dir = tmp_path / "input"
+    runner._info_file = runner._input_dir / "job.qqinfo"
+    runner._input_machine = "input.host"
+    runner._batch_system = MagicMock()
+    runner._informer = MagicMock()
+    runner._informer.info.input_machine = "input.host"
+    runner._informer.info.stdout_file = str(runner._work_dir / "job.out")
+    runner._informer.info.stderr_file = str(runner._work_dir / "job.err")
+    runner._informer.info.included_files = [Path("/shared/forcefield.ff")]
+    runner._informer.info.start_time = datetime(2025, 1, 1, 12, 0)
+    return runner
+
+
+def _touch(path, mtime, size=1):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+
+
+def test_runner_get_stage_out_candidates_orders_files(tmp_path):
+    runner = _make_killed_runner(tmp_path)
+    start = runner._informer.info.start_time.timestamp()
+    work = runner._work_dir
+
+    _touch(work / "input.gro", start - 100)  # staged input, not modified
+    _touch(work / "job.out", start + 10)  # runtime file
+    _touch(work / "job.err", start + 10)  # runtime file
+    _touch(work / "forcefield.ff" / "ions.itp", start + 10)  # included file
+    _touch(work / "old.xtc", start + 10, size=10)
+    _touch(work / "new.xtc", start + 50, size=10)
+    _touch(work / "small.log", start + 50, size=1)
+    _touch(work / "sub" / "state.cpt", start + 5, size=100)
+
+    with (
+        patch.object(CFG.runner, "kill_stage_out_patterns", ["*.cpt"]),
+        patch("qq_lib.run.runner.logger"),
+    ):
+        files = runner._getStageOutCandidates()
+
+    assert files == [
+        work / "sub" / "state.cpt",
+        work / "small.log",
+        work / "new.xtc",
+        work / "old.xtc",
+    ]
+
+
+def test_runner_stage_out_on_kill_copies_batches_and_records_files(tmp_path):
+    runner = _make_killed_runner(tmp_path)
+    files = [runner._work_dir / f"file{i}.txt" for i in range(5)]
+    runner._getStageOutCandidates = MagicMock(return_value=files)
+    runner._batch_system.syncSelected.side_effect = [None, QQError("failed"), None]
+
+    with (
+        patch.object(CFG.runner, "kill_stage_out_batch", 2),
+        patch("qq_lib.run.runner.monotonic", return_value=0.0),
+        patch("qq_lib.run.runner.socket.gethostname", return_value="node1"),
+        patch("qq_lib.run.runner.logger"),
+    ):
+        runner._stageOutOnKill(10.0)
+
+    assert runner._batch_system.syncSelected.call_count == 3
+    # each transfer is bounded by the time left until the deadline
+    runner._batch_system.syncSelected.assert_any_call(
+        runner._work_dir,
+        runner._input_dir,
+        "node1",
+        "input.host",
+        files[:2],
+        timeout=10.0,
+    )
+    assert runner._informer.info.saved_files == [
+        Path("file0.txt"),
+        Path("file1.txt"),
+        Path("file4.txt"),
+    ]
+    # saved files are recorded after each successfully copied batch
+    assert runner._informer.toJournal.call_count == 2
+    runner._informer.toJournal.assert_called_with(
+        runner._info_file, ["saved_files"], host="input.host"
+    )
+
+
+def test_runner_stage_out_on_kill_stops_at_deadline(tmp_path):
+    runner = _make_killed_runner(tmp_path)
+    files = [runner._work_dir / f"file{i}.txt" for i in range(4)]
+    runner._getStageOutCandidates = MagicMock(return_value=files)
+
+    with (
+        patch.object(CFG.runner, "kill_stage_out_batch", 2),
+        patch("qq_lib.run.runner.monotonic", side_effect=[5.0, 15.0]),
+        patch("qq_lib.run.runner.socket.gethostname", return_value="node1"),
+        patch("qq_lib.run.runner.logger"),
+    ):
+        runner._stageOutOnKill(10.0)
+
+    runner._batch_system.syncSelected.assert_called_once()
+    assert runner._batch_system.syncSelected.call_args.kwargs["timeout"] == 5.0
+    assert runner._informer.info.saved_files == [Path("file0.txt"), Path("file1.txt")]
+    runner._informer.toJournal.assert_called_once()
+
+
+def test_runner_stage_out_on_kill_nothing_saved(tmp_path):
+    runner = _make_killed_runner(tmp_path)
+    runner._getStageOutCandidates = MagicMock(return_value=[])
+
+    with patch("qq_lib.run.runner.logger"):
+        runner._stageOutOnKill(10.0)
+
+    runner._batch_system.syncSelected.assert_not_called()
+    runner._informer.toJournal.assert_not_called()
+
+
 def test_runner_resubmit_final_cycle():
     informer_mock = MagicMock()
     informer_mock.info.loop_info.current = 5
@@ -350,10 +510,161 @@ def test_runner_resubmit_should_resubmit_is_false():
     )
 
 
+def test_runner_resubmit_should_resubmit_is_false_cancels_queued_cycles():
+    informer_mock = MagicMock()
+    informer_mock.info.loop_info.current = 5
+    informer_mock.info.loop_info.end = 9999
+
+    runner = Runner.__new__(Runner)
+    runner._informer = informer_mock
+    runner._should_resubmit = False
+
+    with (
+        patch("qq_lib.run.runner.logger"),
+        patch.object(Runner, "_cancelQueuedCycles") as mock_cancel,
+    ):
+        runner._resubmit()
+
+    mock_cancel.assert_called_once()
+
+
+def test_runner_resubmit_all_cycles_already_queued():
+    informer_mock = MagicMock()
+    informer_mock.info.loop_info.current = 8
+    informer_mock.info.loop_info.end = 10
+    informer_mock.info.loop_info.window = 3
+    informer_mock.info.loop_info.getLastQueuedCycle.return_value = 10
+
+    runner = Runner.__new__(Runner)
+    runner._informer = informer_mock
+    runner._should_resubmit = True
+
+    with (
+        patch("qq_lib.run.runner.logger") as mock_logger,
+        patch("qq_lib.run.runner.Retryer") as mock_retryer,
+    ):
+        runner._resubmit()
+
+    mock_retryer.assert_not_called()
+    mock_logger.info.assert_called_once_with(
+        "All remaining cycles of the loop job are already submitted. Not resubmitting."
+    )
+
+
+def test_runner_resubmit_with_window_submits_next_cycle():
+    informer_mock = MagicMock()
+    informer_mock.info.loop_info.current = 2
+    informer_mock.info.loop_info.end = 10
+    informer_mock.info.loop_info.window = 3
+    informer_mock.info.loop_info.autosize = None
+    informer_mock.info.loop_info.getLastQueuedCycle.return_value = 4
+    informer_mock.info.getCommandLineForResubmit.return_value = ["cmd"]
+
+    runner = Runner.__new__(Runner)
+    runner._informer = informer_mock
+    runner._batch_system = MagicMock()
+    runner._should_resubmit = True
+
+    with (
+        patch("qq_lib.run.runner.logger"),
+        patch("qq_lib.run.runner.Retryer") as mock_retryer,
+    ):
+        runner._resubmit()
+
+    mock_retryer.assert_called_once()
+    assert mock_retryer.call_args.kwargs["command_line"] == ["cmd"]
+
+
+def _make_queued_cycle_informer(job_id, state):
+    informer = MagicMock()
+    informer.info.job_id = job_id
+    informer.info.job_state = state
+    return informer
+
+
+def test_runner_cancel_queued_cycles_kills_queued_jobs():
+    informer_mock = MagicMock()
+    informer_mock.info.input_machine = "input.host"
+    informer_mock.info.getQueuedCyclesInfoFiles.return_value = [
+        Path("/dir/job+0003.qqinfo"),
+        Path("/dir/job+0004.qqinfo"),
+    ]
+
+    runner = Runner.__new__(Runner)
+    runner._informer = informer_mock
+    runner._batch_system = MagicMock()
+
+    queued = [
+        _make_queued_cycle_informer("3", NaiveState.QUEUED),
+        _make_queued_cycle_informer("4", NaiveState.QUEUED),
+    ]
+
+    with patch(
+        "qq_lib.run.runner.Informer.fromFile", side_effect=queued
+    ) as mock_from_file:
+        runner._cancelQueuedCycles()
+
+    mock_from_file.assert_any_call(Path("/dir/job+0003.qqinfo"), "input.host")
+    assert runner._batch_system.jobKill.call_args_list == [
+        ((("3",)), {}),
+        ((("4",)), {}),
+    ]
+    for informer, name in zip(queued, ["job+0003.qqinfo", "job+0004.qqinfo"]):
+        informer.setKilled.assert_called_once()
+        informer.toJournal.assert_called_once_with(
+            Path("/dir") / name, ["job_state", "completion_time"], host="input.host"
+        )
+
+
+def test_runner_cancel_queued_cycles_skips_jobs_that_are_not_queued():
+    informer_mock = MagicMock()
+    informer_mock.info.getQueuedCyclesInfoFiles.return_value = [
+        Path("/dir/job+0003.qqinfo")
+    ]
+
+    runner = Runner.__new__(Runner)
+    runner._informer = informer_mock
+    runner._batch_system = MagicMock()
+
+    killed = _make_queued_cycle_informer("3", NaiveState.KILLED)
+    with patch("qq_lib.run.runner.Informer.fromFile", return_value=killed):
+        runner._cancelQueuedCycles()
+
+    runner._batch_system.jobKill.assert_not_called()
+    killed.toJournal.assert_not_called()
+
+
+def test_runner_cancel_queued_cycles_continues_after_error():
+    informer_mock = MagicMock()
+    informer_mock.info.getQueuedCyclesInfoFiles.return_value = [
+        Path("/dir/job+0003.qqinfo"),
+        Path("/dir/job+0004.qqinfo"),
+    ]
+
+    runner = Runner.__new__(Runner)
+    runner._informer = informer_mock
+    runner._batch_system = MagicMock()
+
+    queued = _make_queued_cycle_informer("4", NaiveState.QUEUED)
+    with (
+        patch(
+            "qq_lib.run.runner.Informer.fromFile",
+            side_effect=[QQError("missing"), queued],
+        ),
+        patch("qq_lib.run.runner.logger") as mock_logger,
+    ):
+        runner._cancelQueuedCycles()
+
+    mock_logger.warning.assert_called_once()
+    runner._batch_system.jobKill.assert_called_once_with("4")
+
+
 def test_runner_resubmit_successful_resubmission():
     informer_mock = MagicMock()
     informer_mock.info.loop_info.current = 1
     informer_mock.info.loop_info.end = 5
+    informer_mock.info.loop_info.window = 1
+    informer_mock.info.loop_info.autosize = None
     informer_mock.info.input_machine = "random.host.org"
     informer_mock.info.input_dir = "/dir"
     informer_mock.info.job_id = "123"
@@ -389,6 +700,8 @@ def test_runner_resubmit_raises_qqerror():
     informer_mock = MagicMock()
     informer_mock.info.loop_info.current = 1
     informer_mock.info.loop_info.end = 5
+    informer_mock.info.loop_info.window = 1
+    informer_mock.info.loop_info.autosize = None
     informer_mock.info.input_machine = "random.host.org"
     informer_mock.info.input_dir = "/dir"
     runner = Runner.__new__(Runner)
@@ -424,8 +737,8 @@ def test_runner_update_info_killed_success():
 
     runner._reloadInfoAndEnsureValid.assert_called_with(retry=False)
     informer_mock.setKilled.assert_called_once_with(now)
-    informer_mock.toFile.assert_called_once_with(
-        runner._info_file, host="random.host.org"
+    informer_mock.toJournal.assert_called_once_with(
+        runner._info_file, ["job_state", "completion_time"], host="random.host.org"
     )
     mock_logger.warning.assert_not_called()
 
@@ -472,13 +785,17 @@ def test_runner_update_info_failed_success():
     runner._reloadInfoAndEnsureValid.assert_called_once()
     informer_mock.setFailed.assert_called_once_with(now, 42)
     retryer_cls.assert_called_once_with(
-        informer_mock.toFile,
+        informer_mock.toJournal,
         runner._info_file,
+        ["job_state", "completion_time", "job_exit_code"],
         host="random.host.org",
         max_tries=CFG.runner.retry_tries,
         wait_seconds=CFG.runner.retry_wait,
     )
     retryer_mock.run.assert_called_once()
+    informer_mock.compactJournal.assert_called_once_with(
+        runner._info_file, host="random.host.org"
+    )
     mock_logger.warning.assert_not_called()
 
 
@@ -524,16 +841,39 @@ def test_runner_update_info_finished_success():
     runner._reloadInfoAndEnsureValid.assert_called_once()
     informer_mock.setFinished.assert_called_once_with(now)
     retryer_cls.assert_called_once_with(
-        informer_mock.toFile,
+        informer_mock.toJournal,
         runner._info_file,
+        ["job_state", "completion_time", "job_exit_code", "usage"],
         host="random.host.org",
         max_tries=CFG.runner.retry_tries,
         wait_seconds=CFG.runner.retry_wait,
     )
     retryer_mock.run.assert_called_once()
+    informer_mock.compactJournal.assert_called_once_with(
+        runner._info_file, host="random.host.org"
+    )
     mock_logger.warning.assert_not_called()
 
 
+def test_runner_update_info_finished_records_usage():
+    runner = Runner.__new__(Runner)
+    runner._informer = MagicMock()
+    runner._info_file = Path("job.qqinfo")
+    runner._input_machine = "random.host.org"
+    runner._reloadInfoAndEnsureValid = MagicMock()
+    runner._started = 100.0
+    usage = ResourceUsage(mem=Size(1, "gb"))
+
+    with (
+        patch("qq_lib.run.runner.Retryer"),
+        patch("qq_lib.run.runner.monotonic", return_value=3700.4),
+    ):
+        runner._updateInfoFinished(usage)
+
+    assert runner._informer.info.usage is usage
+    assert usage.walltime == timedelta(hours=1)
+
+
 def test_runner_update_info_finished_logs_warning_on_failure():
     informer_mock = MagicMock()
     informer_mock.setFinished.side_effect = Exception("fail")
@@ -550,6 +890,26 @@ def test_runner_update_info_finished_logs_warning_on_failure():
     runner._reloadInfoAndEnsureValid.assert_called_once()
     informer_mock.setFinished.assert_called_once()
     mock_logger.warning.assert_called_once()
+    # the journal is not compacted if the record could not be appended
+    informer_mock.compactJournal.assert_not_called()
+
+
+def test_runner_compact_journal_logs_warning_on_failure():
+    informer_mock = MagicMock()
+    informer_mock.compactJournal.side_effect = QQError("fail")
+
+    runner = Runner.__new__(Runner)
+    runner._informer = informer_mock
+    runner._info_file = Path("job.qqinfo")
+    runner._input_machine = "random.host.org"
+
+    with patch("qq_lib.run.runner.logger") as mock_logger:
+        runner._compactJournal()
+
+    informer_mock.compactJournal.assert_called_once_with(
+        Path("job.qqinfo"), host="random.host.org"
+    )
+    mock_logger.warning.assert_called_once()
 
 
 def test_runner_update_info_running_success():
@@ -564,6 +924,7 @@ def test_runner_update_info_running_success():
     runner._info_file = Path("job.qqinfo")
     runner._input_machine = "random.host.org"
     runner._work_dir = Path("/workdir")
+    runner._reused_work_dir = None
     runner._reloadInfoAndEnsureValid = MagicMock()
 
     with (
@@ -582,8 +943,9 @@ def test_runner_update_info_running_success():
         now, "host", nodes, Path("/workdir")
     )
     retryer_cls.assert_called_once_with(
-        informer_mock.toFile,
+        informer_mock.toJournal,
         runner._info_file,
+        ["job_state", "start_time", "main_node", "all_nodes", "work_dir", "loop_info"],
         host="random.host.org",
         max_tries=CFG.runner.retry_tries,
         wait_seconds=CFG.runner.retry_wait,
@@ -601,6 +963,7 @@ def test_runner_update_info_running_raises_qqerror_on_failure():
     runner._info_file = Path("job.qqinfo")
     runner._input_machine = "random.host.org"
     runner._work_dir = Path("/workdir")
+    runner._reused_work_dir = None
     runner._reloadInfoAndEnsureValid = MagicMock()
 
     with (
@@ -619,6 +982,7 @@ def test_runner_update_info_running_raises_on_empty_node_list():
     runner._info_file = Path("job.qqinfo")
     runner._input_machine = "random.host.org"
     runner._work_dir = Path("/workdir")
+    runner._reused_work_dir = None
     runner._reloadInfoAndEnsureValid = MagicMock()
 
     with (
@@ -636,6 +1000,7 @@ def test_runner_delete_work_dir_invokes_shutil_rmtree_with_retryer():
 
     retryer_mock = MagicMock()
     with (
+        patch.object(CFG.runner, "deferred_deletion", False),
         patch("qq_lib.run.runner.Retryer", return_value=retryer_mock) as retryer_cls,
         patch("qq_lib.run.runner.logger") as mock_logger,
     ):
@@ -653,18 +1018,123 @@ def test_runner_delete_work_dir_invokes_shutil_rmtree_with_retryer():
     )
 
 
+def test_runner_delete_work_dir_renames_to_tombstone_and_deletes_in_background(
+    tmp_path,
+):
+    work_dir = tmp_path / "main"
+    work_dir.mkdir()
+    (work_dir / "file.txt").write_text("data")
+
+    runner = Runner.__new__(Runner)
+    runner._work_dir = work_dir
+    runner._deleteTombstone = MagicMock()
+
+    with patch("qq_lib.run.runner.Retryer") as retryer_cls:
+        runner._deleteWorkDir()
+
+    tombstone = tmp_path / f"main{CFG.suffixes.tombstone}"
+    assert not work_dir.exists()
+    assert (tombstone / "file.txt").is_file()
+    runner._deleteTombstone.assert_called_once_with(tombstone)
+    retryer_cls.assert_not_called()
+
+
+def test_runner_delete_work_dir_falls_back_to_rmtree_if_rename_fails():
+    runner = Runner.__new__(Runner)
+    runner._work_dir = MagicMock()
+    runner._work_dir.with_name.return_value = Path("/scratch/main.qqtomb")
+    runner._work_dir.rename.side_effect = OSError("cross-device link")
+    runner._deleteTombstone = MagicMock()
+
+    retryer_mock = MagicMock()
+    with (
+        patch("qq_lib.run.runner.Retryer", return_value=retryer_mock) as retryer_cls,
+        patch("qq_lib.run.runner.logger") as mock_logger,
+    ):
+        runner._deleteWorkDir()
+
+    runner._deleteTombstone.assert_not_called()
+    mock_logger.warning.assert_called_once()
+    retryer_cls.assert_called_once_with(
+        shutil.rmtree,
+        runner._work_dir,
+        max_tries=CFG.runner.retry_tries,
+        wait_seconds=CFG.runner.retry_wait,
+    )
+    retryer_mock.run.assert_called_once()
+
+
+def test_runner_delete_tombstone_spawns_detached_low_priority_process():
+    runner = Runner.__new__(Runner)
+    tombstone = Path("/scratch/main.qqtomb")
+
+    with (
+        patch("qq_lib.run.runner.os.chdir") as mock_chdir,
+        patch("qq_lib.run.runner.shutil.which", side_effect=lambda x: f"/usr/bin/{x}"),
+        patch("qq_lib.run.runner.subprocess.Popen") as mock_popen,
+    ):
+        runner._deleteTombstone(tombstone)
+
+    mock_chdir.assert_called_once_with(Path("/scratch"))
+    mock_popen.assert_called_once()
+    command = mock_popen.call_args.args[0]
+    assert command == [
+        "nice",
+        "-n",
+        str(CFG.runner.deletion_niceness),
+        "ionice",
+        "-c",
+        "3",
+        "rm",
+        "-rf",
+        str(tombstone),
+    ]
+    assert mock_popen.call_args.kwargs["start_new_session"] is True
+
+
+def test_runner_delete_tombstone_skips_unavailable_priority_tools():
+    runner = Runner.__new__(Runner)
+    tombstone = Path("/scratch/main.qqtomb")
+
+    with (
+        patch("qq_lib.run.runner.os.chdir"),
+        patch("qq_lib.run.runner.shutil.which", return_value=None),
+        patch("qq_lib.run.runner.subprocess.Popen") as mock_popen,
+    ):
+        runner._deleteTombstone(tombstone)
+
+    assert mock_popen.call_args.args[0] == ["rm", "-rf", str(tombstone)]
+
+
+def test_runner_delete_tombstone_logs_warning_if_process_cannot_start():
+    runner = Runner.__new__(Runner)
+
+    with (
+        patch("qq_lib.run.runner.os.chdir"),
+        patch("qq_lib.run.runner.shutil.which", return_value=None),
+        patch("qq_lib.run.runner.subprocess.Popen", side_effect=OSError("no rm")),
+        patch("qq_lib.run.runner.logger") as mock_logger,
+    ):
+        runner._deleteTombstone(Path("/scratch/main.qqtomb"))
+
+    mock_logger.warning.assert_called_once()
+    assert "wipe --orphans" in mock_logger.warning.call_args.args[0]
+
+
 def test_runner_set_up_scratch_dir_calls_retryers_with_correct_arguments():
     runner = Runner.__new__(Runner)
     runner._batch_system = MagicMock()
     runner._informer = MagicMock()
     runner._info_file = Path("job.qqinfo")
     runner._input_dir = Path("/input")
+    runner._reused_work_dir = None
     runner._informer.info.job_id = "123"
     runner._informer.info.excluded_files = ["ignore.txt"]
     runner._informer.info.included_files = ["include1.txt", "include2.txt"]
     runner._informer.info.input_machine = "random.host.org"
     runner._informer.info.input_dir = Path("/input")
     runner._informer.info.job_name = "job+0002"
+    runner._informer.info.prestaged_node = None
     runner._archiver = None
 
     work_dir = Path("/scratch/job123")
@@ -717,11 +1187,13 @@ def test_runner_set_up_scratch_dir_with_archiver_adds_archive_to_excluded():
     runner._informer = MagicMock()
     runner._info_file = Path("job.qqinfo")
     runner._input_dir = Path("/input")
+    runner._reused_work_dir = None
     runner._informer.info.job_id = "123"
     runner._informer.info.excluded_files = ["ignore.txt"]
     runner._informer.info.input_machine = "random.host.org"
     runner._informer.info.input_dir = Path("/input")
     runner._informer.info.job_name = "job+0002"
+    runner._informer.info.prestaged_node = None
 
     # set archiver with a dummy _archive attribute
     archiver_mock = MagicMock()
@@ -793,45 +1265,290 @@ def test_runner_log_failure_and_exit_calls_fallback_on_exception():
     mock_fatal.assert_called_once()
 
 
-@patch("qq_lib.run.runner.logger.info")
-@patch.object(Runner, "_copyRunTimeFilesToInputDir")
-def test_runner_finalize_failure_updates_info_failed(mock_copy, mock_logger_info):
+def _make_requeue_runner(requeues=0, max_requeues=2, window=1):
     runner = Runner.__new__(Runner)
-    runner._process = MagicMock()
-    runner._process.returncode = 91
-    runner._use_scratch = True
-    runner._updateInfoFailed = MagicMock()
+    runner._process = None
+    runner._batch_system = MagicMock()
+    runner._informer = MagicMock()
+    runner._informer.info.job_state = NaiveState.RUNNING
+    runner._informer.info.loop_info = LoopInfo(
+        start=1,
+        end=5,
+        archive=Path("archive"),
+        archive_format="job%04d",
+        window=window,
+        max_requeues=max_requeues,
+        requeues=requeues,
+    )
+    return runner
 
-    runner.finalize()
 
-    mock_copy.assert_called_once_with(retry=True)
-    runner._updateInfoFailed.assert_called_once_with(91)
-    mock_logger_info.assert_any_call("Finalizing the execution.")
-    mock_logger_info.assert_any_call("Job completed with an exit code of 91.")
+def test_runner_should_requeue_on_qq_error_before_script():
+    runner = _make_requeue_runner()
+    assert runner._shouldRequeue(QQError("rsync failed"))
 
 
-@patch("qq_lib.run.runner.logger.info")
-@patch.object(Runner, "_copyRunTimeFilesToInputDir")
-def test_runner_finalize_failure_updates_info_failed_no_scratch(
-    mock_copy, mock_logger_info
-):
-    runner = Runner.__new__(Runner)
-    runner._process = MagicMock()
-    runner._process.returncode = 91
-    runner._use_scratch = False
-    runner._updateInfoFailed = MagicMock()
+@pytest.mark.parametrize(
+    "exception",
+    [RuntimeError("unexpected"), QQJobMismatchError("mismatch")],
+)
+def test_runner_should_requeue_false_for_other_errors(exception):
+    runner = _make_requeue_runner()
+    assert not runner._shouldRequeue(exception)
 
-    runner.finalize()
 
-    mock_copy.assert_not_called()
-    runner._updateInfoFailed.assert_called_once_with(91)
-    mock_logger_info.assert_any_call("Finalizing the execution.")
-    mock_logger_info.assert_any_call("Job completed with an exit code of 91.")
+def test_runner_should_requeue_false_if_script_failed():
+    runner = _make_requeue_runner()
+    runner._process = MagicMock(returncode=1)
+    assert not runner._shouldRequeue(QQError("sync failed"))
 
 
-@patch("qq_lib.run.runner.logger.info")
-def test_runner_finalize_with_scratch_and_archiver(mock_logger_info):
+def test_runner_should_requeue_false_if_cycle_finished():
+    runner = _make_requeue_runner()
+    runner._process = MagicMock(returncode=0)
+    runner._informer.info.job_state = NaiveState.FINISHED
+    assert not runner._shouldRequeue(QQError("resubmit failed"))
+
+
+@pytest.mark.parametrize(
+    "requeues, max_requeues, window", [(2, 2, 1), (0, 0, 1), (0, 2, 3)]
+)
+def test_runner_should_requeue_false_if_not_allowed(requeues, max_requeues, window):
+    runner = _make_requeue_runner(requeues, max_requeues, window)
+    assert not runner._shouldRequeue(QQError("rsync failed"))
+
+
+def test_runner_requeue_resubmits_without_waiting():
+    runner = _make_requeue_runner(requeues=1, max_requeues=3)
+    runner._informer.info.getCommandLineForResubmit.return_value = ["script.sh"]
+
+    with (
+        patch("qq_lib.run.runner.sleep") as mock_sleep,
+        patch("qq_lib.run.runner.Retryer") as mock_retryer,
+    ):
+        runner._requeue()
+
+    # the backoff is applied by the batch system, not inside the allocation
+    mock_sleep.assert_not_called()
+    runner._informer.info.getCommandLineForResubmit.assert_called_once_with(
+        requeue=True
+    )
+    assert mock_retryer.call_args.args[0] == runner._batch_system.resubmit
+    assert mock_retryer.call_args.kwargs["command_line"] == ["script.sh"]
+    mock_retryer.return_value.run.assert_called_once()
+
+
+def test_runner_requeue_reports_failure():
+    runner = _make_requeue_runner()
+
+    with (
+        patch("qq_lib.run.runner.Retryer") as mock_retryer,
+        patch("qq_lib.run.runner.logger") as mock_logger,
+    ):
+        mock_retryer.return_value.run.side_effect = QQError("cannot submit")
+        runner._requeue()
+
+    mock_logger.warning.assert_called_once()
+
+
+def test_runner_log_failure_and_exit_requeues_cycle():
+    runner = _make_requeue_runner()
+    runner._updateInfoFailed = MagicMock()
+    runner._requeue = MagicMock()
+    exc = QQError("rsync failed")
+
+    with patch("qq_lib.run.runner.logger"), patch("sys.exit") as mock_exit:
+        runner.logFailureAndExit(exc)
+
+    runner._updateInfoFailed.assert_called_once_with(exc.exit_code)
+    runner._requeue.assert_called_once()
+    mock_exit.assert_called_once_with(exc.exit_code)
+
+
+def _make_autosize_runner(tmp_path, current=3):
+    runner = Runner.__new__(Runner)
+    runner._batch_system = MagicMock()
+    runner._use_scratch = True
+    runner._work_dir = tmp_path / "work"
+    runner._informer = MagicMock()
+    runner._informer.info.job_type = JobType.LOOP
+    runner._informer.info.job_id = "123"
+    runner._informer.info.input_machine = "random.host.org"
+    runner._informer.info.resources = Resources(
+        walltime="10:00:00", mem="16gb", work_dir="input_dir"
+    )
+    runner._informer.info.loop_info = LoopInfo(
+        start=1,
+        end=10,
+        archive=tmp_path / "archive",
+        archive_format="job%04d",
+        current=current,
+        autosize=AutosizeInfo("10:00:00", Size(16, "gb")),
+    )
+    return runner
+
+
+def test_runner_measure_usage_uses_batch_system_and_work_dir(tmp_path):
+    runner = _make_autosize_runner(tmp_path)
+    runner._work_dir.mkdir()
+    (runner._work_dir / "data").write_bytes(b"x" * 4096)
+    job = runner._batch_system.getBatchJob.return_value
+    job.getUtilMem.return_value = 25
+    job.getMem.return_value = Size(16, "gb")
+
+    usage = runner._measureUsage()
+
+    runner._batch_system.getBatchJob.assert_called_once_with("123")
+    assert usage.mem == Size(4, "gb")
+    assert usage.work_size == Size(4, "kb")
+    assert usage.walltime is None
+
+
+def test_runner_measure_usage_falls_back_to_rusage(tmp_path):
+    runner = _make_autosize_runner(tmp_path)
+    runner._use_scratch = False
+    runner._batch_system.getBatchJob.side_effect = QQError("qstat failed")
+
+    with patch("qq_lib.run.runner.resource.getrusage") as mock_rusage:
+        mock_rusage.return_value.ru_maxrss = 2048
+        usage = runner._measureUsage()
+
+    assert usage.mem == Size(2, "mb")
+    assert usage.work_size is None
+
+
+def test_runner_get_autosized_resources_not_autosized():
+    runner = Runner.__new__(Runner)
+    runner._informer = MagicMock()
+    runner._informer.info.loop_info.autosize = None
+
+    assert runner._getAutosizedResources() is None
+
+
+def test_runner_get_autosized_resources_reads_archived_usage(tmp_path):
+    runner = _make_autosize_runner(tmp_path, current=3)
+    runner._informer.info.usage = ResourceUsage(timedelta(hours=2), Size(4, "gb"))
+
+    archived = MagicMock()
+    archived.info.usage = ResourceUsage(timedelta(hours=4), Size(2, "gb"))
+
+    def from_file(file, host):
+        assert host == "random.host.org"
+        if file.name == "job0002.qqinfo":
+            return archived
+        raise QQError("missing")
+
+    with patch(
+        "qq_lib.run.runner.Informer.fromFile", side_effect=from_file
+    ) as mock_from_file:
+        resources = runner._getAutosizedResources()
+
+    assert mock_from_file.call_count == 2
+    assert resources.walltime == "05:00:00"
+    assert resources.mem == Size(5, "gb")
+
+
+@patch("qq_lib.run.runner.logger.info")
+def test_runner_finalize_measures_usage_of_autosized_loop_job(_mock_logger_info):
+    runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = False
+    runner._process = MagicMock(returncode=0)
+    runner._archiver = None
+    runner._use_scratch = False
+    runner._informer = MagicMock()
+    runner._informer.info.job_type = JobType.LOOP
+    runner._updateInfoFinished = MagicMock()
+    runner._resubmit = MagicMock()
+    runner._measureUsage = MagicMock()
+
+    runner.finalize()
+
+    runner._measureUsage.assert_called_once()
+    runner._updateInfoFinished.assert_called_once_with(
+        runner._measureUsage.return_value
+    )
+    runner._resubmit.assert_called_once()
+
+
+@patch("qq_lib.run.runner.logger.info")
+@patch.object(Runner, "_copyRunTimeFilesToInputDir")
+def test_runner_finalize_failure_updates_info_failed(mock_copy, mock_logger_info):
+    runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = False
+    runner._process = MagicMock()
+    runner._process.returncode = 91
+    runner._use_scratch = True
+    runner._updateInfoFailed = MagicMock()
+    runner._cancelQueuedCycles = MagicMock()
+
+    runner.finalize()
+
+    mock_copy.assert_called_once_with(retry=True)
+    runner._updateInfoFailed.assert_called_once_with(91)
+    runner._cancelQueuedCycles.assert_called_once()
+    mock_logger_info.assert_any_call("Finalizing the execution.")
+    mock_logger_info.assert_any_call("Job completed with an exit code of 91.")
+
+
+@pytest.mark.parametrize(
+    "enabled, states, stage_out",
+    [
+        (True, [NaiveState.FINISHED, NaiveState.FAILED], True),
+        (True, [NaiveState.FAILED, NaiveState.FAILED], False),
+        (False, [NaiveState.FINISHED, NaiveState.FAILED], False),
+    ],
+)
+@patch.object(Runner, "_copyWorkDirToInputDir")
+@patch.object(Runner, "_copyRunTimeFilesToInputDir")
+def test_runner_finalize_failed_pack_copies_results_of_finished_tasks(
+    mock_copy_runtime, mock_copy_work_dir, enabled, states, stage_out
+):
+    runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = False
+    runner._process = PackScheduler.__new__(PackScheduler)
+    runner._process.returncode = 2
+    runner._use_scratch = True
+    runner._informer = MagicMock()
+    runner._informer.info.pack_info = PackInfo(
+        [PackTask(str(i), state=state) for i, state in enumerate(states)]
+    )
+    runner._updateInfoFailed = MagicMock()
+    runner._cancelQueuedCycles = MagicMock()
+
+    with patch.object(CFG.runner, "pack_stage_out_on_failure", enabled):
+        runner.finalize()
+
+    assert mock_copy_work_dir.called is stage_out
+    assert mock_copy_runtime.called is not stage_out
+    runner._updateInfoFailed.assert_called_once_with(2)
+
+
+@patch("qq_lib.run.runner.logger.info")
+@patch.object(Runner, "_copyRunTimeFilesToInputDir")
+def test_runner_finalize_failure_updates_info_failed_no_scratch(
+    mock_copy, mock_logger_info
+):
+    runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = False
+    runner._process = MagicMock()
+    runner._process.returncode = 91
+    runner._use_scratch = False
+    runner._updateInfoFailed = MagicMock()
+    runner._cancelQueuedCycles = MagicMock()
+
+    runner.finalize()
+
+    mock_copy.assert_not_called()
+    runner._updateInfoFailed.assert_called_once_with(91)
+    runner._cancelQueuedCycles.assert_called_once()
+    mock_logger_info.assert_any_call("Finalizing the execution.")
+    mock_logger_info.assert_any_call("Job completed with an exit code of 91.")
+
+
+@patch("qq_lib.run.runner.logger.info")
+def test_runner_finalize_with_scratch_and_archiver(mock_logger_info):
     runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = False
     runner._process = MagicMock()
     runner._process.returncode = 0
     runner._archiver = MagicMock()
@@ -867,6 +1584,7 @@ def test_runner_finalize_with_scratch_and_archiver(mock_logger_info):
 @patch("qq_lib.run.runner.logger.info")
 def test_runner_finalize_with_scratch_and_without_archiver(mock_logger_info):
     runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = False
     runner._process = MagicMock()
     runner._process.returncode = 0
     runner._archiver = None
@@ -897,6 +1615,7 @@ def test_runner_finalize_with_scratch_and_without_archiver(mock_logger_info):
 @patch("qq_lib.run.runner.logger.info")
 def test_runner_finalize_without_scratch_and_with_archiver(mock_logger_info):
     runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = False
     runner._process = MagicMock()
     runner._process.returncode = 0
     runner._archiver = MagicMock()
@@ -923,6 +1642,7 @@ def test_runner_finalize_without_scratch_and_with_archiver(mock_logger_info):
 @patch("qq_lib.run.runner.logger.info")
 def test_runner_finalize_without_scratch_and_without_archiver(mock_logger_info):
     runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = False
     runner._process = MagicMock()
     runner._process.returncode = 0
     runner._archiver = None
@@ -948,6 +1668,7 @@ def test_runner_finalize_without_scratch_and_without_archiver(mock_logger_info):
 @patch("qq_lib.run.runner.logger.info")
 def test_runner_finalize_with_scratch_archiver_and_resubmit(mock_logger_info):
     runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = False
     runner._process = MagicMock()
     runner._process.returncode = 0
     runner._archiver = MagicMock()
@@ -1072,6 +1793,7 @@ def test_runner_execute_handles_no_resubmit_exit_code(tmp_path):
 
 def test_runner_prepare_with_scratch_and_archiver():
     runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = False
     runner._use_scratch = True
     runner._archiver = MagicMock()
     runner._setUpScratchDir = MagicMock()
@@ -1098,6 +1820,7 @@ def test_runner_prepare_with_scratch_and_archiver():
 
 def test_runner_prepare_with_scratch_and_without_archiver():
     runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = False
     runner._use_scratch = True
     runner._archiver = None
     runner._setUpScratchDir = MagicMock()
@@ -1111,6 +1834,7 @@ def test_runner_prepare_with_scratch_and_without_archiver():
 
 def test_runner_prepare_without_scratch_and_with_archiver():
     runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = False
     runner._use_scratch = False
     runner._archiver = MagicMock()
     runner._setUpScratchDir = MagicMock()
@@ -1135,6 +1859,7 @@ def test_runner_prepare_without_scratch_and_with_archiver():
 
 def test_runner_prepare_without_scratch_and_without_archiver():
     runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = False
     runner._use_scratch = False
     runner._archiver = None
     runner._setUpScratchDir = MagicMock()
@@ -1224,8 +1949,8 @@ def test_runner_reload_info_without_retry(mock_informer_cls, mock_retryer_cls):
 def test_runner_ensure_matches_job_with_matching_numeric_id():
     informer = MagicMock()
     informer.info.job_id = "12345.cluster.domain"
-    informer.matchesJob = (
-        lambda job_id: informer.info.job_id.split(".", 1)[0] == job_id.split(".", 1)[0]
+    informer.matchesJob = lambda job_id: (
+        informer.info.job_id.split(".", 1)[0] == job_id.split(".", 1)[0]
     )
 
     runner = Runner.__new__(Runner)
@@ -1238,8 +1963,8 @@ def test_runner_ensure_matches_job_with_matching_numeric_id():
 def test_runner_ensure_matches_job_with_different_numeric_id_raises():
     informer = MagicMock()
     informer.info.job_id = "99999.cluster.domain"
-    informer.matchesJob = (
-        lambda job_id: informer.info.job_id.split(".", 1)[0] == job_id.split(".", 1)[0]
+    informer.matchesJob = lambda job_id: (
+        informer.info.job_id.split(".", 1)[0] == job_id.split(".", 1)[0]
     )
 
     runner = Runner.__new__(Runner)
@@ -1253,8 +1978,8 @@ def test_runner_ensure_matches_job_with_different_numeric_id_raises():
 def test_runner_ensure_matches_job_with_partial_suffix_matching():
     informer = MagicMock()
     informer.info.job_id = "5678.random.server.org"
-    informer.matchesJob = (
-        lambda job_id: informer.info.job_id.split(".", 1)[0] == job_id.split(".", 1)[0]
+    informer.matchesJob = lambda job_id: (
+        informer.info.job_id.split(".", 1)[0] == job_id.split(".", 1)[0]
     )
 
     runner = Runner.__new__(Runner)
@@ -1449,6 +2174,7 @@ def test_runner_copy_files_calls_sync_selected(tmp_path):
     runner._batch_system = MagicMock()
     runner._informer = MagicMock()
     runner._informer.info.input_machine = "input_machine"
+    runner._input_cache = None
 
     runner._copyFiles(files)
 
@@ -1469,3 +2195,692 @@ def test_runner_copy_files_calls_sync_selected(tmp_path):
     )
 
     assert runner._batch_system.syncSelected.call_count == 2
+
+
+@patch("qq_lib.run.runner.socket.gethostname", return_value="local")
+def test_runner_copy_files_uses_input_cache(_mock_hostname, tmp_path):
+    runner = Runner.__new__(Runner)
+    runner._work_dir = tmp_path / "work"
+    runner._work_dir.mkdir()
+
+    file1 = tmp_path / "a" / "file1.txt"
+    file2 = tmp_path / "b" / "file2.txt"
+
+    runner._batch_system = MagicMock()
+    runner._batch_system.isShared.return_value = True
+    runner._informer = MagicMock()
+    runner._informer.info.input_machine = "input_machine"
+    runner._input_cache = MagicMock()
+    # the first file is staged from the cache, the second one is not accessible
+    runner._input_cache.stage.side_effect = [True, False]
+
+    runner._copyFiles([file1, file2])
+
+    runner._input_cache.stage.assert_any_call(file1, runner._work_dir / "file1.txt")
+    runner._input_cache.stage.assert_any_call(file2, runner._work_dir / "file2.txt")
+    runner._batch_system.syncSelected.assert_called_once_with(
+        file2.parent,
+        runner._work_dir,
+        "input_machine",
+        "local",
+        [file2],
+    )
+
+
+@patch("qq_lib.run.runner.socket.gethostname", return_value="local")
+def test_runner_copy_files_skips_input_cache_for_files_not_on_shared_storage(
+    _mock_hostname, tmp_path
+):
+    runner = Runner.__new__(Runner)
+    runner._work_dir = tmp_path / "work"
+    file = tmp_path / "a" / "file1.txt"
+
+    runner._batch_system = MagicMock()
+    runner._batch_system.isShared.return_value = False
+    runner._informer = MagicMock()
+    runner._informer.info.input_machine = "input_machine"
+    runner._input_cache = MagicMock()
+
+    runner._copyFiles([file])
+
+    runner._batch_system.isShared.assert_called_once_with(file.parent)
+    runner._input_cache.stage.assert_not_called()
+    runner._batch_system.syncSelected.assert_called_once_with(
+        file.parent, runner._work_dir, "input_machine", "local", [file]
+    )
+
+
+@patch("qq_lib.run.runner.socket.gethostname", return_value="input_machine")
+def test_runner_is_accessible_for_cache_on_input_machine(_mock_hostname):
+    runner = Runner.__new__(Runner)
+    runner._batch_system = MagicMock()
+    runner._informer = MagicMock()
+    runner._informer.info.input_machine = "input_machine"
+
+    assert runner._isAccessibleForCache(Path("/local/file.txt"))
+    runner._batch_system.isShared.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "enabled, included, expected",
+    [(True, [Path("a")], True), (True, [], False), (False, [Path("a")], False)],
+)
+def test_runner_copy_input_to_work_dir_creates_input_cache(enabled, included, expected):
+    runner = Runner.__new__(Runner)
+    runner._batch_system = MagicMock()
+    runner._batch_system.getInputCacheDir.return_value = Path("/scratch/.qqcache")
+    runner._informer = MagicMock()
+    runner._informer.info.excluded_files = []
+    runner._informer.info.included_files = included
+    runner._info_file = Path("job.qqinfo")
+    runner._input_dir = Path("/input")
+    runner._work_dir = Path("/scratch/job/main")
+    runner._reused_work_dir = None
+    runner._archiver = None
+    runner._input_cache = None
+
+    with (
+        patch.object(CFG.input_cache, "enabled", enabled),
+        patch("qq_lib.run.runner.Retryer"),
+        patch("qq_lib.run.runner.socket.gethostname", return_value="local"),
+    ):
+        runner._copyInputToWorkDir()
+
+    assert (runner._input_cache is not None) is expected
+    if expected:
+        runner._batch_system.getInputCacheDir.assert_called_once_with(runner._work_dir)
+        assert runner._input_cache._directory == Path("/scratch/.qqcache")
+
+
+def test_runner_copy_input_to_work_dir_excludes_queued_cycles():
+    runner = Runner.__new__(Runner)
+    runner._batch_system = MagicMock()
+    runner._informer = MagicMock()
+    runner._informer.info.input_dir = Path("/input")
+    runner._informer.info.job_name = "job+0002"
+    runner._informer.info.excluded_files = []
+    runner._informer.info.included_files = []
+    runner._informer.info.getQueuedCyclesInfoFiles.return_value = [
+        Path("/input/job+0003.qqinfo")
+    ]
+    runner._info_file = Path("/input/job+0002.qqinfo")
+    runner._input_dir = Path("/input")
+    runner._work_dir = Path("/scratch/job/main")
+    runner._reused_work_dir = None
+    runner._archiver = None
+    runner._input_cache = None
+
+    with (
+        patch("qq_lib.run.runner.Retryer") as mock_retryer,
+        patch("qq_lib.run.runner.socket.gethostname", return_value="local"),
+    ):
+        runner._copyInputToWorkDir()
+
+    excluded = mock_retryer.call_args_list[0].args[5]
+    assert Path("/input/job+0002.qqinfo") in excluded
+    assert Path("/input/job+0003.qqinfo") in excluded
+
+
+@pytest.mark.parametrize("reused", [False, True])
+def test_runner_copy_input_to_work_dir_deletes_only_in_reused_work_dir(reused):
+    runner = Runner.__new__(Runner)
+    runner._batch_system = MagicMock()
+    runner._informer = MagicMock()
+    runner._informer.info.input_dir = Path("/input")
+    runner._informer.info.job_name = "job+0002"
+    runner._informer.info.excluded_files = []
+    runner._informer.info.included_files = [Path("/data/extra")]
+    runner._informer.info.getQueuedCyclesInfoFiles.return_value = []
+    runner._info_file = Path("/input/job+0002.qqinfo")
+    runner._input_dir = Path("/input")
+    runner._work_dir = Path("/scratch/job/main")
+    runner._reused_work_dir = runner._work_dir if reused else None
+    runner._archiver = None
+    runner._input_cache = None
+
+    with (
+        patch.object(CFG.input_cache, "enabled", False),
+        patch("qq_lib.run.runner.Retryer") as mock_retryer,
+        patch("qq_lib.run.runner.socket.gethostname", return_value="local"),
+    ):
+        runner._copyInputToWorkDir()
+
+    sync_call = mock_retryer.call_args_list[0]
+    assert sync_call.kwargs["delete"] is reused
+    # explicitly included files are protected from deletion
+    assert (Path("/input/extra") in sync_call.args[5]) is reused
+
+
+def _make_loop_runner(tmp_path, current=2, end=5):
+    runner = Runner.__new__(Runner)
+    runner._input_dir = tmp_path / "input"
+    runner._input_machine = "input.host"
+    runner._informer = MagicMock()
+    runner._informer.info.script_name = "job.sh"
+    runner._informer.info.job_id = f"{current}.server"
+    runner._informer.info.stdout_file = f"job+000{current}.out"
+    runner._informer.info.stderr_file = f"job+000{current}.err"
+    runner._informer.info.loop_info.start = 1
+    runner._informer.info.loop_info.current = current
+    runner._informer.info.loop_info.end = end
+    runner._should_resubmit = True
+    runner._reuse_work_dir = True
+    runner._reused_work_dir = None
+    return runner
+
+
+def _previous_info(work_dir, state=NaiveState.FINISHED, main_node="node1"):
+    info = MagicMock()
+    info.job_id = "1.server"
+    info.job_state = state
+    info.main_node = main_node
+    info.work_dir = work_dir
+    return MagicMock(info=info)
+
+
+def test_runner_get_retained_work_dir_returns_manifest(tmp_path):
+    runner = _make_loop_runner(tmp_path)
+    work_dir = tmp_path / "main"
+    work_dir.mkdir()
+    WorkDirManifest.fromWorkDir(
+        "1.server", "node1", runner._input_dir, work_dir
+    ).toFile(work_dir / CFG.loop_jobs.manifest_file)
+
+    with (
+        patch(
+            "qq_lib.run.runner.Informer.fromFile",
+            return_value=_previous_info(work_dir),
+        ) as mock_from_file,
+        patch("qq_lib.run.runner.socket.gethostname", return_value="node1"),
+    ):
+        manifest = runner._getRetainedWorkDir()
+
+    assert manifest is not None
+    assert manifest.work_dir == work_dir
+    previous_file = mock_from_file.call_args.args[0]
+    assert previous_file.parent == runner._input_dir.resolve()
+    assert previous_file.suffix == CFG.suffixes.qq_info
+
+
+def test_runner_get_retained_work_dir_first_cycle_returns_none(tmp_path):
+    runner = _make_loop_runner(tmp_path, current=1)
+
+    with patch("qq_lib.run.runner.Informer.fromFile") as mock_from_file:
+        assert runner._getRetainedWorkDir() is None
+
+    mock_from_file.assert_not_called()
+
+
+def test_runner_get_retained_work_dir_previous_info_unavailable(tmp_path):
+    runner = _make_loop_runner(tmp_path)
+
+    with patch("qq_lib.run.runner.Informer.fromFile", side_effect=QQError("missing")):
+        assert runner._getRetainedWorkDir() is None
+
+
+@pytest.mark.parametrize(
+    "state, main_node",
+    [
+        (NaiveState.FAILED, "node1"),
+        (NaiveState.FINISHED, "node2"),
+    ],
+)
+def test_runner_get_retained_work_dir_not_reusable(tmp_path, state, main_node):
+    runner = _make_loop_runner(tmp_path)
+    work_dir = tmp_path / "main"
+    work_dir.mkdir()
+    WorkDirManifest.fromWorkDir(
+        "1.server", "node1", runner._input_dir, work_dir
+    ).toFile(work_dir / CFG.loop_jobs.manifest_file)
+
+    with (
+        patch(
+            "qq_lib.run.runner.Informer.fromFile",
+            return_value=_previous_info(work_dir, state, main_node),
+        ),
+        patch("qq_lib.run.runner.socket.gethostname", return_value="node1"),
+    ):
+        assert runner._getRetainedWorkDir() is None
+
+
+def test_runner_get_retained_work_dir_without_manifest(tmp_path):
+    runner = _make_loop_runner(tmp_path)
+    work_dir = tmp_path / "main"
+    work_dir.mkdir()
+
+    with (
+        patch(
+            "qq_lib.run.runner.Informer.fromFile",
+            return_value=_previous_info(work_dir),
+        ),
+        patch("qq_lib.run.runner.socket.gethostname", return_value="node1"),
+    ):
+        assert runner._getRetainedWorkDir() is None
+
+
+def test_runner_get_retained_work_dir_manifest_of_other_job(tmp_path):
+    runner = _make_loop_runner(tmp_path)
+    work_dir = tmp_path / "main"
+    work_dir.mkdir()
+    WorkDirManifest.fromWorkDir(
+        "999.server", "node1", runner._input_dir, work_dir
+    ).toFile(work_dir / CFG.loop_jobs.manifest_file)
+
+    with (
+        patch(
+            "qq_lib.run.runner.Informer.fromFile",
+            return_value=_previous_info(work_dir),
+        ),
+        patch("qq_lib.run.runner.socket.gethostname", return_value="node1"),
+    ):
+        assert runner._getRetainedWorkDir() is None
+
+
+def test_runner_adopt_work_dir_reuses_directory(tmp_path):
+    runner = _make_loop_runner(tmp_path)
+    work_dir = tmp_path / "main"
+    work_dir.mkdir()
+    (work_dir / "data.txt").write_text("data")
+    manifest = WorkDirManifest.fromWorkDir(
+        "1.server", "node1", runner._input_dir, work_dir
+    )
+    manifest.toFile(work_dir / CFG.loop_jobs.manifest_file)
+    runner._copyInputToWorkDir = MagicMock()
+    runner._removeDirectory = MagicMock()
+
+    with patch("qq_lib.run.runner.Retryer") as retryer_cls:
+        assert runner._adoptWorkDir(manifest)
+
+    assert runner._work_dir == work_dir
+    assert runner._reused_work_dir == work_dir
+    assert not (work_dir / CFG.loop_jobs.manifest_file).exists()
+    retryer_cls.assert_called_once_with(
+        os.chdir,
+        work_dir,
+        max_tries=CFG.runner.retry_tries,
+        wait_seconds=CFG.runner.retry_wait,
+    )
+    runner._copyInputToWorkDir.assert_called_once()
+    runner._removeDirectory.assert_not_called()
+
+
+def test_runner_adopt_work_dir_discards_modified_directory(tmp_path):
+    runner = _make_loop_runner(tmp_path)
+    work_dir = tmp_path / "main"
+    work_dir.mkdir()
+    manifest = WorkDirManifest.fromWorkDir(
+        "1.server", "node1", runner._input_dir, work_dir
+    )
+    (work_dir / "new.txt").write_text("new")
+    runner._copyInputToWorkDir = MagicMock()
+    runner._removeDirectory = MagicMock()
+
+    assert not runner._adoptWorkDir(manifest)
+
+    runner._removeDirectory.assert_called_once_with(work_dir)
+    runner._copyInputToWorkDir.assert_not_called()
+    assert runner._reused_work_dir is None
+
+
+def test_runner_adopt_work_dir_discards_expired_directory(tmp_path):
+    runner = _make_loop_runner(tmp_path)
+    work_dir = tmp_path / "main"
+    work_dir.mkdir()
+    manifest = WorkDirManifest.fromWorkDir(
+        "1.server", "node1", runner._input_dir, work_dir
+    )
+    manifest.created -= timedelta(seconds=CFG.loop_jobs.reuse_max_age + 10)
+    runner._copyInputToWorkDir = MagicMock()
+    runner._removeDirectory = MagicMock()
+
+    assert not runner._adoptWorkDir(manifest)
+
+    runner._removeDirectory.assert_called_once_with(work_dir)
+    runner._copyInputToWorkDir.assert_not_called()
+
+
+def test_runner_retain_work_dir_writes_manifest(tmp_path):
+    runner = _make_loop_runner(tmp_path)
+    runner._work_dir = tmp_path / "main"
+    runner._work_dir.mkdir()
+    (runner._work_dir / "data.txt").write_text("data")
+    # runtime files of the job
+    (runner._work_dir / "job+0002.out").write_text("stdout")
+    (runner._work_dir / "job+0002.err").write_text("stderr")
+
+    with patch("qq_lib.run.runner.socket.gethostname", return_value="node1"):
+        assert runner._retainWorkDir()
+
+    manifest = WorkDirManifest.fromFile(runner._work_dir / CFG.loop_jobs.manifest_file)
+    assert manifest.job_id == "2.server"
+    assert manifest.host == "node1"
+    assert manifest.work_dir == runner._work_dir
+    assert list(manifest.files) == ["data.txt"]
+    assert not (runner._work_dir / "job+0002.out").exists()
+    assert not (runner._work_dir / "job+0002.err").exists()
+
+
+def test_runner_retain_work_dir_replaces_old_manifest(tmp_path):
+    runner = _make_loop_runner(tmp_path)
+    runner._work_dir = tmp_path / "main"
+    runner._work_dir.mkdir()
+    (runner._work_dir / "data.txt").write_text("data")
+    (runner._work_dir / CFG.loop_jobs.manifest_file).write_text("stale")
+
+    with patch("qq_lib.run.runner.socket.gethostname", return_value="node1"):
+        assert runner._retainWorkDir()
+
+    manifest = WorkDirManifest.fromFile(runner._work_dir / CFG.loop_jobs.manifest_file)
+    assert list(manifest.files) == ["data.txt"]
+
+
+@pytest.mark.parametrize(
+    "current, end, should_resubmit",
+    [
+        (5, 5, True),
+        (2, 5, False),
+    ],
+)
+def test_runner_retain_work_dir_not_retained_without_next_cycle(
+    tmp_path, current, end, should_resubmit
+):
+    runner = _make_loop_runner(tmp_path, current=current, end=end)
+    runner._should_resubmit = should_resubmit
+    runner._work_dir = tmp_path / "main"
+    runner._work_dir.mkdir()
+
+    assert not runner._retainWorkDir()
+    assert not (runner._work_dir / CFG.loop_jobs.manifest_file).exists()
+
+
+def test_runner_retain_work_dir_not_retained_when_too_large(tmp_path):
+    runner = _make_loop_runner(tmp_path)
+    runner._work_dir = tmp_path / "main"
+    runner._work_dir.mkdir()
+    (runner._work_dir / "data.txt").write_text("x" * 2048)
+
+    with (
+        patch.object(CFG.loop_jobs, "reuse_max_size", "1kb"),
+        patch("qq_lib.run.runner.socket.gethostname", return_value="node1"),
+    ):
+        assert not runner._retainWorkDir()
+
+    assert not (runner._work_dir / CFG.loop_jobs.manifest_file).exists()
+
+
+def test_runner_finalize_retains_work_dir_instead_of_deleting():
+    runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = True
+    runner._process = MagicMock()
+    runner._process.returncode = 0
+    runner._archiver = MagicMock()
+    runner._use_scratch = True
+    runner._work_dir = Path("/work")
+    runner._input_dir = Path("/input")
+    runner._batch_system = MagicMock()
+    runner._informer = MagicMock()
+    runner._informer.info.job_type = JobType.LOOP
+
+    runner._retainWorkDir = MagicMock(return_value=True)
+    runner._deleteWorkDir = MagicMock()
+    runner._updateInfoFinished = MagicMock()
+    runner._resubmit = MagicMock()
+
+    with (
+        patch("qq_lib.run.runner.Retryer"),
+        patch("socket.gethostname", return_value="host"),
+        patch.object(Runner, "_getExplicitlyIncludedFilesInWorkDir", return_value=[]),
+    ):
+        runner.finalize()
+
+    runner._retainWorkDir.assert_called_once()
+    runner._deleteWorkDir.assert_not_called()
+    runner._resubmit.assert_called_once()
+
+
+def test_runner_finalize_deletes_work_dir_if_not_retained():
+    runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = True
+    runner._process = MagicMock()
+    runner._process.returncode = 0
+    runner._archiver = MagicMock()
+    runner._use_scratch = True
+    runner._work_dir = Path("/work")
+    runner._input_dir = Path("/input")
+    runner._batch_system = MagicMock()
+    runner._informer = MagicMock()
+    runner._informer.info.job_type = JobType.LOOP
+
+    runner._retainWorkDir = MagicMock(return_value=False)
+    runner._deleteWorkDir = MagicMock()
+    runner._updateInfoFinished = MagicMock()
+    runner._resubmit = MagicMock()
+
+    with (
+        patch("qq_lib.run.runner.Retryer"),
+        patch("socket.gethostname", return_value="host"),
+        patch.object(Runner, "_getExplicitlyIncludedFilesInWorkDir", return_value=[]),
+    ):
+        runner.finalize()
+
+    runner._retainWorkDir.assert_called_once()
+    runner._deleteWorkDir.assert_called_once()
+
+
+@pytest.mark.parametrize("adopted", [True, False])
+def test_runner_prepare_adopts_retained_work_dir(adopted):
+    runner = Runner.__new__(Runner)
+    runner._reuse_work_dir = True
+    runner._use_scratch = True
+    runner._archiver = MagicMock()
+    runner._informer = MagicMock()
+    runner._informer.info.loop_info.current = 2
+    runner._informer.info.script_name = "job"
+    runner._work_dir = Path("/work")
+    manifest = MagicMock()
+    runner._getRetainedWorkDir = MagicMock(return_value=manifest)
+    runner._adoptWorkDir = MagicMock(return_value=adopted)
+    runner._setUpScratchDir = MagicMock()
+
+    with patch("qq_lib.run.runner.logger"):
+        runner.prepare()
+
+    runner._getRetainedWorkDir.assert_called_once()
+    runner._adoptWorkDir.assert_called_once_with(manifest)
+    assert runner._setUpScratchDir.called is not adopted
+    runner._archiver.fromArchive.assert_called_once_with(Path("/work"), 2)
+
+
+def test_runner_update_info_running_records_reused_work_dir():
+    informer_mock = MagicMock()
+    informer_mock.getNodes.return_value = ["node1"]
+
+    runner = Runner.__new__(Runner)
+    runner._informer = informer_mock
+    runner._info_file = Path("job.qqinfo")
+    runner._input_machine = "random.host.org"
+    runner._work_dir = Path("/scratch/main")
+    runner._reused_work_dir = Path("/scratch/main")
+    runner._reloadInfoAndEnsureValid = MagicMock()
+
+    with (
+        patch("qq_lib.run.runner.socket.gethostname", return_value="host"),
+        patch("qq_lib.run.runner.Retryer"),
+    ):
+        runner._updateInfoRunning()
+
+    assert informer_mock.info.loop_info.reused_work_dir == Path("/scratch/main")
+
+
+def _make_prestaged_runner(tmp_path, prestaged_node="node1"):
+    runner = Runner.__new__(Runner)
+    runner._work_dir = tmp_path / "work"
+    runner._work_dir.mkdir()
+    runner._batch_system = MagicMock()
+    runner._batch_system.getPrestageDir.return_value = (
+        tmp_path / ".qqprestage" / "123.server"
+    )
+    runner._informer = MagicMock()
+    runner._informer.info.job_id = "123.server"
+    runner._informer.info.username = "user"
+    runner._informer.info.resources.work_dir = "scratch_local"
+    runner._informer.info.prestaged_node = prestaged_node
+    runner._removeDirectory = MagicMock()
+    return runner
+
+
+def _prestage(tmp_path, job_id="123.server"):
+    prestage_dir = tmp_path / ".qqprestage" / "123.server"
+    (prestage_dir / "sub").mkdir(parents=True)
+    (prestage_dir / "md.mdp").write_text("mdp")
+    (prestage_dir / "sub" / "topol.top").write_text("top")
+    WorkDirManifest.fromWorkDir(
+        job_id, "node1", tmp_path / "input", prestage_dir
+    ).toFile(prestage_dir / CFG.loop_jobs.manifest_file)
+    return prestage_dir
+
+
+def test_runner_adopt_prestaged_dir_not_prestaged(tmp_path):
+    runner = _make_prestaged_runner(tmp_path, prestaged_node=None)
+
+    assert not runner._adoptPrestagedDir()
+
+    runner._batch_system.getPrestageDir.assert_not_called()
+
+
+def test_runner_adopt_prestaged_dir_moves_content(tmp_path):
+    runner = _make_prestaged_runner(tmp_path)
+    prestage_dir = _prestage(tmp_path)
+
+    with patch("qq_lib.run.runner.logger"):
+        assert runner._adoptPrestagedDir()
+
+    runner._batch_system.getPrestageDir.assert_called_once_with(
+        "123.server", "user", "scratch_local"
+    )
+    assert (runner._work_dir / "md.mdp").read_text() == "mdp"
+    assert (runner._work_dir / "sub" / "topol.top").read_text() == "top"
+    assert not (runner._work_dir / CFG.loop_jobs.manifest_file).exists()
+    assert not prestage_dir.exists()
+    runner._removeDirectory.assert_not_called()
+
+
+def test_runner_adopt_prestaged_dir_on_different_node_deletes_remote(tmp_path):
+    runner = _make_prestaged_runner(tmp_path, prestaged_node="node2")
+    runner._batch_system.deleteRemoteDir.side_effect = QQError("unreachable")
+
+    with (
+        patch("qq_lib.run.runner.logger"),
+        patch("qq_lib.run.runner.socket.gethostname", return_value="node1"),
+    ):
+        assert not runner._adoptPrestagedDir()
+
+    runner._batch_system.deleteRemoteDir.assert_called_once_with(
+        "node2", tmp_path / ".qqprestage" / "123.server"
+    )
+
+
+def test_runner_adopt_prestaged_dir_modified_is_removed(tmp_path):
+    runner = _make_prestaged_runner(tmp_path)
+    prestage_dir = _prestage(tmp_path)
+    (prestage_dir / "md.mdp").write_text("modified mdp")
+
+    with patch("qq_lib.run.runner.logger"):
+        assert not runner._adoptPrestagedDir()
+
+    runner._removeDirectory.assert_called_once_with(prestage_dir)
+    assert not (runner._work_dir / "md.mdp").exists()
+
+
+def test_runner_adopt_prestaged_dir_of_other_job_is_removed(tmp_path):
+    runner = _make_prestaged_runner(tmp_path)
+    prestage_dir = _prestage(tmp_path, job_id="999.server")
+
+    with patch("qq_lib.run.runner.logger"):
+        assert not runner._adoptPrestagedDir()
+
+    runner._removeDirectory.assert_called_once_with(prestage_dir)
+
+
+def test_runner_adopt_prestaged_dir_without_manifest_is_removed(tmp_path):
+    runner = _make_prestaged_runner(tmp_path)
+    prestage_dir = _prestage(tmp_path)
+    (prestage_dir / CFG.loop_jobs.manifest_file).unlink()
+
+    with patch("qq_lib.run.runner.logger"):
+        assert not runner._adoptPrestagedDir()
+
+    runner._removeDirectory.assert_called_once_with(prestage_dir)
+
+
+def test_runner_execute_pack_job_runs_scheduler(tmp_path, monkeypatch):
+    monkeypatch.setenv(CFG.env_vars.ncpus, "8")
+    monkeypatch.delenv(CFG.env_vars.ngpus, raising=False)
+
+    runner = Runner.__new__(Runner)
+    runner._updateInfoRunning = MagicMock()
+    runner._work_dir = tmp_path
+    runner._informer = MagicMock()
+    runner._informer.info.job_type = JobType.PACK
+    runner._informer.info.job_name = "job"
+    runner._informer.info.script_name = "script.sh"
+    runner._informer.info.stdout_file = str(tmp_path / "job.out")
+    runner._informer.info.stderr_file = str(tmp_path / "job.err")
+    runner._informer.info.resources.ngpus = None
+
+    with (
+        patch("qq_lib.run.runner.PackScheduler") as scheduler_cls,
+        patch("qq_lib.run.runner.subprocess.Popen") as popen_mock,
+        patch("qq_lib.run.runner.logger"),
+    ):
+        scheduler_cls.return_value.run.return_value = 1
+        retcode = runner.execute()
+
+    assert retcode == 1
+    runner._updateInfoRunning.assert_called_once()
+    popen_mock.assert_not_called()
+    scheduler_cls.assert_called_once_with(
+        runner._informer.info.pack_info,
+        Path("script.sh").resolve(),
+        tmp_path,
+        "job",
+        8,
+        0,
+    )
+    assert scheduler_cls.return_value.run.call_args.args[0] == runner._updateInfoPack
+    assert runner._process is scheduler_cls.return_value
+
+
+def test_runner_update_info_pack_writes_task_states():
+    runner = Runner.__new__(Runner)
+    runner._info_file = Path("job.qqinfo")
+    runner._input_machine = "host"
+    runner._informer = MagicMock()
+    pack_info = MagicMock()
+
+    with (
+        patch.object(runner, "_reloadInfoAndEnsureValid") as reload_mock,
+        patch("qq_lib.run.runner.Retryer") as retryer_mock,
+    ):
+        runner._updateInfoPack(pack_info)
+
+    reload_mock.assert_called_once()
+    assert runner._informer.info.pack_info is pack_info
+    retryer_mock.assert_called_once()
+    retryer_mock.return_value.run.assert_called_once()
+
+
+def test_runner_update_info_pack_logs_warning_on_failure():
+    runner = Runner.__new__(Runner)
+    runner._info_file = Path("job.qqinfo")
+    runner._input_machine = "host"
+    runner._informer = MagicMock()
+
+    with (
+        patch.object(runner, "_reloadInfoAndEnsureValid"),
+        patch("qq_lib.run.runner.Retryer", side_effect=Exception("failed")),
+        patch("qq_lib.run.runner.logger") as logger_mock,
+    ):
+        runner._updateInfoPack(MagicMock())
+
+    logger_mock.warning.assert_called_once()
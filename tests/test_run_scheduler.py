@@ -0,0 +1,152 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from qq_lib.core.error import QQError
+from qq_lib.properties.pack import PackInfo, PackTask
+from qq_lib.properties.states import NaiveState
+from qq_lib.run.scheduler import CFG, PackScheduler
+
+
+@pytest.fixture(autouse=True)
+def fast_polling():
+    with (
+        patch.object(CFG.runner, "subprocess_checks_wait_time", 0.01),
+        patch("qq_lib.run.scheduler._available_cores", return_value=[]),
+    ):
+        yield
+
+
+def test_pack_scheduler_slots_partition_resources(monkeypatch):
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "4,5,6,7")
+    pack_info = PackInfo([PackTask(str(i)) for i in range(10)], 2, 1)
+
+    with patch("qq_lib.run.scheduler._available_cores", return_value=list(range(8))):
+        scheduler = PackScheduler(pack_info, MagicMock(), MagicMock(), "job", 8, 3)
+
+    assert scheduler._slots == [([0, 1], ["4"]), ([2, 3], ["5"]), ([4, 5], ["6"])]
+
+
+def test_pack_scheduler_slots_limited_by_tasks_and_unknown_cores():
+    pack_info = PackInfo([PackTask("a"), PackTask("b")], 1, 0)
+
+    scheduler = PackScheduler(pack_info, MagicMock(), MagicMock(), "job", 16, 0)
+
+    assert scheduler._slots == [(None, []), (None, [])]
+
+
+def test_pack_scheduler_insufficient_resources_raises():
+    pack_info = PackInfo([PackTask("a")], 4, 2)
+
+    with pytest.raises(QQError, match="not enough"):
+        PackScheduler(pack_info, MagicMock(), MagicMock(), "job", 8, 1)
+
+
+def test_pack_scheduler_runs_command_tasks_concurrently(tmp_path):
+    pack_info = PackInfo(
+        [
+            PackTask(f'echo "$QQ_PACK_TASK $QQ_NCPUS $OMP_NUM_THREADS"; exit {code}')
+            for code in (0, 3, 0, 0)
+        ],
+        task_ncpus=2,
+    )
+    on_update = MagicMock()
+    log = io.StringIO()
+
+    scheduler = PackScheduler(pack_info, tmp_path / "script.sh", tmp_path, "job", 4, 0)
+
+    returncode = scheduler.run(on_update, log)
+
+    assert returncode == 3
+    assert scheduler.poll() == 3
+    assert [t.state for t in pack_info.tasks] == [
+        NaiveState.FINISHED,
+        NaiveState.FAILED,
+        NaiveState.FINISHED,
+        NaiveState.FINISHED,
+    ]
+    assert [t.exit_code for t in pack_info.tasks] == [0, 3, 0, 0]
+    assert (tmp_path / "job.task0002.out").read_text() == "2 2 2\n"
+    assert (tmp_path / "job.task0001.err").exists()
+    on_update.assert_called_with(pack_info)
+    assert "Task 1 " in log.getvalue()
+
+
+def test_pack_scheduler_runs_script_in_task_directories(tmp_path):
+    script = tmp_path / "script.sh"
+    script.write_text("pwd > where.txt\n")
+    for name in ("sim1", "sim2"):
+        (tmp_path / name).mkdir()
+
+    pack_info = PackInfo.fromTaskList(["sim1", "sim2"], tmp_path)
+    scheduler = PackScheduler(pack_info, script, tmp_path, "job", 1, 0)
+
+    assert scheduler.run(MagicMock()) == 0
+    for name in ("sim1", "sim2"):
+        assert (tmp_path / name / "where.txt").read_text().strip() == str(
+            tmp_path / name
+        )
+        assert (tmp_path / name / f"job{CFG.suffixes.stdout}").exists()
+
+
+def test_pack_scheduler_task_that_cannot_start_fails(tmp_path):
+    pack_info = PackInfo(
+        [PackTask("missing", is_dir=True), PackTask("true")], task_ncpus=1
+    )
+    scheduler = PackScheduler(pack_info, tmp_path / "script.sh", tmp_path, "job", 1, 0)
+
+    assert scheduler.run(MagicMock()) == CFG.exit_codes.default
+    assert pack_info.tasks[0].state == NaiveState.FAILED
+    assert pack_info.tasks[1].state == NaiveState.FINISHED
+
+
+def test_pack_scheduler_skips_finished_tasks(tmp_path):
+    pack_info = PackInfo(
+        [PackTask("exit 1", state=NaiveState.FINISHED, exit_code=0), PackTask("true")]
+    )
+    scheduler = PackScheduler(pack_info, tmp_path / "script.sh", tmp_path, "job", 1, 0)
+
+    assert scheduler.run(MagicMock()) == 0
+    assert not (tmp_path / "job.task0000.out").exists()
+
+
+def test_pack_scheduler_poll_reports_running_tasks():
+    pack_info = PackInfo(
+        [
+            PackTask("a", state=NaiveState.FAILED, exit_code=4),
+            PackTask("b", state=NaiveState.RUNNING),
+        ]
+    )
+    scheduler = PackScheduler(pack_info, MagicMock(), MagicMock(), "job", 2, 0)
+
+    process = MagicMock()
+    process.poll.return_value = None
+    scheduler._running = {1: (1, process)}
+    assert scheduler.poll() is None
+
+    # no task is running even though the scheduler has not completed
+    process.poll.return_value = 0
+    assert scheduler.returncode is None
+    assert scheduler.poll() == 4
+
+
+def test_pack_scheduler_terminate_and_kill_running_tasks():
+    pack_info = PackInfo([PackTask("a"), PackTask("b")])
+    scheduler = PackScheduler(pack_info, MagicMock(), MagicMock(), "job", 2, 0)
+
+    running, finished = MagicMock(), MagicMock()
+    running.poll.return_value = None
+    finished.poll.return_value = 0
+    scheduler._running = {0: (0, running), 1: (1, finished)}
+
+    scheduler.terminate()
+    scheduler.kill()
+
+    running.terminate.assert_called_once()
+    running.kill.assert_called_once()
+    finished.terminate.assert_not_called()
+    finished.kill.assert_not_called()
@@ -8,8 +8,10 @@ import pytest
 from click.testing import CliRunner
 
 from qq_lib.batch.interface import BatchMeta
+from qq_lib.batch.interface.job_index import NodeJobIndex
 from qq_lib.batch.pbs import PBS, PBSJob
 from qq_lib.batch.pbs.common import parse_multi_pbs_dump_to_dictionaries
+from qq_lib.core.config import CFG
 from qq_lib.jobs.presenter import JobsPresenter
 from qq_lib.stat.cli import stat
 
@@ -166,3 +168,70 @@ def test_stat_command_no_jobs():
         assert result.exit_code == 0
         assert "No jobs found." in result.output
         mock_sort.assert_not_called()
+
+
+def test_stat_command_watch_uses_watcher(parsed_jobs):
+    runner = CliRunner()
+
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(PBS, "getAllUnfinishedBatchJobs", return_value=parsed_jobs),
+        patch.object(PBS, "sortJobs"),
+        patch("qq_lib.stat.cli.JobsWatcher") as mock_watcher,
+    ):
+        result = runner.invoke(stat, ["--watch"], catch_exceptions=False)
+
+        assert result.exit_code == 0
+        fetch, render, _ = mock_watcher.call_args[0]
+        assert fetch() == parsed_jobs
+        assert render(parsed_jobs) is not None
+
+    mock_watcher.return_value.watch.assert_called_once()
+
+
+def test_stat_command_plain_pages(parsed_jobs):
+    runner = CliRunner()
+
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(PBS, "getAllUnfinishedBatchJobs", return_value=parsed_jobs),
+        patch.object(PBS, "sortJobs"),
+    ):
+        result = runner.invoke(
+            stat, ["--limit", "1", "--page", "2"], catch_exceptions=False
+        )
+
+    assert result.exit_code == 0
+    assert JobsPresenter._shortenJobId(parsed_jobs[1].getId()) in result.output
+    assert JobsPresenter._shortenJobId(parsed_jobs[0].getId()) not in result.output
+    assert "Showing rows 2-2 of 2 (page 2 of 2)." in result.output
+
+
+def test_stat_command_by_node_groups_running_jobs(parsed_jobs):
+    runner = CliRunner()
+
+    with (
+        patch.object(BatchMeta, "fromEnvVarOrGuess", return_value=PBS),
+        patch.object(
+            PBS, "getAllUnfinishedBatchJobs", return_value=parsed_jobs
+        ) as mock_get,
+    ):
+        result = runner.invoke(stat, ["--by-node"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    mock_get.assert_called_once_with(NodeJobIndex.COLUMNS)
+    lines = result.output.splitlines()
+    assert lines[0].split() == ["Node", "Jobs", "Users", "Job", "IDs"]
+    assert lines[1].split() == ["nodeA", "1", "user1", "123456"]
+    assert lines[2].split() == ["nodeB", "1", "user2", "654321"]
+    assert "2 nodes are occupied by 2 jobs of 2 users." in result.output
+
+
+def test_stat_command_by_node_with_all_fails():
+    runner = CliRunner()
+
+    with patch.object(BatchMeta, "fromEnvVarOrGuess") as mock_meta:
+        result = runner.invoke(stat, ["--by-node", "--all"])
+
+    assert result.exit_code == CFG.exit_codes.default
+    mock_meta.assert_not_called()
@@ -1,12 +1,14 @@
 # Released under MIT License.
 # Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from click.testing import CliRunner
 
 from qq_lib.core.config import CFG
 from qq_lib.submit.cli import submit
+from qq_lib.submit.submitter import SubmitResult
 
 
 def test_submit_successful(tmp_path):
@@ -138,3 +140,95 @@ def test_submit_generic_exception_results_in_critical_log(tmp_path):
         ]
         assert any("unexpected error" in str(msg) for msg in critical_messages)
         factory_mock.makeSubmitter.assert_called_once()
+
+
+def test_submit_dirs_submits_from_each_directory(tmp_path):
+    runner = CliRunner()
+
+    submitters = [MagicMock(), MagicMock()]
+    failed = [SubmitResult(tmp_path / "c", error="Could not open 'script.sh'")]
+    results = [
+        SubmitResult(tmp_path / "a", job_id="1"),
+        SubmitResult(tmp_path / "b", job_id="2"),
+    ]
+
+    with (
+        patch(
+            "qq_lib.submit.cli.SubmitterFactory.makeSubmitters",
+            return_value=(submitters, failed),
+        ) as mock_make,
+        patch(
+            "qq_lib.submit.cli.Submitter.submitMany", return_value=results
+        ) as mock_submit_many,
+        patch("qq_lib.submit.cli.logger") as mock_logger,
+    ):
+        result = runner.invoke(
+            submit, ["script.sh", "--dirs", "a,b c", "-q", "default"]
+        )
+
+    assert result.exit_code == CFG.exit_codes.default
+    script, dirs = mock_make.call_args.args
+    assert script == Path("script.sh")
+    assert dirs == [Path("a"), Path("b"), Path("c")]
+    assert mock_make.call_args.kwargs["queue"] == "default"
+    assert "dirs" not in mock_make.call_args.kwargs
+    mock_submit_many.assert_called_once_with(submitters)
+
+    assert mock_logger.error.call_count == 1
+    assert "Submitted 2 of 3 jobs." in mock_logger.info.call_args.args[0]
+
+
+def test_submit_dirs_all_submitted(tmp_path):
+    runner = CliRunner()
+
+    with (
+        patch(
+            "qq_lib.submit.cli.SubmitterFactory.makeSubmitters",
+            return_value=([MagicMock()], []),
+        ),
+        patch(
+            "qq_lib.submit.cli.Submitter.submitMany",
+            return_value=[SubmitResult(tmp_path, job_id="1")],
+        ),
+    ):
+        result = runner.invoke(submit, ["script.sh", "--dirs", str(tmp_path)])
+
+    assert result.exit_code == 0
+
+
+def test_submit_array_submits_single_array_job(tmp_path):
+    runner = CliRunner()
+
+    submitters = [MagicMock(), MagicMock()]
+    results = [
+        SubmitResult(tmp_path / "a", job_id="5[0]"),
+        SubmitResult(tmp_path / "b", job_id="5[1]"),
+    ]
+
+    with (
+        patch(
+            "qq_lib.submit.cli.SubmitterFactory.makeSubmitters",
+            return_value=(submitters, []),
+        ) as mock_make,
+        patch(
+            "qq_lib.submit.cli.Submitter.submitArray", return_value=results
+        ) as mock_submit_array,
+        patch("qq_lib.submit.cli.logger") as mock_logger,
+    ):
+        result = runner.invoke(submit, ["script.sh", "--array", "a:b"])
+
+    assert result.exit_code == 0
+    assert mock_make.call_args.args[1] == [Path("a"), Path("b")]
+    assert "array" not in mock_make.call_args.kwargs
+    mock_submit_array.assert_called_once_with(submitters, Path.cwd())
+    assert "Submitted 2 of 2 jobs." in mock_logger.info.call_args.args[0]
+
+
+def test_submit_array_cannot_be_combined_with_dirs():
+    runner = CliRunner()
+
+    with patch("qq_lib.submit.cli.logger") as mock_logger:
+        result = runner.invoke(submit, ["script.sh", "--array", "a", "--dirs", "b"])
+
+    assert result.exit_code == CFG.exit_codes.default
+    assert "cannot be combined" in str(mock_logger.error.call_args.args[0])
@@ -8,13 +8,16 @@ import pytest
 
 from qq_lib.batch.interface import BatchMeta
 from qq_lib.batch.interface.interface import BatchInterface
+from qq_lib.batch.pbs import PBS
 from qq_lib.core.error import QQError
+from qq_lib.properties.autosize import AutosizeInfo
 from qq_lib.properties.depend import Depend
 from qq_lib.properties.job_type import JobType
 from qq_lib.properties.loop import LoopInfo
 from qq_lib.properties.resources import Resources
 from qq_lib.properties.size import Size
 from qq_lib.submit.factory import SubmitterFactory
+from qq_lib.submit.submitter import Submitter
 
 
 def test_submitter_factory_init(tmp_path):
@@ -34,6 +37,14 @@ def test_submitter_factory_init(tmp_path):
     mock_parser_class.assert_called_once()
 
 
+def test_submitter_factory_get_options_by_name():
+    options = SubmitterFactory.getOptionsByName()
+
+    assert {"queue", "ncpus", "work_dir", "dirs", "script"} <= set(options)
+    assert all("-" not in name for name in options)
+    assert all(name == option.name for name, option in options.items())
+
+
 def test_submitter_factory_get_depend():
     mock_parser = MagicMock()
     parser_depend = [MagicMock(), MagicMock()]
@@ -100,6 +111,9 @@ def test_submitter_factory_get_loop_info_uses_cli_over_parser():
     mock_parser.getLoopEnd.return_value = 5
     mock_parser.getArchive.return_value = Path("storage")
     mock_parser.getArchiveFormat.return_value = "job%02d"
+    mock_parser.getLoopWindow.return_value = None
+    mock_parser.getArchivePack.return_value = None
+    mock_parser.getMaxRequeues.return_value = None
 
     factory = SubmitterFactory.__new__(SubmitterFactory)
     factory._input_dir = Path("fake_path")
@@ -126,6 +140,9 @@ def test_submitter_factory_get_loop_info_falls_back_to_parser():
     mock_parser.getLoopEnd.return_value = 5
     mock_parser.getArchive.return_value = Path("archive")
     mock_parser.getArchiveFormat.return_value = "job%02d"
+    mock_parser.getLoopWindow.return_value = None
+    mock_parser.getArchivePack.return_value = None
+    mock_parser.getMaxRequeues.return_value = None
 
     factory = SubmitterFactory.__new__(SubmitterFactory)
     factory._input_dir = Path("fake_path")
@@ -147,6 +164,9 @@ def test_submitter_factory_get_loop_info_mixed_cli_parser_and_defaults():
     mock_parser.getLoopEnd.return_value = 50
     mock_parser.getArchive.return_value = None
     mock_parser.getArchiveFormat.return_value = "job%02d"
+    mock_parser.getLoopWindow.return_value = None
+    mock_parser.getArchivePack.return_value = None
+    mock_parser.getMaxRequeues.return_value = None
 
     factory = SubmitterFactory.__new__(SubmitterFactory)
     factory._input_dir = Path("fake_path")
@@ -164,6 +184,46 @@ def test_submitter_factory_get_loop_info_mixed_cli_parser_and_defaults():
     assert loop_info.archive_format == "job%02d"  # parser
 
 
+def test_submitter_factory_get_loop_info_requeues():
+    mock_parser = MagicMock()
+    mock_parser.getLoopStart.return_value = 1
+    mock_parser.getLoopEnd.return_value = 5
+    mock_parser.getArchive.return_value = None
+    mock_parser.getArchiveFormat.return_value = None
+    mock_parser.getLoopWindow.return_value = None
+    mock_parser.getArchivePack.return_value = None
+    mock_parser.getMaxRequeues.return_value = 3
+
+    factory = SubmitterFactory.__new__(SubmitterFactory)
+    factory._input_dir = Path("fake_path")
+    factory._parser = mock_parser
+    factory._kwargs = {"requeues": 2}
+
+    loop_info = factory._getLoopInfo()
+
+    assert loop_info.max_requeues == 3
+    assert loop_info.requeues == 2
+
+
+def test_submitter_factory_get_autosize_info():
+    factory = SubmitterFactory.__new__(SubmitterFactory)
+    factory._parser = MagicMock()
+    factory._parser.getAutosize.return_value = False
+    resources = Resources(walltime="10:00:00", mem="8gb", work_dir="input_dir")
+
+    factory._kwargs = {}
+    assert factory._getAutosizeInfo(resources) is None
+
+    factory._kwargs = {"autosize": True}
+    assert factory._getAutosizeInfo(resources) == AutosizeInfo(
+        "10:00:00", Size(8, "gb")
+    )
+
+    # reference resources of the previous cycle take precedence
+    factory._kwargs = {"autosize": True, "autosize_base": "mem=4gb"}
+    assert factory._getAutosizeInfo(resources) == "mem=4gb"
+
+
 def test_submitter_factory_get_resources():
     mock_parser = MagicMock()
     parser_resources = Resources(ncpus=4, mem="4gb")
@@ -190,6 +250,103 @@ def test_submitter_factory_get_resources():
     assert result == transformed_resources
 
 
+def test_submitter_factory_get_resources_selects_auto_work_dir(tmp_path):
+    (tmp_path / "input.dat").write_text("x" * 4096)
+    mock_parser = MagicMock()
+    mock_parser.getResources.return_value = Resources(work_dir="auto")
+
+    factory = SubmitterFactory.__new__(SubmitterFactory)
+    factory._parser = mock_parser
+    factory._kwargs = {}
+    factory._input_dir = tmp_path
+
+    mock_batch_system = MagicMock()
+    selected = Resources(work_dir="scratch_ssd", work_size="1gb")
+    mock_batch_system.selectWorkDir.return_value = selected
+
+    with (
+        patch.object(SubmitterFactory, "_getInclude", return_value=[]),
+        patch.object(SubmitterFactory, "_getExclude", return_value=[]),
+        patch.object(SubmitterFactory, "_getJobType", return_value=JobType.STANDARD),
+    ):
+        factory._getResources(mock_batch_system, "default")
+
+    queue, provided, input_size = mock_batch_system.selectWorkDir.call_args[0]
+    assert queue == "default"
+    assert provided.work_dir == "auto"
+    assert input_size == Size(4, "kb")
+    mock_batch_system.transformResources.assert_called_once_with("default", selected)
+
+
+def test_submitter_factory_get_resources_auto_work_dir_counts_external_includes(
+    tmp_path,
+):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    (input_dir / "input.dat").write_text("x" * 2048)
+    (tmp_path / "external.dat").write_text("x" * 3072)
+
+    factory = SubmitterFactory.__new__(SubmitterFactory)
+    factory._input_dir = input_dir
+
+    with (
+        patch.object(
+            SubmitterFactory,
+            "_getInclude",
+            return_value=[Path("input.dat"), Path("../external.dat")],
+        ),
+        patch.object(SubmitterFactory, "_getExclude", return_value=[]),
+        patch.object(SubmitterFactory, "_getJobType", return_value=JobType.STANDARD),
+    ):
+        assert factory._getInputSize() == Size(5, "kb")
+
+
+def test_submitter_factory_get_input_size_skips_excluded_files_and_archive(tmp_path):
+    (tmp_path / "input.dat").write_text("x" * 2048)
+    (tmp_path / "excluded").mkdir()
+    (tmp_path / "excluded" / "big.dat").write_text("x" * 4096)
+    (tmp_path / "excluded" / "nested.dat").write_text("x" * 1024)
+    (tmp_path / "kept.dat").write_text("x" * 1024)
+    (tmp_path / "storage").mkdir()
+    (tmp_path / "storage" / "job0001.dat").write_text("x" * 8192)
+
+    factory = SubmitterFactory.__new__(SubmitterFactory)
+    factory._input_dir = tmp_path
+    factory._kwargs = {}
+    factory._parser = MagicMock()
+    factory._parser.getArchive.return_value = None
+
+    with (
+        patch.object(SubmitterFactory, "_getInclude", return_value=[Path("kept.dat")]),
+        patch.object(
+            SubmitterFactory,
+            "_getExclude",
+            return_value=[
+                Path("excluded"),
+                Path("excluded/nested.dat"),
+                Path("kept.dat"),
+                Path("missing.dat"),
+            ],
+        ),
+        patch.object(SubmitterFactory, "_getJobType", return_value=JobType.LOOP),
+    ):
+        assert factory._getInputSize() == Size(3, "kb")
+
+
+def test_submitter_factory_get_resources_without_auto_does_not_select_work_dir():
+    mock_parser = MagicMock()
+    mock_parser.getResources.return_value = Resources(work_dir="scratch_local")
+
+    factory = SubmitterFactory.__new__(SubmitterFactory)
+    factory._parser = mock_parser
+    factory._kwargs = {}
+
+    mock_batch_system = MagicMock()
+    factory._getResources(mock_batch_system, "default")
+
+    mock_batch_system.selectWorkDir.assert_not_called()
+
+
 def test_submitter_factory_get_queue_uses_cli_over_parser():
     mock_parser = MagicMock()
     mock_parser.getQueue.return_value = "parser_queue"
@@ -398,6 +555,7 @@ def test_submitter_factory_make_submitter_standard_job():
         excludes,
         includes,
         depends,
+        None,
     )
     assert result == mock_submit_instance
 
@@ -460,5 +618,114 @@ def test_submitter_factory_make_submitter_loop_job():
         excludes,
         includes,
         depends,
+        None,
     )
     assert result == mock_submit_instance
+
+
+def test_submitter_factory_make_submitters_reuses_identical_directives(tmp_path):
+    dirs = []
+    for name, queue in [("a", "default"), ("b", "default"), ("c", "gpu")]:
+        (directory := tmp_path / name).mkdir()
+        (directory / "script.sh").write_text(
+            f"#!/usr/bin/env -S qq run\n# qq queue={queue}\n"
+        )
+        dirs.append(directory)
+    dirs.append(tmp_path / "missing")
+
+    def make_submitter(factory):
+        factory._parser.parse()
+        return Submitter(
+            PBS,
+            factory._parser.getQueue(),
+            None,
+            factory._script,
+            JobType.STANDARD,
+            Resources(),
+        )
+
+    with patch.object(
+        SubmitterFactory, "makeSubmitter", autospec=True, side_effect=make_submitter
+    ) as mock_make:
+        submitters, failed = SubmitterFactory.makeSubmitters(
+            Path("script.sh"), dirs, queue=None
+        )
+
+    # the batch system is only queried once for each distinct set of directives
+    assert mock_make.call_count == 2
+    assert [s.getInputDir() for s in submitters] == [d.resolve() for d in dirs[:3]]
+    assert [s.getQueue() for s in submitters] == ["default", "default", "gpu"]
+    assert len(failed) == 1
+    assert failed[0].input_dir == dirs[3].resolve()
+    assert "Could not open" in failed[0].error
+
+
+def test_submitter_factory_make_submitters_selects_auto_work_dir_per_directory(
+    tmp_path,
+):
+    dirs = []
+    for name in ["a", "b"]:
+        (directory := tmp_path / name).mkdir()
+        (directory / "script.sh").write_text(
+            "#!/usr/bin/env -S qq run\n# qq queue=default\n# qq work-dir=auto\n"
+        )
+        dirs.append(directory)
+
+    def make_submitter(factory):
+        return Submitter(
+            PBS,
+            "default",
+            None,
+            factory._script,
+            JobType.STANDARD,
+            Resources(work_dir="scratch_local"),
+        )
+
+    with patch.object(
+        SubmitterFactory, "makeSubmitter", autospec=True, side_effect=make_submitter
+    ) as mock_make:
+        submitters, failed = SubmitterFactory.makeSubmitters(
+            Path("script.sh"), dirs, queue=None
+        )
+
+    # the working directory depends on the size of the input data of each directory
+    assert mock_make.call_count == 2
+    assert [s.getInputDir() for s in submitters] == [d.resolve() for d in dirs]
+    assert failed == []
+
+
+def test_submitter_factory_get_pack_info_reads_task_list(tmp_path):
+    (tmp_path / "sim1").mkdir()
+    (tmp_path / "tasks.txt").write_text("sim1\necho done\n")
+
+    mock_parser = MagicMock()
+    mock_parser.getPackTasks.return_value = Path("ignored.txt")
+    mock_parser.getPackTaskNCPUs.return_value = 4
+    mock_parser.getPackTaskNGPUs.return_value = None
+
+    factory = SubmitterFactory.__new__(SubmitterFactory)
+    factory._input_dir = tmp_path
+    factory._parser = mock_parser
+    factory._kwargs = {"pack_tasks": "tasks.txt", "pack_task_ngpus": 1}
+
+    pack_info = factory._getPackInfo()
+
+    assert [(t.task, t.is_dir) for t in pack_info.tasks] == [
+        ("sim1", True),
+        ("echo done", False),
+    ]
+    assert pack_info.task_ncpus == 4
+    assert pack_info.task_ngpus == 1
+
+
+def test_submitter_factory_get_pack_info_requires_task_list():
+    mock_parser = MagicMock()
+    mock_parser.getPackTasks.return_value = None
+
+    factory = SubmitterFactory.__new__(SubmitterFactory)
+    factory._input_dir = Path("fake_path")
+    factory._parser = mock_parser
+    factory._kwargs = {}
+
+    with pytest.raises(QQError, match="pack-tasks"):
+        factory._getPackInfo()
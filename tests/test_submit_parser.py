@@ -125,6 +125,79 @@ def test_parser_get_archive_format_value():
     assert result == "job%04d"
 
 
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("true", True),
+        ("True", True),
+        ("yes", True),
+        (1, True),
+        ("false", False),
+        (0, False),
+    ],
+)
+def test_parser_get_reuse_work_dir_value(value, expected):
+    parser = Parser.__new__(Parser)
+    parser._options = {"reuse_work_dir": value}
+
+    assert parser.getReuseWorkDir() is expected
+
+
+def test_parser_get_reuse_work_dir_none():
+    parser = Parser.__new__(Parser)
+    parser._options = {}
+
+    assert parser.getReuseWorkDir() is False
+
+
+def test_parser_get_loop_window_value():
+    parser = Parser.__new__(Parser)
+    parser._options = {"loop_window": 5}
+
+    assert parser.getLoopWindow() == 5
+
+
+def test_parser_get_max_requeues():
+    parser = Parser.__new__(Parser)
+    parser._options = {"max_requeues": 3}
+
+    assert parser.getMaxRequeues() == 3
+
+    parser._options = {}
+    assert parser.getMaxRequeues() is None
+
+
+@pytest.mark.parametrize(
+    "value, expected", [(1, True), ("true", True), ("no", False), (None, False)]
+)
+def test_parser_get_autosize(value, expected):
+    parser = Parser.__new__(Parser)
+    parser._options = {"autosize": value}
+
+    assert parser.getAutosize() is expected
+
+
+def test_parser_get_loop_window_none():
+    parser = Parser.__new__(Parser)
+    parser._options = {}
+
+    assert parser.getLoopWindow() is None
+
+
+def test_parser_get_archive_pack_value():
+    parser = Parser.__new__(Parser)
+    parser._options = {"archive_pack": "GZ"}
+
+    assert parser.getArchivePack() == "gz"
+
+
+def test_parser_get_archive_pack_none():
+    parser = Parser.__new__(Parser)
+    parser._options = {}
+
+    assert parser.getArchivePack() is None
+
+
 def test_parser_get_archive_none():
     parser = Parser.__new__(Parser)
     parser._options = {}
@@ -627,3 +700,29 @@ def test_parser_integration_nonexistent_script_raises():
     parser = Parser(Path("non_existent.sh"), submit.params)
     with pytest.raises(QQError, match="Could not open"):
         parser.parse()
+
+
+def test_parser_parse_memoizes_identical_directives(tmp_path):
+    content = "#!/usr/bin/env -S qq run\n# qq queue=default\n# qq ncpus=8\nrun_md\n"
+    scripts = []
+    for name in ["a", "b"]:
+        (tmp_path / name).mkdir()
+        (script := tmp_path / name / "script.sh").write_text(content)
+        scripts.append(script)
+
+    Parser._cache.clear()
+
+    first = Parser(scripts[0], submit.params)
+    first.parse()
+
+    second = Parser(scripts[1], submit.params)
+    with patch.object(Parser, "_stripAndSplit") as mock_split:
+        second.parse()
+
+    mock_split.assert_not_called()
+    assert second._options == {"queue": "default", "ncpus": 8}
+    assert second.getDirectives() == first.getDirectives()
+    assert len(second.getDirectives()) == 2
+    # the memoized options are not shared between parsers
+    second._options["queue"] = "other"
+    assert first.getQueue() == "default"
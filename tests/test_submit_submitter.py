@@ -362,6 +362,70 @@ def test_submitter_continues_loop_returns_true_for_valid_continuation(tmp_path):
     assert result is True
 
 
+@pytest.mark.parametrize(
+    "state, previous_current, previous_requeues, requeues, max_requeues, expected",
+    [
+        (NaiveState.FAILED, 2, 0, 1, 2, True),
+        (NaiveState.FAILED, 2, 1, 2, 2, True),
+        (NaiveState.FAILED, 2, 2, 3, 2, False),
+        (NaiveState.FAILED, 2, 0, 2, 2, False),
+        (NaiveState.FAILED, 1, 0, 1, 2, False),
+        (NaiveState.RUNNING, 2, 0, 1, 2, False),
+    ],
+)
+def test_submitter_continues_loop_requeue(
+    tmp_path,
+    state,
+    previous_current,
+    previous_requeues,
+    requeues,
+    max_requeues,
+    expected,
+):
+    submitter = Submitter.__new__(Submitter)
+    submitter._loop_info = MagicMock(
+        current=2, requeues=requeues, max_requeues=max_requeues
+    )
+    submitter._input_dir = tmp_path
+
+    dummy_informer = MagicMock()
+    dummy_informer.info.loop_info = MagicMock(
+        current=previous_current, requeues=previous_requeues
+    )
+    dummy_informer.info.job_state = state
+
+    with (
+        patch(
+            "qq_lib.submit.submitter.get_info_file",
+            return_value=tmp_path / "job.qqinfo",
+        ),
+        patch.object(Informer, "fromFile", return_value=dummy_informer),
+    ):
+        assert submitter.continuesLoop() is expected
+
+
+def test_submitter_get_start_time_none_without_requeue():
+    submitter = Submitter.__new__(Submitter)
+    submitter._loop_info = None
+    assert submitter._getStartTime() is None
+
+    submitter._loop_info = MagicMock()
+    submitter._loop_info.getRequeueDelay.return_value = 0
+    assert submitter._getStartTime() is None
+
+
+def test_submitter_get_start_time_defers_requeued_cycle():
+    submitter = Submitter.__new__(Submitter)
+    submitter._loop_info = MagicMock()
+    submitter._loop_info.getRequeueDelay.return_value = 120
+
+    before = datetime.now()
+    start_time = submitter._getStartTime()
+
+    assert start_time is not None
+    assert (start_time - before).total_seconds() >= 120
+
+
 def test_submitter_continues_loop_returns_false_if_previous_not_finished(tmp_path):
     submitter = Submitter.__new__(Submitter)
     submitter._loop_info = MagicMock(current=2)
@@ -461,7 +525,7 @@ def test_submitter_continues_loop_returns_false_if_no_loop_info_current(tmp_path
 def test_submitter_continues_loop_returns_false_on_qqerror(tmp_path):
     submitter = Submitter.__new__(Submitter)
 
-    submitter._loop_info = MagicMock(current=2)
+    submitter._loop_info = MagicMock(current=2, window=1)
     submitter._input_dir = tmp_path
 
     with patch("qq_lib.submit.submitter.get_info_file", side_effect=QQError("error")):
@@ -482,6 +546,7 @@ def test_submitter_submit_calls_all_steps_and_returns_job_id(tmp_path):
     submitter._job_type = JobType.STANDARD
     submitter._input_dir = tmp_path
     submitter._loop_info = None
+    submitter._pack_info = None
     submitter._exclude = []
     submitter._include = []
     submitter._depend = []
@@ -512,6 +577,7 @@ def test_submitter_submit_calls_all_steps_and_returns_job_id(tmp_path):
         submitter._depend,
         env_vars,
         submitter._account,
+        start_time=None,
     )
     mock_informer_class.assert_called_once()
     mock_informer_instance.toFile.assert_called_once_with(submitter._info_file)
@@ -530,6 +596,7 @@ def test_submitter_submit(tmp_path):
     submitter._job_type = JobType.STANDARD
     submitter._input_dir = tmp_path
     submitter._loop_info = None
+    submitter._pack_info = None
     submitter._exclude = ["exclude1"]
     submitter._include = ["include1"]
     submitter._depend = []
@@ -564,6 +631,7 @@ def test_submitter_submit(tmp_path):
         submitter._depend,
         env_vars,
         submitter._account,
+        start_time=None,
     )
     mock_informer_class.assert_called_once()
     mock_informer_instance.toFile.assert_called_once_with(submitter._info_file)
@@ -596,3 +664,331 @@ def test_submitter_submit(tmp_path):
     assert info_arg.excluded_files == submitter._exclude
     assert info_arg.included_files == submitter._include
     assert info_arg.depend == submitter._depend
+
+
+def _make_window_submitter(tmp_path, current=1, end=5, window=3, depend=None):
+    script = tmp_path / "script.sh"
+    script.write_text("#!/usr/bin/env -S qq run\n")
+
+    return Submitter(
+        batch_system=PBS,
+        queue="default",
+        account=None,
+        script=script,
+        job_type=JobType.LOOP,
+        resources=Resources(),
+        loop_info=LoopInfo(
+            start=1,
+            end=end,
+            archive=tmp_path / "storage",
+            archive_format="job%04d",
+            current=current,
+            window=window,
+        ),
+        depend=depend,
+    )
+
+
+def test_submitter_submit_loop_window_chains_cycles(tmp_path):
+    user_depend = [Depend(DependType.AFTER_START, ["999"])]
+    submitter = _make_window_submitter(tmp_path, depend=user_depend)
+
+    with patch.object(PBS, "jobSubmit", side_effect=["1", "2", "3"]) as mock_job_submit:
+        result = submitter.submit()
+
+    assert result == "1"
+    assert mock_job_submit.call_count == 3
+
+    names = [call.args[3] for call in mock_job_submit.call_args_list]
+    assert names == ["script+0001.sh", "script+0002.sh", "script+0003.sh"]
+
+    depends = [call.args[4] for call in mock_job_submit.call_args_list]
+    assert depends[0] == user_depend
+    assert depends[1] == user_depend + [Depend(DependType.AFTER_SUCCESS, ["1"])]
+    assert depends[2] == user_depend + [Depend(DependType.AFTER_SUCCESS, ["2"])]
+
+    env_vars = [call.args[5] for call in mock_job_submit.call_args_list]
+    assert [e[CFG.env_vars.loop_current] for e in env_vars] == ["1", "2", "3"]
+
+    for cycle, job_id in [(1, "1"), (2, "2"), (3, "3")]:
+        info = Informer.fromFile(tmp_path / f"script+000{cycle}.qqinfo").info
+        assert info.job_id == job_id
+        assert info.loop_info.current == cycle
+
+    # the submitter itself is not modified
+    assert submitter.getLoopInfo().current == 1
+    assert submitter.getDepend() == user_depend
+
+
+def test_submitter_submit_loop_window_only_submits_missing_cycles(tmp_path):
+    with patch.object(PBS, "jobSubmit", side_effect=["1", "2", "3"]):
+        _make_window_submitter(tmp_path).submit()
+
+    # continuation submitted by cycle 1 after it finished
+    submitter = _make_window_submitter(tmp_path, current=2)
+    with patch.object(PBS, "jobSubmit", return_value="4") as mock_job_submit:
+        result = submitter.submit()
+
+    assert result == "4"
+    mock_job_submit.assert_called_once()
+    assert mock_job_submit.call_args.args[3] == "script+0004.sh"
+    assert mock_job_submit.call_args.args[4] == [
+        Depend(DependType.AFTER_SUCCESS, ["3"])
+    ]
+
+
+def test_submitter_submit_loop_window_is_capped_by_loop_end(tmp_path):
+    submitter = _make_window_submitter(tmp_path, current=4, end=5, window=3)
+
+    with patch.object(PBS, "jobSubmit", side_effect=["4", "5"]) as mock_job_submit:
+        submitter.submit()
+
+    assert mock_job_submit.call_count == 2
+
+
+def test_submitter_submit_loop_window_raises_if_all_cycles_submitted(tmp_path):
+    with patch.object(PBS, "jobSubmit", side_effect=["4", "5"]):
+        _make_window_submitter(tmp_path, current=4, end=5).submit()
+
+    with (
+        patch.object(PBS, "jobSubmit") as mock_job_submit,
+        pytest.raises(QQError, match="already submitted"),
+    ):
+        _make_window_submitter(tmp_path, current=5, end=5).submit()
+
+    mock_job_submit.assert_not_called()
+
+
+def _write_cycle_info(tmp_path, cycle, state):
+    submitter = _make_window_submitter(tmp_path, current=cycle)
+    with patch.object(PBS, "jobSubmit", return_value=str(cycle)):
+        submitter._forCycle(cycle)._submitJob()
+
+    info_file = tmp_path / f"script+{cycle:04d}.qqinfo"
+    informer = Informer.fromFile(info_file)
+    informer.info.job_state = state
+    informer.toFile(info_file)
+
+
+def test_submitter_continues_loop_with_queued_cycles(tmp_path):
+    _write_cycle_info(tmp_path, 1, NaiveState.FINISHED)
+    _write_cycle_info(tmp_path, 2, NaiveState.QUEUED)
+    _write_cycle_info(tmp_path, 3, NaiveState.QUEUED)
+
+    assert _make_window_submitter(tmp_path, current=2).continuesLoop() is True
+
+
+def test_submitter_continues_loop_with_queued_cycles_previous_not_finished(tmp_path):
+    _write_cycle_info(tmp_path, 1, NaiveState.RUNNING)
+    _write_cycle_info(tmp_path, 2, NaiveState.QUEUED)
+
+    assert _make_window_submitter(tmp_path, current=2).continuesLoop() is False
+
+
+def test_submitter_continues_loop_with_queued_cycles_killed_cycle(tmp_path):
+    _write_cycle_info(tmp_path, 1, NaiveState.FINISHED)
+    _write_cycle_info(tmp_path, 2, NaiveState.KILLED)
+
+    assert _make_window_submitter(tmp_path, current=2).continuesLoop() is False
+
+
+def test_submitter_continues_loop_with_queued_cycles_missing_previous(tmp_path):
+    _write_cycle_info(tmp_path, 2, NaiveState.QUEUED)
+    _write_cycle_info(tmp_path, 3, NaiveState.QUEUED)
+
+    assert _make_window_submitter(tmp_path, current=2).continuesLoop() is False
+
+
+def test_submitter_continues_loop_with_queued_cycles_foreign_info_file(tmp_path):
+    _write_cycle_info(tmp_path, 1, NaiveState.FINISHED)
+    _write_cycle_info(tmp_path, 2, NaiveState.QUEUED)
+    (tmp_path / "other.qqinfo").write_text(
+        (tmp_path / "script+0002.qqinfo").read_text()
+    )
+
+    assert _make_window_submitter(tmp_path, current=2).continuesLoop() is False
+
+
+def test_submitter_continues_loop_with_queued_cycles_requires_window(tmp_path):
+    _write_cycle_info(tmp_path, 1, NaiveState.FINISHED)
+    _write_cycle_info(tmp_path, 2, NaiveState.QUEUED)
+
+    submitter = _make_window_submitter(tmp_path, current=2, window=1)
+    assert submitter.continuesLoop() is False
+
+
+def _make_replica_dirs(tmp_path, n):
+    dirs = []
+    for i in range(n):
+        directory = tmp_path / f"rep{i}"
+        directory.mkdir()
+        (directory / "script.sh").write_text("#!/usr/bin/env -S qq run\n")
+        dirs.append(directory)
+    return dirs
+
+
+def test_submitter_submit_does_not_change_working_directory(tmp_path):
+    (directory,) = _make_replica_dirs(tmp_path, 1)
+    submitter = Submitter(
+        PBS, "default", None, directory / "script.sh", JobType.STANDARD, Resources()
+    )
+    cwd = Path.cwd()
+
+    def fake_submit(_res, _queue, script, *_args, **_kwargs):
+        assert Path.cwd() == cwd
+        assert script == directory.resolve() / "script.sh"
+        return "1"
+
+    with patch.object(PBS, "jobSubmit", side_effect=fake_submit):
+        assert submitter.submit() == "1"
+
+
+def test_submitter_for_directory_rebases_paths(tmp_path):
+    source, target = _make_replica_dirs(tmp_path, 2)
+    (target / "storage").mkdir()
+    (target / "storage" / "job0003.dat").touch()
+
+    submitter = Submitter(
+        PBS,
+        "default",
+        "acc",
+        source / "script.sh",
+        JobType.LOOP,
+        Resources(ncpus=4),
+        loop_info=LoopInfo(1, 10, source / "storage", "job%04d", window=2),
+        exclude=[Path("big.dat")],
+        include=[Path("/abs/file"), Path("local")],
+    )
+
+    moved = submitter.forDirectory(target)
+
+    assert moved.getInputDir() == target.resolve()
+    assert moved.getScript() == target.resolve() / "script.sh"
+    assert moved.getQueue() == "default"
+    assert moved.getAccount() == "acc"
+    assert moved.getResources() == Resources(ncpus=4)
+    assert moved.getExclude() == [target.resolve() / "big.dat"]
+    assert moved.getInclude() == [Path("/abs/file"), target.resolve() / "local"]
+    # the current cycle is determined from the archive in the new directory
+    assert moved.getLoopInfo().archive == (target / "storage").resolve()
+    assert moved.getLoopInfo().current == 3
+    assert moved.getLoopInfo().window == 2
+    assert moved._job_name == "script+0003.sh"
+    # the original submitter is not modified
+    assert submitter.getLoopInfo().current == 1
+
+
+def test_submitter_for_directory_missing_script_raises(tmp_path):
+    (source,) = _make_replica_dirs(tmp_path, 1)
+    (tmp_path / "empty").mkdir()
+    submitter = Submitter(
+        PBS, "default", None, source / "script.sh", JobType.STANDARD, Resources()
+    )
+
+    with pytest.raises(QQError, match="does not exist"):
+        submitter.forDirectory(tmp_path / "empty")
+
+
+def test_submitter_submit_many_reports_per_directory(tmp_path):
+    dirs = _make_replica_dirs(tmp_path, 4)
+    # directory occupied by another job
+    (dirs[1] / "other.qqinfo").touch()
+
+    base = Submitter(
+        PBS, "default", None, dirs[0] / "script.sh", JobType.STANDARD, Resources()
+    )
+    submitters = [base] + [base.forDirectory(d) for d in dirs[1:]]
+
+    def fake_submit(_res, _queue, script, *_args, **_kwargs):
+        if script.parent == dirs[2].resolve():
+            raise QQError("qsub failed")
+        return f"id-{script.parent.name}"
+
+    with patch.object(PBS, "jobSubmit", side_effect=fake_submit):
+        results = Submitter.submitMany(submitters, max_workers=2)
+
+    assert [r.input_dir for r in results] == [d.resolve() for d in dirs]
+    assert [r.job_id for r in results] == ["id-rep0", None, None, "id-rep3"]
+    assert "runtime files" in results[1].error
+    assert results[2].error == "qsub failed"
+    assert (dirs[3] / "script.qqinfo").is_file()
+    assert not (dirs[2] / "script.qqinfo").exists()
+
+
+def test_submitter_submit_array_maps_indices_to_directories(tmp_path):
+    dirs = _make_replica_dirs(tmp_path, 4)
+    # directory occupied by another job
+    (dirs[2] / "other.qqinfo").touch()
+    array_dir = tmp_path / "campaign"
+    array_dir.mkdir()
+
+    base = Submitter(
+        PBS, "default", None, dirs[0] / "script.sh", JobType.STANDARD, Resources()
+    )
+    submitters = [base] + [base.forDirectory(d) for d in dirs[1:]]
+
+    with (
+        patch.object(PBS, "jobSubmitArray", return_value="7[].pbs") as mock_submit,
+        patch("qq_lib.properties.info.BatchMeta.fromEnvVarOrGuess", return_value=PBS),
+    ):
+        results = Submitter.submitArray(submitters, array_dir)
+
+    assert [r.job_id for r in results] == ["7[0].pbs", "7[1].pbs", None, "7[2].pbs"]
+    assert "runtime files" in results[2].error
+
+    index_file = array_dir / f"script{CFG.suffixes.qq_array}"
+    assert index_file.read_text().splitlines() == [
+        str(d.resolve() / "script.qqinfo") for d in (dirs[0], dirs[1], dirs[3])
+    ]
+
+    args = mock_submit.call_args.args
+    env_vars = args[5]
+    assert CFG.env_vars.info_file not in env_vars
+    assert CFG.env_vars.input_dir not in env_vars
+    assert env_vars[CFG.env_vars.array_index] == str(index_file)
+    assert args[6:8] == (array_dir, 3)
+
+    informer = Informer.fromFile(dirs[3] / "script.qqinfo")
+    assert informer.info.job_id == "7[2].pbs"
+    assert informer.info.input_dir == dirs[3].resolve()
+
+
+def test_submitter_submit_array_rejects_different_resources(tmp_path):
+    dirs = _make_replica_dirs(tmp_path, 2)
+    submitters = [
+        Submitter(
+            PBS, "default", None, d / "script.sh", JobType.STANDARD, Resources(ncpus=n)
+        )
+        for d, n in zip(dirs, [1, 2])
+    ]
+
+    with pytest.raises(QQError, match="cannot be part of the same array job"):
+        Submitter.submitArray(submitters, tmp_path)
+
+    assert not (tmp_path / f"script{CFG.suffixes.qq_array}").exists()
+
+
+def test_submitter_submit_array_removes_index_on_failure(tmp_path):
+    dirs = _make_replica_dirs(tmp_path, 2)
+    base = Submitter(
+        PBS, "default", None, dirs[0] / "script.sh", JobType.STANDARD, Resources()
+    )
+
+    with (
+        patch.object(PBS, "jobSubmitArray", side_effect=QQError("qsub failed")),
+        pytest.raises(QQError, match="qsub failed"),
+    ):
+        Submitter.submitArray([base, base.forDirectory(dirs[1])], tmp_path)
+
+    assert not (tmp_path / f"script{CFG.suffixes.qq_array}").exists()
+    assert not (dirs[0] / "script.qqinfo").exists()
+
+
+def test_submitter_submit_array_requires_two_members(tmp_path):
+    (directory,) = _make_replica_dirs(tmp_path, 1)
+    submitter = Submitter(
+        PBS, "default", None, directory / "script.sh", JobType.STANDARD, Resources()
+    )
+
+    with pytest.raises(QQError, match="at least two"):
+        Submitter.submitArray([submitter], tmp_path)
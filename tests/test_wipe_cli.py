@@ -9,7 +9,7 @@ from click.testing import CliRunner
 
 from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError, QQNotSuitableError
-from qq_lib.wipe.cli import _wipe_work_dir, wipe
+from qq_lib.wipe.cli import _wipe_orphans, _wipe_work_dir, wipe
 
 
 @patch("qq_lib.wipe.cli.logger.info")
@@ -172,3 +172,53 @@ def test_wipe_catches_generic_exception_and_exits_99(tmp_path):
 
     assert result.exit_code == CFG.exit_codes.unexpected_error
     mock_logger.critical.assert_called_once()
+
+
+@patch("qq_lib.wipe.cli.logger.info")
+@patch("qq_lib.wipe.cli.Wiper.fromInformer")
+@patch("qq_lib.wipe.cli.yes_or_no_prompt", return_value=True)
+def test_wipe_orphans_success_with_prompt(
+    mock_prompt, mock_wiper_from_informer, mock_logger_info
+):
+    mock_wiper = MagicMock()
+    mock_wiper.wipeOrphans.return_value = "job42"
+    mock_wiper_from_informer.return_value = mock_wiper
+
+    _wipe_orphans(MagicMock(), force=False, yes=False)
+
+    mock_prompt.assert_called_once()
+    mock_wiper.ensureSuitableForOrphans.assert_called_once()
+    mock_wiper.wipeOrphans.assert_called_once()
+    mock_wiper.wipe.assert_not_called()
+    mock_logger_info.assert_called_with(
+        "Deleted the leftover working directory of the job 'job42'."
+    )
+
+
+@patch("qq_lib.wipe.cli.Wiper.fromInformer")
+def test_wipe_orphans_with_force_skips_suitability_check(mock_wiper_from_informer):
+    mock_wiper = MagicMock()
+    mock_wiper_from_informer.return_value = mock_wiper
+
+    with patch("qq_lib.wipe.cli.logger"):
+        _wipe_orphans(MagicMock(), force=True, yes=False)
+
+    mock_wiper.ensureSuitableForOrphans.assert_not_called()
+    mock_wiper.wipeOrphans.assert_called_once()
+
+
+def test_wipe_with_orphans_flag_uses_orphan_handler():
+    runner = CliRunner()
+    repeater_mock = MagicMock()
+    informer_mock = MagicMock()
+
+    with (
+        patch("qq_lib.wipe.cli.Informer.fromJobId", return_value=informer_mock),
+        patch("qq_lib.wipe.cli.Repeater", return_value=repeater_mock) as repeater_cls,
+        patch("qq_lib.wipe.cli.logger"),
+    ):
+        result = runner.invoke(wipe, ["123", "--orphans"])
+
+    assert result.exit_code == 0
+    repeater_cls.assert_called_once_with([informer_mock], _wipe_orphans, False, False)
+    repeater_mock.run.assert_called_once()
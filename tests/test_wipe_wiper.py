@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from qq_lib.core.config import CFG
 from qq_lib.core.error import QQError, QQNotSuitableError
 from qq_lib.properties.states import RealState
 from qq_lib.wipe.wiper import Wiper
@@ -227,3 +228,151 @@ def test_wiper_workdir_is_inputdir_various_conditions(
 
     result = wiper._workDirIsInputDir()
     assert result is expected
+
+
+@pytest.mark.parametrize(
+    "state",
+    [
+        RealState.QUEUED,
+        RealState.RUNNING,
+        RealState.FAILED,
+        RealState.KILLED,
+    ],
+)
+def test_wiper_ensure_suitable_for_orphans_raises_for_unfinished_jobs(state):
+    wiper = Wiper.__new__(Wiper)
+    wiper._state = state
+    wiper._informer = MagicMock()
+    wiper._informer.getRealState.return_value = state
+    wiper.hasDestination = MagicMock(return_value=True)
+
+    with pytest.raises(QQNotSuitableError, match="Only finished jobs"):
+        wiper.ensureSuitableForOrphans()
+
+
+def test_wiper_ensure_suitable_for_orphans_raises_when_destination_missing():
+    wiper = Wiper.__new__(Wiper)
+    wiper._state = RealState.FINISHED
+    wiper._informer = MagicMock()
+    wiper.hasDestination = MagicMock(return_value=False)
+
+    with pytest.raises(QQNotSuitableError, match="does not have a working directory"):
+        wiper.ensureSuitableForOrphans()
+
+
+def test_wiper_ensure_suitable_for_orphans_passes_for_finished_job():
+    wiper = Wiper.__new__(Wiper)
+    wiper._state = RealState.FINISHED
+    wiper._informer = MagicMock()
+    wiper.hasDestination = MagicMock(return_value=True)
+
+    wiper.ensureSuitableForOrphans()
+
+
+def test_wiper_wipe_orphans_deletes_existing_tombstone():
+    wiper = Wiper.__new__(Wiper)
+    wiper.hasDestination = MagicMock(return_value=True)
+    wiper._batch_system = MagicMock()
+    wiper._batch_system.listRemoteDir.return_value = [
+        Path("/scratch/job/other"),
+        Path("/scratch/job/main.qqtomb"),
+    ]
+    wiper._informer = MagicMock()
+    wiper._informer.info.job_id = "job123"
+    wiper._main_node = "node"
+    wiper._work_dir = Path("/scratch/job/main")
+
+    with patch("qq_lib.wipe.wiper.logger"):
+        result = wiper.wipeOrphans()
+
+    assert result == "job123"
+    wiper._batch_system.listRemoteDir.assert_called_once_with(
+        "node", Path("/scratch/job")
+    )
+    wiper._batch_system.deleteRemoteDir.assert_called_once_with(
+        "node", Path("/scratch/job/main.qqtomb")
+    )
+
+
+def test_wiper_wipe_orphans_raises_if_no_tombstone():
+    wiper = Wiper.__new__(Wiper)
+    wiper.hasDestination = MagicMock(return_value=True)
+    wiper._batch_system = MagicMock()
+    wiper._batch_system.listRemoteDir.return_value = [Path("/scratch/job/other")]
+    wiper._informer = MagicMock()
+    wiper._main_node = "node"
+    wiper._work_dir = Path("/scratch/job/main")
+
+    with pytest.raises(QQNotSuitableError, match="No leftover working directory"):
+        wiper.wipeOrphans()
+
+    wiper._batch_system.deleteRemoteDir.assert_not_called()
+
+
+def test_wiper_wipe_orphans_raises_without_destination():
+    wiper = Wiper.__new__(Wiper)
+    wiper.hasDestination = MagicMock(return_value=False)
+
+    with pytest.raises(QQError, match="are not defined"):
+        wiper.wipeOrphans()
+
+
+def test_wiper_wipe_orphans_deletes_retained_work_dir():
+    wiper = Wiper.__new__(Wiper)
+    wiper.hasDestination = MagicMock(return_value=True)
+    wiper._workDirIsInputDir = MagicMock(return_value=False)
+    wiper._batch_system = MagicMock()
+    wiper._batch_system.listRemoteDir.side_effect = [
+        [Path("/scratch/job/main")],
+        [
+            Path("/scratch/job/main/file.txt"),
+            Path(f"/scratch/job/main/{CFG.loop_jobs.manifest_file}"),
+        ],
+    ]
+    wiper._informer = MagicMock()
+    wiper._informer.info.job_id = "job123"
+    wiper._main_node = "node"
+    wiper._work_dir = Path("/scratch/job/main")
+
+    with patch("qq_lib.wipe.wiper.logger"):
+        result = wiper.wipeOrphans()
+
+    assert result == "job123"
+    wiper._batch_system.deleteRemoteDir.assert_called_once_with(
+        "node", Path("/scratch/job/main")
+    )
+
+
+def test_wiper_wipe_orphans_does_not_delete_work_dir_without_manifest():
+    wiper = Wiper.__new__(Wiper)
+    wiper.hasDestination = MagicMock(return_value=True)
+    wiper._workDirIsInputDir = MagicMock(return_value=False)
+    wiper._batch_system = MagicMock()
+    wiper._batch_system.listRemoteDir.side_effect = [
+        [Path("/scratch/job/main")],
+        [Path("/scratch/job/main/file.txt")],
+    ]
+    wiper._informer = MagicMock()
+    wiper._main_node = "node"
+    wiper._work_dir = Path("/scratch/job/main")
+
+    with pytest.raises(QQNotSuitableError, match="No leftover working directory"):
+        wiper.wipeOrphans()
+
+    wiper._batch_system.deleteRemoteDir.assert_not_called()
+
+
+def test_wiper_wipe_orphans_never_deletes_input_dir():
+    wiper = Wiper.__new__(Wiper)
+    wiper.hasDestination = MagicMock(return_value=True)
+    wiper._workDirIsInputDir = MagicMock(return_value=True)
+    wiper._batch_system = MagicMock()
+    wiper._batch_system.listRemoteDir.return_value = [Path("/scratch/job/main")]
+    wiper._informer = MagicMock()
+    wiper._main_node = "node"
+    wiper._work_dir = Path("/scratch/job/main")
+
+    with pytest.raises(QQNotSuitableError):
+        wiper.wipeOrphans()
+
+    wiper._batch_system.deleteRemoteDir.assert_not_called()
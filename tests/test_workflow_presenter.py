@@ -0,0 +1,49 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from rich.console import Console
+
+from qq_lib.properties.states import BatchState
+from qq_lib.submit.submitter import SubmitResult
+from qq_lib.workflow.presenter import WorkflowPresenter
+from qq_lib.workflow.state import WorkflowState
+
+
+def _job(job_id, state):
+    job = MagicMock()
+    job.getId.return_value = job_id
+    job.getState.return_value = state
+    return job
+
+
+def test_workflow_presenter_summarizes_steps():
+    state = WorkflowState(
+        Path("/dir/workflow.yaml"),
+        {
+            "prep": [SubmitResult(Path("prep"), job_id="1")],
+            "production": [
+                SubmitResult(Path("run1"), job_id="2"),
+                SubmitResult(Path("run2"), job_id="3"),
+                SubmitResult(Path("run3"), job_id="4"),
+                SubmitResult(Path("run4"), error="failed"),
+            ],
+        },
+    )
+    jobs = [
+        _job("1", BatchState.FINISHED),
+        _job("2", BatchState.RUNNING),
+        _job("3", BatchState.RUNNING),
+        _job("99", BatchState.QUEUED),
+    ]
+
+    console = Console(record=True, width=200)
+    console.print(WorkflowPresenter(state, jobs).createSummaryTable())
+    output = console.export_text()
+
+    assert "Workflow workflow.yaml" in output
+    assert "1 finished" in output
+    assert "2 running 1 unknown 1 not submitted" in output
+    assert "queued" not in output
@@ -0,0 +1,59 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from qq_lib.core.error import QQError
+from qq_lib.submit.submitter import SubmitResult
+from qq_lib.workflow.state import CFG, WorkflowState
+
+
+@pytest.fixture
+def sample_state(tmp_path):
+    return WorkflowState(
+        tmp_path / "workflow.yaml",
+        {
+            "prep": [SubmitResult(tmp_path / "prep", job_id="1.server")],
+            "production": [
+                SubmitResult(tmp_path / "run1", job_id="2.server"),
+                SubmitResult(tmp_path / "run2", error="Script does not exist."),
+            ],
+        },
+        datetime(2025, 10, 1, 12, 30, 0),
+    )
+
+
+def test_workflow_state_file_roundtrip(sample_state):
+    file = WorkflowState.getPath(sample_state.workflow)
+    sample_state.toFile(file)
+
+    loaded = WorkflowState.fromFile(file)
+
+    assert loaded.workflow == sample_state.workflow
+    assert loaded.submission_time == sample_state.submission_time
+    assert loaded.steps == sample_state.steps
+    assert list(loaded.steps) == ["prep", "production"]
+
+
+def test_workflow_state_get_job_ids(sample_state):
+    assert sample_state.getJobIds() == {"1.server": "prep", "2.server": "production"}
+
+
+def test_workflow_state_get_path():
+    assert WorkflowState.getPath(Path("/dir/workflow.yaml")) == Path(
+        f"/dir/workflow{CFG.suffixes.qq_workflow}"
+    )
+    assert WorkflowState.getPath(
+        Path(f"/dir/workflow{CFG.suffixes.qq_workflow}")
+    ) == Path(f"/dir/workflow{CFG.suffixes.qq_workflow}")
+
+
+def test_workflow_state_from_invalid_file_raises(tmp_path):
+    file = tmp_path / f"workflow{CFG.suffixes.qq_workflow}"
+    file.write_text("steps: {}\n")
+
+    with pytest.raises(QQError, match="Could not read workflow state"):
+        WorkflowState.fromFile(file)
@@ -0,0 +1,281 @@
+# Released under MIT License.
+# Copyright (c) 2025 Ladislav Bartos and Robert Vacha Lab
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from qq_lib.core.error import QQError
+from qq_lib.properties.depend import DependType
+from qq_lib.submit.submitter import SubmitResult
+from qq_lib.workflow.state import WorkflowState
+from qq_lib.workflow.workflow import Workflow, WorkflowStep
+
+WORKFLOW_YAML = """
+steps:
+  analysis:
+    script: analyze.sh
+    dir: analysis
+    after: production
+    depend_type: afterany
+  prep:
+    script: prep.sh
+    dir: prep
+    options: {ncpus: 8, walltime: 2h, work-dir: scratch_local}
+  production:
+    script: run.sh
+    dirs: [run1, run2]
+    after: [prep]
+  extra:
+    script: extra.sh
+"""
+
+
+def _step(name, after=None, dirs=None):
+    return WorkflowStep(name, Path("run.sh"), dirs or [Path(name)], after=after or [])
+
+
+def test_workflow_from_yaml_file_parses_steps(tmp_path):
+    file = tmp_path / "workflow.yaml"
+    file.write_text(WORKFLOW_YAML)
+
+    workflow = Workflow.fromFile(file)
+    steps = {s.name: s for s in workflow.getSteps()}
+
+    assert steps["prep"].options == {
+        "ncpus": 8,
+        "walltime": "2h",
+        "work_dir": "scratch_local",
+    }
+    assert steps["production"].dirs == [tmp_path / "run1", tmp_path / "run2"]
+    assert steps["analysis"].after == ["production"]
+    assert steps["analysis"].depend_type == DependType.AFTER_COMPLETION
+    assert steps["production"].depend_type == DependType.AFTER_SUCCESS
+    assert steps["extra"].dirs == [tmp_path / "."]
+
+
+def test_workflow_from_toml_file_parses_steps(tmp_path):
+    file = tmp_path / "workflow.toml"
+    file.write_text(
+        '[steps.prep]\nscript = "prep.sh"\n\n'
+        '[steps.run]\nscript = "run.sh"\nafter = ["prep"]\n'
+    )
+
+    workflow = Workflow.fromFile(file)
+
+    assert [s.name for s in workflow.getSteps()] == ["prep", "run"]
+
+
+def test_workflow_steps_are_ordered_topologically(tmp_path):
+    file = tmp_path / "workflow.yaml"
+    file.write_text(WORKFLOW_YAML)
+
+    workflow = Workflow.fromFile(file)
+
+    assert [[s.name for s in level] for level in workflow._levels] == [
+        ["prep", "extra"],
+        ["production"],
+        ["analysis"],
+    ]
+
+
+def test_workflow_cycle_raises():
+    with pytest.raises(QQError, match="cycle"):
+        Workflow(
+            Path("workflow.yaml"),
+            [_step("a", ["c"]), _step("b", ["a"]), _step("c", ["b"]), _step("d")],
+        )
+
+
+def test_workflow_unknown_dependency_raises():
+    with pytest.raises(QQError, match="unknown steps: missing"):
+        Workflow(Path("workflow.yaml"), [_step("a", ["missing"])])
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        ("steps: {}", "contains no steps"),
+        ("jobs: []", "does not define any steps"),
+        ("steps:\n  a: {dir: x}", "does not specify a script"),
+        ("steps:\n  a: {script: a.sh, dir: x, dirs: [y]}", "both 'dir' and 'dirs'"),
+        ("steps:\n  a: {script: a.sh, dirs: []}", "not a valid workflow step"),
+        ("steps:\n  a: {script: a.sh, queues: x}", "unknown keys: queues"),
+        ("steps:\n  a: {script: a.sh, options: {array: x}}", "unsupported options"),
+        (
+            "steps:\n  a: {script: a.sh, options: {exclude: [x.dat, y.dat]}}",
+            "must be a single value",
+        ),
+        ("steps:\n  a: {script: a.sh, options: {ncpus: many}}", "Invalid value"),
+        ("steps:\n  a: {script: a.sh, depend_type: afterall}", "Unknown dependency"),
+        ("steps: [", "Could not read workflow file"),
+    ],
+)
+def test_workflow_from_file_invalid_raises(tmp_path, content, message):
+    file = tmp_path / "workflow.yaml"
+    file.write_text(content)
+
+    with pytest.raises(QQError, match=message):
+        Workflow.fromFile(file)
+
+
+def _fake_make_submitters(calls):
+    def make_submitters(script, directories, **kwargs):
+        calls.append((script, directories, kwargs))
+        submitters = []
+        for directory in directories:
+            submitter = MagicMock()
+            submitter.directory = directory
+            submitters.append(submitter)
+        return submitters, []
+
+    return make_submitters
+
+
+def _fake_submit_many(failing=()):
+    counter = iter(range(100, 200))
+
+    def submit_many(submitters, _max_workers=None):
+        return [
+            SubmitResult(s.directory, error="failed")
+            if s.directory.name in failing
+            else SubmitResult(s.directory, job_id=str(next(counter)))
+            for s in submitters
+        ]
+
+    return submit_many
+
+
+def test_workflow_submit_translates_dependencies(tmp_path):
+    file = tmp_path / "workflow.yaml"
+    file.write_text(WORKFLOW_YAML)
+    workflow = Workflow.fromFile(file)
+    calls = []
+
+    with (
+        patch(
+            "qq_lib.workflow.workflow.SubmitterFactory.makeSubmitters",
+            side_effect=_fake_make_submitters(calls),
+        ),
+        patch(
+            "qq_lib.workflow.workflow.Submitter.submitMany",
+            side_effect=_fake_submit_many(),
+        ) as submit_many,
+    ):
+        state = workflow.submit()
+
+    # one concurrent submission per level
+    assert submit_many.call_count == 3
+    kwargs = {c[0].name: c[2] for c in calls}
+    assert kwargs["prep.sh"] == {
+        "ncpus": 8,
+        "walltime": "2h",
+        "work_dir": "scratch_local",
+    }
+    assert kwargs["extra.sh"] == {}
+    assert kwargs["run.sh"] == {"depend": "afterok=100"}
+    assert kwargs["analyze.sh"] == {"depend": "afterany=102:103"}
+
+    assert list(state.steps) == ["prep", "extra", "production", "analysis"]
+    assert WorkflowState.getPath(file).is_file()
+
+
+def test_workflow_submit_merges_explicit_dependencies():
+    step = WorkflowStep(
+        "b", Path("b.sh"), [Path("b")], options={"depend": "after=1"}, after=["a"]
+    )
+    results = {"a": [SubmitResult(Path("a"), job_id="2")]}
+
+    assert Workflow._getSubmitOptions(step, results) == {"depend": "after=1 afterok=2"}
+
+
+def test_workflow_submit_skips_steps_depending_on_failed_steps(tmp_path):
+    file = tmp_path / "workflow.yaml"
+    file.write_text(WORKFLOW_YAML)
+    workflow = Workflow.fromFile(file)
+    calls = []
+
+    with (
+        patch(
+            "qq_lib.workflow.workflow.SubmitterFactory.makeSubmitters",
+            side_effect=_fake_make_submitters(calls),
+        ),
+        patch(
+            "qq_lib.workflow.workflow.Submitter.submitMany",
+            side_effect=_fake_submit_many(failing=("run2",)),
+        ),
+    ):
+        state = workflow.submit()
+
+    assert [c[0].name for c in calls] == ["prep.sh", "extra.sh", "run.sh"]
+    assert len(state.steps["analysis"]) == 1
+    assert state.steps["analysis"][0].job_id is None
+    assert "production" in state.steps["analysis"][0].error
+
+
+def test_workflow_options_are_converted_like_submit_options(tmp_path):
+    file = tmp_path / "workflow.yaml"
+    file.write_text(
+        "steps:\n  a: {script: a.sh, options: {ncpus: '8', mem: 4, autosize: 'yes'}}"
+    )
+
+    (step,) = Workflow.fromFile(file).getSteps()
+
+    assert step.options == {"ncpus": 8, "mem": "4", "autosize": True}
+
+
+def test_workflow_submit_records_submitted_jobs_on_failure(tmp_path):
+    file = tmp_path / "workflow.yaml"
+    file.write_text(WORKFLOW_YAML)
+    workflow = Workflow.fromFile(file)
+    calls = []
+    make_submitters = _fake_make_submitters(calls)
+
+    def failing_make_submitters(script, directories, **kwargs):
+        if script.name == "run.sh":
+            raise RuntimeError("unexpected")
+        return make_submitters(script, directories, **kwargs)
+
+    with (
+        patch(
+            "qq_lib.workflow.workflow.SubmitterFactory.makeSubmitters",
+            side_effect=failing_make_submitters,
+        ),
+        patch(
+            "qq_lib.workflow.workflow.Submitter.submitMany",
+            side_effect=_fake_submit_many(),
+        ),
+        pytest.raises(RuntimeError),
+    ):
+        workflow.submit()
+
+    # jobs of the first level are already queued and must stay tracked
+    state = WorkflowState.fromFile(WorkflowState.getPath(file))
+    assert list(state.steps) == ["prep", "extra"]
+    assert [r.job_id for r in state.steps["prep"]] == ["100"]
+
+
+def test_workflow_submit_does_not_record_state_if_nothing_was_submitted(tmp_path):
+    file = tmp_path / "workflow.yaml"
+    file.write_text(WORKFLOW_YAML)
+
+    with (
+        patch(
+            "qq_lib.workflow.workflow.SubmitterFactory.makeSubmitters",
+            side_effect=RuntimeError("unexpected"),
+        ),
+        pytest.raises(RuntimeError),
+    ):
+        Workflow.fromFile(file).submit()
+
+    assert not WorkflowState.getPath(file).exists()
+
+
+def test_workflow_submit_refuses_submitted_workflow(tmp_path):
+    file = tmp_path / "workflow.yaml"
+    file.write_text(WORKFLOW_YAML)
+    WorkflowState.getPath(file).touch()
+
+    with pytest.raises(QQError, match="already submitted"):
+        Workflow.fromFile(file).submit()